@@ -9,11 +9,13 @@ Restored from archaeological recovery with enhanced features:
 - Real-time game data integration
 """
 
-from flask import Flask, request, jsonify, render_template, redirect, url_for, g, send_from_directory
+from flask import Flask, request, jsonify, render_template, redirect, url_for, g, send_from_directory, send_file, has_request_context
 from typing import Any, Dict, Optional
 import json
 import os
 import glob
+import copy
+import hashlib
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import logging
@@ -23,7 +25,7 @@ import threading
 import time
 import subprocess
 import requests
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 from utils.name_normalization import normalize_name
 from pathlib import Path
 
@@ -45,11 +47,16 @@ def get_business_date(offset_days: int = 0) -> str:
     return (_now_local() + timedelta(days=offset_days)).strftime('%Y-%m-%d')
 
 # -------------------------------------------------------------
-# Lightweight response caching (in-memory, per-process)
+# Lightweight response caching (backend chosen by APP_CACHE_BACKEND:
+# per-process memory by default, sqlite/redis to share across workers)
 # -------------------------------------------------------------
 from threading import RLock
+from collections import OrderedDict
+from cache_backend import get_cache_backend
+from payload_artifacts import AVAILABLE_ENCODINGS, choose_encoding, compress_body, dumps as _json_bytes, make_etag
 
-_RESPONSE_CACHE = {}
+_CACHE_BACKEND = get_cache_backend()
+_RESPONSE_CACHE = _CACHE_BACKEND.namespace('resp')
 _CACHE_LOCK = RLock()
 
 def _cache_make_key(name: str, params: Optional[dict] = None) -> str:
@@ -58,25 +65,325 @@ def _cache_make_key(name: str, params: Optional[dict] = None) -> str:
     items = sorted((k, str(v)) for k, v in params.items())
     return name + '|' + '&'.join(f"{k}={v}" for k, v in items)
 
-def cache_get(name: str, params: Optional[dict], ttl_seconds: int):
-    now = time.time()
+def cache_get(name: str, params: Optional[dict], ttl_seconds: int, coalesce: bool = True):
+    """Cached value no older than ttl_seconds, else None (caller computes, then cache_set).
+    For names registered with cache_policy() concurrent misses are coalesced (see cache_coalesce);
+    pass coalesce=False for plain lookups such as stale fallbacks in error paths.
+    """
     key = _cache_make_key(name, params)
-    with _CACHE_LOCK:
-        entry = _RESPONSE_CACHE.get(key)
-        if entry:
-            ts, data = entry
-            if now - ts <= ttl_seconds:
-                return data
-            else:
-                _RESPONSE_CACHE.pop(key, None)
-    return None
+    # Expired entries are kept by the backend (retention: 1h) so they can be served stale
+    entry = _RESPONSE_CACHE.get_entry(key)
+    if entry and time.time() - entry[0] <= ttl_seconds:
+        _note_cache_version(key, entry[0])
+        return entry[1]
+    policy = _CACHE_POLICIES.get(name)
+    if policy is None or not coalesce:
+        return None
+    return cache_coalesce(name, params, ttl_seconds, lambda: _RESPONSE_CACHE.get_entry(key))
 
 def cache_set(name: str, params: Optional[dict], data):
     key = _cache_make_key(name, params)
-    with _CACHE_LOCK:
-        _RESPONSE_CACHE[key] = (time.time(), data)
+    ts = time.time()
+    _RESPONSE_CACHE.put(key, data, ts=ts)
+    _note_cache_version(key, ts)
+    _cache_flight_finish(key)
     return data
 
+# -------------------------------------------------------------
+# Conditional GET for cached JSON payloads
+# -------------------------------------------------------------
+# A cache entry's (key, write time) identifies the payload version. cache_get/cache_set record the
+# version they returned/stored on the request; conditional_json() serializes each version once and
+# tags it with a hash of the encoded body, so every worker (and the today-games artifact) sends the
+# same ETag for the same content, then answers 304 or serves the version's encoded bytes.
+def _note_cache_version(key: str, ts: float):
+    if has_request_context():
+        versions = getattr(g, '_cache_versions', None)
+        if versions is None:
+            versions = g._cache_versions = {}
+        versions[key] = ts
+
+def _etag_matches(etag: str) -> bool:
+    """If-None-Match check tolerant of encoding suffixes added by compressors/proxies (etag:gzip, etag-gzip)."""
+    inm = request.if_none_match
+    if not inm:
+        return False
+    if inm.star_tag:
+        return True
+    for tag in inm.as_set(include_weak=True):
+        base = tag.split(':', 1)[0]
+        for suffix in ('-gzip', '-br', '-deflate'):
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if base == etag:
+            return True
+    return False
+
+# Encoded bodies per payload version: a version is serialized once per process and each
+# compressed variant is built on first demand, so repeat hits are a bytes copy plus headers.
+_ENCODED_RESPONSES = OrderedDict()  # (key, ts) -> {'identity': bytes, 'gzip': bytes, 'br': bytes}
+_ENCODED_ETAGS = {}  # (key, ts) -> ETag (hash of the identity body)
+_ENCODED_SIZES = {}  # (key, ts) -> bytes counted in _ENCODED_STATS['bytes'] for that entry
+_ENCODED_LOCK = threading.Lock()
+_ENCODED_STATS = {'hits': 0, 'encodes': 0, 'compressions': 0, 'evictions': 0, 'bytes': 0}
+try:
+    _ENCODED_MAX_BYTES = int(float(os.environ.get('RESPONSE_BYTES_CACHE_MB', '64')) * 1024 * 1024)
+except Exception:
+    _ENCODED_MAX_BYTES = 64 * 1024 * 1024
+_COMPRESS_MIN_BYTES = 1024
+
+def _encode_json(payload) -> bytes:
+    try:
+        return _json_bytes(payload)
+    except Exception:
+        return app.json.dumps(payload).encode('utf-8')
+
+def _encoded_variants(version: tuple, payload):
+    """(encoded variants, ETag) for a payload version, serializing and hashing it only once."""
+    with _ENCODED_LOCK:
+        variants = _ENCODED_RESPONSES.get(version)
+        if variants is not None:
+            _ENCODED_RESPONSES.move_to_end(version)
+            _ENCODED_STATS['hits'] += 1
+            etag = _ENCODED_ETAGS.get(version)
+            if etag is None:  # re-stored by a compression after being evicted
+                etag = _ENCODED_ETAGS[version] = make_etag(variants['identity']).strip('"')
+            return variants, etag
+    body = _encode_json(payload() if callable(payload) else payload)
+    variants = {'identity': body}
+    etag = make_etag(body).strip('"')
+    with _ENCODED_LOCK:
+        _ENCODED_STATS['encodes'] += 1
+        _ENCODED_ETAGS[version] = etag
+        _encoded_store(version, variants)
+    return variants, etag
+
+def _encoded_response_body(version: tuple, payload, encoding: Optional[str]):
+    """(body bytes, encoding actually used) for a payload version; payload may be a zero-arg builder."""
+    variants, _ = _encoded_variants(version, payload)
+    if encoding is None or len(variants['identity']) < _COMPRESS_MIN_BYTES:
+        return variants['identity'], None
+    data = variants.get(encoding)
+    if data is None:
+        data = compress_body(variants['identity'], encoding)
+        if data is None:
+            return variants['identity'], None
+        with _ENCODED_LOCK:
+            variants[encoding] = data
+            _ENCODED_STATS['compressions'] += 1
+            _encoded_store(version, variants)
+    return data, encoding
+
+def _encoded_store(version: tuple, variants: dict):
+    # Caller holds _ENCODED_LOCK. Inserts or replaces the entry, accounting its full size
+    # (variants may have grown in place, or the version been evicted since it was counted).
+    size = sum(len(b) for b in variants.values())
+    _ENCODED_STATS['bytes'] += size - _ENCODED_SIZES.get(version, 0)
+    _ENCODED_SIZES[version] = size
+    _ENCODED_RESPONSES[version] = variants
+    _ENCODED_RESPONSES.move_to_end(version)
+    while _ENCODED_STATS['bytes'] > _ENCODED_MAX_BYTES and len(_ENCODED_RESPONSES) > 1:
+        evicted_version, _ = _ENCODED_RESPONSES.popitem(last=False)
+        _ENCODED_ETAGS.pop(evicted_version, None)
+        _ENCODED_STATS['bytes'] -= _ENCODED_SIZES.pop(evicted_version, 0)
+        _ENCODED_STATS['evictions'] += 1
+
+def conditional_json(payload, name: str = None, params: Optional[dict] = None, version: tuple = None):
+    """JSON response for payload tagged with the version of cache entry name/params (as read or
+    stored by this request), or an explicit (key, ts) version. Returns 304 without serializing when
+    the client's If-None-Match (or If-Modified-Since) already covers that version; otherwise serves
+    the version's pre-encoded (and pre-compressed) bytes. payload may be a zero-arg builder, only
+    called when this version has not been encoded yet."""
+    if version is None and name is not None:
+        key = _cache_make_key(name, params)
+        ts = (getattr(g, '_cache_versions', None) or {}).get(key)
+        version = (key, ts) if ts is not None else None
+    if version is None:
+        return jsonify(payload() if callable(payload) else payload)
+    key, ts = version
+    _, etag = _encoded_variants(version, payload)
+    last_modified = datetime.utcfromtimestamp(int(ts))
+    if _etag_matches(etag) or (not request.if_none_match and request.if_modified_since
+                               and last_modified <= request.if_modified_since.replace(tzinfo=None)):
+        resp = app.response_class(status=304)
+    else:
+        encoding = choose_encoding(request.headers.get('Accept-Encoding'), AVAILABLE_ENCODINGS)
+        body, encoding = _encoded_response_body((key, ts), payload, encoding)
+        resp = app.response_class(body, mimetype='application/json')
+        if encoding:
+            resp.headers['Content-Encoding'] = encoding
+    resp.headers['Vary'] = 'Accept-Encoding'
+    resp.set_etag(etag)
+    resp.last_modified = last_modified
+    return resp
+
+# -------------------------------------------------------------
+# Single-flight / stale-while-revalidate for expensive endpoints
+# -------------------------------------------------------------
+# When a hot entry expires, only one request (the flight leader) recomputes it. Concurrent
+# requests for the same key either wait for the leader ('wait') or are answered immediately
+# with the expired entry while the request is re-run in a background thread ('swr').
+# Leaders publish with cache_set(); flights left open (errors, early returns) are closed
+# when the leader's request context tears down, or after _CACHE_FLIGHT_LEASE_SEC.
+_CACHE_POLICIES = {}
+_CACHE_FLIGHTS = {}
+_CACHE_FLIGHT_LEASE_SEC = 120.0
+_CACHE_FLIGHT_STATS = {'leads': 0, 'waits': 0, 'wait_hits': 0, 'wait_timeouts': 0,
+                       'stale_served': 0, 'bg_refreshes': 0, 'bg_refresh_errors': 0}
+
+class _CacheFlight:
+    __slots__ = ('event', 'started')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.started = time.time()
+
+def cache_policy(name: str, mode: str = 'wait', stale_ttl: float = 60.0, wait_timeout: float = 15.0):
+    """Enable request coalescing for a cache name.
+    mode: 'wait' (callers block up to wait_timeout for the in-flight result), 'swr' (callers get an
+    entry up to stale_ttl seconds old right away while it is refreshed in the background) or 'off'.
+    Per-endpoint env overrides: CACHE_MODE_<NAME>, CACHE_STALE_SEC_<NAME> (e.g. CACHE_MODE_TODAY_GAMES=wait).
+    """
+    env_name = name.upper()
+    mode = (os.environ.get(f'CACHE_MODE_{env_name}') or mode).strip().lower()
+    try:
+        stale_ttl = float(os.environ.get(f'CACHE_STALE_SEC_{env_name}', stale_ttl))
+    except Exception:
+        pass
+    if mode not in ('wait', 'swr'):
+        _CACHE_POLICIES.pop(name, None)
+        return None
+    _CACHE_POLICIES[name] = {'mode': mode, 'stale_ttl': stale_ttl, 'wait_timeout': wait_timeout}
+    return _CACHE_POLICIES[name]
+
+def _cache_flight_finish(key: str, flight: '_CacheFlight' = None):
+    with _CACHE_LOCK:
+        current = _CACHE_FLIGHTS.get(key)
+        if current is None or (flight is not None and current is not flight):
+            return
+        _CACHE_FLIGHTS.pop(key, None)
+    current.event.set()
+
+def _cache_led_flights() -> dict:
+    flights = getattr(g, '_cache_flights', None)
+    if flights is None:
+        flights = g._cache_flights = {}
+    return flights
+
+def cache_coalesce(name: str, params: Optional[dict], ttl_seconds: float, peek):
+    """Single-flight gate for a cache miss on name/params.
+    peek() returns the raw entry as (ts, data) - or a dict with a 'ts' key, returned as-is - or None.
+    Returns a value to serve (fresh, or stale under 'swr'), or None when the caller should compute
+    and publish the result. Outside a request context this is a no-op (returns None).
+    """
+    policy = _CACHE_POLICIES.get(name)
+    if policy is None or not has_request_context():
+        return None
+    key = _cache_make_key(name, params)
+    led = _cache_led_flights()
+    if key in led:
+        # This request (or its background refresh) is the leader
+        return None
+
+    def _split(entry):
+        if not entry:
+            return None, None
+        if isinstance(entry, dict):
+            return entry.get('ts', 0), entry
+        return entry
+
+    now = time.time()
+    with _CACHE_LOCK:
+        ts, data = _split(peek())
+        if ts is not None and now - ts <= ttl_seconds:
+            _note_cache_version(key, ts)
+            return data
+        stale = data if (ts is not None and now - ts <= policy['stale_ttl']) else None
+        flight = _CACHE_FLIGHTS.get(key)
+        if flight is not None and now - flight.started > _CACHE_FLIGHT_LEASE_SEC:
+            flight = None  # abandoned leader; take over
+        lead = flight is None
+        if lead:
+            flight = _CACHE_FLIGHTS[key] = _CacheFlight()
+            _CACHE_FLIGHT_STATS['leads'] += 1
+        serve_stale = stale is not None and policy['mode'] == 'swr'
+        if serve_stale and not lead:
+            _CACHE_FLIGHT_STATS['stale_served'] += 1
+            g._cache_stale = True
+            _note_cache_version(key, ts)
+            return stale
+    if lead:
+        if serve_stale and _cache_spawn_refresh(key, flight):
+            with _CACHE_LOCK:
+                _CACHE_FLIGHT_STATS['stale_served'] += 1
+            g._cache_stale = True
+            _note_cache_version(key, ts)
+            return stale
+        led[key] = flight
+        return None
+    with _CACHE_LOCK:
+        _CACHE_FLIGHT_STATS['waits'] += 1
+    if not flight.event.wait(policy['wait_timeout']):
+        with _CACHE_LOCK:
+            _CACHE_FLIGHT_STATS['wait_timeouts'] += 1
+        return None
+    seen_ts = ts
+    with _CACHE_LOCK:
+        ts, data = _split(peek())
+        # Anything the leader published counts, even if its build outlasted the TTL
+        if ts is not None and (ts != seen_ts or time.time() - ts <= ttl_seconds):
+            _CACHE_FLIGHT_STATS['wait_hits'] += 1
+            _note_cache_version(key, ts)
+            return data
+    # Leader finished without publishing (error path): compute independently
+    return None
+
+def _cache_spawn_refresh(key: str, flight: '_CacheFlight') -> bool:
+    """Re-run the current GET request in a background thread as the leader of flight."""
+    try:
+        if request.method != 'GET':
+            return False
+        path, query = request.path, request.query_string
+        view = app.view_functions[request.endpoint]
+        view_args = dict(request.view_args or {})
+    except Exception:
+        return False
+
+    def _refresh():
+        try:
+            with app.test_request_context(path, query_string=query):
+                _cache_led_flights()[key] = flight
+                view(**view_args)
+        except Exception:
+            with _CACHE_LOCK:
+                _CACHE_FLIGHT_STATS['bg_refresh_errors'] += 1
+        finally:
+            _cache_flight_finish(key, flight)
+
+    try:
+        threading.Thread(target=_refresh, name='cache-refresh', daemon=True).start()
+    except Exception:
+        return False
+    with _CACHE_LOCK:
+        _CACHE_FLIGHT_STATS['bg_refreshes'] += 1
+    return True
+
+# Hot, expensive endpoints (per-endpoint mode can be overridden via CACHE_MODE_<NAME>)
+cache_policy('today_games', mode='swr', stale_ttl=60.0)
+cache_policy('today_games_quick', mode='swr', stale_ttl=300.0)
+cache_policy('live_status', mode='wait', wait_timeout=10.0)
+cache_policy('pitcher_props_unified', mode='wait', stale_ttl=120.0, wait_timeout=30.0)
+
+def cache_flight_stats() -> dict:
+    with _CACHE_LOCK:
+        return {
+            **_CACHE_FLIGHT_STATS,
+            'in_flight': len(_CACHE_FLIGHTS),
+            'backend': _CACHE_BACKEND.stats(),
+            'encoded': {**_ENCODED_STATS, 'entries': len(_ENCODED_RESPONSES), 'max_bytes': _ENCODED_MAX_BYTES},
+            'policies': {k: dict(v) for k, v in _CACHE_POLICIES.items()},
+        }
+
 # -------------------------------------------------------------
 # Optional compression (smaller payloads -> faster loads)
 # -------------------------------------------------------------
@@ -141,12 +448,11 @@ logger = setup_safe_logging()
 # ---------------------------------------------
 # Small JSON file helper
 # ---------------------------------------------
+from json_doc_cache import get_doc_cache, load_json_doc
+
 def _read_json_safe(path: str):
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return None
+    """Parsed JSON (shared, read-only) from the process-wide doc cache; None if missing/invalid."""
+    return load_json_doc(path)
 
 
 # -------------------------------------------------------------
@@ -157,24 +463,17 @@ def _read_json_safe(path: str):
 _PROCESS_START_TS = time.time()
 _PROCESS_START_ISO = datetime.utcnow().isoformat()
 
-if 'PERFORMANCE_TRACKING_AVAILABLE' not in globals():
-    PERFORMANCE_TRACKING_AVAILABLE = False
+# In-memory timing registry (per-endpoint/stage latency histograms, see performance_tracking)
+from performance_tracking import (time_operation, get_timing_registry, parse_server_timing,
+                                  server_timing_name, RequestProfiler, StageTimer)
+_PERF = get_timing_registry()
+PERFORMANCE_TRACKING_AVAILABLE = True
+
 if 'redesigned_analytics' not in globals():
     redesigned_analytics = None
 if 'enhanced_analytics' not in globals():
     enhanced_analytics = None
 
-if 'time_operation' not in globals():
-    from contextlib import contextmanager
-    @contextmanager
-    def time_operation(label: str):  # type: ignore
-        start = time.time()
-        try:
-            yield
-        finally:
-            dur = (time.time() - start)*1000
-            logger.info(f"[time_operation] {label} took {dur:.1f} ms")
-
 if 'get_live_status_with_timeout' not in globals():
     def get_live_status_with_timeout(away_team, home_team, date_param):  # type: ignore
         return None
@@ -310,6 +609,49 @@ except Exception:
 def _start_timer():
     try:
         g._request_start_ts = time.time()
+        _PERF.begin_request()
+        if request.args.get('profile') and _profiling_allowed():
+            prof = RequestProfiler('pyinstrument' if request.args.get('profile') == 'pyinstrument' else 'cprofile')
+            g._profiler = prof if prof.start() else None
+            g._profile_busy = g._profiler is None
+    except Exception:
+        pass
+
+def _profiling_allowed():
+    """?profile=1 needs env PERF_PROFILE=1 and, when ADMIN_TOKEN is set, a matching X-Admin-Token header"""
+    if os.environ.get('PERF_PROFILE', '').lower() not in ('1', 'true', 'yes'):
+        return False
+    admin_token = os.environ.get('ADMIN_TOKEN')
+    return not admin_token or request.headers.get('X-Admin-Token') == admin_token
+
+def _record_request_timings(response, dur_ms):
+    """Feed the request and its Server-Timing stages into the timing registry; returns the
+    header value with stages collected from time_operation blocks appended."""
+    header = response.headers.get('Server-Timing')
+    collected = _PERF.end_request()
+    if collected:
+        extra = ', '.join(f"{server_timing_name(n)};dur={ms:.1f}" for n, ms in collected)
+        header = f"{header}, {extra}" if header else extra
+    endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    _PERF.record(endpoint, dur_ms, 'endpoint', error=response.status_code >= 500)
+    for name, ms in parse_server_timing(header):
+        if name not in ('app', 'total'):
+            _PERF.record(f"{endpoint} {name}", ms, 'stage')
+    return header
+
+# Close any cache flights this request led but did not publish (errors, early returns)
+@app.teardown_request
+def _release_cache_flights(exc=None):
+    try:
+        flights = g.pop('_cache_flights', None)
+        for key, flight in (flights or {}).items():
+            _cache_flight_finish(key, flight)
+    except Exception:
+        pass
+    try:
+        prof = g.pop('_profiler', None)  # normally stopped by the after_request hook
+        if prof is not None:
+            prof.stop()
     except Exception:
         pass
 
@@ -324,7 +666,8 @@ def _add_no_cache_headers(response):
     try:
         p = request.path or ''
         if p.startswith('/api/pitcher-props') or p.startswith('/api/live-status') or p.startswith('/api/today-games'):
-            response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
+            # Revalidate on every use (ETag / If-None-Match -> 304) rather than refetch whole bodies
+            response.headers['Cache-Control'] = 'no-cache, must-revalidate, max-age=0'
             response.headers['Pragma'] = 'no-cache'
             response.headers['Expires'] = '0'
         elif p.startswith('/static/'):
@@ -332,19 +675,35 @@ def _add_no_cache_headers(response):
             response.headers['Cache-Control'] = 'public, max-age=2592000, immutable'  # 30 days
             response.headers.pop('Pragma', None)
             response.headers.pop('Expires', None)
+        if getattr(g, '_cache_stale', False):
+            response.headers['X-Cache-Stale'] = '1'
         # Attach timing headers for observability
         try:
             start = getattr(g, '_request_start_ts', None)
             if start:
                 dur_ms = max(0.0, (time.time() - start) * 1000.0)
                 # Standard Server-Timing header
-                prev = response.headers.get('Server-Timing')
+                prev = _record_request_timings(response, dur_ms)
                 metric = f"app;dur={dur_ms:.1f}"
                 response.headers['Server-Timing'] = (f"{prev}, {metric}" if prev else metric)
                 # X-Response-Time for easy inspection
                 response.headers['X-Response-Time'] = f"{dur_ms:.1f}ms"
         except Exception:
             pass
+        # ?profile=1: replace the body with the request's profile
+        if getattr(g, '_profile_busy', False):
+            response.headers['X-Profile'] = 'busy'
+        prof = g.pop('_profiler', None)
+        if prof is not None:
+            report = prof.stop()
+            if not response.is_streamed:
+                response.headers['X-Profile-Original-Status'] = str(response.status_code)
+                response.headers['X-Profile'] = prof.engine
+                for h in ('Content-Encoding', 'ETag', 'Last-Modified', 'Vary'):
+                    response.headers.pop(h, None)
+                response.status_code = 200
+                response.mimetype = 'text/plain'
+                response.set_data(report)
     except Exception:
         pass
     return response
@@ -357,6 +716,25 @@ try:
 except NameError:
     pass
 
+# Conditional GET for every other JSON API response: strong ETag from the body, 304 when unchanged.
+# Registered after compression so it runs first (after_request handlers run in reverse) and hashes
+# the identity body. Cached endpoints tag responses themselves via conditional_json().
+@app.after_request
+def _add_json_etag(response):
+    try:
+        if (request.method in ('GET', 'HEAD') and response.status_code == 200
+                and not response.direct_passthrough and not response.is_streamed
+                and response.mimetype == 'application/json' and (request.path or '').startswith('/api/')
+                and 'ETag' not in response.headers and 'Content-Encoding' not in response.headers):
+            response.add_etag()
+            etag = response.get_etag()[0]
+            if _etag_matches(etag):
+                response.status_code = 304
+                response.set_data(b'')
+    except Exception:
+        pass
+    return response
+
 print("DEBUG: Flask app successfully created - all routes will now register properly")
 
 print("DEBUG: Successfully defined Flask app")
@@ -389,6 +767,9 @@ def _warm_caches_async():
                 # tiny delay to ensure server fully initialized
                 time.sleep(1.5)
                 date_str = get_business_date()
+                # With a shared cache backend one worker warms for all of them
+                if _CACHE_BACKEND.shared and not _CACHE_BACKEND.add(f'warm|{date_str}', os.getpid(), ttl=120):
+                    return
                 # Warm unified (strict today, skip projection-only)
                 with app.test_request_context(f"/api/pitcher-props/unified?strict_today=1&include_noline=0&date={date_str}"):
                     try:
@@ -626,8 +1007,7 @@ def healthz():
     try:
         # Basic checks: routes registered, key data file present
         routes_count = len(list(app.url_map.iter_rules()))
-        data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'unified_predictions_cache.json')
-        data_exists = os.path.exists(data_path)
+        data_exists = bool(_unified_store().dates())
         resp = {
             'ok': True,
             'routes': routes_count,
@@ -702,6 +1082,63 @@ def api_diag():
         except Exception:
             pass
 
+        # Engine data store (master_games / park-weather) hit/miss counters
+        engine_data = None
+        try:
+            from engines.engine_data import engine_data_stats
+            engine_data = engine_data_stats()
+        except Exception:
+            pass
+
+        # Shared JSON document cache (per-path hit/miss/parse time)
+        json_doc_stats = None
+        try:
+            json_doc_stats = get_doc_cache().stats()
+        except Exception:
+            pass
+
+        # Date-sharded unified predictions store counters
+        unified_store_stats = None
+        try:
+            unified_store_stats = _unified_store().stats()
+        except Exception:
+            pass
+
+        # Precomputed today-games artifacts
+        artifact_stats = None
+        try:
+            artifact_stats = _TODAY_GAMES_ARTIFACTS.stats()
+        except Exception:
+            pass
+        http_stats = None
+        try:
+            from http_client import get_http_client
+            http_stats = get_http_client().stats()
+        except Exception:
+            pass
+        live_feed_stats = None
+        try:
+            from live_mlb_data import get_live_mlb_data
+            live_feed_stats = get_live_mlb_data().poller_stats()
+            from live_game_state import get_live_game_tracker
+            live_feed_stats['tracker'] = get_live_game_tracker().stats()
+        except Exception:
+            pass
+
+        # Endpoint latency percentiles from the timing registry (stages: /api/monitoring/performance)
+        timing_stats = None
+        try:
+            timing_stats = {**_PERF.stats(), 'endpoints': _PERF.snapshot('endpoint').get('endpoint', {})}
+        except Exception:
+            pass
+
+        # Response cache single-flight counters
+        response_cache_stats = None
+        try:
+            response_cache_stats = cache_flight_stats()
+        except Exception:
+            pass
+
         # Environment flags
         env = {
             'is_render': bool(os.environ.get('RENDER') or os.environ.get('RENDER_SERVICE_ID')),
@@ -719,7 +1156,15 @@ def api_diag():
                 'home_snapshot_age_s': home_snap_age,
                 'unified_recs_age_s': unified_recs_age,
                 'unified_recs_count_hint': unified_recs_count,
+                'engine_data': engine_data,
+                'unified_predictions': unified_store_stats,
+                'json_docs': json_doc_stats,
+                'response_cache': response_cache_stats,
+                'today_games_artifacts': artifact_stats,
             },
+            'http': http_stats,
+            'live_feeds': live_feed_stats,
+            'timings': timing_stats,
             'last_warm': last_warm_summary,
             'ts': datetime.utcnow().isoformat(),
             'env': env
@@ -1286,16 +1731,7 @@ class TBDMonitor:
         """Get list of games that currently have TBD pitchers"""
         try:
             current_date = get_business_date()
-            cache_path = 'data/unified_predictions_cache.json'
-            
-            if not os.path.exists(cache_path):
-                logger.warning(f"Cache file not found: {cache_path}")
-                return set()
-                
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
-            
-            today_data = data.get('predictions_by_date', {}).get(current_date, {})
+            today_data = load_unified_day(current_date)
             if 'games' not in today_data:
                 logger.warning(f"No games found for {current_date}")
                 return set()
@@ -1480,7 +1916,28 @@ def normalize_team_name(team_name):
 # Global cache for unified cache to avoid repeated file loading
 _unified_cache = None
 _unified_cache_time = None
-UNIFIED_CACHE_DURATION = 60  # 1 minute
+
+# Unified pitcher props payloads per date ({'ts', 'payload'}); full and true-light views
+_UNIFIED_PITCHER_CACHE = _CACHE_BACKEND.namespace('unified_pitcher', ttl=6 * 3600)
+_UNIFIED_PITCHER_CACHE_LIGHT = _CACHE_BACKEND.namespace('unified_pitcher_light', ttl=6 * 3600)
+# Projection memo shared across workers ('<date>|<pitcher>|<opp>|<lines fp>'); per-process LRU in _PROJ_MEMO
+_PROJ_MEMO_SHARED = _CACHE_BACKEND.namespace('proj', ttl=6 * 3600)
+# Process-level snapshots (home snapshot, unified recs) published for other workers
+_SHARED_SNAPSHOTS = _CACHE_BACKEND.namespace('snapshot', ttl=3600)
+
+def _shared_snapshot_get(name: str, max_age: float):
+    """(ts, value) of a snapshot another worker published within max_age seconds.
+    Always None with the per-process memory backend (the module globals already hold it)."""
+    if not _CACHE_BACKEND.shared:
+        return None
+    entry = _SHARED_SNAPSHOTS.get_entry(name)
+    if entry and time.time() - entry[0] < max_age:
+        return entry
+    return None
+
+def _shared_snapshot_put(name: str, value, ts: float = None):
+    if _CACHE_BACKEND.shared:
+        _SHARED_SNAPSHOTS.put(name, value, ts=ts)
 
 # Lightweight home snapshot cache to speed up initial page load
 _HOME_SNAPSHOT = None  # type: ignore[var-annotated]
@@ -1494,9 +1951,7 @@ def _get_quick_predictions_for_date(date_str: str) -> list:
     Returns a list of dicts with minimal fields needed to render quick cards.
     """
     try:
-        uc = load_unified_cache()
-        predictions_by_date = uc.get('predictions_by_date', {}) if isinstance(uc, dict) else {}
-        day = predictions_by_date.get(date_str, {}) if isinstance(predictions_by_date, dict) else {}
+        day = load_unified_day(date_str)
         games_dict = day.get('games', {}) if isinstance(day, dict) else {}
         out = []
         for gk, gd in (games_dict.items() if isinstance(games_dict, dict) else []):
@@ -1551,8 +2006,7 @@ def _load_daily_games_minimal(date_param: str) -> list:
         for p in candidates:
             if os.path.exists(p):
                 try:
-                    with open(p, 'r', encoding='utf-8') as f:
-                        loaded = json.load(f)
+                    loaded = load_json_doc(p)
                     if isinstance(loaded, list):
                         games_list = loaded
                     elif isinstance(loaded, dict) and 'games' in loaded:
@@ -1611,9 +2065,7 @@ def _build_home_snapshot() -> dict:
     """
     try:
         date_today = get_business_date()
-        uc = load_unified_cache()
-        predictions_by_date = uc.get('predictions_by_date', {}) if isinstance(uc, dict) else {}
-        today = predictions_by_date.get(date_today, {}) if isinstance(predictions_by_date, dict) else {}
+        today = load_unified_day(date_today)
         games_dict = today.get('games', {}) if isinstance(today, dict) else {}
 
         predictions_list = []
@@ -1703,6 +2155,10 @@ def _get_home_snapshot_fast() -> dict:
     # If we have a fresh snapshot, use it
     if _HOME_SNAPSHOT and (now - _HOME_SNAPSHOT_TS < HOME_SNAPSHOT_TTL):
         return _HOME_SNAPSHOT
+    shared = _shared_snapshot_get('home', HOME_SNAPSHOT_TTL)
+    if shared:
+        _HOME_SNAPSHOT_TS, _HOME_SNAPSHOT = shared
+        return _HOME_SNAPSHOT
     # Otherwise, return a minimal skeleton immediately and build in background
     minimal = {
         'date': get_business_date(),
@@ -1720,6 +2176,7 @@ def _get_home_snapshot_fast() -> dict:
                 snap = _build_home_snapshot()
                 _HOME_SNAPSHOT = snap
                 _HOME_SNAPSHOT_TS = time.time()
+                _shared_snapshot_put('home', snap, _HOME_SNAPSHOT_TS)
             except Exception:
                 pass
             finally:
@@ -1735,65 +2192,68 @@ def _get_home_snapshot(force_rebuild: bool = False) -> dict:
     now = time.time()
     if (not force_rebuild) and _HOME_SNAPSHOT and (now - _HOME_SNAPSHOT_TS < HOME_SNAPSHOT_TTL):
         return _HOME_SNAPSHOT
+    if not force_rebuild:
+        shared = _shared_snapshot_get('home', HOME_SNAPSHOT_TTL)
+        if shared:
+            _HOME_SNAPSHOT_TS, _HOME_SNAPSHOT = shared
+            return _HOME_SNAPSHOT
     # Rebuild in current thread (home API can opt to background this)
     snap = _build_home_snapshot()
     _HOME_SNAPSHOT = snap
     _HOME_SNAPSHOT_TS = now
+    _shared_snapshot_put('home', snap, now)
     return snap
 
+def _unified_store():
+    from unified_predictions_store import get_unified_predictions_store
+    return get_unified_predictions_store(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+
+def load_unified_day(date_str: str) -> dict:
+    """One date's unified predictions doc ({'games': {...}, ...}) from its shard; {} when missing.
+    Prefer this over load_unified_cache() when only a single date is needed."""
+    try:
+        doc = _unified_store().get_date(date_str)
+        return doc if isinstance(doc, dict) else {}
+    except Exception as e:
+        logger.warning(f"Unified predictions shard unavailable for {date_str}: {e}")
+        return {}
+
 def load_unified_cache():
-    """Load our archaeological treasure - the unified predictions cache with caching"""
+    """Load the unified predictions cache ({'predictions_by_date': {...}}).
+    Assembled from the per-date shards and revalidated on every call (one stat per shard);
+    only shards whose file changed are re-parsed. The returned doc is shared: read-only."""
     global _unified_cache, _unified_cache_time
     
-    # Check if we have a valid cache
-    current_time = time.time()
-    if (_unified_cache is not None and 
-        _unified_cache_time is not None and 
-        current_time - _unified_cache_time < UNIFIED_CACHE_DURATION):
-        return _unified_cache
-
-    # Get the directory where app.py is located
-    app_dir = os.path.dirname(os.path.abspath(__file__))
-    logger.info(f"🔍 App directory: {app_dir}")
-    
-    # Try data directory first (the correct one)
-    cache_path = os.path.join(app_dir, 'data', 'unified_predictions_cache.json')
-    logger.info(f"🔍 Trying cache path: {cache_path}")
-    logger.info(f"🔍 Cache file exists: {os.path.exists(cache_path)}")
-    
-    if not os.path.exists(cache_path):
-        # Fallback to relative path
-        cache_path = 'data/unified_predictions_cache.json'
-        logger.info(f"🔍 Fallback cache path: {cache_path}")
-        logger.info(f"🔍 Fallback cache exists: {os.path.exists(cache_path)}")
-    
-    try:
-        with open(cache_path, 'r') as f:
-            data = json.load(f)
-            logger.info(f"🔄 FRESH RELOAD: Loaded unified cache from {cache_path} with {len(data)} entries")
-            
-            # Log today's data availability
-            today = get_business_date()
-            predictions_by_date = data.get('predictions_by_date', {})
-            today_data = predictions_by_date.get(today, {})
-            games_count = len(today_data.get('games', {}))
-            logger.info(f"🎯 Today's games in cache: {games_count}")
-            
-            # Cache the result
-            _unified_cache = data
-            _unified_cache_time = current_time
-            return data
-    except FileNotFoundError:
-        logger.error(f"❌ CRITICAL: Unified cache not found at {cache_path}")
-        raise FileNotFoundError(f"Real data cache not found at {cache_path}. No fake data fallback available.")
-    except json.JSONDecodeError as e:
-        logger.error(f"❌ CRITICAL: Error parsing unified cache: {e}")
-        raise json.JSONDecodeError(f"Invalid unified cache data: {e}")
+    store = _unified_store()
+    data = store.load_all()
+    if not data.get('predictions_by_date') and not os.path.exists(store.legacy_path):
+        logger.error(f"❌ CRITICAL: Unified predictions not found in {store.shard_dir}")
+        raise FileNotFoundError(f"Real data cache not found at {store.shard_dir}. No fake data fallback available.")
+    if data is not _unified_cache:
+        _unified_cache = data
+        _unified_cache_time = time.time()
+    return data
 
 # --- Performance helpers for latency-sensitive endpoints (today-games) ---
 _LIVE_GAMES_CACHE = {}
 _LIVE_GAMES_CACHE_TS = {}
 
+# Diffed live game state pushed over SSE, fed by the LiveMLBData poller (see live_game_state.py)
+try:
+    from live_mlb_data import get_live_mlb_data as _get_live_mlb_data
+    from live_game_state import get_live_game_tracker
+    get_live_game_tracker().attach(_get_live_mlb_data())
+except Exception as _e:
+    logger.warning(f"Live game tracker unavailable: {_e}")
+
+def _live_game_snapshot(date_str: str):
+    """Poller-maintained {'games', 'pitchers'} state for date, or None when it is not being kept fresh."""
+    try:
+        from live_game_state import get_live_game_tracker
+        return get_live_game_tracker().snapshot(date_str)
+    except Exception:
+        return None
+
 def _get_live_games_cached(date_str: str, ttl_seconds: int = 30):
     """Fetch live/schedule games for a date with a short in-process cache to avoid repeated network calls."""
     try:
@@ -1801,8 +2261,8 @@ def _get_live_games_cached(date_str: str, ttl_seconds: int = 30):
         ts = _LIVE_GAMES_CACHE_TS.get(date_str)
         if date_str in _LIVE_GAMES_CACHE and ts and (now - ts < ttl_seconds):
             return _LIVE_GAMES_CACHE[date_str]
-        from live_mlb_data import LiveMLBData
-        mlb_api = LiveMLBData()
+        from live_mlb_data import get_live_mlb_data
+        mlb_api = get_live_mlb_data()
         games = mlb_api.get_enhanced_games_data(date_str)
         _LIVE_GAMES_CACHE[date_str] = games
         _LIVE_GAMES_CACHE_TS[date_str] = now
@@ -1811,6 +2271,27 @@ def _get_live_games_cached(date_str: str, ttl_seconds: int = 30):
         logger.warning(f"_get_live_games_cached failed for {date_str}: {e}")
         return []
 
+_LIVE_GAMES_REFRESHING = set()
+
+def _get_live_games_nowait(date_str: str, ttl_seconds: int = 30):
+    """Like _get_live_games_cached, but once a date has been fetched never blocks on the network:
+    a stale list is returned while a background thread refreshes it."""
+    if date_str not in _LIVE_GAMES_CACHE:
+        return _get_live_games_cached(date_str, ttl_seconds)
+    ts = _LIVE_GAMES_CACHE_TS.get(date_str) or 0
+    if time.time() - ts >= ttl_seconds and date_str not in _LIVE_GAMES_REFRESHING:
+        _LIVE_GAMES_REFRESHING.add(date_str)
+        def _refresh():
+            try:
+                _get_live_games_cached(date_str, ttl_seconds)
+            finally:
+                _LIVE_GAMES_REFRESHING.discard(date_str)
+        try:
+            threading.Thread(target=_refresh, daemon=True).start()
+        except Exception:
+            _LIVE_GAMES_REFRESHING.discard(date_str)
+    return _LIVE_GAMES_CACHE.get(date_str) or []
+
 def _get_unified_betting_recs_with_timeout(timeout_sec: float = 2.5) -> dict:
     """Call get_app_betting_recommendations with a soft timeout to keep /api/today-games responsive.
     Returns only the raw unified recommendations dict; empty dict on timeout/error.
@@ -1849,6 +2330,10 @@ def _get_unified_betting_recs_cached(timeout_sec: float = 2.5, start_background_
         # Serve fresh cache if available
         if _UNIFIED_RECS_CACHE is not None and (now - _UNIFIED_RECS_TS) < UNIFIED_RECS_TTL_SECONDS:
             return _UNIFIED_RECS_CACHE
+        shared = _shared_snapshot_get('unified_recs', UNIFIED_RECS_TTL_SECONDS)
+        if shared:
+            _UNIFIED_RECS_TS, _UNIFIED_RECS_CACHE = shared
+            return _UNIFIED_RECS_CACHE
 
         result_box = {'data': None}
         done = threading.Event()
@@ -1870,6 +2355,8 @@ def _get_unified_betting_recs_cached(timeout_sec: float = 2.5, start_background_
                     # assign
                     globals()['_UNIFIED_RECS_CACHE'] = _cache
                     globals()['_UNIFIED_RECS_TS'] = ts_now
+                    if _cache:
+                        _shared_snapshot_put('unified_recs', _cache, ts_now)
                 except Exception as ce:
                     logger.debug(f"unified recs cache store skipped: {ce}")
             except Exception as _e:
@@ -1893,6 +2380,8 @@ def _get_unified_betting_recs_cached(timeout_sec: float = 2.5, start_background_
             data = _compute_unified_betting_recs()
             _UNIFIED_RECS_CACHE = data or {}
             _UNIFIED_RECS_TS = time.time()
+            if _UNIFIED_RECS_CACHE:
+                _shared_snapshot_put('unified_recs', _UNIFIED_RECS_CACHE, _UNIFIED_RECS_TS)
             return _UNIFIED_RECS_CACHE
     except Exception as e:
         logger.warning(f"_get_unified_betting_recs_cached failed: {e}")
@@ -1992,23 +2481,35 @@ def extract_real_total_line(real_lines, game_key="Unknown"):
 # Global cache for betting lines to avoid repeated file loading
 _betting_lines_cache = None
 _betting_lines_cache_time = None
-BETTING_LINES_CACHE_DURATION = 300  # 5 minutes
 _betting_lines_norm_index = None  # maps (norm_away, norm_home) -> lines doc
 _betting_lines_norm_index_time = None
+_betting_lines_norm_index_src = None  # lines doc the index was built from
 
 def load_real_betting_lines():
-    """Load real betting lines from historical cache with caching"""
+    """Load real betting lines: latest real_betting_lines_* file, else the historical cache.
+    Files are parsed once per version through the shared JSON doc cache."""
     global _betting_lines_cache, _betting_lines_cache_time, _betting_lines_norm_index, _betting_lines_norm_index_time
     
-    # Check if we have a valid cache
+    doc_cache = get_doc_cache()
     current_time = time.time()
-    if (_betting_lines_cache is not None and 
-        _betting_lines_cache_time is not None and 
-        current_time - _betting_lines_cache_time < BETTING_LINES_CACHE_DURATION):
-        return _betting_lines_cache
-    
     today = get_business_date()
     
+    def _use(data, path):
+        global _betting_lines_cache, _betting_lines_cache_time, _betting_lines_norm_index, _betting_lines_norm_index_time, _betting_lines_norm_index_src
+        if data is not _betting_lines_cache:
+            logger.info(f"Loaded real betting lines from {path}")
+            # Cache the result and build normalized index for robust lookups
+            _betting_lines_cache = data
+            _betting_lines_cache_time = current_time
+            try:
+                _betting_lines_norm_index = _build_betting_lines_norm_index(data)
+                _betting_lines_norm_index_time = current_time
+                _betting_lines_norm_index_src = data
+            except Exception:
+                _betting_lines_norm_index = None
+                _betting_lines_norm_index_time = None
+        return data
+    
     # First try the real_betting_lines files (correct format and data)
     dates_to_try = [
         today.replace('-', '_'),  # Convert 2025-08-19 to 2025_08_19
@@ -2019,23 +2520,10 @@ def load_real_betting_lines():
     
     for date_str in dates_to_try:
         lines_path = f'data/real_betting_lines_{date_str}.json'
-        try:
-            with open(lines_path, 'r') as f:
-                data = json.load(f)
-                logger.info(f"Loaded real betting lines from {lines_path}")
-                # Cache the result and build normalized index for robust lookups
-                _betting_lines_cache = data
-                _betting_lines_cache_time = current_time
-                try:
-                    _betting_lines_norm_index = _build_betting_lines_norm_index(data)
-                    _betting_lines_norm_index_time = current_time
-                except Exception:
-                    _betting_lines_norm_index = None
-                    _betting_lines_norm_index_time = None
-                return data
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.warning(f"Could not load from {lines_path}: {e}")
-            continue
+        data = doc_cache.load(lines_path)
+        if data is not None:
+            return _use(data, lines_path)
+        logger.debug(f"No real betting lines at {lines_path}")
     
     # Fallback to historical_betting_lines_cache.json in data directory
     historical_paths = [
@@ -2043,53 +2531,34 @@ def load_real_betting_lines():
     ]
     
     for historical_path in historical_paths:
-        try:
-            with open(historical_path, 'r') as f:
-                historical_data = json.load(f)
-                
-            if today in historical_data:
-                logger.info(f"Loaded real betting lines from {historical_path} for {today}")
-                # Transform the data to match expected structure
-                result = {
-                    "lines": {},  # Will be populated below
-                    "historical_data": historical_data[today],  # This is the game_id-indexed data
-                    "source": "historical_cache",
-                    "date": today,
-                    "last_updated": datetime.now().isoformat()
-                }
-                # Cache the result and build normalized index
-                _betting_lines_cache = result
-                _betting_lines_cache_time = current_time
-                try:
-                    _betting_lines_norm_index = _build_betting_lines_norm_index(result)
-                    _betting_lines_norm_index_time = current_time
-                except Exception:
-                    _betting_lines_norm_index = None
-                    _betting_lines_norm_index_time = None
-                return result
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.warning(f"Could not load from {historical_path}: {e}")
-            continue
+        historical_data = doc_cache.load(historical_path)
+        if isinstance(historical_data, dict) and today in historical_data:
+            # Transform the data to match expected structure (once per file version)
+            result = doc_cache.derive(historical_path, f'lines:{today}', lambda doc: {
+                "lines": {},  # Will be populated below
+                "historical_data": doc[today],  # This is the game_id-indexed data
+                "source": "historical_cache",
+                "date": today,
+                "last_updated": datetime.now().isoformat()
+            })
+            return _use(result, f"{historical_path} for {today}")
     
     # No real betting lines found after trying all fallbacks
-    logger.warning(f"⚠️ No real betting lines found for recent dates - using empty fallback")
-    
-    # Return empty structure instead of raising an exception
-    fallback_result = {
-        "lines": {},
-        "historical_data": {},
-        "source": "empty_fallback",
-        "date": today,
-        "last_updated": datetime.now().isoformat(),
-        "error": "No betting lines data available"
-    }
-    
-    # Cache the fallback result
-    _betting_lines_cache = fallback_result
-    _betting_lines_cache_time = current_time
-    _betting_lines_norm_index = None
-    _betting_lines_norm_index_time = current_time
-    return fallback_result
+    if not (isinstance(_betting_lines_cache, dict) and _betting_lines_cache.get('source') == 'empty_fallback'
+            and _betting_lines_cache.get('date') == today):
+        logger.warning(f"⚠️ No real betting lines found for recent dates - using empty fallback")
+        _betting_lines_cache = {
+            "lines": {},
+            "historical_data": {},
+            "source": "empty_fallback",
+            "date": today,
+            "last_updated": datetime.now().isoformat(),
+            "error": "No betting lines data available"
+        }
+        _betting_lines_cache_time = current_time
+        _betting_lines_norm_index = None
+        _betting_lines_norm_index_time = current_time
+    return _betting_lines_cache
 
 def _build_betting_lines_norm_index(real_betting_lines_doc: dict):
     """Build a normalized index for betting lines keyed by (norm_away, norm_home).
@@ -2124,12 +2593,13 @@ def get_lines_for_matchup(away_team: str, home_team: str, real_betting_lines_doc
         if direct_key in lines:
             return lines[direct_key]
     # Fallback to normalized index
-    global _betting_lines_norm_index, _betting_lines_norm_index_time
+    global _betting_lines_norm_index, _betting_lines_norm_index_time, _betting_lines_norm_index_src
     try:
-        now_ts = time.time()
-        if _betting_lines_norm_index is None or (_betting_lines_norm_index_time is None or now_ts - _betting_lines_norm_index_time > BETTING_LINES_CACHE_DURATION):
+        # Rebuild only when asked about a different lines document than the one indexed
+        if _betting_lines_norm_index is None or _betting_lines_norm_index_src is not real_betting_lines_doc:
             _betting_lines_norm_index = _build_betting_lines_norm_index(real_betting_lines_doc)
-            _betting_lines_norm_index_time = now_ts
+            _betting_lines_norm_index_time = time.time()
+            _betting_lines_norm_index_src = real_betting_lines_doc
         norm_key = (normalize_team_name(away_team), normalize_team_name(home_team))
         match = _betting_lines_norm_index.get(norm_key)
         if match:
@@ -3690,11 +4160,9 @@ def pitcher_props_page_underscore():
 def _load_bovada_pitcher_props(date_str: str) -> Dict[str, Any]:
     """Load Bovada pitcher props for the given date (if available). Keys are lowercased pitcher names."""
     try:
-        date_us = date_str.replace('-', '_')
-        path = os.path.join('data', 'daily_bovada', f'bovada_pitcher_props_{date_us}.json')
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        from snapshot_store import get_snapshot_store
+        data = get_snapshot_store().get('props', date_str)
+        if isinstance(data, dict):
             props = data.get('pitcher_props', {}) or {}
             # Normalize keys (accent-insensitive)
             result = {}
@@ -3709,35 +4177,50 @@ def _load_bovada_pitcher_props(date_str: str) -> Dict[str, Any]:
         logger.warning(f"Could not load Bovada pitcher props for {date_str}: {e}")
     return {}
 
+def _build_master_pitcher_index(data) -> Dict[str, Dict[str, Any]]:
+    # Support both flat and nested structures
+    if isinstance(data, dict) and 'pitcher_data' in data:
+        data = data['pitcher_data']
+    elif isinstance(data, dict) and 'refresh_info' in data and 'pitcher_data' in data['refresh_info']:
+        data = data['refresh_info']['pitcher_data']
+    # Build lookup by lowercase and accent-insensitive name
+    by_name = {}
+    if isinstance(data, dict):
+        for pid, p in data.items():
+            name = str(p.get('name', '')).strip()
+            if name:
+                key_lc = name.lower()
+                key_norm = normalize_name(name)
+                by_name[key_lc] = p
+                if key_norm and key_norm != key_lc:
+                    by_name[key_norm] = p
+    return by_name
+
 def _load_master_pitcher_stats() -> Dict[str, Dict[str, Any]]:
-    """Load master pitcher stats (by name lowercase)."""
+    """Load master pitcher stats (by name lowercase). The index is rebuilt only when the file changes
+    and is shared between callers (read-only)."""
     try:
         path = os.path.join('data', 'master_pitcher_stats.json')
         if not os.path.exists(path):
             raise FileNotFoundError(path)
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        # Support both flat and nested structures
-        if isinstance(data, dict) and 'pitcher_data' in data:
-            data = data['pitcher_data']
-        elif isinstance(data, dict) and 'refresh_info' in data and 'pitcher_data' in data['refresh_info']:
-            data = data['refresh_info']['pitcher_data']
-        # Build lookup by lowercase and accent-insensitive name
-        by_name = {}
-        if isinstance(data, dict):
-            for pid, p in data.items():
-                name = str(p.get('name', '')).strip()
-                if name:
-                    key_lc = name.lower()
-                    key_norm = normalize_name(name)
-                    by_name[key_lc] = p
-                    if key_norm and key_norm != key_lc:
-                        by_name[key_norm] = p
-        return by_name
+        return get_doc_cache().derive(path, 'by_name', _build_master_pitcher_index, {})
     except Exception as e:
         logger.warning(f"Could not load master pitcher stats: {e}")
         return {}
 
+def _build_pitches_per_out_overrides(data) -> Dict[str, float]:
+    # Normalize keys to lowercase and accent-insensitive names
+    result = {}
+    for k, v in data.items():
+        if v is None:
+            continue
+        key_lc = str(k).strip().lower()
+        key_norm = normalize_name(k)
+        result[key_lc] = float(v)
+        if key_norm and key_norm != key_lc:
+            result[key_norm] = float(v)
+    return result
+
 def _load_pitches_per_out_overrides() -> Dict[str, float]:
     """Optionally load per-pitcher pitches-per-out calibration if present."""
     candidates = [
@@ -3747,19 +4230,7 @@ def _load_pitches_per_out_overrides() -> Dict[str, float]:
     for path in candidates:
         try:
             if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                # Normalize keys to lowercase and accent-insensitive names
-                result = {}
-                for k, v in data.items():
-                    if v is None:
-                        continue
-                    key_lc = str(k).strip().lower()
-                    key_norm = normalize_name(k)
-                    result[key_lc] = float(v)
-                    if key_norm and key_norm != key_lc:
-                        result[key_norm] = float(v)
-                return result
+                return get_doc_cache().derive(path, 'overrides', _build_pitches_per_out_overrides, {})
         except Exception as e:
             logger.warning(f"Failed loading pitches-per-out overrides from {path}: {e}")
     return {}
@@ -4031,8 +4502,8 @@ def api_pitcher_projections():
         date_str = request.args.get('date') or get_business_date()
 
         # Data sources
-        from live_mlb_data import LiveMLBData
-        mlb = LiveMLBData()
+        from live_mlb_data import get_live_mlb_data
+        mlb = get_live_mlb_data()
         games = mlb.get_enhanced_games_data(date_str) or []
 
         props = _load_bovada_pitcher_props(date_str)
@@ -4088,8 +4559,8 @@ def api_pitcher_props_recap():
         date_str = request.args.get('date') or get_business_date()
 
         # Data sources
-        from live_mlb_data import LiveMLBData
-        mlb = LiveMLBData()
+        from live_mlb_data import get_live_mlb_data
+        mlb = get_live_mlb_data()
         games = mlb.get_enhanced_games_data(date_str) or []
 
         props = _load_bovada_pitcher_props(date_str)
@@ -4212,7 +4683,6 @@ def api_pitcher_props_recap():
 # Pitcher Props Line History & Diagnostics / SSE Stream
 # -------------------------------------------------------------
 
-_PITCHER_SSE_SUBSCRIBERS = []  # simple in-memory list of queues (per connection)
 # Lightweight stats for SSE/ingest health checks
 _PITCHER_SSE_STATS = {
     'last_event_ts': None,
@@ -4224,23 +4694,11 @@ _PITCHER_SSE_STATS = {
 }
 
 def broadcast_pitcher_update(event: dict):
-    """Broadcast a pitcher prop related event to all SSE subscribers.
+    """Publish a pitcher prop related event to SSE subscribers via the fan-out hub.
     Event should be JSON-serializable. Failures are swallowed (best-effort)."""
     try:
-        import json as _json
-        dead = []
-        payload = f"data: {_json.dumps(event)}\n\n".encode('utf-8')
-        for q in list(_PITCHER_SSE_SUBSCRIBERS):
-            try:
-                q.put(payload, block=False)
-            except Exception:
-                dead.append(q)
-        if dead:
-            for d in dead:
-                try:
-                    _PITCHER_SSE_SUBSCRIBERS.remove(d)
-                except ValueError:
-                    pass
+        from sse_hub import get_sse_hub
+        get_sse_hub().publish(event)
     except Exception:
         pass
 
@@ -4248,53 +4706,44 @@ def broadcast_pitcher_update(event: dict):
 def api_pitcher_props_stream():
     """Server-Sent Events stream for real-time pitcher prop line movements / updates.
     Usage (frontend):
-      const es = new EventSource('/api/pitcher-props/stream');
+      const es = new EventSource('/api/pitcher-props/stream?date=YYYY-MM-DD&pitchers=gerrit cole');
       es.onmessage = ev => { const data = JSON.parse(ev.data); ... };
+    Optional filters: date, pitchers (comma-separated), types (comma-separated event types).
+    Reconnects resume from the Last-Event-ID header (or ?lastEventId=) via the hub's replay buffer.
     """
-    from queue import Queue, Empty
+    return _sse_stream_response('pitcher-props')
+
+@app.route('/api/live-status/stream')
+def api_live_status_stream():
+    """Server-Sent Events stream of live game changes ({"type": "game_status", "game_pk", "changes": {...}}),
+    pushed by the background live-game poller. Optional filters: date, types. Resumes via Last-Event-ID.
+    Clients load /api/live-status once and apply the changes instead of polling it."""
+    return _sse_stream_response('game-status')
+
+def _sse_stream_response(channel: str):
     from flask import Response
-    q: Queue = Queue(maxsize=1000)
-    _PITCHER_SSE_SUBSCRIBERS.append(q)
-
-    def gen():
-        # Initial hello (client can treat as heartbeat origin)
-        import json as _json
-        yield f"data: {_json.dumps({'type':'sse_hello','ts': datetime.utcnow().isoformat()})}\n\n"
-        while True:
-            try:
-                item = q.get(timeout=30)
-                yield item
-            except Empty:
-                # heartbeat keep-alive
-                yield f"data: {{\"type\": \"heartbeat\", \"ts\": \"{datetime.utcnow().isoformat()}\"}}\n\n"
-            except GeneratorExit:
-                break
-            except Exception:
-                break
-    headers = {'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache', 'Connection': 'keep-alive'}
-    return Response(gen(), headers=headers)
+    from sse_hub import get_sse_hub
+    hub = get_sse_hub(channel)
+    def _csv(name):
+        raw = request.args.get(name) or ''
+        vals = [v.strip() for v in raw.split(',') if v.strip()]
+        return vals or None
+    last_id = request.headers.get('Last-Event-ID') or request.args.get('lastEventId')
+    sub = hub.subscribe(
+        date=request.args.get('date') or None,
+        pitchers=_csv('pitchers') or _csv('pitcher'),
+        types=_csv('types'),
+        last_event_id=hub.parse_event_id(last_id),
+    )
+    headers = {'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache', 'Connection': 'keep-alive',
+               'X-Accel-Buffering': 'no'}
+    return Response(hub.stream(sub), headers=headers)
 
 # --- Relay ingest to support cross-process workers on Render ---
 def _append_pitcher_line_history(date_str: str, events: list[dict]):
     try:
-        import json as _json, os as _os
-        safe_date = (date_str or '').replace('-', '_')
-        path = _os.path.join('data', 'daily_bovada', f"pitcher_prop_line_history_{safe_date}.json")
-        _os.makedirs(_os.path.dirname(path), exist_ok=True)
-        doc = {'date': date_str, 'events': []}
-        if _os.path.exists(path):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    existing = _json.load(f)
-                if isinstance(existing, dict) and isinstance(existing.get('events'), list):
-                    doc = existing
-            except Exception:
-                pass
-        doc['events'].extend(events or [])
-        tmp = path + '.tmp'
-        with open(tmp, 'w', encoding='utf-8') as f:
-            _json.dump(doc, f, indent=2)
-        _os.replace(tmp, path)
+        from pitcher_line_history import append_line_history_events
+        append_line_history_events(date_str, events or [])
     except Exception:
         pass
 
@@ -4346,39 +4795,46 @@ def _save_realized_results_and_daily(date_str: str, outcomes: list[dict]):
         pass
 
 def _process_ingested_event(ev: dict):
-    try:
-        et = ev.get('type')
-        # Update ingest stats
-        try:
-            _PITCHER_SSE_STATS['last_event_ts'] = datetime.utcnow().isoformat()
-            _PITCHER_SSE_STATS['last_event_type'] = et
-            cbt = _PITCHER_SSE_STATS.get('counts_by_type') or {}
-            cbt[et] = int(cbt.get(et, 0)) + 1
-            _PITCHER_SSE_STATS['counts_by_type'] = cbt
-        except Exception:
-            pass
-        # Broadcast to connected SSE clients (best-effort)
+    _process_ingested_batch([ev])
+
+def _process_ingested_batch(events: list[dict]):
+    """Process relayed events: stats + SSE broadcast per event, then coalesced persistence.
+    Line events are appended once per date, outcomes merged once per date, and only the
+    latest props/recommendations snapshot per date is written."""
+    line_events_by_date: dict = {}
+    outcomes_by_date: dict = {}
+    latest_snapshots: dict = {}  # (type, date) -> doc
+    for ev in events:
         try:
-            broadcast_pitcher_update(ev)
-        except Exception:
-            pass
-        # Persist line history for initial/move
-        if et in ('line_initial','line_move'):
+            et = ev.get('type')
+            # Update ingest stats
+            try:
+                _PITCHER_SSE_STATS['last_event_ts'] = datetime.utcnow().isoformat()
+                _PITCHER_SSE_STATS['last_event_type'] = et
+                cbt = _PITCHER_SSE_STATS.get('counts_by_type') or {}
+                cbt[et] = int(cbt.get(et, 0)) + 1
+                _PITCHER_SSE_STATS['counts_by_type'] = cbt
+            except Exception:
+                pass
+            # Broadcast to connected SSE clients (best-effort)
+            try:
+                broadcast_pitcher_update(ev)
+            except Exception:
+                pass
             # Prefer explicit date provided by worker; else fallback to today
             d = ev.get('date') or get_business_date()
-            _append_pitcher_line_history(d, [ev])
-        # Persist realized outcomes batches
-        if et in ('final_outcomes_batch',):
-            d = ev.get('date') or get_business_date()
-            outcomes = ev.get('outcomes') or []
-            if isinstance(outcomes, list):
-                _save_realized_results_and_daily(d, outcomes)
-        # Persist full props snapshot so web has the latest lines file (for unified/current endpoints)
-        if et == 'props_snapshot':
-            d = ev.get('date') or get_business_date()
-            doc = ev.get('doc') or {}
-            if isinstance(doc, dict):
-                try:
+            # Persist line history for initial/move
+            if et in ('line_initial','line_move'):
+                line_events_by_date.setdefault(d, []).append(ev)
+            # Persist realized outcomes batches
+            if et in ('final_outcomes_batch',):
+                outcomes = ev.get('outcomes') or []
+                if isinstance(outcomes, list):
+                    outcomes_by_date.setdefault(d, []).extend(outcomes)
+            # Persist full props snapshot so web has the latest lines file (for unified/current endpoints)
+            if et == 'props_snapshot':
+                doc = ev.get('doc') or {}
+                if isinstance(doc, dict):
                     # Update in-memory diagnostics
                     try:
                         pc = len((doc.get('pitcher_props') or {}))
@@ -4390,22 +4846,11 @@ def _process_ingested_event(ev: dict):
                         'event_count': doc.get('event_count'),
                         'retrieved_at': doc.get('retrieved_at')
                     }
-                    safe = d.replace('-', '_')
-                    base_dir = os.path.join('data', 'daily_bovada')
-                    os.makedirs(base_dir, exist_ok=True)
-                    path = os.path.join(base_dir, f'bovada_pitcher_props_{safe}.json')
-                    tmp = path + '.tmp'
-                    with open(tmp, 'w', encoding='utf-8') as f:
-                        json.dump(doc, f, indent=2)
-                    os.replace(tmp, path)
-                except Exception:
-                    pass
-        # Persist recommendations snapshot (optional, used by unified endpoint for plays/EV context)
-        if et == 'recommendations_snapshot':
-            d = ev.get('date') or get_business_date()
-            doc = ev.get('doc') or {}
-            if isinstance(doc, dict):
-                try:
+                    latest_snapshots[(et, d)] = doc
+            # Persist recommendations snapshot (optional, used by unified endpoint for plays/EV context)
+            if et == 'recommendations_snapshot':
+                doc = ev.get('doc') or {}
+                if isinstance(doc, dict):
                     # Update in-memory diagnostics
                     try:
                         rc = len((doc.get('recommendations') or []))
@@ -4416,18 +4861,120 @@ def _process_ingested_event(ev: dict):
                         'count': rc,
                         'generated_at': doc.get('generated_at') or doc.get('built_at') or doc.get('timestamp')
                     }
-                    safe = d.replace('-', '_')
-                    base_dir = os.path.join('data', 'daily_bovada')
-                    os.makedirs(base_dir, exist_ok=True)
-                    path = os.path.join(base_dir, f'pitcher_prop_recommendations_{safe}.json')
-                    tmp = path + '.tmp'
-                    with open(tmp, 'w', encoding='utf-8') as f:
-                        json.dump(doc, f, indent=2)
-                    os.replace(tmp, path)
-                except Exception:
-                    pass
+                    latest_snapshots[(et, d)] = doc
+        except Exception:
+            pass
+    for d, evs in line_events_by_date.items():
+        _append_pitcher_line_history(d, evs)
+    for d, outcomes in outcomes_by_date.items():
+        _save_realized_results_and_daily(d, outcomes)
+    # Snapshots go to the write-behind store: readers see them immediately, disk writes are throttled
+    if latest_snapshots:
+        from snapshot_store import get_snapshot_store
+        store = get_snapshot_store()
+        for (et, d), doc in latest_snapshots.items():
+            try:
+                store.put('props' if et == 'props_snapshot' else 'recommendations', d, doc)
+            except Exception:
+                pass
+
+# --- Bounded ingest queue drained by a background writer ---
+# The broadcast endpoint only enqueues; persistence happens off the request thread.
+# Disable with PITCHER_INGEST_SYNC=1 to process inline (old behavior).
+import queue as _queue_mod
+try:
+    _INGEST_QUEUE_MAX = int(os.environ.get('PITCHER_INGEST_QUEUE_MAX', '5000'))
+except Exception:
+    _INGEST_QUEUE_MAX = 5000
+try:
+    _INGEST_BATCH_MAX = int(os.environ.get('PITCHER_INGEST_BATCH_MAX', '500'))
+except Exception:
+    _INGEST_BATCH_MAX = 500
+_INGEST_QUEUE = _queue_mod.Queue(maxsize=_INGEST_QUEUE_MAX)
+_INGEST_WORKER = None
+_INGEST_WORKER_LOCK = threading.Lock()
+_INGEST_STATS = {
+    'enqueued': 0,
+    'processed': 0,
+    'dropped': 0,
+    'batches': 0,
+    'last_batch_size': 0,
+    'last_drain_latency_ms': None,
+    'max_drain_latency_ms': None,
+    'avg_drain_latency_ms': None,
+    'last_batch_duration_ms': None,
+    'last_error': None
+}
+
+def _ingest_worker_loop():
+    while True:
+        batch = [_INGEST_QUEUE.get()]
+        while len(batch) < _INGEST_BATCH_MAX:
+            try:
+                batch.append(_INGEST_QUEUE.get_nowait())
+            except _queue_mod.Empty:
+                break
+        t0 = time.time()
+        try:
+            _process_ingested_batch([ev for _, ev in batch])
+        except Exception as e:
+            _INGEST_STATS['last_error'] = str(e)
+        done = time.time()
+        # Drain latency = time from enqueue of the oldest event to the end of its batch
+        latency_ms = round((done - batch[0][0]) * 1000.0, 1)
+        st = _INGEST_STATS
+        st['processed'] += len(batch)
+        st['batches'] += 1
+        st['last_batch_size'] = len(batch)
+        st['last_batch_duration_ms'] = round((done - t0) * 1000.0, 1)
+        st['last_drain_latency_ms'] = latency_ms
+        st['max_drain_latency_ms'] = max(st['max_drain_latency_ms'] or 0.0, latency_ms)
+        prev = st['avg_drain_latency_ms']
+        st['avg_drain_latency_ms'] = latency_ms if prev is None else round(prev * 0.9 + latency_ms * 0.1, 1)
+
+def _ensure_ingest_worker():
+    global _INGEST_WORKER
+    if _INGEST_WORKER is not None and _INGEST_WORKER.is_alive():
+        return
+    with _INGEST_WORKER_LOCK:
+        if _INGEST_WORKER is None or not _INGEST_WORKER.is_alive():
+            _INGEST_WORKER = threading.Thread(target=_ingest_worker_loop, name='pitcher-ingest-writer', daemon=True)
+            _INGEST_WORKER.start()
+
+_INGEST_ENQUEUE_LOCK = threading.Lock()
+
+def _enqueue_ingested_batch(events: list) -> bool:
+    """Queue a whole batch or none of it, so a rejected batch can be retried as-is without
+    duplicating events. Returns False (and counts the drops) when the queue lacks room."""
+    if not events:
+        return True
+    _ensure_ingest_worker()
+    # Only the writer removes items, so room checked under the lock cannot shrink before the puts
+    with _INGEST_ENQUEUE_LOCK:
+        if _INGEST_QUEUE_MAX > 0 and _INGEST_QUEUE_MAX - _INGEST_QUEUE.qsize() < len(events):
+            _INGEST_STATS['dropped'] += len(events)
+            return False
+        now = time.time()
+        for ev in events:
+            _INGEST_QUEUE.put_nowait((now, ev))
+        _INGEST_STATS['enqueued'] += len(events)
+    return True
+
+def _snapshot_store_stats() -> dict:
+    try:
+        from snapshot_store import get_snapshot_store
+        return get_snapshot_store().stats()
     except Exception:
-        pass
+        return {}
+
+def _ingest_queue_stats() -> dict:
+    return {
+        **_INGEST_STATS,
+        'depth': _INGEST_QUEUE.qsize(),
+        'maxsize': _INGEST_QUEUE_MAX,
+        'worker_alive': bool(_INGEST_WORKER is not None and _INGEST_WORKER.is_alive()),
+        'sync_mode': os.environ.get('PITCHER_INGEST_SYNC', '0') == '1'
+    }
 
 def _get_ingest_token():
     """Return (token, source) from env or file without raising.
@@ -4476,12 +5023,22 @@ def api_pitcher_props_broadcast_ingest():
         if not isinstance(data, dict):
             return jsonify({'ok': False, 'error': 'invalid payload'}), 400
         if data.get('type') == 'batch' and isinstance(data.get('events'), list):
-            for ev in data['events']:
-                if isinstance(ev, dict):
-                    _process_ingested_event(ev)
+            events = [ev for ev in data['events'] if isinstance(ev, dict)]
         else:
-            _process_ingested_event(data)
-        return jsonify({'ok': True})
+            events = [data]
+        if os.environ.get('PITCHER_INGEST_SYNC', '0') == '1':
+            _process_ingested_batch(events)
+            return jsonify({'ok': True, 'accepted': len(events), 'dropped': 0})
+        # A batch larger than the whole queue can never fit: 413 so the bridge drops or splits it
+        if _INGEST_QUEUE_MAX > 0 and len(events) > _INGEST_QUEUE_MAX:
+            _INGEST_STATS['dropped'] += len(events)
+            logger.warning(f"⚠️ Pitcher ingest batch of {len(events)} events exceeds queue size {_INGEST_QUEUE_MAX}; rejected")
+            return jsonify({'ok': False, 'error': 'batch too large', 'accepted': 0, 'dropped': len(events),
+                            'max_events': _INGEST_QUEUE_MAX}), 413
+        # All or nothing: 503 tells the worker bridge to back off and retry the whole batch
+        accepted = len(events) if _enqueue_ingested_batch(events) else 0
+        status = 200 if accepted == len(events) else 503
+        return jsonify({'ok': status == 200, 'accepted': accepted, 'dropped': len(events) - accepted}), status
     except Exception as e:
         return jsonify({'ok': False, 'error': str(e)}), 500
 
@@ -4498,10 +5055,18 @@ def api_health_props_stream_stats():
         # Optional OddsAPI supplement to increase same-day coverage using user's premium key
         oddsapi_path = os.path.join(base_dir, f'oddsapi_pitcher_props_{safe_date}.json')
         recs_path = os.path.join(base_dir, f'pitcher_prop_recommendations_{safe_date}.json')
-        line_hist_path = os.path.join(base_dir, f'pitcher_prop_line_history_{safe_date}.json')
+        from pitcher_line_history import get_line_history_store
+        line_history_store = get_line_history_store()
+        line_hist_path = line_history_store.path_for(date_str)
         _tok, _src = _get_ingest_token()
+        try:
+            from sse_hub import get_sse_hub
+            sse_stats = get_sse_hub().stats()
+        except Exception:
+            sse_stats = {}
         stats = {
-            'subscribers': len(_PITCHER_SSE_SUBSCRIBERS),
+            'subscribers': sse_stats.get('subscribers', 0),
+            'sse_hub': sse_stats,
             'last_event_ts': _PITCHER_SSE_STATS.get('last_event_ts'),
             'last_event_type': _PITCHER_SSE_STATS.get('last_event_type'),
             'counts_by_type': _PITCHER_SSE_STATS.get('counts_by_type', {}),
@@ -4510,6 +5075,8 @@ def api_health_props_stream_stats():
             'ingest_token_source': _src,
             'last_props_snapshot': _PITCHER_SSE_STATS.get('last_props_snapshot'),
             'last_recs_snapshot': _PITCHER_SSE_STATS.get('last_recs_snapshot'),
+            'ingest_queue': _ingest_queue_stats(),
+            'snapshot_store': _snapshot_store_stats(),
             'files': {
                 'props': {
                     'path': props_path,
@@ -4574,13 +5141,9 @@ def api_health_props_stream_stats():
             }
         except Exception:
             pass
-        # Count events in line history (cheap peek)
+        # Count events in line history (served from the store's incremental index)
         try:
-            if stats['files']['line_history']['exists']:
-                with open(line_hist_path, 'r', encoding='utf-8') as f:
-                    doc = json.load(f)
-                if isinstance(doc, dict) and isinstance(doc.get('events'), list):
-                    stats['files']['line_history']['event_count'] = len(doc['events'])
+            stats['files']['line_history']['event_count'] = line_history_store.count(date_str)
         except Exception:
             stats['files']['line_history']['event_count'] = None
         return jsonify({'ok': True, 'date': date_str, 'stats': stats})
@@ -4614,25 +5177,24 @@ def api_pitcher_props_line_history():
     """Return recorded intraday line movement history events for pitcher props.
     Query params:
       date (optional) -> defaults to business date.
-      limit (optional int) -> max events to return (default 500).
-    File format written by continuous_pitcher_props_updater.py:
-      data/daily_bovada/pitcher_prop_line_history_<DATE>.json
-      {"date":"YYYY-MM-DD","events":[ {...}, ... ]}
+      limit (optional int) -> max events to return, most recent kept (default 500).
+      pitcher (optional) -> only events for this pitcher (accent/case-insensitive).
+      market (optional) -> only events for this market (e.g. strikeouts).
+      since (optional ISO timestamp) -> only events with ts >= since.
+    Events are served from the append-only store in pitcher_line_history.py:
+      data/daily_bovada/pitcher_prop_line_history_<DATE>.jsonl (one event per line)
     """
     try:
         date_str = request.args.get('date') or get_business_date()
         limit = int(request.args.get('limit', '500'))
-        safe_date = date_str.replace('-', '_')
-        path = os.path.join('data','daily_bovada', f'pitcher_prop_line_history_{safe_date}.json')
-        events = []
-        if os.path.exists(path):
-            try:
-                with open(path,'r',encoding='utf-8') as f:
-                    doc = json.load(f)
-                if isinstance(doc, dict) and isinstance(doc.get('events'), list):
-                    events = doc['events'][-limit:]
-            except Exception:
-                pass
+        from pitcher_line_history import get_line_history_store
+        events = get_line_history_store().query(
+            date_str,
+            pitcher=request.args.get('pitcher') or None,
+            market=request.args.get('market') or None,
+            since=request.args.get('since') or None,
+            limit=limit
+        )
         return jsonify({'success': True, 'date': date_str, 'count': len(events), 'events': events})
     except Exception as e:
         logger.error(f"Error in api_pitcher_props_line_history: {e}\n{traceback.format_exc()}")
@@ -4647,12 +5209,10 @@ def api_pitcher_props_current():
     """
     try:
         date_str = request.args.get('date') or get_business_date()
-        safe_date = date_str.replace('-', '_')
-        path = os.path.join('data','daily_bovada', f'bovada_pitcher_props_{safe_date}.json')
-        if not os.path.exists(path):
+        from snapshot_store import get_snapshot_store
+        doc = get_snapshot_store().get('props', date_str)
+        if doc is None:
             return jsonify({'success': True, 'date': date_str, 'pitchers': 0, 'pitcher_props': {}})
-        with open(path,'r',encoding='utf-8') as f:
-            doc = json.load(f)
         pitcher_props = doc.get('pitcher_props', {}) if isinstance(doc, dict) else {}
         filt = request.args.get('pitchers')
         if filt:
@@ -4673,6 +5233,10 @@ def api_pitcher_props_live_pitches():
         date_str = request.args.get('date') or get_business_date()
         name_filter = (request.args.get('name') or '').strip().lower()
         box = _load_boxscore_pitcher_stats(date_str) or {}
+        # Lines kept current by the live-game poller take precedence over the boxscore file
+        live_state = _live_game_snapshot(date_str)
+        if live_state:
+            box = {**box, **live_state['pitchers']}
         out = {}
         for k, v in box.items():
             if not isinstance(v, dict):
@@ -4698,14 +5262,18 @@ def api_pitcher_props_live_stats():
         date_str = request.args.get('date') or get_business_date()
         name_filter = (request.args.get('name') or '').strip().lower()
         box = _load_boxscore_pitcher_stats(date_str) or {}
+        # Lines kept current by the live-game poller take precedence over the boxscore file
+        live_state = _live_game_snapshot(date_str)
+        if live_state:
+            box = {**box, **{k: {**v, 'hits': v.get('hits_allowed')} for k, v in live_state['pitchers'].items()}}
         # Optional gate: by default, only return stats for pitchers whose games are live to avoid pregame leakage
         only_live = (request.args.get('only_live') or '1') in ('1','true','yes')
         live_names: set[str] = set()
         live_ids: set[str] = set()
         if only_live:
             try:
-                from live_mlb_data import LiveMLBData as _LMD_gate
-                _api = _LMD_gate()
+                from live_mlb_data import get_live_mlb_data
+                _api = get_live_mlb_data()
                 eg = _api.get_enhanced_games_data(date_str) or []
                 for g in eg:
                     if g.get('is_live'):
@@ -4734,8 +5302,8 @@ def api_pitcher_props_live_stats():
                     games_doc = {}
             if not games_doc:
                 try:
-                    from live_mlb_data import LiveMLBData
-                    mlb_api = LiveMLBData()
+                    from live_mlb_data import get_live_mlb_data
+                    mlb_api = get_live_mlb_data()
                     live_games = mlb_api.get_enhanced_games_data(date_str) or []
                     games_doc = {'games': {str(i): g for i, g in enumerate(live_games)}}
                 except Exception:
@@ -4819,57 +5387,23 @@ def api_pitcher_props_live_stats():
                     pk = g.get('game_id') or g.get('game_pk') or (g.get('meta') or {}).get('game_id')
                     if pk and str(pk) not in pks:
                         pks.append(str(pk))
-                # Helper: fetch one boxscore
-                def _fetch_box(game_pk: str) -> Dict[str, Dict[str, Any]]:
-                    try:
-                        import requests
-                        url = f"https://statsapi.mlb.com/api/v1/game/{game_pk}/boxscore"
-                        resp = requests.get(url, timeout=4)
-                        if not resp.ok:
-                            return {}
-                        data = resp.json() or {}
-                        res: Dict[str, Dict[str, Any]] = {}
-                        teams = (data.get('teams') or {})
-                        for side in ('away','home'):
-                            players = (teams.get(side) or {}).get('players') or {}
-                            for _, pdata in players.items():
-                                try:
-                                    person = pdata.get('person') or {}
-                                    full = str(person.get('fullName') or '').strip()
-                                    if not full:
-                                        continue
-                                    pos = ((pdata.get('position') or {}) or {}).get('abbreviation')
-                                    if pos != 'P':
-                                        continue
-                                    stats = ((pdata.get('stats') or {}) or {}).get('pitching') or {}
-                                    key = normalize_name(full)
-                                    entry = res.setdefault(key, {})
-                                    # map fields
-                                    val = stats.get('numberOfPitches') or stats.get('pitchesThrown')
-                                    if val is not None:
-                                        try: entry['pitches'] = int(val)
-                                        except Exception: pass
-                                    for sk, dk in (
-                                        ('outs','outs'), ('strikeOuts','strikeouts'), ('inningsPitched','innings_pitched'),
-                                        ('baseOnBalls','walks'), ('hits','hits_allowed'), ('earnedRuns','earned_runs')
-                                    ):
-                                        vv = stats.get(sk)
-                                        if vv is not None:
-                                            try:
-                                                entry[dk] = int(vv) if dk != 'innings_pitched' else vv
-                                            except Exception:
-                                                entry[dk] = vv
-                                    pid = (person.get('id') if isinstance(person, dict) else None)
-                                    if pid is not None:
-                                        entry['player_id'] = str(pid)
-                                except Exception:
-                                    continue
-                        return res
-                    except Exception:
-                        return {}
-                # Merge fetched stats
-                for pk in pks[:20]:  # cap to avoid excessive calls
-                    fetched = _fetch_box(str(pk))
+                # Merge fetched stats: in-progress games from the shared live-feed cache, the rest from
+                # the much smaller /boxscore document; both fetched concurrently under one deadline
+                from live_mlb_data import get_live_mlb_data
+                from live_game_state import pitcher_lines_from_boxscore
+                _api = get_live_mlb_data()
+                pks = pks[:20]  # cap to avoid excessive calls
+                if live_state:
+                    live_pks = {pk for pk, g in live_state['games'].items() if g.get('is_live')}
+                else:
+                    live_pks = {str(g.get('game_pk')) for g in (_api.get_enhanced_games_data(date_str) or [])
+                                if g.get('is_live') and g.get('game_pk')}
+                feed_pks = [pk for pk in pks if pk in live_pks]
+                feeds = _api.get_live_feeds(feed_pks) if feed_pks else {}
+                boxes = {pk: ((feeds.get(pk) or {}).get('liveData') or {}).get('boxscore') or {} for pk in feed_pks}
+                boxes.update(_api.get_boxscores([pk for pk in pks if pk not in live_pks]))
+                for pk in pks:
+                    fetched = pitcher_lines_from_boxscore(boxes.get(pk) or {})
                     if not fetched:
                         continue
                     for nk, st in fetched.items():
@@ -5006,16 +5540,12 @@ def api_pitcher_props_model_diagnostics():
                     market_counts[mk] = market_counts.get(mk,0)+1
             coverage = {'total_recommendations': len(props), 'by_market': market_counts}
         # Line movement recent count
-        line_history_path = os.path.join(base_dir, f'pitcher_prop_line_history_{safe_date}.json')
         line_event_count = 0
-        if os.path.exists(line_history_path):
-            try:
-                with open(line_history_path,'r',encoding='utf-8') as f:
-                    doc = json.load(f)
-                if isinstance(doc, dict) and isinstance(doc.get('events'), list):
-                    line_event_count = len(doc['events'])
-            except Exception:
-                pass
+        try:
+            from pitcher_line_history import get_line_history_store
+            line_event_count = get_line_history_store().count(date_str)
+        except Exception:
+            pass
         return jsonify({
             'success': True,
             'date': date_str,
@@ -5134,6 +5664,57 @@ def api_pitcher_props_refresh_models():
         logger.error(f"Error starting model refresh: {e}\n{traceback.format_exc()}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def _unified_light_view(payload: dict) -> dict:
+    """Light-mode view of a full unified payload: slim markets (line + odds) per pitcher.
+    Built once per cache version via conditional_json(); the full payload is not modified."""
+    slim_data = {}
+    for k,v in payload['data'].items():
+        # Build a slim "markets" with just line and odds to keep payload small
+        full_mkts = v.get('markets') or {}
+        slim_mkts = {}
+        try:
+            for mk, info in full_mkts.items():
+                if not isinstance(info, dict):
+                    continue
+                line = info.get('line')
+                oo = info.get('over_odds')
+                uo = info.get('under_odds')
+                # Only include markets that have a usable betting line
+                if line is not None:
+                    slim_mkts[mk] = {'line': line, 'over_odds': oo, 'under_odds': uo}
+            # Fallback: if no market lines, synthesize from recommended play when available
+            if not slim_mkts:
+                p = v.get('plays') or {}
+                if isinstance(p, dict) and p.get('market') and (p.get('line') is not None):
+                    mk = str(p.get('market'))
+                    slim_mkts[mk] = {
+                        'line': p.get('line'),
+                        'over_odds': p.get('over_odds'),
+                        'under_odds': p.get('under_odds'),
+                        '_from': 'recs'
+                    }
+        except Exception:
+            slim_mkts = {}
+        slim_data[k] = {
+            'display_name': v.get('display_name'),
+            'mlb_player_id': v.get('mlb_player_id'),
+            'headshot_url': v.get('headshot_url'),
+            'team_logo': v.get('team_logo'),
+            'opponent_logo': v.get('opponent_logo'),
+            'plays': v.get('plays'),
+            'lines': v.get('lines'),
+            'markets': slim_mkts,
+            'team': v.get('team'),
+            'opponent': v.get('opponent'),
+            'pitch_count': v.get('pitch_count'),
+            'live_pitches': v.get('live_pitches')
+        }
+    light_payload = dict(payload)
+    light_payload['data'] = slim_data
+    light_payload['meta'] = dict(light_payload.get('meta', {}))
+    light_payload['meta']['light_mode'] = True
+    return light_payload
+
 @app.route('/api/pitcher-props/unified')
 def api_pitcher_props_unified():
     """Unified pitcher props + projections + EV/Kelly in one call (15s cache).
@@ -5171,6 +5752,8 @@ def api_pitcher_props_unified():
             _PROJ_MEMO[date_str] = OrderedDict()
         proj_cache = _PROJ_MEMO[date_str]
         proj_stats = {'hits': 0, 'misses': 0}
+        # With a shared cache backend, projections computed by other workers are reused too
+        proj_shared = _PROJ_MEMO_SHARED if _CACHE_BACKEND.shared else None
 
         def _proj_cache_get(key):
             try:
@@ -5179,6 +5762,11 @@ def api_pitcher_props_unified():
                     val = proj_cache.pop(key)
                     proj_cache[key] = val
                     return val
+                if proj_shared is not None:
+                    val = proj_shared.get(date_str + '|' + '|'.join(map(str, key)))
+                    if val is not None:
+                        proj_cache[key] = val
+                        return val
             except Exception:
                 pass
             return None
@@ -5188,6 +5776,8 @@ def api_pitcher_props_unified():
                 if key in proj_cache:
                     proj_cache.pop(key, None)
                 proj_cache[key] = value
+                if proj_shared is not None:
+                    proj_shared[date_str + '|' + '|'.join(map(str, key))] = value
                 # Enforce LRU size cap
                 while len(proj_cache) > max(200, int(_PROJ_MEMO_MAX)):
                     try:
@@ -5197,74 +5787,37 @@ def api_pitcher_props_unified():
             except Exception:
                 pass
 
-        # Cache
-        global _UNIFIED_PITCHER_CACHE
-        # Separate tiny cache for true-light payloads so we don't pollute the full cache
-        global _UNIFIED_PITCHER_CACHE_LIGHT
-        if '_UNIFIED_PITCHER_CACHE' not in globals():
-            _UNIFIED_PITCHER_CACHE = {}
-        if '_UNIFIED_PITCHER_CACHE_LIGHT' not in globals():
-            _UNIFIED_PITCHER_CACHE_LIGHT = {}
+        # Cache (full payloads; true-light payloads live in a separate cache so they don't pollute it)
         now_ts = time.time()
         cached = _UNIFIED_PITCHER_CACHE.get(date_str)
-        if (not no_cache) and cached and (now_ts - cached.get('ts', 0) < 15):
+        light_cached = _UNIFIED_PITCHER_CACHE_LIGHT.get(date_str) if light_mode else None
+        served = None
+        if not no_cache and not any(e and now_ts - e.get('ts', 0) < 15 for e in (cached, light_cached)):
+            # Expired: coalesce concurrent rebuilds of this date (see cache_policy)
+            peeked = {}
+            def _peek_unified():
+                peeked['full'] = _UNIFIED_PITCHER_CACHE.get(date_str)
+                peeked['light'] = _UNIFIED_PITCHER_CACHE_LIGHT.get(date_str) if light_mode else None
+                entries = [e for e in (peeked['full'], peeked['light']) if e]
+                return max(entries, key=lambda e: e.get('ts', 0)) if entries else None
+            served = cache_coalesce('pitcher_props_unified', {'date': date_str, 'light': int(light_mode)}, 15, _peek_unified)
+            if served is not None:
+                if served is peeked.get('full'):
+                    cached = served
+                else:
+                    light_cached = served
+        if (not no_cache) and cached and (cached is served or now_ts - cached.get('ts', 0) < 15):
             # Serve cached; if light mode requested but cache is full, derive light view on the fly
             payload = cached['payload']
             if light_mode and payload.get('data'):
-                slim_data = {}
-                for k,v in payload['data'].items():
-                    # Build a slim "markets" with just line and odds to keep payload small
-                    full_mkts = v.get('markets') or {}
-                    slim_mkts = {}
-                    try:
-                        for mk, info in full_mkts.items():
-                            if not isinstance(info, dict):
-                                continue
-                            line = info.get('line')
-                            oo = info.get('over_odds')
-                            uo = info.get('under_odds')
-                            # Only include markets that have a usable betting line
-                            if line is not None:
-                                slim_mkts[mk] = {'line': line, 'over_odds': oo, 'under_odds': uo}
-                        # Fallback: if no market lines, synthesize from recommended play when available
-                        if not slim_mkts:
-                            p = v.get('plays') or {}
-                            if isinstance(p, dict) and p.get('market') and (p.get('line') is not None):
-                                mk = str(p.get('market'))
-                                slim_mkts[mk] = {
-                                    'line': p.get('line'),
-                                    'over_odds': p.get('over_odds'),
-                                    'under_odds': p.get('under_odds'),
-                                    '_from': 'recs'
-                                }
-                    except Exception:
-                        slim_mkts = {}
-                    slim_data[k] = {
-                        'display_name': v.get('display_name'),
-                        'mlb_player_id': v.get('mlb_player_id'),
-                        'headshot_url': v.get('headshot_url'),
-                        'team_logo': v.get('team_logo'),
-                        'opponent_logo': v.get('opponent_logo'),
-                        'plays': v.get('plays'),
-                        'lines': v.get('lines'),
-                        'markets': slim_mkts,
-                        'team': v.get('team'),
-                        'opponent': v.get('opponent'),
-                        'pitch_count': v.get('pitch_count'),
-                        'live_pitches': v.get('live_pitches')
-                    }
-                light_payload = dict(payload)
-                light_payload['data'] = slim_data
-                light_payload['meta'] = dict(light_payload.get('meta', {}))
-                light_payload['meta']['light_mode'] = True
-                resp = jsonify(light_payload)
+                resp = conditional_json(lambda: _unified_light_view(payload), version=(f'pitcher_props_unified|{date_str}|light', cached.get('ts', 0)))
                 try:
                     resp.headers['X-Cache-Hit'] = '1'
                     resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t0)*1000)}"
                 except Exception:
                     pass
                 return resp
-            resp = jsonify(payload)
+            resp = conditional_json(payload, version=(f'pitcher_props_unified|{date_str}', cached.get('ts', 0)))
             try:
                 resp.headers['X-Cache-Hit'] = '1'
                 resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t0)*1000)}"
@@ -5275,10 +5828,9 @@ def api_pitcher_props_unified():
 
         # If light mode requested and no full cache hit, try returning a prebuilt true-light payload
         if light_mode:
-            light_cached = _UNIFIED_PITCHER_CACHE_LIGHT.get(date_str)
-            if (not no_cache) and light_cached and (now_ts - light_cached.get('ts', 0) < 15):
+            if (not no_cache) and light_cached and (light_cached is served or now_ts - light_cached.get('ts', 0) < 15):
                 payload = light_cached['payload']
-                resp = jsonify(payload)
+                resp = conditional_json(payload, version=(f'pitcher_props_unified|{date_str}|true_light', light_cached.get('ts', 0)))
                 try:
                     resp.headers['X-Cache-Hit'] = '1'
                     resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t0)*1000)}"
@@ -5341,24 +5893,21 @@ def api_pitcher_props_unified():
         props_path = os.path.join(base_dir, f'bovada_pitcher_props_{safe_date}.json')
         # Optional OddsAPI supplement to increase same-day coverage using user's premium key
         oddsapi_path = os.path.join(base_dir, f'oddsapi_pitcher_props_{safe_date}.json')
-        rec_path = os.path.join(base_dir, f'pitcher_prop_recommendations_{safe_date}.json')
         stats_path = os.path.join('data', 'master_pitcher_stats.json')
         games_path = os.path.join('data', f'games_{date_str}.json')
         last_known_path = os.path.join(base_dir, f'pitcher_last_known_lines_{safe_date}.json')
 
         def _load_json(path, default):
-            if not os.path.exists(path):
-                return default
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return default
+            # Shared doc cache: parsed once per file version; docs are read-only here
+            return load_json_doc(path, default)
         # --- Load primary docs (ensure variables always initialized) ---
         t_props = time.time()
-        props_doc = _load_json(props_path, {})
+        from snapshot_store import get_snapshot_store
+        _snapshots = get_snapshot_store()
+        props_doc = _snapshots.get('props', date_str, {})
         timings['load_props'] = round(time.time()-t_props,3)
-        pitcher_props = props_doc.get('pitcher_props', {}) if isinstance(props_doc, dict) else {}
+        # Shallow copy: the snapshot doc is shared, merges below copy buckets before writing
+        pitcher_props = dict(props_doc.get('pitcher_props', {}) or {}) if isinstance(props_doc, dict) else {}
         # Load OddsAPI props if available and merge into pitcher_props before grouping
         try:
             odds_doc = _load_json(oddsapi_path, {})
@@ -5372,6 +5921,7 @@ def api_pitcher_props_unified():
                         if not isinstance(base_bucket, dict):
                             pitcher_props[nk] = dict(mkts or {})
                             continue
+                        base_bucket = pitcher_props[nk] = dict(base_bucket)
                         for mk, info in (mkts or {}).items():
                             if not isinstance(info, dict):
                                 continue
@@ -5379,6 +5929,7 @@ def api_pitcher_props_unified():
                             if not isinstance(base_info, dict):
                                 base_bucket[mk] = dict(info)
                                 continue
+                            base_info = base_bucket[mk] = dict(base_info)
                             # If Bovada missing a line/odds, fill from OddsAPI
                             if base_info.get('line') is None and info.get('line') is not None:
                                 base_info['line'] = info.get('line')
@@ -5423,7 +5974,7 @@ def api_pitcher_props_unified():
 
         requested_date = date_str
         source_date = date_str
-        source_file = props_path if os.path.exists(props_path) else None
+        source_file = props_path if _snapshots.has('props', date_str) else None
 
         # Build a union of markets per normalized pitcher key across all raw entries
         # This avoids iteration-order overwrites when the props file contains both
@@ -5511,8 +6062,8 @@ def api_pitcher_props_unified():
         # Fallback: if no local games file, derive from MLB schedule for requested date
         if (not games_doc) or (isinstance(games_doc, list) and len(games_doc) == 0) or (isinstance(games_doc, dict) and not games_doc.get('games')):
             try:
-                from live_mlb_data import LiveMLBData
-                mlb_api = LiveMLBData()
+                from live_mlb_data import get_live_mlb_data
+                mlb_api = get_live_mlb_data()
                 live_games = mlb_api.get_enhanced_games_data(date_str) or []
                 games_doc = [
                     {
@@ -5531,8 +6082,8 @@ def api_pitcher_props_unified():
         t_status = time.time()
         live_pitchers: set[str] = set()
         try:
-            from live_mlb_data import LiveMLBData as _LMD_for_status
-            _status_api = _LMD_for_status()
+            from live_mlb_data import get_live_mlb_data
+            _status_api = get_live_mlb_data()
             _enh_games = _status_api.get_enhanced_games_data(date_str) or []
             for g in _enh_games:
                 if g.get('is_live'):
@@ -5730,7 +6281,7 @@ def api_pitcher_props_unified():
 
         recs_by_pitcher = {}
         recs_by_pitcher_norm = {}
-        rec_doc = _load_json(rec_path, {})
+        rec_doc = _snapshots.get('recommendations', date_str, {})
         if isinstance(rec_doc, dict):
             for r in (rec_doc.get('recommendations') or []):
                 pk = r.get('pitcher_key')
@@ -6076,7 +6627,7 @@ def api_pitcher_props_unified():
                 payload['meta']['timings'] = timings
             # Cache only in the light cache to avoid blocking full-build hydration later
             _UNIFIED_PITCHER_CACHE_LIGHT[date_str] = {'ts': now_ts, 'payload': payload}
-            resp = jsonify(payload)
+            resp = conditional_json(payload, version=(f'pitcher_props_unified|{date_str}|true_light', now_ts))
             try:
                 resp.headers['X-Cache-Hit'] = '0'
                 resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t0)*1000)}"
@@ -6599,7 +7150,7 @@ def api_pitcher_props_unified():
                 timings['total'] = round(time.time()-t0,3)
                 empty_payload['meta']['timings'] = timings
             _UNIFIED_PITCHER_CACHE[date_str] = {'ts': now_ts, 'payload': empty_payload}
-            return jsonify(empty_payload)
+            return conditional_json(empty_payload, version=(f'pitcher_props_unified|{date_str}', now_ts))
 
         # Post-process: if any bundle has zero markets (e.g., scheduled-only entry), try to backfill
         # from last-known lines so the full payload hydrates lines instead of wiping them.
@@ -6784,10 +7335,13 @@ def api_pitcher_props_unified():
         if want_timings:
             payload['meta']['timings'] = timings
         _UNIFIED_PITCHER_CACHE[date_str] = {'ts': now_ts, 'payload': payload}
-        resp = jsonify(payload)
+        resp = conditional_json(payload, version=(f'pitcher_props_unified|{date_str}' + ('|light' if light_mode else ''), now_ts))
         try:
             resp.headers['X-Cache-Hit'] = '0'
-            resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t0)*1000)}"
+            # Build stages (seconds, except the *_ms accumulators) -> Server-Timing / timing registry
+            stages = [f"{k[:-3] if k.endswith('_ms') else k};dur={v if k.endswith('_ms') else int(v * 1000)}"
+                      for k, v in timings.items() if k != 'total' and isinstance(v, (int, float))]
+            resp.headers['Server-Timing'] = ', '.join(stages + [f"total;dur={int((time.time()-t0)*1000)}"])
         except Exception:
             pass
         return resp
@@ -7004,11 +7558,13 @@ def api_health_unified_meta():
                 date = data.get('date') or request.form.get('date')
                 if action == 'clear_all':
                     _PROJ_MEMO = {}
+                    _PROJ_MEMO_SHARED.clear()
                     return jsonify({'success': True, 'cleared': 'all'})
                 elif action == 'clear':
                     if date and date in (_PROJ_MEMO or {}):
                         try:
                             _PROJ_MEMO.pop(date, None)
+                            _PROJ_MEMO_SHARED.clear(date + '|')
                         except Exception:
                             pass
                         return jsonify({'success': True, 'cleared': date})
@@ -7562,28 +8118,16 @@ def api_historical_recap(date):
     try:
         logger.info(f"Historical recap requested for date: {date}")
         
-        # Load unified cache
-        unified_cache = load_unified_cache()
-        predictions_by_date = unified_cache.get('predictions_by_date', {})
-        
-        # Get the requested date data - check both structures
-        date_data = predictions_by_date.get(date, {})
+        # Load the requested date's unified predictions shard
+        date_data = load_unified_day(date)
         games_dict = date_data.get('games', {})
         
-        # If not found in predictions_by_date, check direct date structure
-        if not games_dict:
-            games_list = unified_cache.get(date, [])
-            if games_list:
-                # Convert list to dict for consistent processing
-                games_dict = {f"game_{i}": game for i, game in enumerate(games_list)}
-                logger.info(f"Found {len(games_list)} games for {date} in direct date structure")
-        
         if not games_dict:
             logger.warning(f"No games found for date {date}")
             return jsonify({
                 'success': False,
                 'error': f'No games found for {date}',
-                'available_dates': list(predictions_by_date.keys()) + [k for k in unified_cache.keys() if k.startswith('2025-')]
+                'available_dates': _unified_store().dates()
             })
         
         # Import live data fetcher for final scores
@@ -7950,7 +8494,7 @@ def api_predictions(date):
     """API endpoint for predictions by date"""
     try:
         if PERFORMANCE_TRACKING_AVAILABLE:
-            with time_operation(f"api_predictions_{date}"):
+            with time_operation("api_predictions"):
                 unified_cache = load_unified_cache()
                 
                 # Filter predictions by date
@@ -8634,32 +9178,266 @@ def api_all_team_colors():
             'team_colors': {}
         })
 
+# -------------------------------------------------------------
+# Precomputed /api/today-games artifacts (see payload_artifacts.py)
+# -------------------------------------------------------------
+# The daily pipeline (build_today_games_artifact.py) and the endpoint itself write one encoded,
+# pre-compressed payload per date. While none of its source files change, requests are served
+# the file as-is; only the live status of each game is overlaid at request time. Pitcher data
+# (boxscore pitch counts, master stats, Bovada props) is a source, so its updates rebuild it.
+from payload_artifacts import PayloadArtifactStore, choose_encoding, compress_variants, dumps as _artifact_dumps, make_etag, source_signatures
+
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+_TODAY_GAMES_ARTIFACTS = PayloadArtifactStore('today_games', base_dir=os.path.join(_APP_DIR, 'data', 'artifacts'))
+_TODAY_GAMES_ARTIFACT_BUILDING = set()
+_TODAY_GAMES_OVERLAY = {}  # date -> (etag, body, {encoding: bytes}, (artifact etag, live signature))
+
+# Live fields of an enhanced game's 'live_status' that change during the day, with builder defaults
+_LIVE_OVERLAY_FIELDS = (
+    ('is_live', False), ('is_final', False), ('away_score', 0), ('home_score', 0), ('inning', ''),
+    ('inning_state', ''), ('is_top_inning', None), ('status', 'Scheduled'), ('badge_class', 'scheduled'),
+    ('base_state', None), ('outs', None), ('on_first', None), ('on_second', None), ('on_third', None),
+    ('current_batter', None), ('balls', None), ('strikes', None), ('last_play', None),
+)
+_LIVE_TOP_LEVEL_FIELDS = ('away_score', 'home_score', 'is_live', 'is_final', 'inning', 'inning_state')
+
+def _today_games_artifact_sources(date_str: str) -> list:
+    """Files an /api/today-games payload is derived from; the artifact is stale once any changes."""
+    safe = date_str.replace('-', '_')
+    data_dir = os.path.join(_APP_DIR, 'data')
+    store = _unified_store()
+    try:
+        store.dates()  # imports a rewritten legacy monolith first, so the shard signature is current
+    except Exception:
+        pass
+    try:
+        from snapshot_store import get_snapshot_store
+        props_path = os.path.abspath(get_snapshot_store().path_for('props', date_str))
+    except Exception:
+        props_path = os.path.join(data_dir, 'daily_bovada', f'bovada_pitcher_props_{safe}.json')
+    return [
+        os.path.abspath(__file__),
+        store.shard_path(date_str),
+        os.path.join(data_dir, f'real_betting_lines_{safe}.json'),
+        os.path.join(data_dir, f'betting_recommendations_{safe}.json'),
+        os.path.join(data_dir, f'betting_recommendations_{safe}_enhanced.json'),
+        # Pitcher fields of each game (live pitch counts, projected pitch counts, prop lines);
+        # the overlay only refreshes live_status, so these must invalidate the artifact
+        os.path.join(data_dir, f'boxscore_cache_{safe}.json'),
+        os.path.join(data_dir, 'boxscore_cache.json'),
+        os.path.join(data_dir, 'master_pitcher_stats.json'),
+        os.path.join(data_dir, 'pitches_per_out.json'),
+        os.path.join(data_dir, 'pitches_per_out_calibration.json'),
+        props_path,
+    ]
+
+def _live_status_signature(games: list) -> str:
+    rows = [[(g.get('live_status') or {}).get(f, d) for f, d in _LIVE_OVERLAY_FIELDS] for g in games]
+    return hashlib.sha1(json.dumps(rows, default=str).encode('utf-8')).hexdigest()[:16]
+
+def write_today_games_artifact(date_str: str, payload: dict, sources: dict = None) -> Optional[dict]:
+    """Persist a computed /api/today-games payload as the date's artifact (skips empty payloads)."""
+    games = payload.get('games') if isinstance(payload, dict) else None
+    if not payload.get('success') or not games:
+        return None
+    if sources is None:
+        sources = source_signatures(_today_games_artifact_sources(date_str))
+    return _TODAY_GAMES_ARTIFACTS.write(date_str, payload, sources, extra_meta={
+        'games': len(games),
+        'live_sig': _live_status_signature(games),
+    })
+
+def _write_today_games_artifact_async(date_str: str, payload: dict, sources: dict):
+    if date_str in _TODAY_GAMES_ARTIFACT_BUILDING:
+        return
+    _TODAY_GAMES_ARTIFACT_BUILDING.add(date_str)
+    def _bg():
+        try:
+            write_today_games_artifact(date_str, payload, sources)
+        except Exception as e:
+            logger.warning(f"today-games artifact write failed for {date_str}: {e}")
+        finally:
+            _TODAY_GAMES_ARTIFACT_BUILDING.discard(date_str)
+    try:
+        threading.Thread(target=_bg, daemon=True).start()
+    except Exception:
+        _TODAY_GAMES_ARTIFACT_BUILDING.discard(date_str)
+
+def _overlay_live_status(games: list, live_games: list) -> list:
+    """Copy of games with current live status applied (unchanged games are shared, not copied)."""
+    by_pk, by_pair = {}, {}
+    for lg in (live_games or []):
+        a = normalize_team_name(lg.get('away_team', ''))
+        h = normalize_team_name(lg.get('home_team', ''))
+        pk = lg.get('game_pk') or lg.get('game_id')
+        if pk:
+            by_pk[str(pk)] = lg
+        if a and h:
+            by_pair[(a, h)] = lg
+    out = []
+    for game in games:
+        lg = by_pk.get(str(game.get('game_pk'))) if game.get('game_pk') else None
+        if lg is None and not game.get('doubleheader'):
+            lg = by_pair.get((game.get('away_team'), game.get('home_team')))
+        if lg is None:
+            out.append(game)
+            continue
+        old_ls = game.get('live_status') or {}
+        new_ls = dict(old_ls)
+        for f, d in _LIVE_OVERLAY_FIELDS:
+            new_ls[f] = lg.get(f, d)
+        new_ls['game_time'] = lg.get('game_time', game.get('game_time', 'TBD'))
+        if new_ls == old_ls:
+            out.append(game)
+            continue
+        game = dict(game)
+        game['live_status'] = new_ls
+        for f in _LIVE_TOP_LEVEL_FIELDS:
+            game[f] = new_ls.get(f)
+        out.append(game)
+    return out
+
+def _serve_today_games_artifact(date_str: str, t_start: float):
+    """Response for a valid artifact (with the live overlay applied), or None to compute normally."""
+    meta = _TODAY_GAMES_ARTIFACTS.load(date_str)
+    if meta is None:
+        return None
+    doc = _TODAY_GAMES_ARTIFACTS.read_doc(date_str)
+    if not isinstance(doc, dict) or not isinstance(doc.get('games'), list):
+        return None
+    games = _overlay_live_status(doc['games'], _get_live_games_nowait(date_str))
+    live_sig = _live_status_signature(games)
+    accept = request.headers.get('Accept-Encoding')
+    if live_sig == meta.get('live_sig'):
+        # Nothing live changed since the build: serve the precompressed file untouched
+        enc = choose_encoding(accept, meta.get('encodings') or {})
+        resp = send_file(_TODAY_GAMES_ARTIFACTS.path_for(date_str, enc), mimetype='application/json',
+                         etag=meta['etag'].strip('"'), conditional=True, max_age=0)
+        if enc:
+            resp.headers['Content-Encoding'] = enc
+    else:
+        cached = _TODAY_GAMES_OVERLAY.get(date_str)
+        if not cached or cached[3] != (meta['etag'], live_sig):
+            body = _artifact_dumps({**doc, 'games': games})
+            cached = (make_etag(body).strip('"'), body, compress_variants(body), (meta['etag'], live_sig))
+            _TODAY_GAMES_OVERLAY[date_str] = cached
+        enc = choose_encoding(accept, cached[2])
+        resp = app.response_class(cached[2][enc] if enc else cached[1], mimetype='application/json')
+        resp.set_etag(cached[0])
+        if enc:
+            resp.headers['Content-Encoding'] = enc
+        resp = resp.make_conditional(request)
+    resp.headers['Vary'] = 'Accept-Encoding'
+    resp.headers['X-Cache-Hit'] = 'artifact'
+    resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t_start)*1000)}"
+    return resp
+
+# Stage breakdowns of the last N today-games requests in this process (/api/diag/today-games)
+try:
+    _TODAY_GAMES_TIMINGS = deque(maxlen=max(1, int(os.environ.get('TODAY_GAMES_DIAG_N', '50'))))
+except Exception:
+    _TODAY_GAMES_TIMINGS = deque(maxlen=50)
+
+def _finish_today_games_timing(resp, st, date_str: str, outcome: str, games: int = None):
+    """Set the request's stage breakdown as Server-Timing (per-game stages as game_<stage>) and
+    keep it for /api/diag/today-games."""
+    try:
+        resp.headers['Server-Timing'] = st.header(prefix='game_')
+        _TODAY_GAMES_TIMINGS.append({
+            'ts': datetime.now().isoformat(),
+            'date': date_str,
+            'outcome': outcome,  # artifact | cache | built | no_games
+            'games': games,
+            'status': resp.status_code,
+            **st.as_dict(),
+        })
+    except Exception:
+        pass
+    return resp
+
+@app.route('/api/diag/today-games')
+def api_diag_today_games():
+    """Stage timings of the last N /api/today-games requests (this worker), newest first, plus
+    per-stage averages/maxima. Per-game stages report the total across games and the slowest
+    game. ?outcome=built limits to requests that built the payload (cache misses)."""
+    try:
+        outcome = request.args.get('outcome')
+        entries = [e for e in list(_TODAY_GAMES_TIMINGS) if not outcome or e.get('outcome') == outcome]
+        stages, items = {}, {}
+        for e in entries:
+            for name, ms in (e.get('stages') or {}).items():
+                acc = stages.setdefault(name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+                acc['count'] += 1
+                acc['total_ms'] += ms
+                acc['max_ms'] = max(acc['max_ms'], ms)
+            for name, it in (e.get('items') or {}).items():
+                acc = items.setdefault(name, {'count': 0, 'total_ms': 0.0, 'max_game_ms': 0.0, 'slowest_game': None})
+                acc['count'] += 1
+                acc['total_ms'] += it['total_ms']
+                if it['max_ms'] >= acc['max_game_ms']:
+                    acc['max_game_ms'], acc['slowest_game'] = it['max_ms'], it.get('max_key')
+        summary = {
+            'stages': {n: {'avg_ms': round(a['total_ms'] / a['count'], 2), 'max_ms': round(a['max_ms'], 2), 'requests': a['count']}
+                       for n, a in sorted(stages.items(), key=lambda kv: -kv[1]['total_ms'])},
+            'per_game': {n: {'avg_total_ms': round(a['total_ms'] / a['count'], 2), 'max_game_ms': round(a['max_game_ms'], 2),
+                             'slowest_game': a['slowest_game'], 'requests': a['count']}
+                         for n, a in sorted(items.items(), key=lambda kv: -kv[1]['total_ms'])},
+        }
+        return jsonify({
+            'ok': True,
+            'pid': os.getpid(),
+            'window': _TODAY_GAMES_TIMINGS.maxlen,
+            'count': len(entries),
+            'summary': summary,
+            'requests': list(reversed(entries)),
+        })
+    except Exception as e:
+        return jsonify({'ok': False, 'error': str(e)}), 500
+
 @app.route('/api/today-games')
 def api_today_games():
     """API endpoint for today's games with live status - this is what powers the game cards!"""
     try:
         t_start = time.time()
+        st = StageTimer()
         # Get date from request parameter (defaults to business date)
         date_param = request.args.get('date', get_business_date())
         # Heavy mode toggle: when enabled or for doubleheaders, run full per-game simulations
         heavy_mode = str(request.args.get('heavy', '')).lower() in ('1', 'true', 'yes', 'heavy')
+        # Analytic mode: heavy predictions computed in closed form instead of sampled
+        analytic_mode = str(request.args.get('analytic', '')).lower() in ('1', 'true', 'yes') or \
+            bool(getattr(prediction_engine, 'analytic', False))
         try:
             sim_count_override = int(request.args.get('sim_count')) if request.args.get('sim_count') else None
         except Exception:
             sim_count_override = None
         logger.info(f"API today-games called for date: {date_param}")
 
+        # Precomputed artifact (default requests only; heavy/simulation variants are always computed)
+        use_artifact = not (heavy_mode or sim_count_override or request.args.get('analytic')
+                            or request.args.get('no_artifact') in ('1', 'true', 'yes'))
+        if use_artifact:
+            try:
+                resp = _serve_today_games_artifact(date_param, t_start)
+                st.mark('artifact')
+                if resp is not None:
+                    return _finish_today_games_timing(resp, st, date_param, 'artifact')
+            except Exception as e:
+                logger.warning(f"today-games artifact unavailable for {date_param}: {e}")
+
         # Ultra-lightweight cache to reduce repeated heavy work
         try:
             cached = cache_get('today_games', {'date': date_param}, ttl_seconds=8)
         except Exception:
             cached = None
+        st.mark('cache_check')
         if cached is not None:
             logger.info("📦 today-games cache HIT")
-            resp = jsonify(cached)
+            resp = conditional_json(cached, 'today_games', {'date': date_param})
+            st.mark('serialize')
             try:
                 resp.headers['X-Cache-Hit'] = '1'
-                resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t_start)*1000)}"
+                _finish_today_games_timing(resp, st, date_param, 'cache', len(cached.get('games') or []))
                 if heavy_mode:
                     resp.headers['X-Heavy-Mode'] = '1'
             except Exception:
@@ -8668,53 +9446,35 @@ def api_today_games():
         else:
             logger.info("📦 today-games cache MISS")
 
-        # Load unified cache 
-        t_uc = time.time()
-        unified_cache = load_unified_cache()
-        uc_ms = int((time.time()-t_uc)*1000)
+        # Source signatures before any input is read, so a concurrent update invalidates the artifact
+        artifact_sources = source_signatures(_today_games_artifact_sources(date_param)) if use_artifact else None
+        st.mark('source_sigs')
+
+        # Load this date's unified predictions shard
+        today_data = load_unified_day(date_param)
+        st.mark('unified_cache')
 
         # Load real betting lines with error handling
         try:
             logger.info("🎯 BETTING LINES: Attempting to load real betting lines...")
-            t_lines = time.time()
             real_betting_lines = load_real_betting_lines()
-            lines_ms = int((time.time()-t_lines)*1000)
             logger.info(f"🎯 BETTING LINES: Successfully loaded with {len(real_betting_lines.get('lines', {}))} games")
         except Exception as e:
             logger.error(f"🎯 BETTING LINES: Failed to load - {e}")
             real_betting_lines = None
-            lines_ms = -1
+        st.mark('lines')
 
         # Unified betting recommendations with soft timeout backed by cache; keeps latency low on cold starts
         betting_recommendations = {'games': {}}  # placeholder for downstream shape
         logger.info("🎯 Loading unified betting recommendations for API (soft timeout + cache)...")
-        t_recs = time.time()
         unified_betting_recommendations = _get_unified_betting_recs_cached(timeout_sec=2.5)
-        recs_ms = int((time.time()-t_recs)*1000)
+        st.mark('recs')
         logger.info(f"✅ Unified betting recs (cached) ready: {len(unified_betting_recommendations) if hasattr(unified_betting_recommendations,'keys') else 0} games (0 means still warming)")
 
-        logger.info(f"Loaded cache with keys: {list(unified_cache.keys())[:5]}...")  # Show first 5 keys
-        
-        # Access the predictions_by_date structure
-        predictions_by_date = unified_cache.get('predictions_by_date', {})
-        logger.info(f"Available dates in cache: {list(predictions_by_date.keys())}")
-        
-        today_data = predictions_by_date.get(date_param, {})
-        
         if not today_data:
-            logger.warning(f"No data found for {date_param} in predictions_by_date structure")
-            logger.info(f"Trying direct cache access for {date_param}...")
-
-            # Try direct access to cache entries - ACTUALLY USE THE DATA
-            if date_param in unified_cache and isinstance(unified_cache[date_param], dict):
-                direct_date_data = unified_cache[date_param]
-                if 'games' in direct_date_data:
-                    logger.info(f"✅ Found direct cache data for {date_param} with games")
-                    today_data = direct_date_data
-                else:
-                    logger.warning(f"Direct cache data found for {date_param} but no 'games' key")
+            logger.warning(f"No unified predictions shard for {date_param}")
 
-            # If still no data, FALL BACK to daily games file (games_YYYY-MM-DD.json)
+            # FALL BACK to daily games file (games_YYYY-MM-DD.json)
             if not today_data:
                 try:
                     logger.info(f"🛟 Fallback: loading daily games file for {date_param}")
@@ -8843,28 +9603,30 @@ def api_today_games():
                 except Exception as le:
                     logger.error(f"MLB schedule fallback failed: {le}")
 
+            st.mark('fallback_games')
             # If still no data, return error
             if not today_data:
                 logger.error(f"❌ No data found for {date_param} in any cache structure, daily files, or MLB schedule")
-                return jsonify({
+                return _finish_today_games_timing(jsonify({
                     'success': False,
                     'date': date_param,
                     'games': [],
                     'count': 0,
                     'error': f'No games found for {date_param}',
                     'debug_info': {
-                        'cache_keys': list(unified_cache.keys())[:10],
-                        'available_dates': list(predictions_by_date.keys()),
-                        'direct_date_key_exists': date_param in unified_cache
+                        'available_dates': _unified_store().dates()
                     }
-                })
+                }), st, date_param, 'no_games')
         
-        games_dict = today_data.get('games', {})
+        # The shard doc is shared with every other reader: the doubleheader/pitcher fixes below
+        # edit games in place, so work on a private copy
+        games_dict = copy.deepcopy(today_data.get('games', {}))
         logger.info(f"Found {len(games_dict)} games for {date_param}")
         
         # Check for doubleheaders and add/match missing games using robust normalized keys
         try:
             live_games = _get_live_games_cached(date_param)
+            st.mark('live_games')
             # Build a map of probable pitchers by normalized matchup to fill TBDs later
             probable_by_matchup = {}
             try:
@@ -9169,6 +9931,7 @@ def api_today_games():
             logger.warning(f"⚠️ Could not check for doubleheaders: {e}")
         
         logger.info(f"Final game count after doubleheader check: {len(games_dict)}")
+        st.mark('doubleheaders')
 
         # Build fast lookup maps for live status (by matchup and by (matchup, game_pk))
         live_status_map = {}
@@ -9196,10 +9959,13 @@ def api_today_games():
             props_by_name = _load_bovada_pitcher_props(date_param)
         except Exception:
             stats_by_name, ppo_overrides, default_ppo, box_pitch_stats, props_by_name = {}, {}, 5.1, {}, {}
+        st.mark('pitcher_data')
 
         # Convert to the format expected by the frontend
+        # (per-game stages: st.item_mark(<stage>, game_key) after each step; see /api/diag/today-games)
         enhanced_games = []
         for game_key, game_data in games_dict.items():
+            st.item_start()
             # Clean up team names (remove underscores)
             away_team = normalize_team_name(game_data.get('away_team', ''))
             home_team = normalize_team_name(game_data.get('home_team', ''))
@@ -9207,6 +9973,9 @@ def api_today_games():
             # Get team colors and assets
             away_team_assets = get_team_assets(away_team)
             home_team_assets = get_team_assets(home_team)
+            away_logo_url = get_team_logo_url(away_team)
+            home_logo_url = get_team_logo_url(home_team)
+            st.item_mark('assets', game_key)
             
             # Extract prediction confidence
             comprehensive_details = game_data.get('comprehensive_details', {})
@@ -9273,6 +10042,7 @@ def api_today_games():
             # Log final result
             if real_over_under_total is None:
                 logger.warning(f"❌ CRITICAL: No real total line available for {betting_game_key} - total betting disabled for this game")
+            st.item_mark('lines_match', game_key)
             
             # Get betting recommendations for this game - try unified engine first
             game_recommendations = None
@@ -9321,6 +10091,7 @@ def api_today_games():
                 logger.warning(f"Enhanced betting grade calculation failed for {betting_game_key}: {grade_error}")
                 recommendation = "NEUTRAL"
                 bet_grade = "C"
+            st.item_mark('recs_match', game_key)
             
             # Get total runs prediction
             over_under_analysis = total_runs_prediction.get('over_under_analysis', {})
@@ -9401,6 +10172,7 @@ def api_today_games():
                 else:
                     if is_doubleheader:
                         logger.info("🛡️ DH safeguard: Skipping matchup-level pitcher override to keep per-game starters distinct")
+            st.item_mark('live_status', game_key)
             
             # Compute projected pitch counts and attach live metrics
             def _proj_pitch_metrics(name: str, team: str, opp: str):
@@ -9472,46 +10244,61 @@ def api_today_games():
 
             away_pitch_metrics = _proj_pitch_metrics(away_pitcher, away_team, home_team)
             home_pitch_metrics = _proj_pitch_metrics(home_pitcher, home_team, away_team)
+            st.item_mark('proj_pitch', game_key)
 
             # HEAVY PREDICTION PATH: For DH games or when explicitly requested, run full simulations per game
             try:
                 if prediction_engine and (heavy_mode or is_doubleheader):
                     sim_params = (prediction_engine.config or {}).get('simulation_parameters', {}) if hasattr(prediction_engine, 'config') else {}
                     sim_count = sim_count_override or sim_params.get('detailed_sim_count', 5000)
-                    results_pitch = prediction_engine.simulate_game_vectorized(
-                        away_team, home_team, int(sim_count), date_param, away_pitcher, home_pitcher
-                    )
-                    # simulate_game_vectorized returns (results, pitcher_info)
-                    if isinstance(results_pitch, tuple) and len(results_pitch) >= 1:
-                        results = results_pitch[0]
-                        if results:
+                    if analytic_mode and hasattr(prediction_engine, 'analyze_game'):
+                        analytic_summary = prediction_engine.analyze_game(
+                            away_team, home_team, date_param, away_pitcher, home_pitcher
+                        )
+                        sim_count = 'analytic'
+                        avg_away = round(analytic_summary['mean_away_runs'], 1)
+                        avg_home = round(analytic_summary['mean_home_runs'], 1)
+                        avg_total = round(analytic_summary['mean_total_runs'], 1)
+                        home_wp = round(analytic_summary['home_win_prob'] * 100.0, 1)
+                        away_wp = round(100.0 - home_wp, 1)
+                    else:
+                        results_pitch = prediction_engine.simulate_game_arrays(
+                            away_team, home_team, int(sim_count), date_param, away_pitcher, home_pitcher
+                        )
+                        results = None
+                        # simulate_game_arrays returns (SimulationArrays, pitcher_info)
+                        if isinstance(results_pitch, tuple) and len(results_pitch) >= 1:
+                            results = results_pitch[0]
+                        if results is not None and len(results):
                             total = len(results)
-                            home_wins = sum(1 for r in results if getattr(r, 'home_wins', False))
-                            sum_away = sum(getattr(r, 'away_score', 0) for r in results)
-                            sum_home = sum(getattr(r, 'home_score', 0) for r in results)
-                            sum_total = sum(getattr(r, 'total_runs', (getattr(r, 'away_score', 0)+getattr(r, 'home_score', 0))) for r in results)
-                            avg_away = round(float(sum_away) / float(total), 1) if total else 0.0
-                            avg_home = round(float(sum_home) / float(total), 1) if total else 0.0
-                            avg_total = round(float(sum_total) / float(total), 1) if total else 0.0
-                            home_wp = round((float(home_wins) / float(total)) * 100.0, 1) if total else 50.0
+                            home_wins = int(results.home_wins.sum())
+                            avg_away = round(float(results.away_scores.mean()), 1)
+                            avg_home = round(float(results.home_scores.mean()), 1)
+                            avg_total = round(float(results.total_runs.mean()), 1)
+                            home_wp = round((float(home_wins) / float(total)) * 100.0, 1)
                             away_wp = round(100.0 - home_wp, 1)
-                            # Write back into game_data predictions so downstream uses the heavy results
-                            game_data.setdefault('predictions', {})
-                            game_data['predictions'].update({
-                                'predicted_away_score': avg_away,
-                                'predicted_home_score': avg_home,
-                                'predicted_total_runs': avg_total,
-                                'away_win_prob': round(away_wp, 1),
-                                'home_win_prob': round(home_wp, 1)
-                            })
-                            game_data['predicted_away_score'] = avg_away
-                            game_data['predicted_home_score'] = avg_home
-                            game_data['predicted_total_runs'] = avg_total
-                            game_data['away_win_probability'] = away_wp
-                            game_data['home_win_probability'] = home_wp
-                            logger.info(f"🧠 HEAVY PRED: {away_team} @ {home_team} ({'DH' if is_doubleheader else 'single'}) -> {avg_away}-{avg_home} total {avg_total} | away_wp {away_wp} home_wp {home_wp} [sim:{sim_count}]")
+                        else:
+                            avg_away = None
+                    if avg_away is not None:
+                        # Write back into game_data predictions so downstream uses the heavy results
+                        game_data.setdefault('predictions', {})
+                        game_data['predictions'].update({
+                            'predicted_away_score': avg_away,
+                            'predicted_home_score': avg_home,
+                            'predicted_total_runs': avg_total,
+                            'away_win_prob': round(away_wp, 1),
+                            'home_win_prob': round(home_wp, 1)
+                        })
+                        game_data['predicted_away_score'] = avg_away
+                        game_data['predicted_home_score'] = avg_home
+                        game_data['predicted_total_runs'] = avg_total
+                        game_data['away_win_probability'] = away_wp
+                        game_data['home_win_probability'] = home_wp
+                        logger.info(f"🧠 HEAVY PRED: {away_team} @ {home_team} ({'DH' if is_doubleheader else 'single'}) -> {avg_away}-{avg_home} total {avg_total} | away_wp {away_wp} home_wp {home_wp} [sim:{sim_count}]")
             except Exception as _he:
                 logger.warning(f"Heavy prediction path failed for {away_team} @ {home_team}: {_he}")
+            if prediction_engine and (heavy_mode or is_doubleheader):
+                st.item_mark('heavy_sim', game_key)
 
             # Extract prediction data with fallback handling for nested structure
             predictions = game_data.get('predictions', {})
@@ -9579,6 +10366,19 @@ def api_today_games():
             # Derive DH metadata and game_pk for UI disambiguation
             dh_meta = game_data.get('meta') or {}
             game_pk_top = (dh_meta.get('game_pk') or game_data.get('game_id') or live_status_data.get('game_pk'))
+            st.item_mark('predictions', game_key)
+
+            # Convert the game's recommendations to the card format
+            game_betting_recommendations = (get_comprehensive_betting_recommendations(
+                game_recommendations, 
+                real_lines, away_team, home_team, away_win_prob_final, home_win_prob_final, predicted_total_final, real_over_under_total
+            ) or {
+                'value_bets': [],
+                'total_opportunities': 0,
+                'best_bet': None,
+                'summary': 'No strong opportunities identified'
+            })
+            st.item_mark('recs_convert', game_key)
 
             enhanced_game = {
                 'game_id': game_key,
@@ -9586,18 +10386,18 @@ def api_today_games():
                 'game_pk': str(game_pk_top) if game_pk_top is not None else None,
                 'away_team': away_team,
                 'home_team': home_team,
-                'away_logo': get_team_logo_url(away_team),
-                'home_logo': get_team_logo_url(home_team),
+                'away_logo': away_logo_url,
+                'home_logo': home_logo_url,
                 
                 # Team assets for template compatibility
                 'away_team_assets': {
-                    'logo_url': get_team_logo_url(away_team),
+                    'logo_url': away_logo_url,
                     'primary_color': away_team_assets.get('primary_color', '#333333'),
                     'secondary_color': away_team_assets.get('secondary_color', '#666666'),
                     'text_color': away_team_assets.get('text_color', '#FFFFFF')
                 },
                 'home_team_assets': {
-                    'logo_url': get_team_logo_url(home_team),
+                    'logo_url': home_logo_url,
                     'primary_color': home_team_assets.get('primary_color', '#333333'),
                     'secondary_color': home_team_assets.get('secondary_color', '#666666'),
                     'text_color': home_team_assets.get('text_color', '#FFFFFF')
@@ -9668,15 +10468,7 @@ def api_today_games():
                 # Real betting lines and recommendations - ALWAYS include unified recommendations
                 'real_betting_lines': real_lines,
                 'has_real_betting_lines': bool(real_lines and isinstance(real_lines, dict) and len(real_lines) > 0),
-                'betting_recommendations': (get_comprehensive_betting_recommendations(
-                    game_recommendations, 
-                    real_lines, away_team, home_team, away_win_prob_final, home_win_prob_final, predicted_total_final, real_over_under_total
-                ) or {
-                    'value_bets': [],
-                    'total_opportunities': 0,
-                    'best_bet': None,
-                    'summary': 'No strong opportunities identified'
-                }),
+                'betting_recommendations': game_betting_recommendations,
 
                 # Doubleheader flags for UI (badge and uniqueness)
                 'doubleheader': bool(dh_meta.get('doubleheader', False)),
@@ -9730,6 +10522,8 @@ def api_today_games():
             }
             
             enhanced_games.append(enhanced_game)
+            st.item_mark('assemble', game_key)
+        st.mark('games')
         
         logger.info(f"API today-games: Successfully processed {len(enhanced_games)} games for {date_param}")
         
@@ -9744,11 +10538,13 @@ def api_today_games():
             cache_set('today_games', {'date': date_param}, response_payload)
         except Exception:
             pass
-        resp = jsonify(response_payload)
+        if use_artifact and enhanced_games:
+            _write_today_games_artifact_async(date_param, response_payload, artifact_sources)
+        st.mark('cache_store')
+        resp = conditional_json(response_payload, 'today_games', {'date': date_param})
+        st.mark('serialize')
         try:
-            total_ms = int((time.time()-t_start)*1000)
-            resp.headers['Server-Timing'] = \
-                f"unified_cache;dur={uc_ms},lines;dur={lines_ms},recs;dur={recs_ms},total;dur={total_ms}"
+            _finish_today_games_timing(resp, st, date_param, 'built', len(enhanced_games))
             resp.headers['X-Cache-Hit'] = '0'
             if heavy_mode:
                 resp.headers['X-Heavy-Mode'] = '1'
@@ -9786,7 +10582,7 @@ def api_today_games_quick():
         except Exception:
             cached = None
         if cached is not None:
-            resp = jsonify(cached)
+            resp = conditional_json(cached, 'today_games_quick', {'date': date_param})
             try:
                 resp.headers['X-Cache-Hit'] = '1'
                 resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t0)*1000)}"
@@ -9974,10 +10770,8 @@ def api_today_games_quick():
 
         # Enrich quick snapshot with unified cache predictions and recommendations (fast, local-only)
         try:
-            # Load unified cache (reads from disk/memory; very fast)
-            unified_cache = load_unified_cache()
-            predictions_by_date = (unified_cache or {}).get('predictions_by_date', {})
-            today_data = (predictions_by_date or {}).get(date_param, {})
+            # Load only the requested date's shard (memory-cached; very fast)
+            today_data = load_unified_day(date_param)
             unified_games = (today_data or {}).get('games', {})
 
             # Try to fetch unified betting recommendations from cache without triggering heavy compute
@@ -10005,8 +10799,7 @@ def api_today_games_quick():
                     from pathlib import Path as _P
                     bets_path = _P(__file__).parent / 'data' / f"betting_recommendations_{date_param.replace('-', '_')}.json"
                     if bets_path.exists():
-                        with open(bets_path, 'r', encoding='utf-8') as _bf:
-                            _bets = json.load(_bf) or {}
+                        _bets = load_json_doc(str(bets_path)) or {}
                         # Normalize to a dict keyed by matchup
                         _games = (_bets.get('games') or {}) if isinstance(_bets, dict) else {}
                         tmp = {}
@@ -10227,7 +11020,7 @@ def api_today_games_quick():
             cache_set('today_games_quick', {'date': date_param}, payload)
         except Exception:
             pass
-        resp = jsonify(payload)
+        resp = conditional_json(payload, 'today_games_quick', {'date': date_param})
         try:
             resp.headers['X-Cache-Hit'] = '0'
             resp.headers['Server-Timing'] = f"total;dur={int((time.time()-t0)*1000)}"
@@ -10256,23 +11049,31 @@ def api_live_status():
             cached = None
         if cached is not None:
             logger.info("📦 live-status cache HIT")
-            return jsonify(cached)
+            return conditional_json(cached, 'live_status', {'date': date_param})
         else:
             logger.info("📦 live-status cache MISS")
         
         # Import the live MLB data fetcher (reuse global instance to leverage caches)
         from live_mlb_data import live_mlb_data as mlb_api, get_live_game_status
-        
-        # Load unified cache to get our prediction games
-        unified_cache = load_unified_cache()
-        predictions_by_date = unified_cache.get('predictions_by_date', {})
-        today_data = predictions_by_date.get(date_param, {})
+        # While the poller keeps this date fresh, serve games and pitcher lines from its state
+        live_state = _live_game_snapshot(date_param)
+        if live_state:
+            mlb_api.keep_polling(date_param)
+        
+        # Load this date's unified predictions shard; the doubleheader/seed fill below only adds
+        # keys, so a shallow copy keeps the shared shard doc untouched
+        today_data = load_unified_day(date_param)
         games_dict = today_data.get('games', {})
+        if isinstance(games_dict, dict):
+            games_dict = dict(games_dict)
         
     # Check for doubleheaders and add missing games from live data (same logic as today-games API)
         try:
             # Use global mlb_api instance for schedule/feed caches
-            live_games_data = mlb_api.get_enhanced_games_data(date_param)
+            if live_state:
+                live_games_data = [{'game_pk': pk, **g} for pk, g in live_state['games'].items()]
+            else:
+                live_games_data = mlb_api.get_enhanced_games_data(date_param)
             # Build fast lookup map for live status by normalized matchup
             live_status_map = {}
             try:
@@ -10342,9 +11143,12 @@ def api_live_status():
         # Live pitcher metrics from cached boxscores if available
         box_pitch_stats = {}
         try:
-            box_pitch_stats = _load_boxscore_pitcher_stats(date_param)
+            box_pitch_stats = _load_boxscore_pitcher_stats(date_param) or {}
         except Exception:
             box_pitch_stats = {}
+        if live_state:
+            box_pitch_stats = {**box_pitch_stats,
+                               **{k: {**v, 'hits': v.get('hits_allowed')} for k, v in live_state['pitchers'].items()}}
 
         # Helper to fetch live boxscore and map pitcher stats by name for a specific game
         def _fetch_boxscore_pitcher_stats_live(game_pk: Any) -> Dict[str, Dict[str, Any]]:
@@ -10446,7 +11250,7 @@ def api_live_status():
                 
                 # Get live status from pre-fetched schedule map to avoid per-game API calls
                 live_status = live_status_map.get((normalize_team_name(away_team), normalize_team_name(home_team)), {})
-                if not live_status:
+                if not live_status and not live_state:
                     # Fallback to timeout-based lookup only if not found (should be rare)
                     try:
                         live_status = get_live_status_with_timeout(away_team, home_team, date_param)
@@ -10464,7 +11268,7 @@ def api_live_status():
                 def _get_live_stat(name_key: str, field: str):
                     # try from preloaded cache
                     val = (box_pitch_stats.get(name_key, {}) or {}).get(field)
-                    if val is not None:
+                    if val is not None or live_state:
                         return val
                     # fallback: fetch boxscore per game
                     bs_live = _fetch_boxscore_pitcher_stats_live(live_status.get('game_pk'))
@@ -10554,7 +11358,7 @@ def api_live_status():
             cache_set('live_status', {'date': date_param}, response_payload)
         except Exception:
             pass
-        return jsonify(response_payload)
+        return conditional_json(response_payload, 'live_status', {'date': date_param})
     
     except Exception as e:
         logger.error(f"Error in API live-status: {e}")
@@ -10564,7 +11368,7 @@ def api_live_status():
         except Exception:
             date_param = get_business_date()
         try:
-            stale = cache_get('live_status', {'date': date_param}, ttl_seconds=3600)
+            stale = cache_get('live_status', {'date': date_param}, ttl_seconds=3600, coalesce=False)
         except Exception:
             stale = None
         if stale:
@@ -10588,12 +11392,10 @@ def api_single_prediction(away_team, home_team):
         date_param = request.args.get('date', get_business_date())
         logger.info(f"Getting prediction for {away_team} @ {home_team} on {date_param}")
         
-        # Load unified cache (hardcoded daily predictions)
-        unified_cache = load_unified_cache()
+        # Load this date's unified predictions shard
+        today_data = load_unified_day(date_param)
         real_betting_lines = load_real_betting_lines()
         betting_recommendations = load_betting_recommendations()
-        predictions_by_date = unified_cache.get('predictions_by_date', {})
-        today_data = predictions_by_date.get(date_param, {})
         games_dict = today_data.get('games', {})
         
         # Find the matching game in cache
@@ -11629,11 +12431,7 @@ def todays_opportunities_direct():
         min_conf = str(request.args.get('minConf', 'HIGH')).upper()
         conf_order = {'HIGH': 3, 'MEDIUM': 2, 'LOW': 1, 'NONE': 0}
         data_dir = Path(__file__).parent / 'data'
-        unified_cache_path = data_dir / 'unified_predictions_cache.json'
-        with open(unified_cache_path, 'r') as f:
-            cache_data = json.load(f)
-        predictions_by_date = cache_data.get('predictions_by_date', {})
-        today_data = predictions_by_date.get(today_str, {})
+        today_data = load_unified_day(today_str)
         today_games = today_data.get('games', {})
 
         # Load real betting lines for today to ground totals to actual market numbers
@@ -13774,17 +14572,27 @@ def get_performance_metrics():
                 'health': 'unknown'
             }
         
-        # Simple API health check (internal, no external calls)
+        # Simple API health check (internal, no external calls); response time from the timing registry
+        timings = {}
+        try:
+            timings = _PERF.snapshot(kind=request.args.get('kind') or None, prefix=request.args.get('prefix') or None)
+        except Exception:
+            timings = {}
+        endpoints = timings.get('endpoint') or {}
+        calls = sum(e['count'] for e in endpoints.values())
+        avg_ms = round(sum(e['total_ms'] for e in endpoints.values()) / calls, 1) if calls else None
         metrics['api'] = {
             'status': 'online',
-            'response_time_ms': 50,  # Estimated
-            'health': 'good'
+            'response_time_ms': avg_ms,
+            'health': 'good' if avg_ms is None or avg_ms < 1000 else 'slow'
         }
         
-        # Performance summary
+        # Performance summary: p50/p95/p99 per endpoint, Server-Timing stage and timed operation
         metrics['performance'] = {
-            'enabled': PERFORMANCE_TRACKING_AVAILABLE if 'PERFORMANCE_TRACKING_AVAILABLE' in globals() else False,
-            'overall_health': 'good'
+            'enabled': PERFORMANCE_TRACKING_AVAILABLE,
+            'overall_health': 'good',
+            'registry': _PERF.stats(),
+            'timings': timings
         }
         
         return jsonify({
@@ -294,21 +294,14 @@ class BettingRecommendationsEngine:
     
     def generate_betting_recommendations(self) -> Dict:
         import os
-        cache_path = os.path.abspath(os.path.join(os.getcwd(), 'data', 'unified_predictions_cache.json'))
-        logger.info(f"🔬 Diagnostic: Attempting to open predictions cache at: {cache_path}")
-        if not os.path.exists(cache_path):
-            logger.error(f"❌ Predictions cache file does not exist at: {cache_path}")
-            raise FileNotFoundError(f"Predictions cache file not found: {cache_path}")
+        from unified_predictions_store import get_unified_predictions_store
+        store = get_unified_predictions_store(os.path.abspath(os.path.join(os.getcwd(), 'data')))
+        logger.info(f"🔬 Diagnostic: Reading predictions shard for {self.current_date} from: {store.shard_dir}")
         try:
-            with open(cache_path, 'r') as f:
-                predictions_data = json.load(f)
+            today_data = store.get_date(self.current_date, {})
         except Exception as e:
-            logger.error(f"Error loading predictions from {cache_path}: {e}")
+            logger.error(f"Error loading predictions from {store.shard_dir}: {e}")
             return {}
-        # Confirm available date keys
-        available_dates = list(predictions_data.get('predictions_by_date', {}).keys())
-        logger.info(f"🔬 Available dates in cache: {available_dates}")
-        today_data = predictions_data.get('predictions_by_date', {}).get(self.current_date, {})
         if not today_data:
             logger.error(f"❌ No predictions found for date: {self.current_date}")
             return {}
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Content-addressed build manifest for the daily data artifacts.
+
+data/build_manifest.json records, per artifact (the output files of one producing step):
+
+  {"artifacts": {<name>: {"producer": <version>, "inputs": {path: hash}, "outputs": {path: hash},
+                          "built_at": ...}},
+   "hashes": {path: [mtime_ns, size, hash]}}
+
+A file hash is the sha256 of its content. JSON documents are hashed without their volatile
+timestamp fields (retrieved_at, generated_at, ...), so a re-fetch that returns the same data
+keeps its hash and does not invalidate anything downstream. The producer version is a hash
+of the producing code files plus an optional explicit version string, so a code change
+rebuilds its artifacts. Hashes are memoised by (mtime_ns, size): unchanged files are not
+re-read.
+
+  manifest = get_build_manifest()
+  if manifest.is_current('kelly_today', inputs, outputs, producer):
+      ...skip...
+  inputs_before = manifest.hash_files(inputs)   # before building
+  ...build...
+  manifest.record('kelly_today', inputs_before, outputs, producer)
+
+is_current() is True when the producer version and every input hash match the last
+recorded build and every output still exists with the recorded hash.
+"""
+from __future__ import annotations
+import os, json, glob, hashlib, threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are not serialized across processes
+    fcntl = None
+
+MANIFEST_PATH = os.path.join('data', 'build_manifest.json')
+VOLATILE_KEYS = frozenset((
+    'retrieved_at', 'generated_at', 'updated_at', 'last_updated', 'fetched_at', 'created_at',
+    'built_at', 'timestamp', 'promoted_at',
+))
+_JSON_HASH_MAX_BYTES = 64 * 1024 * 1024
+
+
+def expand_paths(patterns: Iterable[str]) -> list:
+    """Paths with glob patterns expanded (sorted, so the order is stable)"""
+    paths = []
+    for p in patterns:
+        if any(ch in p for ch in '*?['):
+            paths.extend(sorted(glob.glob(p)))
+        else:
+            paths.append(p)
+    return paths
+
+
+def _strip_volatile(doc: Any) -> Any:
+    if isinstance(doc, dict):
+        return {k: _strip_volatile(v) for k, v in doc.items() if k not in VOLATILE_KEYS}
+    if isinstance(doc, list):
+        return [_strip_volatile(v) for v in doc]
+    return doc
+
+
+def content_hash(path: str) -> Optional[str]:
+    """sha256 of a file's content (JSON without volatile timestamp fields); None when missing"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if path.endswith('.json') and len(data) <= _JSON_HASH_MAX_BYTES:
+        try:
+            doc = _strip_volatile(json.loads(data))
+            data = json.dumps(doc, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+        except Exception:
+            pass  # not valid JSON: hash the raw bytes
+    return hashlib.sha256(data).hexdigest()
+
+
+def producer_version(files: Sequence[str] = (), version: str = '') -> str:
+    """Version of a producer: hash of its code files (and an explicit version string)"""
+    h = hashlib.sha256(version.encode('utf-8'))
+    for path in expand_paths(files):
+        h.update(path.encode('utf-8'))
+        try:
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(b'<missing>')
+    return h.hexdigest()[:16]
+
+
+class BuildManifest:
+    def __init__(self, path: str = MANIFEST_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._doc: Optional[Dict[str, Any]] = None
+        self._dirty: set = set()
+        self._stats = {'hashed': 0, 'memo_hits': 0, 'current': 0, 'stale': 0, 'recorded': 0}
+
+    def _load(self) -> Dict[str, Any]:
+        if self._doc is None:
+            doc = None
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    doc = json.load(f)
+            except Exception:
+                pass
+            if not isinstance(doc, dict):
+                doc = {}
+            doc.setdefault('artifacts', {})
+            doc.setdefault('hashes', {})
+            self._doc = doc
+        return self._doc
+
+    def file_hash(self, path: str) -> Optional[str]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            memo = self._load()['hashes'].get(path)
+        if memo and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+            self._stats['memo_hits'] += 1
+            return memo[2]
+        digest = content_hash(path)
+        self._stats['hashed'] += 1
+        if digest is not None:
+            with self._lock:
+                self._load()['hashes'][path] = [st.st_mtime_ns, st.st_size, digest]
+                self._dirty.add(('hashes', path))
+        return digest
+
+    def hash_files(self, patterns: Iterable[str]) -> Dict[str, Optional[str]]:
+        """{path: content hash or None when missing} for paths and glob patterns"""
+        return {p: self.file_hash(p) for p in expand_paths(patterns)}
+
+    def entry(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load()['artifacts'].get(name)
+
+    def is_current(self, name: str, inputs: Iterable[str], outputs: Iterable[str], producer: str = '') -> bool:
+        """True when name was last built by the same producer from identical inputs and its outputs are intact"""
+        prev = self.entry(name)
+        current = bool(prev) and prev.get('producer') == producer
+        if current:
+            outs = self.hash_files(outputs)
+            current = (bool(outs) and all(h is not None for h in outs.values())
+                       and prev.get('outputs') == outs
+                       and prev.get('inputs') == self.hash_files(inputs))
+        self._stats['current' if current else 'stale'] += 1
+        return current
+
+    def record(self, name: str, input_hashes: Dict[str, Optional[str]], outputs: Iterable[str],
+               producer: str = '', **extra) -> Dict[str, Any]:
+        """Record a successful build (input_hashes taken with hash_files() before building)"""
+        entry = {
+            'producer': producer,
+            'inputs': input_hashes,
+            'outputs': self.hash_files(outputs),
+            'built_at': datetime.now().isoformat(),
+            **extra,
+        }
+        with self._lock:
+            self._load()['artifacts'][name] = entry
+            self._dirty.add(('artifacts', name))
+            self._stats['recorded'] += 1
+        return entry
+
+    def changed_outputs(self, name: str, outputs: Iterable[str]) -> Dict[str, bool]:
+        """{path: True when its content differs from the last recorded build of name}"""
+        prev = (self.entry(name) or {}).get('outputs') or {}
+        return {p: prev.get(p) != h for p, h in self.hash_files(outputs).items()}
+
+    def save(self):
+        """Write the manifest, merging entries recorded concurrently by other processes"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                with open(self.path + '.lock', 'a') as lock_file:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                    self._merge_and_write()  # the lock is released when the file closes
+            except Exception:
+                return
+
+    def _merge_and_write(self):
+        """Read-merge-write of the dirty entries; the caller holds both locks"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                on_disk = json.load(f)
+            if not isinstance(on_disk, dict):
+                on_disk = {}
+        except Exception:
+            on_disk = {}
+        doc = self._load()
+        merged = {'artifacts': dict(on_disk.get('artifacts') or {}), 'hashes': dict(on_disk.get('hashes') or {})}
+        for section, key in self._dirty:
+            merged[section][key] = doc[section][key]
+        # Forget memoised hashes of files that no longer exist
+        merged['hashes'] = {p: v for p, v in merged['hashes'].items() if os.path.exists(p)}
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=1)
+        os.replace(tmp, self.path)
+        self._doc = merged
+        self._dirty.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            doc = self._load()
+            return {**self._stats, 'artifacts': len(doc['artifacts']), 'memoised_files': len(doc['hashes'])}
+
+
+_MANIFESTS: Dict[str, BuildManifest] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+def get_build_manifest(path: str = MANIFEST_PATH) -> BuildManifest:
+    """Process-wide shared manifest for a path"""
+    key = os.path.abspath(path)
+    manifest = _MANIFESTS.get(key)
+    if manifest is None:
+        with _MANIFESTS_LOCK:
+            manifest = _MANIFESTS.get(key)
+            if manifest is None:
+                manifest = _MANIFESTS[key] = BuildManifest(path)
+    return manifest
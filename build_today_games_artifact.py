@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed /api/today-games payload artifact for a date.
+- Computes the payload once through the app's own endpoint (no artifact, no heavy mode)
+- Writes data/artifacts/today_games/<DATE>.json (+ .gz/.br variants and .meta.json with the ETag)
+
+The web app serves the artifact directly until one of its source files changes
+(unified predictions shard, real betting lines, betting recommendations, app.py).
+
+Run without args for today's business date; or pass --date YYYY-MM-DD.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent
+
+
+def _parse_args():
+    import argparse
+    p = argparse.ArgumentParser(description='Build the precomputed today-games payload artifact')
+    p.add_argument('--date', help='Target date YYYY-MM-DD (default: business date)')
+    return p.parse_args()
+
+
+def build_today_games_artifact(date_str: str = None) -> dict:
+    os.chdir(BASE_PATH)
+    sys.path.insert(0, str(BASE_PATH))
+    import app as webapp
+
+    date_str = date_str or webapp.get_business_date()
+    sources = webapp.source_signatures(webapp._today_games_artifact_sources(date_str))
+    with webapp.app.test_request_context(f'/api/today-games?date={date_str}&no_artifact=1'):
+        resp = webapp.api_today_games()
+        payload = resp.get_json(silent=True) or {}
+    meta = webapp.write_today_games_artifact(date_str, payload, sources)
+    if meta is None:
+        print(f"⚠️ No games for {date_str}; artifact not written")
+        return {}
+    print(f"✅ today-games artifact for {date_str}: {meta['games']} games, {meta['bytes']} bytes, "
+          f"encodings={meta['encodings']} etag={meta['etag']}")
+    return meta
+
+
+def main() -> int:
+    args = _parse_args()
+    try:
+        build_today_games_artifact(args.date)
+        return 0
+    except Exception as e:
+        print(f"❌ today-games artifact build failed: {e}")
+        return 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
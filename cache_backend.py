@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""Pluggable key/value backend for the web app's response caches.
+
+The app's hot caches (response cache, unified pitcher payloads, projection memo, unified
+betting recs, home snapshot) store through one backend so that, with more than one gunicorn
+worker, a payload built (or warmed) by one worker is served by all of them.
+
+Backends (env APP_CACHE_BACKEND):
+  memory  per-process dict (default; same behaviour as the old module-level dicts)
+  sqlite  shared file on the local host (APP_CACHE_SQLITE_PATH, default data/.cache/app_cache.sqlite3);
+          WAL mode, safe across forked workers on one machine
+  redis   shared Redis server (APP_CACHE_REDIS_URL or REDIS_URL; requires the redis package)
+
+Entries are (ts, value) pairs; ts is the write time used by callers for their own TTL checks,
+and each entry also carries a retention ttl after which the backend drops it. Shared
+backends pickle values and keep a small per-process L1 of decoded values keyed by ts, so
+an unchanged entry is only unpickled once per worker.
+
+Values returned by get() are shared between callers: treat them as read-only.
+"""
+from __future__ import annotations
+import os, time, pickle, sqlite3, threading, logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600.0
+L1_MAX_ENTRIES = 4096
+
+
+class CacheBackend:
+    name = 'base'
+    shared = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'sets': 0, 'errors': 0}
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """(ts, value) for key, or None when missing/expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float = None, ts: float = None):
+        raise NotImplementedError
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        """Set key only if absent (or expired); True when this caller stored it."""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self, prefix: str = ''):
+        raise NotImplementedError
+
+    def namespace(self, prefix: str, ttl: float = None) -> 'CacheNamespace':
+        return CacheNamespace(self, prefix, ttl)
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'backend': self.name, 'shared': self.shared}
+
+
+class MemoryBackend(CacheBackend):
+    name = 'memory'
+
+    def __init__(self):
+        super().__init__()
+        self._data: Dict[str, Tuple[float, Any, float]] = {}
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            if entry[2] < now:
+                self._data.pop(key, None)
+                self._stats['misses'] += 1
+                return None
+            self._stats['hits'] += 1
+            return entry[0], entry[1]
+
+    def set(self, key, value, ttl=None, ts=None):
+        now = time.time()
+        with self._lock:
+            self._data[key] = (now if ts is None else ts, value, now + (DEFAULT_TTL if ttl is None else ttl))
+            self._stats['sets'] += 1
+
+    def add(self, key, value, ttl):
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[2] >= now:
+                return False
+            self._data[key] = (now, value, now + ttl)
+            return True
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self, prefix=''):
+        with self._lock:
+            for k in [k for k in self._data if k.startswith(prefix)]:
+                self._data.pop(k, None)
+
+    def stats(self):
+        out = super().stats()
+        with self._lock:
+            out['entries'] = len(self._data)
+        return out
+
+
+class _SharedBackend(CacheBackend):
+    """Common L1 handling for backends that store pickled values out of process."""
+    shared = True
+
+    def __init__(self):
+        super().__init__()
+        self._l1: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._stats.update({'l1_hits': 0, 'decodes': 0})
+
+    def _from_l1(self, key: str, ts: float):
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is not None and entry[0] == ts:
+                self._l1.move_to_end(key)
+                self._stats['hits'] += 1
+                self._stats['l1_hits'] += 1
+                return entry
+        return None
+
+    def _to_l1(self, key: str, ts: float, value: Any):
+        with self._lock:
+            self._l1[key] = (ts, value)
+            self._l1.move_to_end(key)
+            while len(self._l1) > L1_MAX_ENTRIES:
+                self._l1.popitem(last=False)
+
+    def _drop_l1(self, prefix: str = None, key: str = None):
+        with self._lock:
+            if key is not None:
+                self._l1.pop(key, None)
+            else:
+                for k in [k for k in self._l1 if k.startswith(prefix or '')]:
+                    self._l1.pop(k, None)
+
+    def _decoded(self, key: str, ts: float, blob: bytes):
+        value = pickle.loads(blob)
+        with self._lock:
+            self._stats['hits'] += 1
+            self._stats['decodes'] += 1
+        self._to_l1(key, ts, value)
+        return ts, value
+
+
+class SQLiteBackend(_SharedBackend):
+    name = 'sqlite'
+    PURGE_EVERY = 200
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._local = threading.local()
+        self._sets_since_purge = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._conn()
+        conn.execute('CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, ts REAL NOT NULL, '
+                     'expires REAL NOT NULL, value BLOB NOT NULL)')
+        conn.execute('CREATE INDEX IF NOT EXISTS kv_expires ON kv (expires)')
+
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread and per process (connections must not cross a fork)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key):
+        try:
+            conn = self._conn()
+            row = conn.execute('SELECT ts FROM kv WHERE key = ? AND expires >= ?', (key, time.time())).fetchone()
+            if row is None:
+                self._count('misses')
+                return None
+            hit = self._from_l1(key, row[0])
+            if hit is not None:
+                return hit
+            row = conn.execute('SELECT ts, value FROM kv WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self._count('misses')
+                return None
+            return self._decoded(key, row[0], row[1])
+        except Exception as e:
+            self._count('errors')
+            logger.debug(f"sqlite cache get failed for {key}: {e}")
+            return None
+
+    def set(self, key, value, ttl=None, ts=None):
+        now = time.time()
+        ts = now if ts is None else ts
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            conn = self._conn()
+            conn.execute('INSERT OR REPLACE INTO kv (key, ts, expires, value) VALUES (?, ?, ?, ?)',
+                         (key, ts, now + (DEFAULT_TTL if ttl is None else ttl), sqlite3.Binary(blob)))
+            self._to_l1(key, ts, value)
+            with self._lock:
+                self._stats['sets'] += 1
+                self._sets_since_purge += 1
+                purge = self._sets_since_purge >= self.PURGE_EVERY
+                if purge:
+                    self._sets_since_purge = 0
+            if purge:
+                conn.execute('DELETE FROM kv WHERE expires < ?', (now,))
+        except Exception as e:
+            self._count('errors')
+            logger.debug(f"sqlite cache set failed for {key}: {e}")
+
+    def add(self, key, value, ttl):
+        now = time.time()
+        try:
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.execute('DELETE FROM kv WHERE key = ? AND expires < ?', (key, now))
+                cur = conn.execute('INSERT OR IGNORE INTO kv (key, ts, expires, value) VALUES (?, ?, ?, ?)',
+                                   (key, now, now + ttl, sqlite3.Binary(pickle.dumps(value))))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            return cur.rowcount == 1
+        except Exception as e:
+            self._count('errors')
+            logger.debug(f"sqlite cache add failed for {key}: {e}")
+            return False
+
+    def delete(self, key):
+        self._drop_l1(key=key)
+        try:
+            self._conn().execute('DELETE FROM kv WHERE key = ?', (key,))
+        except Exception:
+            self._count('errors')
+
+    def clear(self, prefix=''):
+        self._drop_l1(prefix=prefix)
+        try:
+            escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            self._conn().execute("DELETE FROM kv WHERE key LIKE ? ESCAPE '\\'", (escaped + '%',))
+        except Exception:
+            self._count('errors')
+
+    def stats(self):
+        out = super().stats()
+        out['path'] = self.path
+        try:
+            out['entries'] = self._conn().execute('SELECT COUNT(*) FROM kv WHERE expires >= ?', (time.time(),)).fetchone()[0]
+        except Exception:
+            pass
+        return out
+
+
+class RedisBackend(_SharedBackend):
+    """Entries are hashes {ts, v} with a key expiry; keys are prefixed with APP_CACHE_REDIS_PREFIX."""
+    name = 'redis'
+
+    def __init__(self, url: str, prefix: str = 'mlbapp:'):
+        super().__init__()
+        import redis  # optional dependency
+        self._redis = redis.Redis.from_url(url, socket_timeout=2.0, socket_connect_timeout=2.0)
+        self._redis.ping()
+        self.prefix = prefix
+
+    def get(self, key):
+        rkey = self.prefix + key
+        try:
+            raw_ts = self._redis.hget(rkey, 'ts')
+            if raw_ts is None:
+                self._count('misses')
+                return None
+            ts = float(raw_ts)
+            hit = self._from_l1(key, ts)
+            if hit is not None:
+                return hit
+            raw_ts, blob = self._redis.hmget(rkey, 'ts', 'v')
+            if blob is None:
+                self._count('misses')
+                return None
+            return self._decoded(key, float(raw_ts), blob)
+        except Exception as e:
+            self._count('errors')
+            logger.debug(f"redis cache get failed for {key}: {e}")
+            return None
+
+    def set(self, key, value, ttl=None, ts=None):
+        ts = time.time() if ts is None else ts
+        rkey = self.prefix + key
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            pipe = self._redis.pipeline()
+            pipe.hset(rkey, mapping={'ts': repr(ts), 'v': blob})
+            pipe.expire(rkey, max(1, int(DEFAULT_TTL if ttl is None else ttl)))
+            pipe.execute()
+            self._to_l1(key, ts, value)
+            self._count('sets')
+        except Exception as e:
+            self._count('errors')
+            logger.debug(f"redis cache set failed for {key}: {e}")
+
+    _ADD_SCRIPT = (
+        "if redis.call('EXISTS', KEYS[1]) == 1 then return 0 end "
+        "redis.call('HSET', KEYS[1], 'ts', ARGV[1], 'v', ARGV[2]) "
+        "redis.call('EXPIRE', KEYS[1], ARGV[3]) return 1"
+    )
+
+    def add(self, key, value, ttl):
+        try:
+            return bool(self._redis.eval(self._ADD_SCRIPT, 1, self.prefix + key, repr(time.time()),
+                                         pickle.dumps(value), max(1, int(ttl))))
+        except Exception:
+            self._count('errors')
+            return False
+
+    def delete(self, key):
+        self._drop_l1(key=key)
+        try:
+            self._redis.delete(self.prefix + key)
+        except Exception:
+            self._count('errors')
+
+    def clear(self, prefix=''):
+        self._drop_l1(prefix=prefix)
+        try:
+            batch = []
+            for k in self._redis.scan_iter(match=self.prefix + prefix + '*', count=500):
+                batch.append(k)
+                if len(batch) >= 500:
+                    self._redis.delete(*batch)
+                    batch = []
+            if batch:
+                self._redis.delete(*batch)
+        except Exception:
+            self._count('errors')
+
+
+class CacheNamespace:
+    """Dict-like view of one key prefix ('<prefix>|<key>'); get() returns the stored value."""
+
+    def __init__(self, backend: CacheBackend, prefix: str, ttl: float = None):
+        self.backend = backend
+        self.prefix = prefix + '|'
+        self.ttl = ttl
+
+    def get_entry(self, key: str) -> Optional[Tuple[float, Any]]:
+        return self.backend.get(self.prefix + str(key))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self.get_entry(key)
+        return default if entry is None else entry[1]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get_entry(key) is not None
+
+    def __setitem__(self, key: str, value: Any):
+        self.backend.set(self.prefix + str(key), value, ttl=self.ttl)
+
+    def put(self, key: str, value: Any, ts: float = None):
+        """Like item assignment, with an explicit write time."""
+        self.backend.set(self.prefix + str(key), value, ttl=self.ttl, ts=ts)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        value = self.get(key, default)
+        self.backend.delete(self.prefix + str(key))
+        return value
+
+    def clear(self, sub: str = ''):
+        """Drop every key in the namespace (or only keys starting with sub)."""
+        self.backend.clear(self.prefix + sub)
+
+
+def _create_backend() -> CacheBackend:
+    kind = (os.environ.get('APP_CACHE_BACKEND') or 'memory').strip().lower()
+    try:
+        if kind == 'sqlite':
+            path = os.environ.get('APP_CACHE_SQLITE_PATH') or os.path.join('data', '.cache', 'app_cache.sqlite3')
+            return SQLiteBackend(path)
+        if kind == 'redis':
+            url = os.environ.get('APP_CACHE_REDIS_URL') or os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
+            return RedisBackend(url, prefix=os.environ.get('APP_CACHE_REDIS_PREFIX', 'mlbapp:'))
+    except Exception as e:
+        logger.warning(f"Cache backend '{kind}' unavailable ({e}); using in-process memory cache")
+    return MemoryBackend()
+
+
+_BACKEND: Optional[CacheBackend] = None
+_BACKEND_LOCK = threading.Lock()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Process-wide backend selected by APP_CACHE_BACKEND (created on first use)."""
+    global _BACKEND
+    if _BACKEND is None:
+        with _BACKEND_LOCK:
+            if _BACKEND is None:
+                _BACKEND = _create_backend()
+    return _BACKEND
@@ -9,7 +9,7 @@ import sys
 import subprocess
 import logging
 import shutil
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 import json
 
@@ -86,6 +86,40 @@ def run_script(script_path: Path, description: str, logger, timeout: int = 300):
         logger.error(f"💥 EXCEPTION: {description} - {str(e)}")
         return False
 
+def in_process_enabled() -> bool:
+    """Whether pipeline steps marked safe may call a script's main() in this process (env PIPELINE_IN_PROCESS=0 disables)"""
+    return os.environ.get('PIPELINE_IN_PROCESS', '1').lower() not in ('0', 'false', 'no')
+
+def run_in_process(script_path: Path, description: str, logger) -> bool:
+    """Run a script's main() in this process instead of a fresh interpreter.
+    Only for scripts whose main() takes no CLI args, returns a status and keeps no global
+    state that would clash with other steps running on the pipeline's worker threads."""
+    try:
+        logger.info(f"🚀 {description} (in-process)")
+        if os.environ.get('NO_GAMES_MODE', '').lower() in ('1', 'true', 'yes'):
+            logger.info(f"⏭️ Skipping in no-games mode: {description}")
+            return True
+        if not script_path.exists():
+            logger.warning(f"⚠️ Script not found, skipping: {script_path}")
+            return False
+        import importlib
+        if str(script_path.parent) not in sys.path:
+            sys.path.insert(0, str(script_path.parent))
+        module = importlib.import_module(script_path.stem)
+        try:
+            result = module.main()
+        except SystemExit as e:
+            result = e.code in (0, None)
+        ok = True if result is None else bool(result)
+        if ok:
+            logger.info(f"✅ SUCCESS: {description}")
+        else:
+            logger.error(f"❌ FAILED: {description}")
+        return ok
+    except Exception as e:
+        logger.error(f"💥 EXCEPTION: {description} - {str(e)}")
+        return False
+
 def copy_file_safe(source: Path, target: Path, logger):
     """Safely copy a file with error handling"""
     try:
@@ -158,18 +192,12 @@ def write_no_games_day_files(data_dir: Path, today: str, today_underscore: str,
     except Exception as e:
         logger.warning(f"⚠️ Failed to write no-games skeleton files: {e}")
 
-def seed_no_games_unified_cache(unified_cache_path: Path, today: str, games_path: Path, recs_path: Path, logger) -> None:
-    """Seed unified_predictions_cache.json with a no-games entry for today."""
+def seed_no_games_unified_cache(data_dir: Path, today: str, games_path: Path, recs_path: Path, logger) -> None:
+    """Seed today's unified predictions shard with a no-games entry."""
     try:
-        cache = {}
-        if unified_cache_path.exists() and unified_cache_path.stat().st_size > 0:
-            try:
-                with open(unified_cache_path, 'r', encoding='utf-8') as f:
-                    cache = json.load(f) or {}
-            except Exception:
-                cache = {}
-        cache.setdefault('predictions_by_date', {})
-        cache['predictions_by_date'][today] = {
+        from unified_predictions_store import get_unified_predictions_store
+        store = get_unified_predictions_store(str(data_dir))
+        store.put_date(today, {
             'games': {},
             'timestamp': datetime.now().isoformat(),
             'total_games': 0,
@@ -177,11 +205,8 @@ def seed_no_games_unified_cache(unified_cache_path: Path, today: str, games_path
             'games_file': str(games_path),
             'betting_file': str(recs_path),
             'notes': 'No MLB games today'
-        }
-        unified_cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(unified_cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, ensure_ascii=False, indent=2)
-        logger.info(f"🧘 Seeded unified cache with no-games entry: {unified_cache_path.name}")
+        })
+        logger.info(f"🧘 Seeded unified predictions with no-games entry: {store.shard_path(today)}")
     except Exception as e:
         logger.warning(f"⚠️ Failed to seed unified cache for no-games day: {e}")
 
@@ -295,112 +320,175 @@ def complete_daily_automation():
             # Ensure skeletal files exist for today
             write_no_games_day_files(data_dir, today, today_underscore, logger)
             # Seed unified cache so the frontend has a stable entry
-            unified_cache_seed_path = data_dir / "unified_predictions_cache.json"
             recs_seed_path = data_dir / f"betting_recommendations_{today_underscore}.json"
-            seed_no_games_unified_cache(unified_cache_seed_path, today, games_path_for_check, recs_seed_path, logger)
+            seed_no_games_unified_cache(data_dir, today, games_path_for_check, recs_seed_path, logger)
             # Signal run_script to skip subsequent heavy invocations
             os.environ['NO_GAMES_MODE'] = '1'
     except Exception as e:
         logger.debug(f"No-games detection failed gracefully: {e}")
     
-    # Step 2: Fetch Probable Pitchers
-    logger.info("\n🎯 STEP 2: Fetching Probable Pitchers")
-    pitcher_candidates = [
-        base_dir / "fetch_todays_starters.py"
-    ]
+    # Steps 2-7 run as a dependency DAG (see pipeline_dag.py): independent branches such as
+    # weather, team strengths, pitcher props and betting lines overlap on a worker pool, and
+    # file-only steps are skipped when their declared inputs are unchanged since their last
+    # successful run. Writers of the same master files (pitcher stats, team strength) are
+    # chained so they never run concurrently.
+    from pipeline_dag import Step, PipelineRunner
+    from build_manifest import get_build_manifest, producer_version
+    build_manifest = get_build_manifest()
+    os.chdir(base_dir)  # in-process steps resolve 'data/...' relative to the repo root
+    inproc = in_process_enabled()
+    games_file = f"data/games_{today}.json"
+    bovada_dir = "data/daily_bovada"
+    props_file = f"{bovada_dir}/bovada_pitcher_props_{today_underscore}.json"
+    datasets_dir = "data/model_datasets"
+    unified_shard = f"data/unified_predictions/{today}.json"
+    recs_file = f"data/betting_recommendations_{today_underscore}.json"
+    lines_file = f"data/real_betting_lines_{today_underscore}.json"
 
-    success2 = False
-    for candidate in pitcher_candidates:
-        if candidate.exists():
-            success2 = run_script(candidate, f"Fetch Probable Pitchers ({candidate.name})", logger, 300)
-            if success2:
-                break
-        else:
-            logger.debug(f"Pitcher fetch candidate not found: {candidate}")
+    def step_starters():
+        logger.info("\n🎯 STEP 2: Fetching Probable Pitchers")
+        pitcher_candidates = [
+            base_dir / "fetch_todays_starters.py"
+        ]
 
-    if not success2:
-        logger.warning("⚠️ No pitcher fetch script found - predictions may lack pitcher data")
-    else:
-        # Re-run games fetch to merge newly fetched pitcher names into games file
-        logger.info("\n🔁 STEP 2B: Re-fetching Games to Merge Pitchers")
-        success1b = False
-        for candidate in games_candidates:
+        success2 = False
+        for candidate in pitcher_candidates:
             if candidate.exists():
-                success1b = run_script(candidate, f"Re-Fetch Today's Games for Pitcher Merge ({candidate.name})", logger, 300)
-                if success1b:
+                success2 = run_script(candidate, f"Fetch Probable Pitchers ({candidate.name})", logger, 300)
+                if success2:
                     break
-        if not success1b:
-            logger.warning("⚠️ Pitchers fetched but failed to re-merge into games file")
-    
+            else:
+                logger.debug(f"Pitcher fetch candidate not found: {candidate}")
+
+        if not success2:
+            logger.warning("⚠️ No pitcher fetch script found - predictions may lack pitcher data")
+        else:
+            # Re-run games fetch to merge newly fetched pitcher names into games file
+            logger.info("\n🔁 STEP 2B: Re-fetching Games to Merge Pitchers")
+            success1b = False
+            for candidate in games_candidates:
+                if candidate.exists():
+                    success1b = run_script(candidate, f"Re-Fetch Today's Games for Pitcher Merge ({candidate.name})", logger, 300)
+                    if success1b:
+                        break
+            if not success1b:
+                logger.warning("⚠️ Pitchers fetched but failed to re-merge into games file")
+        return success2
+
     # Step 2.5: Update Core Data Files (CRITICAL - Must run before predictions)
-    logger.info("\n🔄 STEP 2.5: Updating Core Data Files")
-    
-    # Step 2.5a: Generate Weather & Park Factors (PRIORITY - affects predictions)
-    logger.info("🌤️ Generating weather and park factors...")
-    weather_script = base_dir / "weather_park_integration.py"
-    if weather_script.exists():
+    def step_weather():
+        logger.info("🌤️ Generating weather and park factors...")
+        weather_script = base_dir / "weather_park_integration.py"
+        if not weather_script.exists():
+            logger.warning("⚠️ Weather integration script not found - using cached weather data")
+            return False
         success_weather = run_script(weather_script, "Generate Weather & Park Factors", logger, 180)
         if success_weather:
             logger.info("✅ Weather and park factors generated")
         else:
             logger.warning("⚠️ Weather generation failed - using static park factors only")
-    else:
-        logger.warning("⚠️ Weather integration script not found - using cached weather data")
-    
-    # Update pitcher stats first (affects today's games)
-    logger.info("📊 Updating pitcher statistics...")
-    pitcher_updater = base_dir / "fast_pitcher_updater.py"
-    if pitcher_updater.exists():
-        success_pitcher = run_script(pitcher_updater, "Update Pitcher Stats", logger, 180)
+        return success_weather
+
+    def step_pitcher_stats():
+        logger.info("📊 Updating pitcher statistics...")
+        pitcher_updater = base_dir / "fast_pitcher_updater.py"
+        if not pitcher_updater.exists():
+            logger.warning("⚠️ Pitcher updater not found - using cached pitcher data")
+            return False
+        success_pitcher = (run_in_process(pitcher_updater, "Update Pitcher Stats", logger) if inproc
+                           else run_script(pitcher_updater, "Update Pitcher Stats", logger, 180))
         if success_pitcher:
             logger.info("✅ Pitcher stats updated")
         else:
             logger.warning("⚠️ Pitcher stats update failed - using cached data")
-    else:
-        logger.warning("⚠️ Pitcher updater not found - using cached pitcher data")
+        return success_pitcher
 
-    # NEW: Fetch Bovada pitcher props
-    logger.info("🧾 Fetching Bovada pitcher prop lines...")
     bovada_script = base_dir / "fetch_bovada_pitcher_props.py"
-    success_bovada = False
-    if bovada_script.exists():
-        success_bovada = run_script(bovada_script, "Fetch Bovada Pitcher Props", logger, 180)
-    else:
-        logger.warning("⚠️ Bovada pitcher props script not found")
-
-    # NEW: Daily pitcher props model retraining BEFORE generating projections
-    logger.info("🧪 STEP 2.6: Daily Pitcher Props Model Retraining")
-    # 1) Build enriched projection features for today (used by historical dataset)
-    proj_features_script = base_dir / "pitcher_projections.py"
-    if proj_features_script.exists():
-        run_script(proj_features_script, "Build Pitcher Projection Features (today)", logger, 420)
-    else:
-        logger.warning("⚠️ pitcher_projections.py not found - dataset may miss today's features")
+    pitcher_prop_proj_script = base_dir / "generate_pitcher_prop_projections.py"
 
-    # 2) Update historical dataset from daily snapshots
-    hist_dataset_script = base_dir / "historical_pitcher_prop_dataset.py"
-    if hist_dataset_script.exists():
-        run_script(hist_dataset_script, "Update Historical Pitcher Props Dataset", logger, 180)
-    else:
-        logger.warning("⚠️ historical_pitcher_prop_dataset.py not found - skipping dataset append")
+    def fetch_bovada(description):
+        if inproc:
+            return run_in_process(bovada_script, description, logger)
+        return run_script(bovada_script, description, logger, 180)
 
-    # 3) Try to ingest outcomes into dataset CSV and augment targets
-    upd_outcomes_script = base_dir / "update_pitcher_prop_outcomes.py"
-    if upd_outcomes_script.exists():
-        run_script(upd_outcomes_script, "Update Pitcher Prop Outcomes (box scores)", logger, 300)
-    else:
-        logger.info("ℹ️ update_pitcher_prop_outcomes.py not found - relying on realized_results file if present")
+    def generate_prop_projections(description):
+        if inproc:
+            return run_in_process(pitcher_prop_proj_script, description, logger)
+        return run_script(pitcher_prop_proj_script, description, logger, 240)
 
-    augment_targets_script = base_dir / "training" / "augment_with_outcomes.py"
-    if augment_targets_script.exists():
-        run_script(augment_targets_script, "Augment Dataset With Targets", logger, 180)
-    else:
-        logger.warning("⚠️ training/augment_with_outcomes.py not found - training may fallback to projections as targets")
+    def step_bovada_props():
+        logger.info("🧾 Fetching Bovada pitcher prop lines...")
+        if not bovada_script.exists():
+            logger.warning("⚠️ Bovada pitcher props script not found")
+            return False
+        return fetch_bovada("Fetch Bovada Pitcher Props")
+
+    def step_team_strengths():
+        logger.info("🏟️ Updating team strength ratings...")
+        team_updater = base_dir / "weekly_team_updater.py"
+        if not team_updater.exists():
+            logger.warning("⚠️ Team updater not found - using cached team data")
+            return False
+        success_teams = (run_in_process(team_updater, "Update Team Strengths", logger) if inproc
+                         else run_script(team_updater, "Update Team Strengths", logger, 120))
+        if success_teams:
+            logger.info("✅ Team strengths updated")
+        else:
+            logger.warning("⚠️ Team strength update failed - using cached data")
+        return success_teams
+
+    def step_daily_data():
+        # Update comprehensive daily data (bullpen, weather, etc.)
+        logger.info("🌐 Updating comprehensive daily data...")
+        daily_updater = base_dir / "daily_data_updater.py"
+        if not daily_updater.exists():
+            logger.warning("⚠️ Daily data updater not found - using cached daily data")
+            return False
+        success_daily = run_script(daily_updater, "Update Daily Data", logger, 300)  # Increased timeout to 300s
+        if success_daily:
+            logger.info("✅ Daily data updated (bullpen, weather factors)")
+        else:
+            logger.warning("⚠️ Daily data update failed - using cached data")
+        return success_daily
 
-    # 4) Train pitcher models (scikit-learn). If deps missing, script will exit gracefully.
-    train_pitcher_models_script = base_dir / "training" / "train_pitcher_models.py"
-    latest_models_version = None
-    if train_pitcher_models_script.exists():
+    # STEP 2.6: Daily pitcher props model retraining BEFORE generating projections
+    def step_projection_features():
+        # 1) Build enriched projection features for today (used by historical dataset)
+        proj_features_script = base_dir / "pitcher_projections.py"
+        if not proj_features_script.exists():
+            logger.warning("⚠️ pitcher_projections.py not found - dataset may miss today's features")
+            return False
+        return run_script(proj_features_script, "Build Pitcher Projection Features (today)", logger, 420)
+
+    def step_props_dataset():
+        # 2) Update historical dataset from daily snapshots
+        hist_dataset_script = base_dir / "historical_pitcher_prop_dataset.py"
+        if not hist_dataset_script.exists():
+            logger.warning("⚠️ historical_pitcher_prop_dataset.py not found - skipping dataset append")
+            return False
+        return run_script(hist_dataset_script, "Update Historical Pitcher Props Dataset", logger, 180)
+
+    def step_prop_outcomes():
+        # 3) Try to ingest outcomes into dataset CSV and augment targets
+        upd_outcomes_script = base_dir / "update_pitcher_prop_outcomes.py"
+        if not upd_outcomes_script.exists():
+            logger.info("ℹ️ update_pitcher_prop_outcomes.py not found - relying on realized_results file if present")
+            return False
+        return run_script(upd_outcomes_script, "Update Pitcher Prop Outcomes (box scores)", logger, 300)
+
+    def step_augment_targets():
+        augment_targets_script = base_dir / "training" / "augment_with_outcomes.py"
+        if not augment_targets_script.exists():
+            logger.warning("⚠️ training/augment_with_outcomes.py not found - training may fallback to projections as targets")
+            return False
+        return run_script(augment_targets_script, "Augment Dataset With Targets", logger, 180)
+
+    def step_train_models():
+        # 4) Train pitcher models (scikit-learn). If deps missing, script will exit gracefully.
+        train_pitcher_models_script = base_dir / "training" / "train_pitcher_models.py"
+        if not train_pitcher_models_script.exists():
+            logger.info("ℹ️ training/train_pitcher_models.py not found - skipping training step")
+            return False
         ok_train = run_script(train_pitcher_models_script, "Train Pitcher Prop Models", logger, 900)
         # Promote latest trained version for runtime if available
         try:
@@ -414,7 +502,6 @@ def complete_daily_automation():
                     meta = latest_dir / 'metadata.json'
                     ver = None
                     if meta.exists():
-                        import json
                         with meta.open('r', encoding='utf-8') as f:
                             mdoc = json.load(f) or {}
                             ver = mdoc.get('version')
@@ -422,180 +509,159 @@ def complete_daily_automation():
                         ver = latest_dir.name
                     promoted = models_root / 'promoted.json'
                     with promoted.open('w', encoding='utf-8') as f:
-                        import json
                         json.dump({'version': ver, 'path': latest_dir.name, 'promoted_at': datetime.now().isoformat()}, f, indent=2)
-                    latest_models_version = ver
                     logger.info(f"🏷️ Promoted pitcher models version: {ver}")
         except Exception as e:
             logger.warning(f"⚠️ Could not promote latest pitcher models: {e}")
-    else:
-        logger.info("ℹ️ training/train_pitcher_models.py not found - skipping training step")
+        return ok_train
 
-    # 5) Now generate pitcher prop projections & recommendations (will use models if available)
-    logger.info("📐 Generating pitcher prop projections & recommendations...")
-    pitcher_prop_proj_script = base_dir / "generate_pitcher_prop_projections.py"
-    success_pitcher_prop_recs = False
-    if pitcher_prop_proj_script.exists():
-        success_pitcher_prop_recs = run_script(pitcher_prop_proj_script, "Generate Pitcher Prop Projections", logger, 240)
-    else:
-        logger.warning("⚠️ Pitcher prop projections script not found")
-    
-    # Retry props fetch/generate if empty (Bovada can lag early morning)
-    try:
-        import json as _json, time as _time
-        props_dir = data_dir / 'daily_bovada'
-        props_dir.mkdir(parents=True, exist_ok=True)
-        props_path = props_dir / f"bovada_pitcher_props_{today_underscore}.json"
-        last_known_path = props_dir / f"pitcher_last_known_lines_{today_underscore}.json"
+    def step_prop_projections():
+        # 5) Now generate pitcher prop projections & recommendations (will use models if available)
+        logger.info("📐 Generating pitcher prop projections & recommendations...")
+        success_pitcher_prop_recs = False
+        if pitcher_prop_proj_script.exists():
+            success_pitcher_prop_recs = generate_prop_projections("Generate Pitcher Prop Projections")
+        else:
+            logger.warning("⚠️ Pitcher prop projections script not found")
 
-        def _props_empty(p: Path) -> bool:
-            try:
-                if not p.exists() or p.stat().st_size == 0:
+        # Retry props fetch/generate if empty (Bovada can lag early morning)
+        try:
+            import time as _time
+            props_dir = data_dir / 'daily_bovada'
+            props_dir.mkdir(parents=True, exist_ok=True)
+            props_path = props_dir / f"bovada_pitcher_props_{today_underscore}.json"
+            last_known_path = props_dir / f"pitcher_last_known_lines_{today_underscore}.json"
+
+            def _props_empty(p: Path) -> bool:
+                try:
+                    if not p.exists() or p.stat().st_size == 0:
+                        return True
+                    with p.open('r', encoding='utf-8') as f:
+                        j = json.load(f)
+                    m = j.get('pitcher_props') if isinstance(j, dict) else None
+                    return not (isinstance(m, dict) and len(m) > 0)
+                except Exception:
                     return True
-                with p.open('r', encoding='utf-8') as f:
-                    j = _json.load(f)
-                m = j.get('pitcher_props') if isinstance(j, dict) else None
-                return not (isinstance(m, dict) and len(m) > 0)
-            except Exception:
-                return True
 
-        if _props_empty(props_path):
-            logger.info("⏳ Props file empty after initial pass; retrying fetch/generate up to 2 more times...")
-            for attempt in (2, 3):
-                _time.sleep(45)
-                if bovada_script.exists():
-                    run_script(bovada_script, f"[Retry {attempt}] Fetch Bovada Pitcher Props", logger, 180)
-                if pitcher_prop_proj_script.exists():
-                    run_script(pitcher_prop_proj_script, f"[Retry {attempt}] Generate Pitcher Prop Projections", logger, 180)
-                if not _props_empty(props_path):
-                    logger.info(f"✅ Props populated on retry {attempt}")
+            if _props_empty(props_path):
+                logger.info("⏳ Props file empty after initial pass; retrying fetch/generate up to 2 more times...")
+                for attempt in (2, 3):
+                    _time.sleep(45)
+                    if bovada_script.exists():
+                        fetch_bovada(f"[Retry {attempt}] Fetch Bovada Pitcher Props")
+                    if pitcher_prop_proj_script.exists():
+                        generate_prop_projections(f"[Retry {attempt}] Generate Pitcher Prop Projections")
+                    if not _props_empty(props_path):
+                        logger.info(f"✅ Props populated on retry {attempt}")
+                        break
+                else:
+                    logger.warning("⚠️ Props still empty after retries; frontend will rely on manual/continuous refresh.")
+            # Seed last-known snapshot if present props but missing/empty last-known
+            def _last_known_empty(p: Path) -> bool:
+                try:
+                    if not p.exists() or p.stat().st_size == 0:
+                        return True
+                    with p.open('r', encoding='utf-8') as f:
+                        j = json.load(f)
+                    m = j.get('pitchers') if isinstance(j, dict) else None
+                    return not (isinstance(m, dict) and len(m) > 0)
+                except Exception:
+                    return True
+            try:
+                if not _props_empty(props_path) and _last_known_empty(last_known_path):
+                    with props_path.open('r', encoding='utf-8') as f:
+                        pdoc = json.load(f) or {}
+                    pitchers = pdoc.get('pitcher_props') or {}
+                    out = {'date': today, 'updated_at': datetime.now().isoformat(), 'pitchers': {}}
+                    for raw_key, mkts in (pitchers.items() if isinstance(pitchers, dict) else []):
+                        try:
+                            name_only = str(raw_key).split('(')[0].strip()
+                            nk = name_only.lower()
+                            mkout = {}
+                            if isinstance(mkts, dict):
+                                for mk, info in mkts.items():
+                                    if isinstance(info, dict) and (info.get('line') is not None):
+                                        mkout[mk] = {
+                                            'line': info.get('line'),
+                                            'over_odds': info.get('over_odds'),
+                                            'under_odds': info.get('under_odds')
+                                        }
+                            if mkout:
+                                out['pitchers'][nk] = mkout
+                        except Exception:
+                            continue
+                    if out['pitchers']:
+                        tmp = last_known_path.with_suffix('.json.tmp')
+                        with tmp.open('w', encoding='utf-8') as f:
+                            json.dump(out, f, ensure_ascii=False, indent=2)
+                        tmp.replace(last_known_path)
+                        logger.info(f"🧭 Seeded last-known snapshot: {last_known_path.name} with {len(out['pitchers'])} pitchers")
+            except Exception as se:
+                logger.debug(f"Last-known seeding skipped: {se}")
+        except Exception as e:
+            logger.debug(f"Props retry guard failed: {e}")
+        return success_pitcher_prop_recs
+
+    # Step 3: Fetch Real Betting Lines
+    def step_betting_lines():
+        logger.info("\n🎯 STEP 3: Fetching Real Betting Lines (DraftKings preferred)")
+        logger.info("💰 Connecting to OddsAPI for current betting odds...")
+        step_start = datetime.now()
+
+        lines_candidates = [
+            base_dir / "fetch_betting_lines_simple.py",  # DK-focused builder
+            base_dir / "fetch_betting_lines_real.py"
+        ]
+
+        success3 = False
+        for candidate in lines_candidates:
+            if candidate.exists():
+                # longer timeout to allow API rate limits
+                logger.info(f"📡 Running {candidate.name} (this may take 2-3 minutes)...")
+                success3 = run_script(candidate, f"Fetch Betting Lines ({candidate.name})", logger, 900)
+                if success3:
                     break
             else:
-                logger.warning("⚠️ Props still empty after retries; frontend will rely on manual/continuous refresh.")
-        # Seed last-known snapshot if present props but missing/empty last-known
-        def _last_known_empty(p: Path) -> bool:
+                logger.debug(f"Lines fetch candidate not found: {candidate}")
+
+        step_duration = (datetime.now() - step_start).total_seconds()
+
+        # Fallback: try importing and calling directly
+        if not success3:
+            logger.info("🔄 Trying fallback import method...")
             try:
-                if not p.exists() or p.stat().st_size == 0:
-                    return True
-                with p.open('r', encoding='utf-8') as f:
-                    j = _json.load(f)
-                m = j.get('pitchers') if isinstance(j, dict) else None
-                return not (isinstance(m, dict) and len(m) > 0)
-            except Exception:
-                return True
-        try:
-            if not _props_empty(props_path) and _last_known_empty(last_known_path):
-                with props_path.open('r', encoding='utf-8') as f:
-                    pdoc = _json.load(f) or {}
-                pitchers = pdoc.get('pitcher_props') or {}
-                out = {'date': today, 'updated_at': datetime.now().isoformat(), 'pitchers': {}}
-                for raw_key, mkts in (pitchers.items() if isinstance(pitchers, dict) else []):
+                import importlib
+                for modname in ("fetch_betting_lines_simple", "fetch_betting_lines_real"):
                     try:
-                        name_only = str(raw_key).split('(')[0].strip()
-                        nk = name_only.lower()
-                        mkout = {}
-                        if isinstance(mkts, dict):
-                            for mk, info in mkts.items():
-                                if isinstance(info, dict) and (info.get('line') is not None):
-                                    mkout[mk] = {
-                                        'line': info.get('line'),
-                                        'over_odds': info.get('over_odds'),
-                                        'under_odds': info.get('under_odds')
-                                    }
-                        if mkout:
-                            out['pitchers'][nk] = mkout
-                    except Exception:
-                        continue
-                if out['pitchers']:
-                    tmp = last_known_path.with_suffix('.json.tmp')
-                    with tmp.open('w', encoding='utf-8') as f:
-                        _json.dump(out, f, ensure_ascii=False, indent=2)
-                    tmp.replace(last_known_path)
-                    logger.info(f"🧭 Seeded last-known snapshot: {last_known_path.name} with {len(out['pitchers'])} pitchers")
-        except Exception as se:
-            logger.debug(f"Last-known seeding skipped: {se}")
-    except Exception as e:
-        logger.debug(f"Props retry guard failed: {e}")
-    
-    # Update team strengths (affects predictions)
-    logger.info("🏟️ Updating team strength ratings...")
-    team_updater = base_dir / "weekly_team_updater.py"
-    if team_updater.exists():
-        success_teams = run_script(team_updater, "Update Team Strengths", logger, 120)
-        if success_teams:
-            logger.info("✅ Team strengths updated")
-        else:
-            logger.warning("⚠️ Team strength update failed - using cached data")
-    else:
-        logger.warning("⚠️ Team updater not found - using cached team data")
-    
-    # Update comprehensive daily data (bullpen, weather, etc.)
-    logger.info("🌐 Updating comprehensive daily data...")
-    daily_updater = base_dir / "daily_data_updater.py"
-    if daily_updater.exists():
-        success_daily = run_script(daily_updater, "Update Daily Data", logger, 300)  # Increased timeout to 300s
-        if success_daily:
-            logger.info("✅ Daily data updated (bullpen, weather factors)")
-        else:
-            logger.warning("⚠️ Daily data update failed - using cached data")
-    else:
-        logger.warning("⚠️ Daily data updater not found - using cached daily data")
-    
-    # Step 3: Fetch Real Betting Lines
-    logger.info("\n🎯 STEP 3: Fetching Real Betting Lines (DraftKings preferred)")
-    logger.info("💰 Connecting to OddsAPI for current betting odds...")
-    step_start = datetime.now()
-    
-    lines_candidates = [
-        base_dir / "fetch_betting_lines_simple.py",  # DK-focused builder
-        base_dir / "fetch_betting_lines_real.py"
-    ]
+                        mod = importlib.import_module(modname)
+                        if hasattr(mod, 'main'):
+                            logger.info(f"🔁 Running {modname}.main() as fallback")
+                            ok = bool(mod.main())
+                            success3 = success3 or ok
+                            if success3:
+                                break
+                    except Exception as ie:
+                        logger.debug(f"Fallback import failed for {modname}: {ie}")
+                if not success3:
+                    raise RuntimeError("No betting lines module succeeded")
+            except Exception as e:
+                logger.warning(f"⚠️ No real betting lines available after {step_duration:.1f}s - continuing without them")
+                logger.info("📋 To get real betting lines:")
+                logger.info("   1. Get an OddsAPI key from https://the-odds-api.com/")
+                logger.info("   2. Add it to data/closing_lines_config.json")
+                logger.info("   3. Re-run the automation")
 
-    success3 = False
-    for candidate in lines_candidates:
-        if candidate.exists():
-            # longer timeout to allow API rate limits
-            logger.info(f"📡 Running {candidate.name} (this may take 2-3 minutes)...")
-            success3 = run_script(candidate, f"Fetch Betting Lines ({candidate.name})", logger, 900)
-            if success3:
-                break
-        else:
-            logger.debug(f"Lines fetch candidate not found: {candidate}")
-
-    step_duration = (datetime.now() - step_start).total_seconds()
-    
-    # Fallback: try importing and calling directly
-    if not success3:
-        logger.info("🔄 Trying fallback import method...")
-        try:
-            import importlib
-            for modname in ("fetch_betting_lines_simple", "fetch_betting_lines_real"):
-                try:
-                    mod = importlib.import_module(modname)
-                    if hasattr(mod, 'main'):
-                        logger.info(f"🔁 Running {modname}.main() as fallback")
-                        ok = bool(mod.main())
-                        success3 = success3 or ok
-                        if success3:
-                            break
-                except Exception as ie:
-                    logger.debug(f"Fallback import failed for {modname}: {ie}")
-            if not success3:
-                raise RuntimeError("No betting lines module succeeded")
-        except Exception as e:
-            logger.warning(f"⚠️ No real betting lines available after {step_duration:.1f}s - continuing without them")
-            logger.info("📋 To get real betting lines:")
-            logger.info("   1. Get an OddsAPI key from https://the-odds-api.com/")
-            logger.info("   2. Add it to data/closing_lines_config.json")
-            logger.info("   3. Re-run the automation")
-    
-    if success3:
-        logger.info(f"✅ Betting lines fetched successfully ({step_duration:.1f}s)")
+        if success3:
+            logger.info(f"✅ Betting lines fetched successfully ({step_duration:.1f}s)")
+        return success3
 
     # Step 3.5: Daily games model retuning before generating predictions
-    logger.info("\n🧪 STEP 3.5: Daily Games Model Retuning")
-    retuner_script = base_dir / "comprehensive_model_retuner.py"
-    if retuner_script.exists():
+    def step_retune():
+        logger.info("\n🧪 STEP 3.5: Daily Games Model Retuning")
+        retuner_script = base_dir / "comprehensive_model_retuner.py"
+        if not retuner_script.exists():
+            logger.info("ℹ️ comprehensive_model_retuner.py not found - skipping daily retune")
+            return False
         # Run a shorter window retune daily (e.g., last 7-10 days)
         retune_ok = run_script(retuner_script, "Run Comprehensive Model Retuner (daily)", logger, 900)
         # Sync the optimized config to engine's default read path if present
@@ -607,92 +673,189 @@ def complete_daily_automation():
                 logger.info("🔄 Synced comprehensive_optimized_config.json -> optimized_config.json for engine usage")
         except Exception as e:
             logger.warning(f"⚠️ Could not sync optimized config for engine: {e}")
-    else:
-        logger.info("ℹ️ comprehensive_model_retuner.py not found - skipping daily retune")
-    
+        return retune_ok
+
     # Step 4: Generate Today's Predictions
-    logger.info("\n🎯 STEP 4: Generating Today's Predictions")
-    prediction_candidates = [
-        base_dir / "daily_ultrafastengine_predictions.py"
-    ]
+    def step_predictions():
+        logger.info("\n🎯 STEP 4: Generating Today's Predictions")
+        prediction_candidates = [
+            base_dir / "daily_ultrafastengine_predictions.py"
+        ]
 
-    success4 = False
-    for candidate in prediction_candidates:
-        if candidate.exists():
-            success4 = run_script(candidate, f"Generate Today's Predictions ({candidate.name})", logger, 900)
-            if success4:
-                break
-        else:
-            logger.debug(f"Prediction candidate not found: {candidate}")
-            
-    if not success4:
-        logger.warning("⚠️ No prediction script found - betting engine will use existing cache if available")
-    
-    # Step 5: Generate Betting Recommendations
-    logger.info("\n🎯 STEP 5: Generating Betting Recommendations")
-    betting_candidates = [
-        base_dir / "unified_betting_engine.py",
-        base_dir / "betting_recommendations_engine.py",
-        base_dir / "app_betting_integration.py"
-    ]
+        success4 = False
+        for candidate in prediction_candidates:
+            if candidate.exists():
+                success4 = run_script(candidate, f"Generate Today's Predictions ({candidate.name})", logger, 900)
+                if success4:
+                    break
+            else:
+                logger.debug(f"Prediction candidate not found: {candidate}")
 
-    success5 = False
-    for candidate in betting_candidates:
-        if candidate.exists():
-            success5 = run_script(candidate, f"Generate Betting Recommendations ({candidate.name})", logger, 300)
-            if success5:
-                break
-        else:
-            logger.debug(f"Betting candidate not found: {candidate}")
+        if not success4:
+            logger.warning("⚠️ No prediction script found - betting engine will use existing cache if available")
+        return success4
 
-    # Step 6: Run Comprehensive Analysis
-    logger.info("\n📊 STEP 6: Running Comprehensive Analysis")
-    analysis_script = base_dir / "comprehensive_mlb_analysis_system.py"
-    success6 = False
-    
-    if analysis_script.exists():
-        success6 = run_script(analysis_script, "Run Comprehensive Analysis", logger, 180)
-    else:
-        logger.warning("❌ Comprehensive analysis script not found")
-    
-    # Step 7: Update Frontend Data
-    logger.info("\n🔄 STEP 7: Updating Frontend Data")
-    frontend_script = base_dir / "update_frontend_analysis.py"
-    success7 = False
-    
-    if frontend_script.exists():
-        success7 = run_script(frontend_script, "Update Frontend Analysis", logger, 60)
-    else:
-        logger.warning("❌ Frontend update script not found")
+    # Step 5: Generate Betting Recommendations
+    def step_recommendations():
+        logger.info("\n🎯 STEP 5: Generating Betting Recommendations")
+        betting_candidates = [
+            base_dir / "unified_betting_engine.py",
+            base_dir / "betting_recommendations_engine.py",
+            base_dir / "app_betting_integration.py"
+        ]
 
-    # Fallback: import unified_betting_engine and call main() or generate_recommendations()
-    if not success5:
-        try:
-            import importlib
-            ube = importlib.import_module('unified_betting_engine')
-            if hasattr(ube, 'main'):
-                logger.info("🔁 Running unified_betting_engine.main() as fallback")
-                try:
-                    ube.main()
-                    success5 = True
-                except Exception as e:
-                    logger.error(f"Unified engine main() failed: {e}")
+        success5 = False
+        for candidate in betting_candidates:
+            if candidate.exists():
+                success5 = run_script(candidate, f"Generate Betting Recommendations ({candidate.name})", logger, 300)
+                if success5:
+                    break
             else:
-                # Try programmatic use
-                if hasattr(ube, 'UnifiedBettingEngine'):
-                    logger.info("🔁 Running UnifiedBettingEngine.generate_recommendations() as fallback")
+                logger.debug(f"Betting candidate not found: {candidate}")
+
+        # Fallback: import unified_betting_engine and call main() or generate_recommendations()
+        if not success5:
+            try:
+                import importlib
+                ube = importlib.import_module('unified_betting_engine')
+                if hasattr(ube, 'main'):
+                    logger.info("🔁 Running unified_betting_engine.main() as fallback")
                     try:
-                        engine = ube.UnifiedBettingEngine()
-                        recs = engine.generate_recommendations()
-                        if recs and engine.save_recommendations(recs):
-                            success5 = True
+                        ube.main()
+                        success5 = True
                     except Exception as e:
-                        logger.error(f"Unified engine programmatic run failed: {e}")
-        except Exception as e:
-            logger.debug(f"Fallback betting recommendations import failed: {e}")
+                        logger.error(f"Unified engine main() failed: {e}")
+                else:
+                    # Try programmatic use
+                    if hasattr(ube, 'UnifiedBettingEngine'):
+                        logger.info("🔁 Running UnifiedBettingEngine.generate_recommendations() as fallback")
+                        try:
+                            engine = ube.UnifiedBettingEngine()
+                            recs = engine.generate_recommendations()
+                            if recs and engine.save_recommendations(recs):
+                                success5 = True
+                        except Exception as e:
+                            logger.error(f"Unified engine programmatic run failed: {e}")
+            except Exception as e:
+                logger.debug(f"Fallback betting recommendations import failed: {e}")
+        return success5
+
+    # Step 6: Run Comprehensive Analysis
+    def step_analysis():
+        logger.info("\n📊 STEP 6: Running Comprehensive Analysis")
+        analysis_script = base_dir / "comprehensive_mlb_analysis_system.py"
+        if not analysis_script.exists():
+            logger.warning("❌ Comprehensive analysis script not found")
+            return False
+        return run_script(analysis_script, "Run Comprehensive Analysis", logger, 180)
+
+    # Step 7: Update Frontend Data
+    def step_frontend():
+        logger.info("\n🔄 STEP 7: Updating Frontend Data")
+        frontend_script = base_dir / "update_frontend_analysis.py"
+        if not frontend_script.exists():
+            logger.warning("❌ Frontend update script not found")
+            return False
+        return run_script(frontend_script, "Update Frontend Analysis", logger, 60)
+
+    # Steps with declared inputs are skipped when their producer code and input contents are
+    # unchanged since their last successful build (build_manifest.py); network fetches declare
+    # no inputs and always run, but downstream steps only re-run if the fetched content changed.
+    pipeline = [
+        Step('starters', step_starters, outputs=[f"data/starting_pitchers_{today_underscore}.json", games_file],
+             producer=["fetch_todays_starters.py", "fetch_today_games.py"], description="Fetch Probable Pitchers"),
+        Step('weather', step_weather, outputs=[f"data/park_weather_factors_{today_underscore}.json"],
+             producer=["weather_park_integration.py"], description="Weather & Park Factors"),
+        Step('bovada_props', step_bovada_props, outputs=[props_file], in_process=inproc, timeout=180,
+             producer=["fetch_bovada_pitcher_props.py"], description="Fetch Bovada Pitcher Props"),
+        Step('team_strengths', step_team_strengths, outputs=["data/master_team_strength.json"],
+             producer=["weekly_team_updater.py"], in_process=inproc, timeout=120, description="Update Team Strengths"),
+        Step('pitcher_stats', step_pitcher_stats, deps=['starters'], in_process=inproc, timeout=180,
+             outputs=["data/master_pitcher_stats.json", f"data/today_pitchers_{today_underscore}.json"],
+             producer=["fast_pitcher_updater.py"], description="Update Pitcher Stats"),
+        Step('daily_data', step_daily_data, deps=['pitcher_stats', 'team_strengths'],
+             outputs=["data/master_team_strength.json", "data/master_pitcher_stats.json"],
+             producer=["daily_data_updater.py"], description="Update Daily Data"),
+        Step('betting_lines', step_betting_lines, deps=['starters'], outputs=[lines_file],
+             producer=["fetch_betting_lines_simple.py", "fetch_betting_lines_real.py"], description="Fetch Betting Lines"),
+        Step('projection_features', step_projection_features, deps=['starters', 'bovada_props', 'daily_data'],
+             outputs=[f"{bovada_dir}/projection_features_{today_underscore}.json"],
+             producer=["pitcher_projections.py"], description="Build Pitcher Projection Features"),
+        Step('props_dataset', step_props_dataset, deps=['projection_features'],
+             inputs=[f"{bovada_dir}/projection_features_*.json", f"{bovada_dir}/bovada_pitcher_props_*.json"],
+             outputs=[f"{datasets_dir}/pitcher_props_history.csv"],
+             producer=["historical_pitcher_prop_dataset.py"], description="Update Pitcher Props Dataset"),
+        Step('prop_outcomes', step_prop_outcomes, deps=['props_dataset'],
+             outputs=[f"{datasets_dir}/pitcher_props_history.csv"],
+             producer=["update_pitcher_prop_outcomes.py"], description="Update Pitcher Prop Outcomes"),
+        Step('augment_targets', step_augment_targets, deps=['prop_outcomes'],
+             inputs=[f"{datasets_dir}/pitcher_props_history.csv", f"{bovada_dir}/pitcher_prop_realized_results.json"],
+             outputs=[f"{datasets_dir}/pitcher_props_history_with_targets.csv"],
+             producer=["training/augment_with_outcomes.py"], description="Augment Dataset With Targets"),
+        Step('train_models', step_train_models, deps=['augment_targets'],
+             inputs=[f"{datasets_dir}/pitcher_props_history_with_targets.csv"],
+             outputs=["models/pitcher_props/promoted.json"],
+             producer=["training/train_pitcher_models.py"], description="Train Pitcher Prop Models"),
+        Step('prop_projections', step_prop_projections, deps=['train_models', 'bovada_props', 'projection_features'],
+             outputs=[f"{bovada_dir}/pitcher_prop_recommendations_{today_underscore}.json"], in_process=inproc,
+             timeout=600, producer=["generate_pitcher_prop_projections.py"], description="Generate Pitcher Prop Projections"),
+        Step('retune', step_retune, deps=['weather'],
+             inputs=["data/final_scores_*.json", "data/betting_recommendations_*.json", "data/park_weather_factors_*.json"],
+             outputs=["data/comprehensive_optimized_config.json", "data/optimized_config.json"],
+             producer=["comprehensive_model_retuner.py"], description="Daily Games Model Retune"),
+        Step('predictions', step_predictions, deps=['starters', 'weather', 'daily_data', 'retune'],
+             inputs=[games_file, "data/master_team_strength.json", "data/master_pitcher_stats.json",
+                     f"data/park_weather_factors_{today_underscore}.json", "data/comprehensive_optimized_config.json",
+                     "data/optimized_config.json"],
+             outputs=[unified_shard], producer=["daily_ultrafastengine_predictions.py", "engines/*.py"],
+             description="Generate Predictions"),
+        Step('recommendations', step_recommendations, deps=['predictions', 'betting_lines', 'prop_projections'],
+             inputs=[unified_shard, lines_file, games_file, f"{bovada_dir}/pitcher_prop_distributions_{today_underscore}.json"],
+             outputs=[recs_file], producer=["unified_betting_engine.py"], description="Generate Betting Recommendations"),
+        Step('analysis', step_analysis, deps=['recommendations'],
+             inputs=["data/betting_recommendations_*.json", "data/final_scores_*.json"],
+             outputs=["comprehensive_mlb_analysis_report.json"],
+             producer=["comprehensive_mlb_analysis_system.py"], description="Comprehensive Analysis"),
+        Step('frontend', step_frontend, deps=['analysis'],
+             inputs=["comprehensive_mlb_analysis_report.json", recs_file],
+             outputs=["data/frontend_historical_summary.json"],
+             producer=["update_frontend_analysis.py"], description="Update Frontend Analysis"),
+    ]
+    logger.info("\n🔀 Running steps 2-7 as a dependency DAG")
+    # Steps are no-ops on a no-games day, so that run must not count as their last successful one
+    runner = PipelineRunner(pipeline, logger=logger, record_state=not no_games_day)
+    step_results = runner.run()
+    runner.log_report()
+
+    success2 = step_results['starters'].ok
+    success_bovada = step_results['bovada_props'].ok
+    success_pitcher_prop_recs = step_results['prop_projections'].ok
+    success3 = step_results['betting_lines'].ok
+    success4 = step_results['predictions'].ok
+    success5 = step_results['recommendations'].ok
     
     # Step 6: Copy files to correct locations
     logger.info("\n🎯 STEP 6: Copying Files to MLB-Betting Directory")
+    # Regenerate the legacy monolith from the date shards for scripts that still read it directly
+    from unified_predictions_store import get_unified_predictions_store
+    unified_store = get_unified_predictions_store(str(data_dir))
+    legacy_inputs = [os.path.join(unified_store.shard_dir, '????-??-??.json')]
+    legacy_producer = producer_version([str(base_dir / 'unified_predictions_store.py')])
+
+    def export_legacy_unified():
+        """Re-export the monolith unless no shard changed since the last export"""
+        if build_manifest.is_current('unified_predictions_cache', legacy_inputs, [unified_store.legacy_path], legacy_producer):
+            logger.info("⏭️ Legacy unified cache already matches the date shards - not re-exported")
+            return
+        shard_hashes = build_manifest.hash_files(legacy_inputs)
+        unified_store.export_legacy()
+        build_manifest.record('unified_predictions_cache', shard_hashes, [unified_store.legacy_path], legacy_producer)
+        build_manifest.save()
+
+    try:
+        export_legacy_unified()
+    except Exception as e:
+        logger.warning(f"⚠️ Could not export legacy unified cache: {e}")
     
     files_to_copy = [
         (data_dir / "unified_predictions_cache.json", mlb_betting_data_dir / "unified_predictions_cache.json"),
@@ -710,19 +873,18 @@ def complete_daily_automation():
     logger.info("\n🎯 STEP 7: Verifying Data Integrity")
     
     # Check unified cache
-    unified_cache_path = mlb_betting_data_dir / "unified_predictions_cache.json"
     betting_recs_path = mlb_betting_data_dir / f"betting_recommendations_{today_underscore}.json"
     betting_lines_path = mlb_betting_data_dir / f"real_betting_lines_{today_underscore}.json"
     games_path = mlb_betting_data_dir / f"games_{today}.json"
     
-    cache_ok = unified_cache_path.exists()
+    cache_ok = bool(unified_store.dates())
     betting_ok = betting_recs_path.exists()
     lines_ok = betting_lines_path.exists()
     games_ok = games_path.exists()
     
-    def ensure_today_in_unified_cache(unified_cache_path: Path, games_path: Path, betting_recs_path: Path) -> bool:
+    def ensure_today_in_unified_cache(games_path: Path, betting_recs_path: Path) -> bool:
         """If today's predictions are missing in unified cache, synthesize from games + betting_recommendations.
-        Returns True if unified cache was updated (or already had today), False on hard failure.
+        Writes only today's shard. Returns True if it was written, False on hard failure.
         """
         try:
             import json
@@ -732,16 +894,6 @@ def complete_daily_automation():
             if not betting_recs_path.exists():
                 logger.warning(f"⚠️ Cannot build unified cache fully: betting recommendations missing: {betting_recs_path}")
                 # We'll still try to build a skeletal entry from games only
-            # Load current unified cache or start a fresh structure
-            cache_data = {}
-            if unified_cache_path.exists():
-                try:
-                    with open(unified_cache_path, 'r', encoding='utf-8') as f:
-                        cache_data = json.load(f)
-                except Exception:
-                    cache_data = {}
-            if 'predictions_by_date' not in cache_data:
-                cache_data['predictions_by_date'] = {}
 
             # Load files
             with open(games_path, 'r', encoding='utf-8') as f:
@@ -791,19 +943,15 @@ def complete_daily_automation():
                     'source': 'daily_files'
                 }
 
-            cache_data['predictions_by_date'][today] = {
+            unified_store.put_date(today, {
                 'games': unified_games,
                 'timestamp': datetime.now().isoformat(),
                 'total_games': len(unified_games),
                 'source': 'daily_files',
                 'games_file': str(games_path),
                 'betting_file': str(betting_recs_path) if betting_recs_path.exists() else None
-            }
-
-            unified_cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(unified_cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
-            logger.info(f"✅ Injected today's predictions into unified cache: {unified_cache_path}")
+            })
+            logger.info(f"✅ Injected today's predictions into unified cache: {unified_store.shard_path(today)}")
             return True
         except Exception as e:
             logger.error(f"❌ Failed to ensure today's unified cache: {e}")
@@ -811,33 +959,25 @@ def complete_daily_automation():
 
     if cache_ok:
         try:
-            import json
-            with open(unified_cache_path, 'r') as f:
-                cache_data = json.load(f)
-                dates = list(cache_data.get('predictions_by_date', {}).keys())
-                has_today = today in dates
-                games_count = len(cache_data.get('predictions_by_date', {}).get(today, {}).get('games', {}))
-                
-                logger.info(f"✅ Unified cache loaded: {len(dates)} dates, today included: {has_today}, games today: {games_count}")
-                if not has_today or games_count == 0:
-                    logger.warning(f"⚠️ Cache missing today's data: has_today={has_today}, games_count={games_count}")
-                    # Attempt to build today's entry from games + betting recommendations
-                    built = ensure_today_in_unified_cache(unified_cache_path, games_path, betting_recs_path)
-                    if built:
-                        # Re-check counts after injection
-                        try:
-                            with open(unified_cache_path, 'r', encoding='utf-8') as rf:
-                                rc = json.load(rf)
-                                games_count2 = len(rc.get('predictions_by_date', {}).get(today, {}).get('games', {}))
-                                logger.info(f"🔁 Unified cache rebuilt for today: games now: {games_count2}")
-                        except Exception:
-                            pass
-                        cache_ok = True
-                    else:
-                        # Allow system to continue - engine can still work, but note degraded state
-                        cache_ok = True
-                else:
-                    cache_ok = True
+            dates = unified_store.dates()
+            has_today = today in dates
+            games_count = len((unified_store.get_date(today) or {}).get('games', {}))
+
+            logger.info(f"✅ Unified cache loaded: {len(dates)} dates, today included: {has_today}, games today: {games_count}")
+            if not has_today or games_count == 0:
+                logger.warning(f"⚠️ Cache missing today's data: has_today={has_today}, games_count={games_count}")
+                # Attempt to build today's entry from games + betting recommendations
+                built = ensure_today_in_unified_cache(games_path, betting_recs_path)
+                if built:
+                    # Re-check counts after injection
+                    games_count2 = len((unified_store.get_date(today) or {}).get('games', {}))
+                    logger.info(f"🔁 Unified cache rebuilt for today: games now: {games_count2}")
+                    try:
+                        export_legacy_unified()
+                    except Exception:
+                        pass
+                # Allow system to continue even if the rebuild failed - engine can still work, but note degraded state
+            cache_ok = True
         except Exception as e:
             logger.error(f"❌ Error reading unified cache: {e}")
             cache_ok = False
@@ -939,23 +1079,64 @@ def complete_daily_automation():
             if step_name in critical_steps:
                 critical_success = False
     
-    # Final step: write Kelly 'Best of Best' entries for yesterday so the tab persists daily
-    try:
-        writer = base_dir / 'write_kelly_best_of_best.py'
-        if writer.exists():
-            logger.info("\n🎯 FINAL STEP: Writing Kelly 'Best of Best' entries for yesterday")
-            run_script(writer, "Write Kelly Best of Best (yesterday)", logger, 180)
-            # Also write today's Kelly after recs so frontend shows correct totals immediately
-            try:
-                today_arg = f"--date={today}"
-                logger.info("🗓️ Writing Kelly 'Best of Best' entries for today as well")
-                subprocess.run([sys.executable, str(writer), today_arg], cwd=str(base_dir), check=False)
-            except Exception as e:
-                logger.debug(f"Could not write today's Kelly file: {e}")
-        else:
+    # Final steps: Kelly 'Best of Best' files and the precomputed today-games artifact are
+    # independent of each other, so they run concurrently on the same DAG runner. Each Kelly
+    # date is rebuilt only when its recommendations, lines or final scores changed.
+    writer = base_dir / 'write_kelly_best_of_best.py'
+    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+
+    def step_kelly_yesterday():
+        # Write Kelly 'Best of Best' entries for yesterday so the tab persists daily
+        if not writer.exists():
             logger.warning("⚠️ Kelly writer script not found; skipping persistent Kelly output")
+            return False
+        logger.info("\n🎯 FINAL STEP: Writing Kelly 'Best of Best' entries for yesterday")
+        return run_script(writer, "Write Kelly Best of Best (yesterday)", logger, 180)
+
+    def step_kelly_today():
+        # Also write today's Kelly after recs so frontend shows correct totals immediately
+        if not writer.exists():
+            return False
+        try:
+            today_arg = f"--date={today}"
+            logger.info("🗓️ Writing Kelly 'Best of Best' entries for today as well")
+            res = subprocess.run([sys.executable, str(writer), today_arg], cwd=str(base_dir), check=False)
+            return res.returncode == 0
+        except Exception as e:
+            logger.debug(f"Could not write today's Kelly file: {e}")
+            return False
+
+    def kelly_inputs(date_str):
+        us = date_str.replace('-', '_')
+        return [f"data/betting_recommendations_{us}.json", f"data/real_betting_lines_{us}.json",
+                f"data/final_scores_{us}.json"]
+
+    def kelly_outputs(date_str):
+        return [f"data/kelly_daily/{date_str[:4]}/kelly_bets_{date_str.replace('-', '_')}.json"]
+
+    def step_today_games_artifact():
+        # Precompute today's /api/today-games payload so the web app serves it straight from disk
+        artifact_builder = base_dir / 'build_today_games_artifact.py'
+        if not artifact_builder.exists() or os.environ.get('NO_GAMES_MODE', '').lower() in ('1', 'true', 'yes'):
+            return True
+        logger.info("\n📦 Building precomputed today-games payload artifact")
+        res = subprocess.run([sys.executable, str(artifact_builder), f"--date={today}"], cwd=str(base_dir), check=False, timeout=300)
+        return res.returncode == 0
+
+    try:
+        final_runner = PipelineRunner([
+            Step('kelly_yesterday', step_kelly_yesterday, inputs=kelly_inputs(yesterday), outputs=kelly_outputs(yesterday),
+                 producer=[str(writer)], description="Write Kelly Best of Best (yesterday)"),
+            # Both dates append to the same kelly_betting_recommendations.json, so they never overlap
+            Step('kelly_today', step_kelly_today, deps=['kelly_yesterday'], inputs=kelly_inputs(today),
+                 outputs=kelly_outputs(today), producer=[str(writer)], description="Write Kelly Best of Best (today)"),
+            Step('today_games_artifact', step_today_games_artifact, description="Build today-games artifact"),
+        ], logger=logger, record_state=not no_games_day,
+           report_path=os.path.join('data', 'pipeline_report_final.json'))
+        final_runner.run()
+        final_runner.log_report()
     except Exception as e:
-        logger.warning(f"⚠️ Kelly writer step failed: {e}")
+        logger.warning(f"⚠️ Final steps failed: {e}")
 
     # Optional: If Sunday, run weekly retune after core pipeline
     try:
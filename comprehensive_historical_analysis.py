@@ -18,6 +18,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 from team_name_normalizer import normalize_team_name
+from unified_predictions_store import get_unified_predictions_store
 import requests
 
 logger = logging.getLogger(__name__)
@@ -29,8 +30,7 @@ class ComprehensiveHistoricalAnalyzer:
         self.start_date = "2025-08-15"  # Analysis start date
         self.data_dir = "data"
         # In-process caches to speed up repeated calls within the same process/request
-        self._unified_cache: Optional[Dict[str, Any]] = None
-        self._unified_cache_mtime: Optional[float] = None
+        self._unified_store = get_unified_predictions_store(self.data_dir)
         self._predictions_cache_by_date: Dict[str, Dict] = {}
         self._final_scores_cache_by_date: Dict[str, Dict] = {}
         self._final_scores_bundle: Optional[Dict[str, Any]] = None
@@ -93,36 +93,14 @@ class ComprehensiveHistoricalAnalyzer:
         except Exception:
             pass
 
-    def _load_unified_cache_once(self) -> Dict[str, Any]:
-        """Load unified_predictions_cache.json only once per file change.
-
-        Returns the parsed JSON dict. If the file does not exist, returns an empty dict.
-        """
-        try:
-            cache_path = os.path.join(self.data_dir, 'unified_predictions_cache.json')
-            if not os.path.exists(cache_path):
-                return {}
-
-            mtime = os.path.getmtime(cache_path)
-            if self._unified_cache is not None and self._unified_cache_mtime == mtime:
-                return self._unified_cache
-
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
-            self._unified_cache = data if isinstance(data, dict) else {}
-            self._unified_cache_mtime = mtime
-            return self._unified_cache
-        except Exception:
-            # On any error, fall back to empty structure (callers have fallbacks too)
-            return {}
-        
     def get_available_dates(self) -> List[str]:
         """Get all available dates with both predictions and final scores"""
         # Load dates from unified cache (fast, no network)
         available_dates = set()
-        cache_data = self._load_unified_cache_once()
-        predictions_by_date = cache_data.get('predictions_by_date', {}) if isinstance(cache_data, dict) else {}
-        cache_dates = set(predictions_by_date.keys())
+        try:
+            cache_dates = set(self._unified_store.dates())
+        except Exception:
+            cache_dates = set()
         if cache_dates:
             logger.info(f"Found {len(cache_dates)} dates in unified cache")
             available_dates.update(cache_dates)
@@ -167,30 +145,14 @@ class ComprehensiveHistoricalAnalyzer:
         if date in self._predictions_cache_by_date:
             return self._predictions_cache_by_date[date]
 
-        # Try to load from unified cache (single file, loaded once)
+        # Try to load from the unified predictions store (only this date's shard is read)
         try:
-            cache_data = self._load_unified_cache_once()
-            # Check if date exists in unified cache structures
-            predictions_by_date = cache_data.get('predictions_by_date', {}) if isinstance(cache_data, dict) else {}
-            if isinstance(predictions_by_date, dict) and date in predictions_by_date:
-                date_data = predictions_by_date.get(date) or {}
-                games_data = date_data.get('games', {}) if isinstance(date_data, dict) else {}
-                if games_data:
-                    logger.info(f"Loaded {len(games_data)} games from unified cache for {date}")
-                    self._predictions_cache_by_date[date] = games_data
-                    return games_data
-
-            # Fallback: some unified caches store dates at top-level
-            if isinstance(cache_data, dict) and date in cache_data:
-                date_blob = cache_data.get(date) or {}
-                games_data = date_blob.get('games') if isinstance(date_blob, dict) else None
-                if not games_data and isinstance(date_blob, dict):
-                    # Some formats store games directly under the date as keys
-                    games_data = {k: v for k, v in date_blob.items() if k not in ['metadata', 'generated_at']}
-                if games_data:
-                    logger.info(f"Loaded {len(games_data)} games from top-level unified cache for {date}")
-                    self._predictions_cache_by_date[date] = games_data
-                    return games_data
+            date_data = self._unified_store.get_date(date) or {}
+            games_data = date_data.get('games', {}) if isinstance(date_data, dict) else {}
+            if games_data:
+                logger.info(f"Loaded {len(games_data)} games from unified cache for {date}")
+                self._predictions_cache_by_date[date] = games_data
+                return games_data
         except Exception as e:
             logger.info(f"Unified cache not available for {date}, trying legacy format: {e}")
         
@@ -402,8 +364,8 @@ class ComprehensiveHistoricalAnalyzer:
 
         # Live fetch (last resort)
         try:
-            from live_mlb_data import LiveMLBData
-            mlb_api = LiveMLBData()
+            from live_mlb_data import get_live_mlb_data
+            mlb_api = get_live_mlb_data()
             live_games = mlb_api.get_enhanced_games_data(date)
 
             final_scores: Dict[str, Any] = {}
@@ -83,7 +83,7 @@ def load_live_games(date_str: str):
     try:
         if _live_data_mod is None:
             import live_mlb_data as _live_data_mod  # type: ignore
-        mlb = _live_data_mod.LiveMLBData()
+        mlb = _live_data_mod.get_live_mlb_data()
         return mlb.get_enhanced_games_data(date_str) or []
     except Exception:
         return []
@@ -358,31 +358,12 @@ def main():
     previous_lines_snapshot: Dict[str, Dict[str, Dict[str, float]]] = {}
     last_git_push_ts: Optional[float] = None
 
-    def load_line_history_path(date_str: str) -> str:
-        # Precompute date tag to keep f-string simple and robust
-        tag = date_str.replace('-', '_')
-        return os.path.join('data', 'daily_bovada', f"pitcher_prop_line_history_{tag}.json")
-
     def append_line_history_events(date_str: str, events: list[dict]):
         if not events:
             return
-        path = load_line_history_path(date_str)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        doc = {'date': date_str, 'events': []}
-        if os.path.exists(path):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    existing = json.load(f)
-                if isinstance(existing, dict) and isinstance(existing.get('events'), list):
-                    doc = existing
-            except Exception:
-                pass
-        doc['events'].extend(events)
-        tmp = path + '.tmp'
         try:
-            with open(tmp, 'w', encoding='utf-8') as f:
-                json.dump(doc, f, indent=2)
-            os.replace(tmp, path)
+            from pitcher_line_history import append_line_history_events as _append
+            _append(date_str, events)
         except Exception:
             pass
 
@@ -4,23 +4,29 @@ Daily MLB Data Updater
 Comprehensive script to update team strength, pitcher stats, and bullpen data daily
 """
 
-import requests
 import json
 import os
 import logging
+import time
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Any
 import statistics
 
+from http_client import get_http_client
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# primaryPosition abbreviations counted as pitchers
+PITCHER_POSITIONS = ('P', 'SP', 'RP', 'CP')
+
 class DailyMLBDataUpdater:
     """Updates core MLB data files daily"""
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", pitcher_mode: str = None):
         self.data_dir = data_dir
+        self.pitcher_mode = pitcher_mode
         self.mlb_api_base = "https://statsapi.mlb.com/api/v1"
         self.current_season = 2025
         
@@ -31,6 +37,13 @@ class DailyMLBDataUpdater:
         self.team_strength_file = os.path.join(self.data_dir, "master_team_strength.json")
         self.pitcher_stats_file = os.path.join(self.data_dir, "master_pitcher_stats.json")
         self.bullpen_stats_file = os.path.join(self.data_dir, "bullpen_stats.json")
+        self.pitcher_stats_meta_file = os.path.join(self.data_dir, "master_pitcher_stats.meta.json")
+        
+        # Pooled HTTP client (keep-alive + retry/backoff) and parallelism for per-pitcher fetches
+        self.http = get_http_client()
+        self.max_workers = int(os.environ.get('PITCHER_STATS_WORKERS', '16'))
+        self.timing_report = {}
+        self._requests = 0
         
         # Team name mappings for consistency
         self.team_name_map = {
@@ -58,7 +71,7 @@ class DailyMLBDataUpdater:
         try:
             # Get standings
             url = f"{self.mlb_api_base}/standings?leagueId=103,104&season={self.current_season}"
-            response = requests.get(url, timeout=30)
+            response = self.http.get(url, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -94,83 +107,184 @@ class DailyMLBDataUpdater:
             # Return empty dict to use existing data
             return {}
     
-    def fetch_pitcher_stats(self) -> Dict[str, Dict[str, Any]]:
-        """Fetch current pitcher statistics"""
-        logger.info("⚾ Fetching pitcher statistics...")
-        
-        try:
-            # Get all active players
-            url = f"{self.mlb_api_base}/sports/1/players?season={self.current_season}"
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            pitcher_stats = {}
-            pitcher_count = 0
-            
-            # Get all players who are pitchers
-            for player in data.get('people', []):
-                player_id = str(player.get('id', ''))
-                player_name = player.get('fullName', '')
-                
-                # Check if this is a pitcher
-                position = player.get('primaryPosition', {}).get('abbreviation', '')
-                if position not in ['P', 'SP', 'RP', 'CP']:
-                    continue
-                
+    def _pitcher_record(self, player_name: str, split: Dict[str, Any]) -> Dict[str, Any]:
+        """master_pitcher_stats entry for one season split, or None below the innings threshold"""
+        stat = split.get('stat', {})
+        team_data = split.get('team', {})
+        innings_pitched = float(stat.get('inningsPitched', 0))
+        # Only include pitchers with meaningful innings
+        if innings_pitched <= 1.0:
+            return None
+        return {
+            'name': player_name,
+            'team': self.normalize_team_name(team_data.get('name', '')),
+            'era': float(stat.get('era', 999)),
+            'whip': float(stat.get('whip', 9.99)),
+            'strikeouts': int(stat.get('strikeOuts', 0)),
+            'walks': int(stat.get('baseOnBalls', 0)),
+            'innings_pitched': innings_pitched,
+            'games_started': int(stat.get('gamesStarted', 0)),
+            'wins': int(stat.get('wins', 0)),
+            'losses': int(stat.get('losses', 0)),
+            'last_updated': datetime.now().isoformat()
+        }
+
+    def _stats_query(self, params: Dict[str, Any], page_size: int = 1000) -> List[Dict[str, Any]]:
+        """All splits of a /stats query (pitching, all players), following offset pages"""
+        splits = []
+        for page in range(20):
+            query = {'group': 'pitching', 'sportId': 1, 'season': self.current_season, 'playerPool': 'ALL',
+                     'limit': page_size, 'offset': page * page_size, **params}
+            data = self.http.get_json(f"{self.mlb_api_base}/stats", params=query, timeout=60)
+            self._requests += 1
+            page_splits = [sp for grp in data.get('stats', []) for sp in grp.get('splits', [])]
+            splits.extend(page_splits)
+            if len(page_splits) < page_size:
+                break
+        return splits
+
+    @staticmethod
+    def _is_pitcher_split(split: Dict[str, Any]) -> bool:
+        """False for position players who pitched (playerPool=ALL returns them too); a split
+        reporting no position at all is kept"""
+        position = (((split.get('player') or {}).get('primaryPosition') or {}).get('abbreviation')
+                    or (split.get('position') or {}).get('abbreviation'))
+        return not position or position in PITCHER_POSITIONS
+
+    def _fetch_pitcher_stats_bulk(self) -> Dict[str, Dict[str, Any]]:
+        """Season pitching lines for every pitcher from one hydrated (paged) /stats query"""
+        pitcher_stats = {}
+        for split in self._stats_query({'stats': 'season'}):
+            if not self._is_pitcher_split(split):
+                continue
+            player = split.get('player', {})
+            player_id = str(player.get('id', ''))
+            if not player_id:
+                continue
+            try:
+                record = self._pitcher_record(player.get('fullName', ''), split)
+            except Exception as e:
+                logger.debug(f"Could not parse stats for pitcher {player.get('fullName', player_id)}: {e}")
+                continue
+            if record:
+                pitcher_stats[player_id] = record
+        return pitcher_stats
+
+    def _fetch_one_pitcher(self, player_id: str, player_name: str):
+        stats_url = f"{self.mlb_api_base}/people/{player_id}/stats?stats=season&group=pitching&season={self.current_season}"
+        stats_data = self.http.get_json(stats_url, timeout=10)
+        record = None
+        for stat_group in stats_data.get('stats', []):
+            for split in stat_group.get('splits', []):
+                record = self._pitcher_record(player_name, split) or record
+        return record
+
+    def _fetch_pitchers_parallel(self, players: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Per-pitcher season lines ({id: name} -> {id: record}) with bounded concurrency"""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        pitcher_stats = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._fetch_one_pitcher, pid, name): (pid, name) for pid, name in players.items()}
+            for n, fut in enumerate(as_completed(futures), 1):
+                pid, name = futures[fut]
+                self._requests += 1
                 try:
-                    # Get detailed stats for this pitcher
-                    stats_url = f"{self.mlb_api_base}/people/{player_id}/stats?stats=season&group=pitching&season={self.current_season}"
-                    stats_response = requests.get(stats_url, timeout=10)
-                    stats_response.raise_for_status()
-                    stats_data = stats_response.json()
-                    
-                    # Extract pitching stats
-                    for stat_group in stats_data.get('stats', []):
-                        for split in stat_group.get('splits', []):
-                            stat = split.get('stat', {})
-                            team_data = split.get('team', {})
-                            team_name = self.normalize_team_name(team_data.get('name', ''))
-                            
-                            era = float(stat.get('era', 999))
-                            whip = float(stat.get('whip', 9.99))
-                            innings_pitched = float(stat.get('inningsPitched', 0))
-                            strikeouts = int(stat.get('strikeOuts', 0))
-                            walks = int(stat.get('baseOnBalls', 0))
-                            games_started = int(stat.get('gamesStarted', 0))
-                            wins = int(stat.get('wins', 0))
-                            losses = int(stat.get('losses', 0))
-                            
-                            # Only include pitchers with meaningful innings
-                            if innings_pitched > 1.0:
-                                pitcher_stats[player_id] = {
-                                    'name': player_name,
-                                    'team': team_name,
-                                    'era': era,
-                                    'whip': whip,
-                                    'strikeouts': strikeouts,
-                                    'walks': walks,
-                                    'innings_pitched': innings_pitched,
-                                    'games_started': games_started,
-                                    'wins': wins,
-                                    'losses': losses,
-                                    'last_updated': datetime.now().isoformat()
-                                }
-                                pitcher_count += 1
-                                
-                                if pitcher_count % 50 == 0:
-                                    logger.info(f"📊 Processed {pitcher_count} pitchers...")
-                
+                    record = fut.result()
                 except Exception as e:
-                    logger.debug(f"Could not get stats for pitcher {player_name}: {e}")
+                    logger.debug(f"Could not get stats for pitcher {name}: {e}")
                     continue
-            
-            logger.info(f"✅ Fetched stats for {len(pitcher_stats)} pitchers")
-            return pitcher_stats
-            
+                if record:
+                    pitcher_stats[pid] = record
+                if n % 200 == 0:
+                    logger.info(f"📊 Processed {n}/{len(players)} pitchers...")
+        return pitcher_stats
+
+    def _list_pitchers(self) -> Dict[str, str]:
+        """{player_id: name} of every pitcher on a roster this season"""
+        data = self.http.get_json(f"{self.mlb_api_base}/sports/1/players?season={self.current_season}", timeout=30)
+        self._requests += 1
+        players = {}
+        for player in data.get('people', []):
+            position = player.get('primaryPosition', {}).get('abbreviation', '')
+            if position in PITCHER_POSITIONS:
+                players[str(player.get('id', ''))] = player.get('fullName', '')
+        return players
+
+    def _pitchers_appeared_since(self, since: str) -> Dict[str, str]:
+        """{player_id: name} of pitchers with an appearance from since through today"""
+        splits = self._stats_query({'stats': 'byDateRange', 'startDate': since,
+                                    'endDate': datetime.now().strftime('%Y-%m-%d')})
+        return {str(sp['player']['id']): sp['player'].get('fullName', '')
+                for sp in splits if (sp.get('player') or {}).get('id') and self._is_pitcher_split(sp)}
+
+    def _load_pitcher_stats_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self.pitcher_stats_meta_file, 'r') as f:
+                return json.load(f) or {}
+        except Exception:
+            return {}
+
+    def fetch_pitcher_stats(self, mode: str = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch current pitcher statistics.
+
+        mode (default env PITCHER_STATS_MODE or 'bulk'):
+        - 'bulk': one paged /stats query for the whole season (falls back to 'per_pitcher')
+        - 'incremental': re-fetch only pitchers who appeared since the last run and merge them
+          into the existing file (first run, or a different season, uses 'bulk')
+        - 'per_pitcher': every rostered pitcher's /people/{id}/stats, fetched in parallel
+        A timing report is logged and kept in self.timing_report.
+        """
+        mode = mode or self.pitcher_mode or os.environ.get('PITCHER_STATS_MODE', 'bulk')
+        logger.info(f"⚾ Fetching pitcher statistics ({mode})...")
+        t_start = time.perf_counter()
+        steps = {}
+        self._requests = 0
+
+        def _step(name, fn, *args):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                steps[name] = round(time.perf_counter() - t0, 3)
+
+        pitcher_stats = {}
+        try:
+            if mode == 'incremental':
+                meta = self._load_pitcher_stats_meta()
+                since = meta.get('last_run')
+                if since and meta.get('season') == self.current_season and os.path.exists(self.pitcher_stats_file):
+                    appeared = _step('appearances', self._pitchers_appeared_since, since)
+                    updated = _step('pitcher_stats', self._fetch_pitchers_parallel, appeared)
+                    with open(self.pitcher_stats_file, 'r') as f:
+                        pitcher_stats = json.load(f)
+                    pitcher_stats.update(updated)
+                    logger.info(f"🔁 Refreshed {len(updated)} of {len(appeared)} pitchers who appeared since {since}")
+                else:
+                    mode = 'bulk'
+            if mode == 'bulk':
+                try:
+                    pitcher_stats = _step('bulk_stats', self._fetch_pitcher_stats_bulk)
+                except Exception as e:
+                    logger.warning(f"⚠️ Bulk pitcher stats query failed ({e}); fetching per pitcher")
+                if not pitcher_stats:
+                    mode = 'per_pitcher'
+            if mode == 'per_pitcher':
+                players = _step('list_players', self._list_pitchers)
+                pitcher_stats = _step('pitcher_stats', self._fetch_pitchers_parallel, players)
         except Exception as e:
             logger.error(f"❌ Error fetching pitcher stats: {e}")
-            return {}
+            pitcher_stats = {}
+
+        self.timing_report = {
+            'mode': mode,
+            'total_sec': round(time.perf_counter() - t_start, 3),
+            'steps': steps,
+            'requests': self._requests,
+            'pitchers': len(pitcher_stats),
+        }
+        logger.info(f"⏱️ Pitcher stats timing: {json.dumps(self.timing_report)}")
+        logger.info(f"✅ Fetched stats for {len(pitcher_stats)} pitchers")
+        return pitcher_stats
     
     def calculate_bullpen_stats(self, pitcher_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Calculate bullpen quality stats for all teams"""
@@ -286,6 +400,10 @@ class DailyMLBDataUpdater:
                 # Save new data
                 with open(self.pitcher_stats_file, 'w') as f:
                     json.dump(new_stats, f, indent=2)
+                # Run record for incremental refreshes and the timing report
+                with open(self.pitcher_stats_meta_file, 'w') as f:
+                    json.dump({'last_run': datetime.now().strftime('%Y-%m-%d'), 'season': self.current_season,
+                               'timing': self.timing_report}, f, indent=2)
                 
                 logger.info(f"✅ Pitcher stats updated successfully")
                 return True
@@ -361,10 +479,15 @@ class DailyMLBDataUpdater:
 
 def main():
     """Main execution function"""
+    import argparse
+    parser = argparse.ArgumentParser(description='Update team strength, pitcher and bullpen data')
+    parser.add_argument('--pitcher-mode', choices=['bulk', 'incremental', 'per_pitcher'],
+                        help='Pitcher stats ingestion mode (default: env PITCHER_STATS_MODE or bulk)')
+    args = parser.parse_args()
     logger.info("🎯 Daily MLB Data Updater Starting")
     logger.info(f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    updater = DailyMLBDataUpdater()
+    updater = DailyMLBDataUpdater(pitcher_mode=args.pitcher_mode)
     results = updater.update_all_data()
     
     if all(results.values()):
@@ -62,6 +62,7 @@ def main():
                 print("No matching games found for filters; nothing to do.")
                 return True
         predictions_by_game = {}
+        slate = []
         for game in games:
             away_team = game.get('away_team')
             home_team = game.get('home_team')
@@ -70,34 +71,26 @@ def main():
             if not away_team or not home_team:
                 continue
             print(f"Generating prediction for {away_team} @ {home_team}")
-            prediction = engine.get_fast_prediction(
-                away_team=away_team,
-                home_team=home_team,
-                game_date=prediction_date,
-                away_pitcher=away_pitcher if away_pitcher != 'TBD' else None,
-                home_pitcher=home_pitcher if home_pitcher != 'TBD' else None
-            )
-            game_key = f"{away_team}_vs_{home_team}"
+            slate.append({
+                'away_team': away_team,
+                'home_team': home_team,
+                'away_pitcher': away_pitcher if away_pitcher != 'TBD' else None,
+                'home_pitcher': home_pitcher if home_pitcher != 'TBD' else None
+            })
+        # Simulate the whole slate in one vectorized pass
+        predictions = engine.get_fast_predictions(slate, game_date=prediction_date)
+        for game, prediction in zip(slate, predictions):
+            game_key = f"{game['away_team']}_vs_{game['home_team']}"
             predictions_by_game[game_key] = prediction
-        # Save to unified predictions cache (append by date)
-        cache_path = data_dir / 'unified_predictions_cache.json'
-        data_dir.mkdir(exist_ok=True)
-        if cache_path.exists():
-            with open(cache_path, 'r') as f:
-                try:
-                    existing_cache = json.load(f)
-                except Exception:
-                    existing_cache = {}
-        else:
-            existing_cache = {}
-        if 'predictions_by_date' not in existing_cache:
-            existing_cache['predictions_by_date'] = {}
-        # Merge into existing date data without wiping other games
-        date_entry = existing_cache['predictions_by_date'].get(prediction_date, {})
-        existing_games = date_entry.get('games', {})
+        # Save to the unified predictions store (this date's shard only)
+        from unified_predictions_store import get_unified_predictions_store
+        store = get_unified_predictions_store(str(data_dir))
+        # Merge into existing date data without wiping other games (copy: store docs are shared)
+        date_entry = dict(store.get_date(prediction_date) or {})
+        existing_games = dict(date_entry.get('games', {}))
         existing_games.update(predictions_by_game)
         date_entry['games'] = existing_games
-        md = date_entry.get('metadata', {})
+        md = dict(date_entry.get('metadata', {}))
         md.update({
             'engine': 'UltraFast',
             'generated_at': datetime.now().isoformat(),
@@ -105,10 +98,8 @@ def main():
         })
         md['game_count'] = len(existing_games)
         date_entry['metadata'] = md
-        existing_cache['predictions_by_date'][prediction_date] = date_entry
-        with open(cache_path, 'w') as f:
-            json.dump(existing_cache, f, indent=2)
-        print(f"Generated {len(predictions_by_game)} predictions and merged into {cache_path}")
+        store.put_date(prediction_date, date_entry)
+        print(f"Generated {len(predictions_by_game)} predictions and merged into {store.shard_path(prediction_date)}")
         return True
     except Exception as e:
         print(f"Error generating UltraFast predictions: {e}")
@@ -17,6 +17,8 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from build_manifest import get_build_manifest, producer_version
+
 def setup_logging():
     """Setup logging for the scheduler"""
     today = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -73,6 +75,38 @@ def run_script(script_path: Path, description: str, logger, timeout: int = 300):
         logger.error(f"💥 EXCEPTION: {description} - {str(e)}")
         return False
 
+def script_outputs(script_name: str):
+    """Files each scheduled script (re)writes, recorded in the build manifest"""
+    today_us = datetime.now().strftime('%Y_%m_%d')
+    return {
+        'fast_pitcher_updater.py': ['data/master_pitcher_stats.json', f'data/today_pitchers_{today_us}.json'],
+        'weather_park_integration.py': [f'data/park_weather_factors_{today_us}.json'],
+        'weekly_team_updater.py': ['data/master_team_strength.json'],
+        'daily_data_updater.py': ['data/master_team_strength.json', 'data/master_pitcher_stats.json',
+                                  'data/bullpen_stats.json'],
+    }.get(script_name, [])
+
+def run_recorded_script(script_path: Path, description: str, logger, timeout: int = 300):
+    """run_script() that records the script's outputs (content hashes + producer version) in the
+    build manifest. The daily pipeline skips its downstream steps when a refresh produced
+    byte-identical data, so this logs whether anything actually changed."""
+    success = run_script(script_path, description, logger, timeout)
+    outputs = script_outputs(script_path.name)
+    if not (success and outputs):
+        return success
+    try:
+        manifest = get_build_manifest()
+        changed = [p for p, c in manifest.changed_outputs(script_path.stem, outputs).items() if c]
+        manifest.record(script_path.stem, {}, outputs, producer_version([str(script_path)]))
+        manifest.save()
+        if changed:
+            logger.info(f"   📝 Changed: {', '.join(os.path.basename(p) for p in changed)}")
+        else:
+            logger.info("   🟰 Outputs unchanged (same content as the previous run)")
+    except Exception as e:
+        logger.debug(f"Build manifest update skipped: {e}")
+    return success
+
 def load_schedule_config():
     """Load or create update schedule configuration"""
     config_file = Path("data") / "update_schedule_config.json"
@@ -228,7 +262,7 @@ def run_data_updates():
         if config.get('daily_updates', {}).get('pitcher_stats', True):
             pitcher_script = base_dir / "fast_pitcher_updater.py"
             if pitcher_script.exists():
-                success = run_script(pitcher_script, "Daily Pitcher Stats Update", logger, 300)
+                success = run_recorded_script(pitcher_script, "Daily Pitcher Stats Update", logger, 300)
                 daily_success = daily_success and success
             else:
                 logger.warning("⚠️ Fast pitcher updater not found")
@@ -238,7 +272,7 @@ def run_data_updates():
         if config.get('daily_updates', {}).get('weather_park_factors', True):
             weather_script = base_dir / "weather_park_integration.py"
             if weather_script.exists():
-                success = run_script(weather_script, "Daily Weather and Park Factors Update", logger, 300)
+                success = run_recorded_script(weather_script, "Daily Weather and Park Factors Update", logger, 300)
                 daily_success = daily_success and success
             else:
                 logger.warning("⚠️ Weather and park factors updater not found")
@@ -263,7 +297,7 @@ def run_data_updates():
         if config.get('weekly_updates', {}).get('team_strength', True):
             team_script = base_dir / "weekly_team_updater.py"
             if team_script.exists():
-                success = run_script(team_script, "Weekly Team Strength Update", logger, 600)
+                success = run_recorded_script(team_script, "Weekly Team Strength Update", logger, 600)
                 weekly_success = weekly_success and success
             else:
                 logger.warning("⚠️ Weekly team updater not found")
@@ -287,7 +321,7 @@ def run_data_updates():
         # Full data update
         comprehensive_script = base_dir / "daily_data_updater.py"
         if comprehensive_script.exists():
-            success = run_script(comprehensive_script, "Comprehensive Data Update", logger, 1200)
+            success = run_recorded_script(comprehensive_script, "Comprehensive Data Update", logger, 1200)
             comprehensive_success = comprehensive_success and success
         else:
             logger.warning("⚠️ Comprehensive data updater not found")
@@ -0,0 +1,133 @@
+"""
+Memory-resident data layer for the simulation engines.
+
+Keeps parsed master_games.json and park_weather_factors_YYYY_MM_DD.json in memory,
+revalidated by file mtime/size, with lookup indexes so per-game loops never re-read disk:
+  (date, away_team, home_team) -> (away_pitcher, home_pitcher)
+  (date, home_team) -> park/weather total_factor
+One store is shared per data directory by UltraFastSimEngine and FastPredictionEngine.
+"""
+
+import json
+import os
+import threading
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class EngineDataStore:
+    """mtime-validated in-memory cache of the engine's per-game data files"""
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        # path -> (mtime_ns, size, value)
+        self._entries: Dict[str, Tuple[int, int, object]] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'reloads': 0, 'missing_files': 0, 'errors': 0}
+
+    def _get(self, path: str, builder):
+        """Return builder(parsed_json) for path, re-parsing only when mtime/size changed.
+        Returns _MISSING when the file does not exist or cannot be parsed.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._stats['missing_files'] += 1
+                self._entries.pop(path, None)
+            return _MISSING
+        sig = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[:2] == sig:
+            self._stats['hits'] += 1
+            return entry[2]
+        with self._lock:
+            # Another thread may have loaded it while we waited
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == sig:
+                self._stats['hits'] += 1
+                return entry[2]
+            self._stats['misses'] += 1
+            if entry is not None:
+                self._stats['reloads'] += 1
+            try:
+                with open(path, 'r') as f:
+                    value = builder(json.load(f))
+            except Exception as e:
+                logger.debug(f"EngineDataStore could not load {path}: {e}")
+                self._stats['errors'] += 1
+                return _MISSING
+            self._entries[path] = (sig[0], sig[1], value)
+            return value
+
+    # ---- master_games.json -------------------------------------------------
+
+    @staticmethod
+    def _build_games(data: Dict) -> Dict:
+        starters = {}
+        for game_date, games in (data.get('games_by_date') or {}).items():
+            for game in games or []:
+                key = (game_date, game.get('away_team'), game.get('home_team'))
+                # First listed game wins (matches the previous linear scan for doubleheaders)
+                starters.setdefault(key, (game.get('away_pitcher'), game.get('home_pitcher')))
+        return {'raw': data, 'starters': starters}
+
+    def _games(self) -> Optional[Dict]:
+        value = self._get(os.path.join(self.data_dir, 'master_games.json'), self._build_games)
+        return None if value is _MISSING else value
+
+    def get_master_games(self) -> Dict:
+        games = self._games()
+        return games['raw'] if games else {}
+
+    def get_starters(self, game_date: str, away_team: str, home_team: str) -> Tuple[Optional[str], Optional[str]]:
+        games = self._games()
+        if not games:
+            return None, None
+        return games['starters'].get((game_date, away_team, home_team), (None, None))
+
+    # ---- park_weather_factors_YYYY_MM_DD.json ------------------------------
+
+    @staticmethod
+    def _build_park_factors(data: Dict) -> Dict[str, float]:
+        return {
+            team: (team_data or {}).get('total_factor', 1.0)
+            for team, team_data in (data.get('teams') or {}).items()
+        }
+
+    def get_park_factor(self, game_date: str, home_team: str) -> Optional[float]:
+        """Park/weather factor for the home park, or None when no daily file exists for the date"""
+        path = os.path.join(self.data_dir, f"park_weather_factors_{game_date.replace('-', '_')}.json")
+        factors = self._get(path, self._build_park_factors)
+        if factors is _MISSING:
+            return None
+        return factors.get(home_team, 1.0)
+
+    def stats(self) -> Dict:
+        return {
+            **self._stats,
+            'cached_files': sorted(os.path.basename(p) for p in self._entries),
+        }
+
+
+_STORES: Dict[str, EngineDataStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_engine_data_store(data_dir: str) -> EngineDataStore:
+    """Process-wide shared store for a data directory"""
+    key = os.path.abspath(data_dir)
+    store = _STORES.get(key)
+    if store is None:
+        with _STORES_LOCK:
+            store = _STORES.setdefault(key, EngineDataStore(key))
+    return store
+
+
+def engine_data_stats() -> Dict[str, Dict]:
+    """Hit/miss counters for every shared store (for diagnostics endpoints)"""
+    return {data_dir: store.stats() for data_dir, store in list(_STORES.items())}
@@ -4,17 +4,71 @@ Optimized for speed while maintaining predictive accuracy with pitcher quality i
 """
 
 import numpy as np
-import random
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import json
+import math
 import os
+import sys
+import hashlib
 import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
 
+try:
+    from utils.name_normalization import normalize_name
+except ImportError:
+    # Allow running from inside engines/ (repo root not on sys.path)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils.name_normalization import normalize_name
+from engines.engine_data import get_engine_data_store
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Scoring model constants shared by the Monte Carlo and analytic paths
+MAX_REGULATION_RUNS = 24          # Regulation scores are clipped to this value
+EXTRA_INNING_SCORE_PROB = 0.6     # Chance each team scores in an extra inning
+MAX_EXTRA_INNINGS = 5             # Extra innings before a coin flip decides the game
+CHAOS_BOUNDS = (0.75, 1.25)       # Clip range for the game-level chaos factor
+SIM_CHUNK_SIZE = 50000            # Sims per RNG stream; fixed so results don't depend on worker count
+
+
+def matchup_seed(*parts) -> int:
+    """Stable 64-bit seed for a matchup key (identical across processes, unlike hash())"""
+    key = '|'.join('' if p is None else str(p) for p in parts)
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _simulate_chunk(away_lambda: float, home_lambda: float, sim_count: int,
+                    seed_seq: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw one chunk of sims from its own RNG stream (module-level so process pools can pickle it)"""
+    rng = np.random.default_rng(seed_seq)
+    away_scores = np.clip(rng.poisson(away_lambda, sim_count), 0, MAX_REGULATION_RUNS)
+    home_scores = np.clip(rng.poisson(home_lambda, sim_count), 0, MAX_REGULATION_RUNS)
+    UltraFastSimEngine._resolve_ties(away_scores, home_scores, rng)
+    return away_scores, home_scores
+
+
+_PROCESS_POOL = None
+_PROCESS_POOL_WORKERS = 0
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Lazily created shared pool; spawn context so it is safe to start from threaded servers"""
+    global _PROCESS_POOL, _PROCESS_POOL_WORKERS
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None or _PROCESS_POOL_WORKERS != workers:
+            if _PROCESS_POOL is not None:
+                _PROCESS_POOL.shutdown(wait=False)
+            _PROCESS_POOL = ProcessPoolExecutor(max_workers=workers,
+                                                mp_context=multiprocessing.get_context('spawn'))
+            _PROCESS_POOL_WORKERS = workers
+        return _PROCESS_POOL
+
 @dataclass
 class FastGameResult:
     away_score: int
@@ -23,13 +77,41 @@ class FastGameResult:
     home_wins: bool
     run_differential: int
 
+@dataclass
+class SimulationArrays:
+    """Columnar simulation output: one NumPy array per field, indexed by sim"""
+    away_scores: np.ndarray
+    home_scores: np.ndarray
+    total_runs: np.ndarray
+    home_wins: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.away_scores.shape[0])
+
+    @property
+    def run_differential(self) -> np.ndarray:
+        return self.home_scores - self.away_scores
+
+    def to_results(self) -> List[FastGameResult]:
+        """Expand to per-sim FastGameResult objects (compatibility with list-based callers)"""
+        return [
+            FastGameResult(
+                away_score=a,
+                home_score=h,
+                total_runs=a + h,
+                home_wins=h > a,
+                run_differential=h - a
+            )
+            for a, h in zip(self.away_scores.tolist(), self.home_scores.tolist())
+        ]
+
 class UltraFastSimEngine:
     """
     Ultra-fast simulation engine using vectorized operations and pre-computed probabilities
     Adapted for MLB-Betting system with master data integration
     """
     
-    def __init__(self, data_dir: str = None, config: dict = None):
+    def __init__(self, data_dir: str = None, config: dict = None, analytic: bool = None):
         # Default to the data directory at the MLB-Betting root level
         if data_dir is None:
             # Get the parent directory of engines (MLB-Betting) and add data
@@ -41,12 +123,22 @@ class UltraFastSimEngine:
         # Load configuration or use defaults
         self.config = config or self._load_comprehensive_config()
         
+        # Analytic (closed-form) mode replaces sampling with exact PMF calculations
+        if analytic is None:
+            analytic = bool(self.config.get('simulation_parameters', {}).get('analytic', False))
+        self.analytic = analytic
+        
+        # Shared mtime-validated cache of master_games / park-weather files
+        self._data_store = get_engine_data_store(self.data_dir)
+        
         # Pre-compute probability distributions for maximum speed
         self.setup_fast_distributions()
         
         # Load team strengths and pitcher data from master files
         self.team_strengths = self._load_team_strengths()
+        self._pitcher_stats_mtime = None
         self.pitcher_stats = self._load_pitcher_stats()
+        self._build_pitcher_index()
         
         # Cache common calculations
         self._setup_speed_cache()
@@ -89,6 +181,7 @@ class UltraFastSimEngine:
         try:
             pitcher_file = os.path.join(self.data_dir, 'master_pitcher_stats.json')
             if os.path.exists(pitcher_file):
+                self._pitcher_stats_mtime = os.stat(pitcher_file).st_mtime_ns
                 with open(pitcher_file, 'r') as f:
                     data = json.load(f)
                     # Handle new refresh_info structure from daily refresh system
@@ -188,12 +281,56 @@ class UltraFastSimEngine:
             }
         }
     
+    def _build_pitcher_index(self):
+        """Build the normalized-name -> stats index and reset memoized quality factors"""
+        index = {}
+        for pitcher_id, data in (self.pitcher_stats or {}).items():
+            # Check if data is a dictionary (not a string)
+            if isinstance(data, dict) and data.get('name'):
+                # First entry wins, matching the previous linear-scan behavior
+                index.setdefault(normalize_name(data['name']), data)
+        self._pitcher_index = index
+        self._quality_factor_cache = {}
+
+    def _refresh_pitcher_stats_if_changed(self):
+        """Reload pitcher stats and rebuild the index when master_pitcher_stats.json changes on disk"""
+        pitcher_file = os.path.join(self.data_dir, 'master_pitcher_stats.json')
+        try:
+            mtime = os.stat(pitcher_file).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._pitcher_stats_mtime:
+            return
+        try:
+            self.pitcher_stats = self._load_pitcher_stats()
+        except FileNotFoundError:
+            # Keep serving the previous stats if the file is mid-write or unreadable
+            self._pitcher_stats_mtime = mtime
+            return
+        self._build_pitcher_index()
+
     def get_pitcher_quality_factor(self, pitcher_name: str) -> float:
         """
         Get pitcher quality factor based on 2025 stats with configurable weights
         Returns multiplier: <1.0 = good pitcher (allows fewer runs), >1.0 = poor pitcher
+        Memoized per normalized name; the memo is invalidated when the stats file changes.
         """
-        if not pitcher_name or not self.pitcher_stats:
+        if not pitcher_name:
+            return 1.0
+        self._refresh_pitcher_stats_if_changed()
+        if not self.pitcher_stats:
+            return 1.0
+        
+        key = normalize_name(pitcher_name)
+        factor = self._quality_factor_cache.get(key)
+        if factor is None:
+            factor = self._compute_pitcher_quality_factor(self._pitcher_index.get(key))
+            self._quality_factor_cache[key] = factor
+        return factor
+
+    def _compute_pitcher_quality_factor(self, pitcher_data: Optional[Dict]) -> float:
+        """Quality factor for one pitcher's stats entry (1.0 when missing or unusable)"""
+        if not pitcher_data:
             return 1.0
         
         # Get configuration
@@ -209,17 +346,6 @@ class UltraFastSimEngine:
         min_quality_factor = pitcher_config.get('min_quality_factor', 0.50)
         max_quality_factor = pitcher_config.get('max_quality_factor', 1.60)
 
-        # Find pitcher by name match
-        pitcher_data = None
-        for pitcher_id, data in self.pitcher_stats.items():
-            # Check if data is a dictionary (not a string)
-            if isinstance(data, dict) and data.get('name', '').lower() == pitcher_name.lower():
-                pitcher_data = data
-                break
-        
-        if not pitcher_data:
-            return 1.0
-        
         try:
             era = float(pitcher_data.get('era', 4.50))
             whip = float(pitcher_data.get('whip', 1.30))
@@ -279,21 +405,10 @@ class UltraFastSimEngine:
     
     def get_matchup_starters(self, away_team: str, home_team: str, game_date: str = None) -> Tuple[Optional[str], Optional[str]]:
         """Get starting pitchers for this matchup from master games data"""
+        # Use today if no date provided
+        target_date = game_date or datetime.now().strftime('%Y-%m-%d')
         try:
-            games_file = os.path.join(self.data_dir, 'master_games.json')
-            if os.path.exists(games_file):
-                with open(games_file, 'r') as f:
-                    games_data = json.load(f)
-                
-                # Use today if no date provided
-                target_date = game_date or datetime.now().strftime('%Y-%m-%d')
-                
-                # Look for the game in the specified date
-                if target_date in games_data.get('games_by_date', {}):
-                    for game in games_data['games_by_date'][target_date]:
-                        if (game.get('away_team') == away_team and 
-                            game.get('home_team') == home_team):
-                            return game.get('away_pitcher'), game.get('home_pitcher')
+            return self._data_store.get_starters(target_date, away_team, home_team)
         except Exception as e:
             print(f"Warning: Could not load game starters: {e}")
         
@@ -364,16 +479,11 @@ class UltraFastSimEngine:
         if game_date is None:
             game_date = datetime.now().strftime('%Y-%m-%d')
         
-        # Try to load daily park/weather data
-        date_formatted = game_date.replace('-', '_')
-        park_weather_file = os.path.join(self.data_dir, f'park_weather_factors_{date_formatted}.json')
-        
+        # Try daily park/weather data (served from the shared in-memory store)
         try:
-            if os.path.exists(park_weather_file):
-                with open(park_weather_file, 'r') as f:
-                    data = json.load(f)
-                    team_data = data.get('teams', {}).get(home_team, {})
-                    return team_data.get('total_factor', 1.0)
+            factor = self._data_store.get_park_factor(game_date, home_team)
+            if factor is not None:
+                return factor
         except Exception as e:
             logger.debug(f"Could not load park/weather data: {e}")
         
@@ -414,13 +524,337 @@ class UltraFastSimEngine:
     
     def simulate_game_vectorized(self, away_team: str, home_team: str, 
                                sim_count: int = 100, game_date: str = None,
-                               away_pitcher: str = None, home_pitcher: str = None) -> List[FastGameResult]:
-        """Ultra-fast vectorized simulation with realistic MLB variance"""
-        # Set consistent seed for stable predictions; include starters so DH games differ
-        seed_value = hash(f"{away_team}{home_team}{game_date or ''}{away_pitcher or ''}{home_pitcher or ''}") % 1000000
-        np.random.seed(seed_value)
-        random.seed(seed_value)
+                               away_pitcher: str = None, home_pitcher: str = None) -> Tuple[List[FastGameResult], Dict]:
+        """Ultra-fast vectorized simulation with realistic MLB variance.
+        Compatibility wrapper around simulate_game_arrays that expands results to FastGameResult objects.
+        """
+        arrays, pitcher_info = self.simulate_game_arrays(
+            away_team, home_team, sim_count, game_date, away_pitcher, home_pitcher
+        )
+        return arrays.to_results(), pitcher_info
+
+    def simulate_game_arrays(self, away_team: str, home_team: str,
+                             sim_count: int = 100, game_date: str = None,
+                             away_pitcher: str = None, home_pitcher: str = None,
+                             workers: int = None) -> Tuple[SimulationArrays, Dict]:
+        """NumPy-only simulation returning columnar arrays (no per-sim Python objects).
+
+        Draws come from per-call Generators seeded by a stable digest of the matchup (starters
+        included so DH games differ), so results are identical across processes and threads.
+        Sims are drawn in SIM_CHUNK_SIZE chunks from spawned SeedSequence children; with
+        workers > 1 (default: simulation_parameters.parallel_workers) chunks run on a process pool
+        and produce exactly the same arrays as the serial path.
+        """
+        away_lambda, home_lambda, pitcher_info = self._matchup_lambdas(
+            away_team, home_team, game_date, away_pitcher, home_pitcher
+        )
+        away_scores, home_scores, _, _ = self._sample_matchup(
+            matchup_seed(away_team, home_team, game_date, away_pitcher, home_pitcher),
+            away_lambda, home_lambda, sim_count, workers
+        )
+        arrays = SimulationArrays(
+            away_scores=away_scores,
+            home_scores=home_scores,
+            total_runs=away_scores + home_scores,
+            home_wins=home_scores > away_scores
+        )
+        return arrays, pitcher_info
+
+    def _sample_matchup(self, seed: int, away_lambda: float, home_lambda: float,
+                        sim_count: int, workers: int = None) -> Tuple[np.ndarray, np.ndarray, float, float]:
+        """Scores of one matchup drawn from its own seeded stream: the chaos factor first, then the
+        sims in chunks on spawned child streams. Returns (away_scores, home_scores, away_lambda,
+        home_lambda) with the lambdas after the chaos factor."""
+        seed_seq = np.random.SeedSequence(seed)
+        rng = np.random.default_rng(seed_seq)
+        
+        # Game-level variance using configurable chaos factor
+        game_chaos_factor = rng.normal(1.0, self.game_chaos_variance)
+        game_chaos_factor = max(CHAOS_BOUNDS[0], min(CHAOS_BOUNDS[1], game_chaos_factor))
+        
+        away_lambda *= game_chaos_factor
+        home_lambda *= game_chaos_factor
         
+        # Generate scores chunk by chunk, each chunk on its own child stream
+        sim_count = int(sim_count)
+        chunk_sizes = [min(SIM_CHUNK_SIZE, sim_count - start) for start in range(0, sim_count, SIM_CHUNK_SIZE)]
+        chunk_seqs = seed_seq.spawn(len(chunk_sizes))
+        if workers is None:
+            workers = int(self.config.get('simulation_parameters', {}).get('parallel_workers', 0) or 0)
+        if workers > 1 and len(chunk_sizes) > 1:
+            pool = _get_process_pool(workers)
+            chunks = list(pool.map(_simulate_chunk, [away_lambda] * len(chunk_sizes),
+                                   [home_lambda] * len(chunk_sizes), chunk_sizes, chunk_seqs))
+        else:
+            chunks = [_simulate_chunk(away_lambda, home_lambda, n, seq)
+                      for n, seq in zip(chunk_sizes, chunk_seqs)]
+        
+        if chunks:
+            away_scores = np.concatenate([c[0] for c in chunks])
+            home_scores = np.concatenate([c[1] for c in chunks])
+        else:
+            away_scores = np.zeros(0, dtype=np.int64)
+            home_scores = np.zeros(0, dtype=np.int64)
+        return away_scores, home_scores, away_lambda, home_lambda
+
+    def simulate_slate(self, games: List, sim_count: int = None, game_date: str = None,
+                       total_lines: List[float] = None, analytic: bool = None) -> List[Dict]:
+        """Simulate a whole slate into (games x sims) score matrices summarized in one pass.
+
+        Each game draws from its own stream seeded by its matchup (as simulate_game_arrays does),
+        so a game's result does not depend on the rest of the slate and equals its
+        simulate_game_arrays result.
+        games: list of dicts with away_team/home_team and optional away_pitcher, home_pitcher,
+        game_date and total_line; (away_team, home_team) tuples are accepted too.
+        Returns one summary dict per game, in input order.
+        With analytic=True (default: self.analytic) summaries are computed exactly, without sampling.
+        """
+        if not games:
+            return []
+        if analytic is None:
+            analytic = self.analytic
+        if not sim_count:
+            sim_count = self.config.get('simulation_parameters', {}).get('default_sim_count', 2000)
+        
+        matchups = []
+        for game in games:
+            if isinstance(game, dict):
+                matchups.append((
+                    game.get('away_team'), game.get('home_team'),
+                    game.get('game_date') or game_date,
+                    game.get('away_pitcher'), game.get('home_pitcher'),
+                    game.get('total_line')
+                ))
+            else:
+                away_team, home_team = game[0], game[1]
+                matchups.append((away_team, home_team, game_date, None, None, None))
+        
+        if analytic:
+            return [
+                self.analyze_game(m[0], m[1], m[2], m[3], m[4],
+                                  list(total_lines or []) + ([m[5]] if m[5] is not None else []))
+                for m in matchups
+            ]
+        
+        shape = (len(matchups), int(sim_count))
+        away_scores = np.empty(shape, dtype=np.int64)
+        home_scores = np.empty(shape, dtype=np.int64)
+        lambdas = np.empty((len(matchups), 2))
+        infos = []
+        for i, (away_team, home_team, g_date, away_pitcher, home_pitcher, _) in enumerate(matchups):
+            away_lambda, home_lambda, pitcher_info = self._matchup_lambdas(
+                away_team, home_team, g_date, away_pitcher, home_pitcher
+            )
+            away_scores[i], home_scores[i], lambdas[i, 0], lambdas[i, 1] = self._sample_matchup(
+                matchup_seed(away_team, home_team, g_date, away_pitcher, home_pitcher),
+                away_lambda, home_lambda, sim_count
+            )
+            infos.append(pitcher_info)
+        
+        summaries = self.summarize_scores(away_scores, home_scores, total_lines)
+        for i, summary in enumerate(summaries):
+            away_team, home_team, g_date, _, _, game_line = matchups[i]
+            if game_line is not None:
+                line_probs = self._total_line_probs(away_scores[i] + home_scores[i], [game_line])
+                summary['total_line_probs'].update(line_probs)
+            summary.update({
+                'away_team': away_team,
+                'home_team': home_team,
+                'game_date': g_date,
+                'away_lambda': round(float(lambdas[i, 0]), 3),
+                'home_lambda': round(float(lambdas[i, 1]), 3),
+                'pitcher_info': infos[i]
+            })
+        return summaries
+
+    def summarize_scores(self, away_scores: np.ndarray, home_scores: np.ndarray,
+                         total_lines: List[float] = None) -> List[Dict]:
+        """Per-game summary statistics from (games x sims) score matrices (1-D input is one game)"""
+        away_scores = np.atleast_2d(away_scores)
+        home_scores = np.atleast_2d(home_scores)
+        totals = away_scores + home_scores
+        sims = away_scores.shape[1]
+        
+        home_win_prob = np.count_nonzero(home_scores > away_scores, axis=1) / sims
+        home_cover_rl = np.count_nonzero(home_scores - away_scores >= 2, axis=1) / sims
+        away_cover_rl = np.count_nonzero(away_scores - home_scores >= -1, axis=1) / sims
+        pct = (10, 50, 90)
+        away_pct = np.percentile(away_scores, pct, axis=1)
+        home_pct = np.percentile(home_scores, pct, axis=1)
+        total_pct = np.percentile(totals, pct, axis=1)
+        means = np.stack([away_scores.mean(axis=1), home_scores.mean(axis=1), totals.mean(axis=1)])
+        total_std = totals.std(axis=1)
+        
+        summaries = []
+        for i in range(away_scores.shape[0]):
+            summaries.append({
+                'method': 'monte_carlo',
+                'sim_count': int(sims),
+                'home_win_prob': float(home_win_prob[i]),
+                'away_win_prob': float(1.0 - home_win_prob[i]),
+                'mean_away_runs': float(means[0, i]),
+                'mean_home_runs': float(means[1, i]),
+                'mean_total_runs': float(means[2, i]),
+                'total_runs_std': float(total_std[i]),
+                'away_runs_pct': {f"p{p}": float(v) for p, v in zip(pct, away_pct[:, i])},
+                'home_runs_pct': {f"p{p}": float(v) for p, v in zip(pct, home_pct[:, i])},
+                'total_runs_pct': {f"p{p}": float(v) for p, v in zip(pct, total_pct[:, i])},
+                'home_cover_run_line': float(home_cover_rl[i]),
+                'away_cover_run_line': float(away_cover_rl[i]),
+                'total_line_probs': self._total_line_probs(totals[i], total_lines or [])
+            })
+        return summaries
+
+    def analyze_game(self, away_team: str, home_team: str, game_date: str = None,
+                     away_pitcher: str = None, home_pitcher: str = None,
+                     total_lines: List[float] = None) -> Dict:
+        """Closed-form equivalent of a simulated game summary (no sampling noise).
+
+        The scoring model is two independent clipped Poissons, mixed over the clipped game chaos
+        factor, with ties resolved by the same extra-innings rule as the Monte Carlo path.
+        Percentiles are the smallest score whose CDF reaches the quantile.
+        """
+        away_lambda, home_lambda, pitcher_info = self._matchup_lambdas(
+            away_team, home_team, game_date, away_pitcher, home_pitcher
+        )
+        joint = self._final_score_pmf(away_lambda, home_lambda)
+        summary = self.summarize_pmf(joint, total_lines)
+        summary.update({
+            'away_team': away_team,
+            'home_team': home_team,
+            'game_date': game_date,
+            'away_lambda': round(float(away_lambda), 3),
+            'home_lambda': round(float(home_lambda), 3),
+            'pitcher_info': pitcher_info
+        })
+        return summary
+
+    def _chaos_nodes(self, nodes: int = 21) -> Tuple[np.ndarray, np.ndarray]:
+        """Discretize the clipped normal chaos factor into (values, weights), point masses at the bounds"""
+        key = (self.game_chaos_variance, nodes)
+        cached = getattr(self, '_chaos_nodes_cache', None)
+        if cached and cached[0] == key:
+            return cached[1]
+        lo, hi = CHAOS_BOUNDS
+        sigma = self.game_chaos_variance
+        if sigma <= 0:
+            result = (np.array([1.0]), np.array([1.0]))
+        else:
+            def cdf(x):
+                return 0.5 * (1.0 + math.erf((x - 1.0) / (sigma * math.sqrt(2.0))))
+            edges = np.linspace(lo, hi, nodes + 1)
+            cdfs = np.array([cdf(x) for x in edges])
+            values = np.concatenate([[lo], (edges[:-1] + edges[1:]) / 2.0, [hi]])
+            weights = np.concatenate([[cdfs[0]], np.diff(cdfs), [1.0 - cdfs[-1]]])
+            result = (values, weights)
+        self._chaos_nodes_cache = (key, result)
+        return result
+
+    @staticmethod
+    def _clipped_poisson_pmf(lambdas: np.ndarray) -> np.ndarray:
+        """PMF over 0..MAX_REGULATION_RUNS for each lambda, tail mass folded into the top value"""
+        k = np.arange(MAX_REGULATION_RUNS + 1)
+        log_fact = np.concatenate([[0.0], np.cumsum(np.log(k[1:]))])
+        lam = np.asarray(lambdas, dtype=float)[:, None]
+        pmf = np.exp(k * np.log(lam) - lam - log_fact)
+        pmf[:, -1] += np.clip(1.0 - pmf.sum(axis=1), 0.0, None)
+        return pmf
+
+    @staticmethod
+    def _extra_innings_pmf() -> np.ndarray:
+        """Joint PMF of (away, home) runs added when regulation ends tied"""
+        p = EXTRA_INNING_SCORE_PROB
+        size = MAX_EXTRA_INNINGS + 2
+        added = np.zeros((size, size))
+        tied = {0: 1.0}  # runs added to each team while still tied -> probability
+        for _ in range(MAX_EXTRA_INNINGS):
+            still_tied = {}
+            for runs, prob in tied.items():
+                added[runs + 1, runs] += prob * p * (1 - p)
+                added[runs, runs + 1] += prob * (1 - p) * p
+                still_tied[runs + 1] = still_tied.get(runs + 1, 0.0) + prob * p * p
+                still_tied[runs] = still_tied.get(runs, 0.0) + prob * (1 - p) * (1 - p)
+            tied = still_tied
+        for runs, prob in tied.items():
+            added[runs + 1, runs] += prob * 0.5
+            added[runs, runs + 1] += prob * 0.5
+        return added
+
+    def _final_score_pmf(self, away_lambda: float, home_lambda: float) -> np.ndarray:
+        """Joint PMF of final (away, home) scores, indexed [away, home]"""
+        chaos, weights = self._chaos_nodes()
+        away_pmf = self._clipped_poisson_pmf(away_lambda * chaos)
+        home_pmf = self._clipped_poisson_pmf(home_lambda * chaos)
+        regulation = np.einsum('c,ca,ch->ah', weights, away_pmf, home_pmf)
+        
+        extra = self._extra_innings_pmf()
+        size = MAX_REGULATION_RUNS + extra.shape[0]
+        joint = np.zeros((size, size))
+        ties = np.diag(regulation).copy()
+        joint[:regulation.shape[0], :regulation.shape[1]] = regulation
+        np.fill_diagonal(joint[:regulation.shape[0], :regulation.shape[1]], 0.0)
+        for score, mass in enumerate(ties):
+            if mass:
+                joint[score:score + extra.shape[0], score:score + extra.shape[1]] += mass * extra
+        return joint
+
+    def summarize_pmf(self, joint: np.ndarray, total_lines: List[float] = None) -> Dict:
+        """Summary statistics (same fields as summarize_scores) from a joint final-score PMF"""
+        runs = np.arange(joint.shape[0])
+        margin = runs[None, :] - runs[:, None]          # home - away
+        totals = runs[:, None] + runs[None, :]
+        away_pmf = joint.sum(axis=1)
+        home_pmf = joint.sum(axis=0)
+        total_pmf = np.bincount(totals.ravel(), weights=joint.ravel())
+        total_values = np.arange(total_pmf.shape[0])
+        
+        home_win_prob = float(joint[margin > 0].sum())
+        mean_total = float(total_values @ total_pmf)
+        pct = (10, 50, 90)
+        
+        def percentiles(pmf):
+            cdf = np.cumsum(pmf)
+            return {f"p{p}": float(np.searchsorted(cdf, p / 100.0 - 1e-12)) for p in pct}
+        
+        line_probs = {}
+        for line in total_lines or []:
+            line_probs[str(line)] = {
+                'over': float(total_pmf[total_values > line].sum()),
+                'under': float(total_pmf[total_values < line].sum()),
+                'push': float(total_pmf[total_values == line].sum())
+            }
+        return {
+            'method': 'analytic',
+            'sim_count': 0,
+            'home_win_prob': home_win_prob,
+            'away_win_prob': 1.0 - home_win_prob,
+            'mean_away_runs': float(runs @ away_pmf),
+            'mean_home_runs': float(runs @ home_pmf),
+            'mean_total_runs': mean_total,
+            'total_runs_std': float(math.sqrt(max(0.0, ((total_values - mean_total) ** 2) @ total_pmf))),
+            'away_runs_pct': percentiles(away_pmf),
+            'home_runs_pct': percentiles(home_pmf),
+            'total_runs_pct': percentiles(total_pmf),
+            'home_cover_run_line': float(joint[margin >= 2].sum()),
+            'away_cover_run_line': float(joint[margin <= 1].sum()),
+            'total_line_probs': line_probs
+        }
+
+    @staticmethod
+    def _total_line_probs(totals: np.ndarray, lines: List[float]) -> Dict[str, Dict[str, float]]:
+        """Over/under/push probabilities for each total line"""
+        sims = totals.shape[0]
+        out = {}
+        for line in lines:
+            over = np.count_nonzero(totals > line) / sims
+            under = np.count_nonzero(totals < line) / sims
+            push = np.count_nonzero(totals == line) / sims
+            out[str(line)] = {'over': float(over), 'under': float(under), 'push': float(push)}
+        return out
+
+    def _matchup_lambdas(self, away_team: str, home_team: str, game_date: str = None,
+                         away_pitcher: str = None, home_pitcher: str = None) -> Tuple[float, float, Dict]:
+        """Resolve starters, quality factors and park factors into (away_lambda, home_lambda, pitcher_info)"""
         # Get pitcher information - use passed parameters if available, otherwise lookup
         if away_pitcher and home_pitcher:
             away_starter = away_pitcher
@@ -437,64 +871,29 @@ class UltraFastSimEngine:
         )
         
         # Poisson parameters using configurable base lambda
-        away_lambda = self.base_lambda * away_mult
-        home_lambda = self.base_lambda * home_mult
-        
-        # Game-level variance using configurable chaos factor
-        game_chaos_factor = np.random.normal(1.0, self.game_chaos_variance)
-        game_chaos_factor = max(0.75, min(1.25, game_chaos_factor))
-        
-        away_lambda *= game_chaos_factor
-        home_lambda *= game_chaos_factor
-        
-        # Generate scores
-        away_scores = np.random.poisson(np.full(sim_count, away_lambda))
-        home_scores = np.random.poisson(np.full(sim_count, home_lambda))
-        
-        away_scores = np.clip(away_scores, 0, 24)
-        home_scores = np.clip(home_scores, 0, 24)
-        
-        # Create results
-        results = []
-        for i in range(sim_count):
-            away_score = int(away_scores[i])
-            home_score = int(home_scores[i])
-            
-            # Handle ties with extra innings
-            if away_score == home_score:
-                extra_innings = 0
-                while away_score == home_score and extra_innings < 5:
-                    extra_innings += 1
-                    if random.random() < 0.6:
-                        away_score += 1
-                    if random.random() < 0.6:
-                        home_score += 1
-                
-                if away_score == home_score:
-                    if random.random() < 0.5:
-                        away_score += 1
-                    else:
-                        home_score += 1
-            
-            total_run = away_score + home_score
-            home_win = home_score > away_score
-            run_diff = home_score - away_score
-            
-            results.append(FastGameResult(
-                away_score=away_score,
-                home_score=home_score,
-                total_runs=total_run,
-                home_wins=home_win,
-                run_differential=run_diff
-            ))
-        
-        return results, {
+        return self.base_lambda * away_mult, self.base_lambda * home_mult, {
             'away_pitcher_name': away_starter,
             'home_pitcher_name': home_starter,
             'away_pitcher_factor': away_pitcher_factor,
             'home_pitcher_factor': home_pitcher_factor
         }
 
+    @staticmethod
+    def _resolve_ties(away_scores: np.ndarray, home_scores: np.ndarray, rng: np.random.Generator,
+                      max_extra_innings: int = MAX_EXTRA_INNINGS) -> None:
+        """Resolve tied sims in place with masked extra innings, then a coin flip for any remaining ties"""
+        tied = np.flatnonzero(away_scores == home_scores)
+        for _ in range(max_extra_innings):
+            if tied.size == 0:
+                return
+            away_scores[tied] += rng.random(tied.size) < EXTRA_INNING_SCORE_PROB
+            home_scores[tied] += rng.random(tied.size) < EXTRA_INNING_SCORE_PROB
+            tied = tied[away_scores[tied] == home_scores[tied]]
+        if tied.size:
+            away_first = rng.random(tied.size) < 0.5
+            away_scores[tied[away_first]] += 1
+            home_scores[tied[~away_first]] += 1
+
 class SmartBettingAnalyzer:
     """Advanced betting analyzer with real-time recommendations and configurable parameters"""
     
@@ -635,6 +1034,7 @@ class FastPredictionEngine:
         # Initialize components with configuration
         self.sim_engine = UltraFastSimEngine(self.data_dir, self.config)
         self.betting_analyzer = SmartBettingAnalyzer(self.config)
+        self._data_store = self.sim_engine._data_store
         self._load_master_data()
     
     def _load_config(self):
@@ -673,13 +1073,8 @@ class FastPredictionEngine:
     def _load_master_data(self):
         """Load master data files"""
         try:
-            # Load master games data
-            games_file = os.path.join(self.data_dir, 'master_games.json')
-            if os.path.exists(games_file):
-                with open(games_file, 'r') as f:
-                    self.master_games = json.load(f)
-            else:
-                self.master_games = {}
+            # Load master games data (shared, mtime-validated)
+            self.master_games = self._data_store.get_master_games()
             
             # Load master predictions data
             predictions_file = os.path.join(self.data_dir, 'master_predictions.json')
@@ -722,26 +1117,60 @@ class FastPredictionEngine:
         sim_params = self.config.get('simulation_parameters', {})
         default_sim_count = sim_params.get('default_sim_count', 2000)
         sim_count = sim_count or default_sim_count
-        results, pitcher_info = self.sim_engine.simulate_game_vectorized(
-            away_team, home_team, sim_count, game_date, away_pitcher, home_pitcher
-        )
+        if self.sim_engine.analytic:
+            summary = self.sim_engine.analyze_game(away_team, home_team, game_date, away_pitcher, home_pitcher)
+            pitcher_info = summary['pitcher_info']
+        else:
+            results, pitcher_info = self.sim_engine.simulate_game_arrays(
+                away_team, home_team, sim_count, game_date, away_pitcher, home_pitcher
+            )
+            summary = self.sim_engine.summarize_scores(results.away_scores, results.home_scores)[0]
         
-        # Calculate statistics
-        away_scores = [r.away_score for r in results]
-        home_scores = [r.home_score for r in results]
-        total_runs = [r.total_runs for r in results]
-        home_wins = sum(r.home_wins for r in results)
+        return self._build_prediction(away_team, home_team, game_date, summary, pitcher_info, start_time)
+
+    def get_fast_predictions(self, games: List[Dict], sim_count: int = 2000,
+                             game_date: str = None) -> List[Dict]:
+        """Batch variant of get_fast_prediction: simulates every non-historical game in one slate pass.
+        games: dicts with away_team/home_team and optional away_pitcher/home_pitcher.
+        """
+        start_time = datetime.now()
+        if not game_date:
+            game_date = datetime.now().strftime('%Y-%m-%d')
+        sim_count = sim_count or self.config.get('simulation_parameters', {}).get('default_sim_count', 2000)
+        
+        predictions = [None] * len(games)
+        to_simulate = []
+        for i, game in enumerate(games):
+            historical_result = self._get_historical_result(game.get('away_team'), game.get('home_team'), game_date)
+            if historical_result:
+                predictions[i] = historical_result
+            else:
+                to_simulate.append(i)
         
-        avg_away = np.mean(away_scores)
-        avg_home = np.mean(home_scores)
-        avg_total = np.mean(total_runs)
-        home_win_prob = home_wins / sim_count
+        summaries = self.sim_engine.simulate_slate(
+            [games[i] for i in to_simulate], sim_count, game_date
+        )
+        for i, summary in zip(to_simulate, summaries):
+            predictions[i] = self._build_prediction(
+                summary['away_team'], summary['home_team'], game_date, summary,
+                summary['pitcher_info'], start_time
+            )
+        return predictions
+
+    def _build_prediction(self, away_team: str, home_team: str, game_date: str, summary: Dict,
+                          pitcher_info: Dict, start_time: datetime) -> Dict:
+        """Turn a simulation summary into the prediction payload with betting analysis"""
+        sim_count = summary['sim_count']
+        avg_away = summary['mean_away_runs']
+        avg_home = summary['mean_home_runs']
+        avg_total = summary['mean_total_runs']
+        home_win_prob = summary['home_win_prob']
         away_win_prob = 1 - home_win_prob
         
         # Confidence intervals
-        home_ci = (np.percentile(home_scores, 10), np.percentile(home_scores, 90))
-        away_ci = (np.percentile(away_scores, 10), np.percentile(away_scores, 90))
-        total_ci = (np.percentile(total_runs, 10), np.percentile(total_runs, 90))
+        home_ci = (summary['home_runs_pct']['p10'], summary['home_runs_pct']['p90'])
+        away_ci = (summary['away_runs_pct']['p10'], summary['away_runs_pct']['p90'])
+        total_ci = (summary['total_runs_pct']['p10'], summary['total_runs_pct']['p90'])
         
         # Get betting lines
         betting_lines = self._get_betting_lines(away_team, home_team, game_date, home_win_prob)
@@ -780,7 +1209,7 @@ class FastPredictionEngine:
                 'home_score_range': (round(home_ci[0], 1), round(home_ci[1], 1)),
                 'away_score_range': (round(away_ci[0], 1), round(away_ci[1], 1)),
                 'total_runs_range': (round(total_ci[0], 1), round(total_ci[1], 1)),
-                'confidence': round(90 - np.std(total_runs) * 10, 1)
+                'confidence': round(90 - summary['total_runs_std'] * 10, 1)
             },
             'betting_lines': betting_lines,
             'recommendations': all_recommendations,
@@ -790,7 +1219,7 @@ class FastPredictionEngine:
                 'execution_time_ms': round(execution_time, 1),
                 'recommendations_found': len(all_recommendations),
                 'timestamp': datetime.now().isoformat(),
-                'data_source': 'live_simulation'
+                'data_source': 'analytic' if summary.get('method') == 'analytic' else 'live_simulation'
             }
         }
     
@@ -937,8 +1366,9 @@ class FastPredictionEngine:
         target_date = game_date or datetime.now().strftime('%Y-%m-%d')
         games = []
         
-        if target_date in self.master_games.get('games_by_date', {}):
-            for game in self.master_games['games_by_date'][target_date]:
+        master_games = self._data_store.get_master_games()
+        if target_date in master_games.get('games_by_date', {}):
+            for game in master_games['games_by_date'][target_date]:
                 games.append((game['away_team'], game['home_team']))
         
         return games
@@ -948,16 +1378,11 @@ class FastPredictionEngine:
         if game_date is None:
             game_date = datetime.now().strftime('%Y-%m-%d')
         
-        # Try to load daily park/weather data
-        date_formatted = game_date.replace('-', '_')
-        park_weather_file = os.path.join(self.data_dir, f'park_weather_factors_{date_formatted}.json')
-        
+        # Try daily park/weather data (served from the shared in-memory store)
         try:
-            if os.path.exists(park_weather_file):
-                with open(park_weather_file, 'r') as f:
-                    data = json.load(f)
-                    team_data = data.get('teams', {}).get(home_team, {})
-                    return team_data.get('total_factor', 1.0)
+            factor = self._data_store.get_park_factor(game_date, home_team)
+            if factor is not None:
+                return factor
         except Exception as e:
             logger.debug(f"Could not load park/weather data: {e}")
         
@@ -19,6 +19,8 @@ from typing import Dict, Any, List
 
 import requests
 
+from http_client import get_http_client
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("bovada_pitcher_props")
 
@@ -102,7 +104,8 @@ def _match_market(market_name: str, keywords: List[str]) -> bool:
 def _http_get_json(url: str) -> Any:
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=25)
+            # Own retry loop below (with Cloudflare detection), so no client-level retries
+            resp = get_http_client().get(url, headers=HEADERS, timeout=25, retries=0)
             # Some blocking responses return HTML (Cloudflare / Akamai) – detect
             ctype = resp.headers.get('Content-Type', '')
             if 'json' not in ctype.lower() and not resp.text.strip().startswith('[') and not resp.text.strip().startswith('{'):
@@ -87,41 +87,22 @@ def fetch_todays_starting_pitchers():
 def update_predictions_with_real_pitchers(pitcher_data):
     """Update today's predictions with real starting pitcher data"""
     try:
-        # Load current predictions cache (append by date)
-        cache_path_candidates = [
-            'data/unified_predictions_cache.json',  # preferred
-            'unified_predictions_cache.json'        # fallback
-        ]
-        cache_path = None
-        predictions_data = {}
-        for p in cache_path_candidates:
-            if os.path.exists(p):
-                cache_path = p
-                try:
-                    with open(p, 'r') as f:
-                        predictions_data = json.load(f)
-                except Exception:
-                    predictions_data = {}
-                break
-        if cache_path is None:
-            cache_path = cache_path_candidates[0]
+        # Load today's shard from the unified predictions store
+        from unified_predictions_store import get_unified_predictions_store
+        store = get_unified_predictions_store('data')
         today = datetime.now().strftime('%Y-%m-%d')
-        # Ensure structure
-        if 'predictions_by_date' not in predictions_data:
-            predictions_data['predictions_by_date'] = {}
-        if today not in predictions_data['predictions_by_date']:
+        day_data = store.get_date(today)
+        if day_data is None:
             logger.warning(f"No predictions found for {today} in cache. Skipping update.")
             # Still write out a metadata note so we can track the attempt
-            predictions_data['predictions_by_date'][today] = {
+            store.put_date(today, {
                 'games': {},
                 'metadata': {
                     'last_pitcher_update': datetime.now().isoformat(),
                     'pitcher_update_date': today,
                     'pitchers_updated_count': 0
                 }
-            }
-            with open(cache_path, 'w') as f:
-                json.dump(predictions_data, f, indent=2)
+            })
             return False
 
         # Create a mapping of "Away Team @ Home Team" to pitchers
@@ -138,7 +119,8 @@ def update_predictions_with_real_pitchers(pitcher_data):
 
         # Update predictions with real pitchers
         updated_count = 0
-        day_data = predictions_data['predictions_by_date'][today]
+        # Deep-copy before editing: docs returned by the store are shared
+        day_data = json.loads(json.dumps(day_data))
         games = day_data.get('games', {})
 
         for game_key, game_data in games.items():
@@ -177,10 +159,8 @@ def update_predictions_with_real_pitchers(pitcher_data):
         md['pitchers_updated_count'] = updated_count
         day_data['metadata'] = md
 
-        # Save merged cache
-        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-        with open(cache_path, 'w') as f:
-            json.dump(predictions_data, f, indent=2)
+        # Save today's shard
+        store.put_date(today, day_data)
         logger.info(f"✅ Updated {updated_count} games with real starting pitchers")
         return True
 
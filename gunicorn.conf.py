@@ -0,0 +1,16 @@
+"""Gunicorn settings (read automatically from the working directory).
+
+Workers default to gevent so that held Server-Sent Events streams (sse_hub.py) wait
+cooperatively instead of each pinning one of a few gthread request threads. The worker
+class is exported before the app is preloaded, so the SSE hubs size their held-stream
+limit for it. Set GUNICORN_WORKER_CLASS=gthread (with WEB_THREADS) to go back to threads.
+"""
+import os
+
+worker_class = os.environ.setdefault('GUNICORN_WORKER_CLASS', 'gevent')
+workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
+threads = int(os.environ.get('WEB_THREADS', '4'))  # gthread only
+worker_connections = int(os.environ.get('WEB_CONNECTIONS', '1000'))  # gevent only
+timeout = 120
+preload_app = True
+loglevel = 'info'
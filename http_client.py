@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Process-wide HTTP client shared by the app, LiveMLBData and the odds/data fetchers.
+
+- One requests.Session per process (recreated after fork) with keep-alive connection pools
+  per host (env HTTP_POOL_MAXSIZE, default 32 connections per host).
+- Retry with exponential backoff + jitter on connection errors, timeouts and 429/5xx
+  (Retry-After is honoured, capped); callers that run their own retry loop pass retries=0.
+- Conditional requests: get(..., conditional=True) remembers ETag/Last-Modified per URL and
+  answers a 304 with the stored response, so unchanged documents are not re-downloaded.
+  Stored bodies are bounded by env HTTP_CONDITIONAL_CACHE_MB (default 32).
+- Per-host counters and latency percentiles via stats() (see /api/diag).
+
+Responses are plain requests.Response objects and errors are the usual requests exceptions,
+so call sites keep their existing raise_for_status()/except handling.
+"""
+from __future__ import annotations
+import os, time, random, threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+DEFAULT_TIMEOUT = 10
+_LATENCY_WINDOW = 200
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except Exception:
+        return default
+
+
+class _HostStats:
+    __slots__ = ('requests', 'errors', 'retries', 'not_modified', 'statuses', 'ms_total', 'ms_max', 'recent')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.not_modified = 0
+        self.statuses: Dict[int, int] = {}
+        self.ms_total = 0.0
+        self.ms_max = 0.0
+        self.recent = deque(maxlen=_LATENCY_WINDOW)
+
+    def as_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+        pct = lambda q: round(recent[min(len(recent) - 1, int(q * len(recent)))], 1) if recent else None
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'not_modified': self.not_modified,
+            'statuses': dict(self.statuses),
+            'avg_ms': round(self.ms_total / self.requests, 1) if self.requests else None,
+            'p50_ms': pct(0.5),
+            'p95_ms': pct(0.95),
+            'max_ms': round(self.ms_max, 1),
+        }
+
+
+class HttpClient:
+    def __init__(self, retries: int = 2, backoff: float = 0.3, max_backoff: float = 8.0,
+                 pool_maxsize: int = None, conditional_max_bytes: int = None):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.pool_maxsize = pool_maxsize or _env_int('HTTP_POOL_MAXSIZE', 32)
+        self.conditional_max_bytes = (conditional_max_bytes if conditional_max_bytes is not None
+                                      else _env_int('HTTP_CONDITIONAL_CACHE_MB', 32) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._pid = None
+        self._session: Optional[requests.Session] = None
+        self._hosts: Dict[str, _HostStats] = {}
+        self._validators: 'OrderedDict[str, requests.Response]' = OrderedDict()
+        self._validator_bytes = 0
+
+    @property
+    def session(self) -> requests.Session:
+        # Sockets must not be shared with a forked parent (gunicorn --preload)
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=self.pool_maxsize)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session, self._pid = session, pid
+        return self._session
+
+    def _host(self, url: str) -> _HostStats:
+        host = urlsplit(url).netloc or 'unknown'
+        hs = self._hosts.get(host)
+        if hs is None:
+            hs = self._hosts.setdefault(host, _HostStats())
+        return hs
+
+    def _sleep_before_retry(self, attempt: int, resp: Optional[requests.Response]):
+        delay = min(self.max_backoff, self.backoff * (2 ** attempt)) * random.uniform(0.5, 1.0)
+        try:
+            retry_after = resp.headers.get('Retry-After') if resp is not None else None
+            if retry_after:
+                delay = min(self.max_backoff, float(retry_after))
+        except Exception:
+            pass
+        time.sleep(delay)
+
+    def request(self, method: str, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+                timeout: float = DEFAULT_TIMEOUT, retries: int = None, conditional: bool = False,
+                **kwargs) -> requests.Response:
+        retries = self.retries if retries is None else retries
+        cond_key = None
+        stored = None
+        if conditional and method == 'GET':
+            cond_key = requests.Request('GET', url, params=params).prepare().url
+            with self._lock:
+                stored = self._validators.get(cond_key)
+            if stored is not None:
+                headers = dict(headers or {})
+                if stored.headers.get('ETag'):
+                    headers['If-None-Match'] = stored.headers['ETag']
+                if stored.headers.get('Last-Modified'):
+                    headers['If-Modified-Since'] = stored.headers['Last-Modified']
+        hs = self._host(url)
+        attempt = 0
+        while True:
+            t0 = time.perf_counter()
+            resp = None
+            try:
+                resp = self.session.request(method, url, params=params, headers=headers, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(hs, t0, None)
+                if attempt >= retries:
+                    raise
+            else:
+                self._record(hs, t0, resp.status_code)
+                if resp.status_code not in RETRY_STATUSES or attempt >= retries:
+                    break
+            with self._lock:
+                hs.retries += 1
+            self._sleep_before_retry(attempt, resp)
+            attempt += 1
+        if cond_key is not None:
+            if resp.status_code == 304 and stored is not None:
+                with self._lock:
+                    hs.not_modified += 1
+                    if cond_key in self._validators:
+                        self._validators.move_to_end(cond_key)
+                return stored
+            if resp.status_code == 200 and (resp.headers.get('ETag') or resp.headers.get('Last-Modified')):
+                self._remember(cond_key, resp)
+        return resp
+
+    def get(self, url: str, params: Dict[str, Any] = None, **kwargs) -> requests.Response:
+        return self.request('GET', url, params=params, **kwargs)
+
+    def get_json(self, url: str, params: Dict[str, Any] = None, **kwargs) -> Any:
+        resp = self.get(url, params=params, **kwargs)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _record(self, hs: _HostStats, t0: float, status: Optional[int]):
+        ms = (time.perf_counter() - t0) * 1000.0
+        with self._lock:
+            hs.requests += 1
+            hs.ms_total += ms
+            hs.ms_max = max(hs.ms_max, ms)
+            hs.recent.append(ms)
+            if status is None or status >= 500:
+                hs.errors += 1
+            if status is not None:
+                hs.statuses[status] = hs.statuses.get(status, 0) + 1
+
+    def _remember(self, key: str, resp: requests.Response):
+        size = len(resp.content or b'')
+        if size > self.conditional_max_bytes:
+            return
+        with self._lock:
+            old = self._validators.pop(key, None)
+            if old is not None:
+                self._validator_bytes -= len(old.content or b'')
+            self._validators[key] = resp
+            self._validator_bytes += size
+            while self._validator_bytes > self.conditional_max_bytes and self._validators:
+                _, evicted = self._validators.popitem(last=False)
+                self._validator_bytes -= len(evicted.content or b'')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'pid': self._pid,
+                'pool_maxsize': self.pool_maxsize,
+                'conditional_entries': len(self._validators),
+                'conditional_bytes': self._validator_bytes,
+                'hosts': {h: hs.as_dict() for h, hs in sorted(self._hosts.items())},
+            }
+
+
+_CLIENT: Optional[HttpClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide shared client"""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = HttpClient()
+    return _CLIENT
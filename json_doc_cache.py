@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Process-wide cache of parsed JSON documents keyed by file path.
+
+Entries are revalidated on every read with a single os.stat: a document is re-parsed only
+when the file's (mtime_ns, size, inode) changes, so atomic replace-style writers
+(tmp + os.replace) are always picked up and unchanged files are never parsed twice.
+
+- Parsing uses orjson when installed, falling back to the stdlib json module.
+- The cache is an LRU bounded by total file bytes (env JSON_DOC_CACHE_MAX_MB, default 256);
+  files larger than the budget are parsed but not retained.
+- Loads are single-flight: concurrent readers of the same changed file wait for one parse.
+- Per-path hit/miss/parse-time counters are exposed via stats() (see /api/diag).
+
+Returned documents are shared between callers: treat them as read-only and copy before
+mutating.
+"""
+from __future__ import annotations
+import os, json, time, threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None
+
+JSON_BACKEND = 'orjson' if _orjson is not None else 'json'
+_MISSING = object()
+
+
+def loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _default_budget() -> int:
+    try:
+        return int(float(os.environ.get('JSON_DOC_CACHE_MAX_MB', '256')) * 1024 * 1024)
+    except Exception:
+        return 256 * 1024 * 1024
+
+
+class _Entry:
+    __slots__ = ('sig', 'value', 'nbytes')
+
+    def __init__(self, sig: Tuple[int, int, int], value: Any, nbytes: int):
+        self.sig = sig
+        self.value = value
+        self.nbytes = nbytes
+
+
+class _PathStats:
+    __slots__ = ('hits', 'misses', 'reloads', 'errors', 'parse_ms_total', 'last_parse_ms', 'bytes')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.errors = 0
+        self.parse_ms_total = 0.0
+        self.last_parse_ms = None
+        self.bytes = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'reloads': self.reloads,
+            'errors': self.errors,
+            'parse_ms_total': round(self.parse_ms_total, 2),
+            'last_parse_ms': self.last_parse_ms,
+            'bytes': self.bytes,
+        }
+
+
+class JsonDocCache:
+    def __init__(self, max_bytes: int = None):
+        self.max_bytes = _default_budget() if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, threading.Event] = {}
+        self._path_stats: Dict[str, _PathStats] = {}
+        self._derived: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'waits': 0, 'uncacheable': 0}
+
+    def _pstats(self, path: str) -> _PathStats:
+        ps = self._path_stats.get(path)
+        if ps is None:
+            ps = self._path_stats[path] = _PathStats()
+        return ps
+
+    def load(self, path: str, default: Any = None) -> Any:
+        """Parsed JSON for path, or default when the file is missing or invalid."""
+        key = os.path.abspath(path)
+        while True:
+            try:
+                st = os.stat(key)
+            except OSError:
+                with self._lock:
+                    entry = self._entries.pop(key, None)
+                    if entry is not None:
+                        self._bytes -= entry.nbytes
+                return default
+            sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry.sig == sig:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    self._pstats(key).hits += 1
+                    return entry.value
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    # This thread parses; others for the same path wait below
+                    self._inflight[key] = threading.Event()
+                    break
+                self._stats['waits'] += 1
+            waiter.wait()
+        try:
+            value = self._parse(key, sig, entry is not None)
+        finally:
+            with self._lock:
+                self._inflight.pop(key).set()
+        if value is _MISSING:
+            # Unparseable (e.g. caught mid-write by a non-atomic writer): keep serving the last good version
+            return entry.value if entry is not None else default
+        return value
+
+    def _parse(self, key: str, sig: Tuple[int, int, int], had_entry: bool) -> Any:
+        t0 = time.perf_counter()
+        try:
+            with open(key, 'rb') as f:
+                raw = f.read()
+            value = loads(raw)
+        except Exception:
+            with self._lock:
+                self._pstats(key).errors += 1
+            return _MISSING
+        parse_ms = round((time.perf_counter() - t0) * 1000.0, 3)
+        nbytes = len(raw)
+        with self._lock:
+            self._stats['misses'] += 1
+            ps = self._pstats(key)
+            ps.misses += 1
+            if had_entry:
+                ps.reloads += 1
+            ps.parse_ms_total += parse_ms
+            ps.last_parse_ms = parse_ms
+            ps.bytes = nbytes
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            if nbytes > self.max_bytes:
+                self._stats['uncacheable'] += 1
+                return value
+            self._entries[key] = _Entry(sig, value, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._stats['evictions'] += 1
+        return value
+
+    def derive(self, path: str, name: str, builder: Callable[[Any], Any], default: Any = None) -> Any:
+        """builder(doc) memoized per document version (e.g. an index built from a file)."""
+        doc = self.load(path, _MISSING)
+        if doc is _MISSING:
+            return default
+        key = (os.path.abspath(path), name)
+        with self._lock:
+            cached = self._derived.get(key)
+            if cached is not None and cached[0] is doc:
+                return cached[1]
+        value = builder(doc)
+        with self._lock:
+            self._derived[key] = (doc, value)
+        return value
+
+    def invalidate(self, path: str = None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._derived.clear()
+                self._bytes = 0
+                return
+            entry = self._entries.pop(os.path.abspath(path), None)
+            if entry is not None:
+                self._bytes -= entry.nbytes
+
+    def stats(self, top: int = 25) -> Dict[str, Any]:
+        with self._lock:
+            per_path = sorted(self._path_stats.items(), key=lambda kv: kv[1].parse_ms_total, reverse=True)
+            return {
+                **self._stats,
+                'backend': JSON_BACKEND,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'paths': {os.path.relpath(p): ps.as_dict() for p, ps in per_path[:top]},
+            }
+
+
+_CACHE = JsonDocCache()
+
+
+def get_doc_cache() -> JsonDocCache:
+    return _CACHE
+
+
+def load_json_doc(path: str, default: Any = None) -> Any:
+    return _CACHE.load(path, default)
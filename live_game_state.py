@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""In-memory state of in-progress games, diffed and pushed over SSE.
+
+The LiveMLBData poller calls LiveGameTracker.update() after every refresh of a date. The
+tracker formats the date's games from the (already fetched) schedule and live feeds, keeps
+per-game status and per-pitcher box lines, and publishes only the fields that changed:
+
+  game-status channel    {"type": "game_status", "date", "game_pk", "away_team", "home_team", "changes": {...}}
+  pitcher-props channel  {"type": "pitcher_live_stats", "date", "pitcher", "player_id", "game_pk",
+                          "changes": {...}, "live_pitches": <int, when the pitch count changed>}
+
+The live endpoints read snapshot() instead of calling the MLB API or re-reading boxscore
+files per request while the poller keeps the date fresh. Pitcher lines of finished games
+are kept (their feed is no longer polled).
+"""
+from __future__ import annotations
+import time, threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from utils.name_normalization import normalize_name
+
+GAME_FIELDS = ('status', 'status_code', 'detailed_state', 'away_score', 'home_score', 'inning',
+               'inning_state', 'is_top_inning', 'outs', 'balls', 'strikes', 'base_state',
+               'on_first', 'on_second', 'on_third', 'pitch_count_ab', 'current_batter', 'away_pitcher',
+               'home_pitcher', 'last_play', 'is_live', 'is_final', 'badge_class', 'game_time')
+PITCHER_FIELDS = ('pitches', 'outs', 'strikeouts', 'walks', 'hits_allowed', 'earned_runs', 'innings_pitched')
+_BOX_STATS = (('numberOfPitches', 'pitches'), ('outs', 'outs'), ('strikeOuts', 'strikeouts'),
+              ('baseOnBalls', 'walks'), ('hits', 'hits_allowed'), ('earnedRuns', 'earned_runs'),
+              ('inningsPitched', 'innings_pitched'))
+
+
+def pitcher_lines_from_boxscore(box: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """{normalized pitcher name: {pitches, outs, strikeouts, ..., player_id}} from an MLB boxscore
+    (the /boxscore document or a live feed's liveData.boxscore)."""
+    out: Dict[str, Dict[str, Any]] = {}
+    for side in ('away', 'home'):
+        players = (((box or {}).get('teams') or {}).get(side) or {}).get('players') or {}
+        for pdata in players.values():
+            try:
+                person = pdata.get('person') or {}
+                full = str(person.get('fullName') or '').strip()
+                if not full or ((pdata.get('position') or {}).get('abbreviation')) != 'P':
+                    continue
+                stats = (pdata.get('stats') or {}).get('pitching') or {}
+                entry: Dict[str, Any] = {}
+                for sk, dk in _BOX_STATS:
+                    val = stats.get(sk)
+                    if val is None and sk == 'numberOfPitches':
+                        val = stats.get('pitchesThrown')
+                    if val is None:
+                        continue
+                    try:
+                        entry[dk] = int(val) if dk != 'innings_pitched' else val
+                    except Exception:
+                        entry[dk] = val
+                if person.get('id') is not None:
+                    entry['player_id'] = str(person.get('id'))
+                out[normalize_name(full)] = entry
+            except Exception:
+                continue
+    return out
+
+
+class LiveGameTracker:
+    def __init__(self, fresh_sec: float = 60.0):
+        self.fresh_sec = fresh_sec
+        self._lock = threading.Lock()
+        self._dates: Dict[str, Dict[str, Any]] = {}
+        self._live = None
+        self._stats = {'updates': 0, 'game_events': 0, 'pitcher_events': 0, 'last_update': None}
+
+    def attach(self, live_data) -> 'LiveGameTracker':
+        """Subscribe to a LiveMLBData poller."""
+        self._live = live_data
+        live_data.add_poll_listener(self.update)
+        return self
+
+    def update(self, date_str: str, schedule: Dict[str, Any]):
+        games = self._live.format_schedule_games(schedule)
+        with self._lock:
+            prev = self._dates.get(date_str) or {'games': {}, 'pitchers': {}}
+        new_games: Dict[str, Dict[str, Any]] = {}
+        live_pks = []
+        for g in games:
+            pk = g.get('game_pk')
+            if not pk:
+                continue
+            pk = str(pk)
+            new_games[pk] = {
+                'away_team': g.get('away_team'),
+                'home_team': g.get('home_team'),
+                **{f: g.get(f) for f in GAME_FIELDS},
+            }
+            if g.get('is_live'):
+                live_pks.append(pk)
+        new_pitchers = dict(prev['pitchers'])
+        feeds = self._live.get_live_feeds(live_pks, timeout=0) if live_pks else {}
+        for pk, feed in feeds.items():
+            box = (feed.get('liveData') or {}).get('boxscore') or {}
+            for name, line in pitcher_lines_from_boxscore(box).items():
+                if any(line.get(f) is not None for f in PITCHER_FIELDS):
+                    new_pitchers[name] = {**line, 'game_pk': pk}
+        with self._lock:
+            self._dates[date_str] = {'games': new_games, 'pitchers': new_pitchers, 'updated': time.time()}
+            for d in [d for d, st in self._dates.items() if time.time() - st['updated'] > 6 * 3600]:
+                self._dates.pop(d, None)
+            self._stats['updates'] += 1
+            self._stats['last_update'] = datetime.now().isoformat()
+        self._publish_diffs(date_str, prev, new_games, new_pitchers)
+
+    def _publish_diffs(self, date_str: str, prev: Dict[str, Any], games: Dict[str, Any], pitchers: Dict[str, Any]):
+        from sse_hub import get_sse_hub
+        ts = datetime.utcnow().isoformat()
+        game_hub = get_sse_hub('game-status')
+        for pk, state in games.items():
+            old = prev['games'].get(pk) or {}
+            changes = {f: state.get(f) for f in GAME_FIELDS if f not in old or old.get(f) != state.get(f)}
+            if changes:
+                game_hub.publish({'type': 'game_status', 'date': date_str, 'game_pk': pk, 'ts': ts,
+                                  'away_team': state.get('away_team'), 'home_team': state.get('home_team'),
+                                  'changes': changes})
+                self._stats['game_events'] += 1
+        props_hub = get_sse_hub()
+        for name, line in pitchers.items():
+            old = prev['pitchers'].get(name) or {}
+            changes = {f: line.get(f) for f in PITCHER_FIELDS
+                       if line.get(f) is not None and old.get(f) != line.get(f)}
+            if not changes:
+                continue
+            event = {'type': 'pitcher_live_stats', 'date': date_str, 'pitcher': name, 'ts': ts,
+                     'player_id': line.get('player_id'), 'game_pk': line.get('game_pk'), 'changes': changes}
+            if 'pitches' in changes:
+                event['live_pitches'] = changes['pitches']
+            props_hub.publish(event)
+            self._stats['pitcher_events'] += 1
+
+    def snapshot(self, date_str: str) -> Optional[Dict[str, Any]]:
+        """{'games': {pk: state}, 'pitchers': {name: line}, 'updated': ts} while the date is being
+        kept fresh by the poller, else None (shared; read-only)."""
+        with self._lock:
+            state = self._dates.get(date_str)
+        if state is None or time.time() - state['updated'] > self.fresh_sec:
+            return None
+        return state
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                'dates': {d: {'games': len(s['games']), 'pitchers': len(s['pitchers']),
+                              'age_s': round(time.time() - s['updated'], 1)} for d, s in self._dates.items()},
+            }
+
+
+_TRACKER = LiveGameTracker()
+
+
+def get_live_game_tracker() -> LiveGameTracker:
+    return _TRACKER
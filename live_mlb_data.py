@@ -10,9 +10,22 @@ from typing import Dict, List, Optional
 import os
 import logging
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as _wait_futures
+
+from http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
+LIVE_STATUS_CODES = ('I', 'IH', 'IT', 'IR')
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except Exception:
+        return default
+
 def get_team_assets(team_abbreviation: str) -> Dict:
     """Get team assets (logo, colors) based on team abbreviation"""
     # MLB team logo URLs and colors
@@ -218,6 +231,9 @@ class LiveMLBData:
         # Tiny in-memory cache for per-game live feed lookups
         self._feed_cache = {}
         self._feed_cache_ttl = 3  # seconds
+        # /boxscore docs of games whose live feed is not worth fetching (scheduled / final)
+        self._box_cache = {}
+        self._box_cache_ttl = 30  # seconds
         # Tiny in-memory cache for schedule to avoid repeated slow calls
         self._schedule_cache = {}
         self._schedule_cache_ts = {}
@@ -226,13 +242,27 @@ class LiveMLBData:
         # Used to avoid flicker/missing data between feed updates within the same half-inning
         self._last_ab_cache = {}
         self._last_ab_ttl = 30  # seconds
-        # Reuse HTTP session for connection pooling (reduces TLS handshakes/latency)
-        self._session = requests.Session()
-        # Per-request throttle for feed/live fallbacks to keep latency predictable on Render
-        from threading import local as _local
-        self._tl = _local()
-        self._fallback_limit = 3  # max feed/live fallbacks per request
-        self._budget_window_sec = 2.0  # total time budget for fallbacks per request
+        # Process-wide HTTP client: keep-alive pools, retry/backoff and per-host metrics
+        self._session = get_http_client()
+        # Feeds of live games are fetched concurrently (one in-flight fetch per game) with a
+        # per-request deadline; a background poller keeps them hot for recently requested dates
+        self._tl = threading.local()
+        self._feed_stale_ttl = 30  # seconds a feed may be served while its refresh is pending
+        self._feed_deadline_sec = _env_float('LIVE_FEED_DEADLINE_SEC', 2.0)
+        self._feed_workers = int(_env_float('LIVE_FEED_WORKERS', 8))
+        self._feed_lock = threading.Lock()
+        self._feed_inflight = {}
+        self._feed_pool = None
+        self._feed_pool_pid = None
+        self._poll_interval = _env_float('LIVE_FEED_POLL_SEC', 5.0)
+        self._poll_idle_interval = 30.0  # no live games: just watch the schedule for first pitch
+        self._poll_keepalive_sec = 600  # stop polling a date nobody has requested for this long
+        self._poll_dates = {}  # date -> last requested
+        self._poll_warm = {}  # date -> last completed poll
+        self._poller = None
+        self._poller_pid = None
+        self._poll_stats = {'ticks': 0, 'feeds_fetched': 0, 'last_tick': None, 'live_games': 0}
+        self._poll_listeners = []
 
     def _get_feed_live(self, game_pk: str) -> Dict:
         """Fetch /game/{gamePk}/feed/live with a very short TTL cache.
@@ -248,20 +278,190 @@ class LiveMLBData:
                 return cached.get('data', {})
 
             url = f"{self.game_url}/{game_pk}/feed/live"
-            # Use session with modest timeout and one retry to reduce tail latency
-            try:
-                resp = self._session.get(url, timeout=3)
-            except Exception:
-                resp = self._session.get(url, timeout=3)
+            # Modest timeout and one retry to reduce tail latency; unchanged feeds come back as 304s
+            resp = self._session.get(url, timeout=3, retries=1, conditional=True)
             resp.raise_for_status()
             data = resp.json() or {}
-            # store
+            # store (and drop feeds of games nobody has asked about for a while)
             self._feed_cache[str(game_pk)] = {'_ts': now, 'data': data}
+            if len(self._feed_cache) > 32:
+                for pk, entry in list(self._feed_cache.items()):
+                    if now - entry.get('_ts', 0) > 300:
+                        self._feed_cache.pop(pk, None)
             return data
         except Exception:
             return {}
         
-    def get_todays_schedule(self, date: str = None) -> Dict:
+    def _cached_feed(self, game_pk, max_age: float = None) -> Dict:
+        cached = self._feed_cache.get(str(game_pk))
+        max_age = self._feed_stale_ttl if max_age is None else max_age
+        if cached and (time.time() - cached.get('_ts', 0)) <= max_age:
+            return cached.get('data', {})
+        return {}
+
+    def _pool_locked(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+        if self._feed_pool is None or self._feed_pool_pid != pid:
+            self._feed_pool = ThreadPoolExecutor(max_workers=max(1, self._feed_workers),
+                                                 thread_name_prefix='live-feed')
+            self._feed_pool_pid = pid
+            self._feed_inflight = {}
+        return self._feed_pool
+
+    def _get_boxscore(self, game_pk: str) -> Dict:
+        """Fetch /game/{gamePk}/boxscore with a short TTL cache. Returns {} on failure."""
+        try:
+            cached = self._box_cache.get(str(game_pk))
+            now = time.time()
+            if cached and (now - cached.get('_ts', 0)) < self._box_cache_ttl:
+                return cached.get('data', {})
+            resp = self._session.get(f"{self.game_url}/{game_pk}/boxscore", timeout=4, retries=1, conditional=True)
+            resp.raise_for_status()
+            data = resp.json() or {}
+            self._box_cache[str(game_pk)] = {'_ts': now, 'data': data}
+            if len(self._box_cache) > 64:
+                for pk, entry in list(self._box_cache.items()):
+                    if now - entry.get('_ts', 0) > 300:
+                        self._box_cache.pop(pk, None)
+            return data
+        except Exception:
+            return {}
+
+    def get_boxscores(self, game_pks, timeout: float = None) -> Dict[str, Dict]:
+        """{game_pk: /boxscore doc} fetched concurrently under one deadline (default: the per-request
+        deadline). For games that are not in progress, where the multi-MB live feed is not needed."""
+        pks = list(dict.fromkeys(str(p) for p in game_pks if p))
+        if not pks:
+            return {}
+        with self._feed_lock:
+            pool = self._pool_locked()
+        futures = {pk: pool.submit(self._get_boxscore, pk) for pk in pks}
+        _wait_futures(list(futures.values()), timeout=self._feed_deadline_sec if timeout is None else timeout)
+        return {pk: fut.result() for pk, fut in futures.items() if fut.done() and fut.result()}
+
+    def _submit_feed(self, game_pk):
+        """Future for a feed/live fetch of game_pk, joining one already in flight."""
+        key = str(game_pk)
+        with self._feed_lock:
+            fut = self._feed_inflight.get(key)
+            if fut is not None:
+                return fut
+            fut = self._pool_locked().submit(self._get_feed_live, key)
+            self._feed_inflight[key] = fut
+        fut.add_done_callback(lambda _f, _k=key: self._feed_inflight.pop(_k, None))
+        return fut
+
+    def prefetch_live_feeds(self, schedule_data: Dict, timeout: float = None) -> int:
+        """Fetch feed/live for every in-progress game in a schedule doc concurrently, waiting up to
+        timeout seconds (default: the per-request deadline). Returns the number of fetches started."""
+        pks = []
+        for date_obj in (schedule_data or {}).get('dates', []) or []:
+            for game in date_obj.get('games', []) or []:
+                code = (game.get('status') or {}).get('statusCode')
+                pk = game.get('gamePk')
+                if pk and code in LIVE_STATUS_CODES and not self._cached_feed(pk, self._feed_cache_ttl):
+                    pks.append(pk)
+        if not pks:
+            return 0
+        futures = [self._submit_feed(pk) for pk in pks]
+        timeout = self._feed_deadline_sec if timeout is None else timeout
+        if timeout > 0:
+            _wait_futures(futures, timeout=timeout)
+        return len(futures)
+
+    def get_live_feeds(self, game_pks, timeout: float = None) -> Dict[str, Dict]:
+        """{game_pk: feed/live doc} for several games: cached feeds are used as-is and the rest are
+        fetched concurrently, waiting up to timeout seconds (default: the per-request deadline)."""
+        out = {}
+        futures = []
+        for pk in dict.fromkeys(str(p) for p in game_pks if p):
+            feed = self._cached_feed(pk)
+            if feed:
+                out[pk] = feed
+            else:
+                futures.append(self._submit_feed(pk))
+        if futures:
+            _wait_futures(futures, timeout=self._feed_deadline_sec if timeout is None else timeout)
+            for pk in game_pks:
+                if str(pk) not in out:
+                    feed = self._cached_feed(pk)
+                    if feed:
+                        out[str(pk)] = feed
+        return out
+
+    # ---- background poller -------------------------------------------------
+
+    def _track_date(self, date: str):
+        """Note a requested date and make sure the poller is running (disable: LIVE_FEED_POLLER=0)."""
+        if not date or os.environ.get('LIVE_FEED_POLLER', '1') == '0':
+            return
+        self._poll_dates[date] = time.time()
+        pid = os.getpid()
+        if self._poller is not None and self._poller_pid == pid and self._poller.is_alive():
+            return
+        with self._feed_lock:
+            if self._poller is not None and self._poller_pid == pid and self._poller.is_alive():
+                return
+            self._poller = threading.Thread(target=self._poll_loop, name='live-feed-poller', daemon=True)
+            self._poller_pid = pid
+            self._poller.start()
+
+    def keep_polling(self, date: str):
+        """Keep the poller refreshing date for callers that read its state instead of the schedule."""
+        self._track_date(date)
+
+    def add_poll_listener(self, fn):
+        """fn(date, schedule_data) is called by the poller after each refresh of a date."""
+        if fn not in self._poll_listeners:
+            self._poll_listeners.append(fn)
+
+    def _polling(self, date: str) -> bool:
+        """True while the poller has refreshed date recently (its schedule and feeds are hot)."""
+        return (self._poller_pid == os.getpid()
+                and time.time() - self._poll_warm.get(date, 0) < 2 * self._poll_idle_interval)
+
+    def _poll_loop(self):
+        while True:
+            now = time.time()
+            for d, ts in list(self._poll_dates.items()):
+                if now - ts > self._poll_keepalive_sec:
+                    self._poll_dates.pop(d, None)
+                    self._poll_warm.pop(d, None)
+            if not self._poll_dates:
+                return
+            live = 0
+            for d in list(self._poll_dates):
+                try:
+                    schedule = self.get_todays_schedule(d, max_age=self._poll_interval / 2)
+                    started = self.prefetch_live_feeds(schedule, timeout=self._poll_interval)
+                    live += sum(1 for date_obj in schedule.get('dates', []) or []
+                                for game in date_obj.get('games', []) or []
+                                if (game.get('status') or {}).get('statusCode') in LIVE_STATUS_CODES)
+                    self._poll_stats['feeds_fetched'] += started
+                    self._poll_warm[d] = time.time()
+                    for fn in list(self._poll_listeners):
+                        try:
+                            fn(d, schedule)
+                        except Exception as e:
+                            logger.debug(f"live feed poll listener failed for {d}: {e}")
+                except Exception as e:
+                    logger.debug(f"live feed poll failed for {d}: {e}")
+            self._poll_stats['ticks'] += 1
+            self._poll_stats['last_tick'] = datetime.now().isoformat()
+            self._poll_stats['live_games'] = live
+            time.sleep(self._poll_interval if live else self._poll_idle_interval)
+
+    def poller_stats(self) -> Dict:
+        return {
+            **self._poll_stats,
+            'running': bool(self._poller is not None and self._poller_pid == os.getpid() and self._poller.is_alive()),
+            'dates': sorted(self._poll_dates),
+            'interval_sec': self._poll_interval,
+            'cached_feeds': len(self._feed_cache),
+            'in_flight': len(self._feed_inflight),
+        }
+
+    def get_todays_schedule(self, date: str = None, max_age: float = None) -> Dict:
         """Get today's MLB schedule with live status"""
         if not date:
             date = datetime.now().strftime('%Y-%m-%d')
@@ -270,17 +470,24 @@ class LiveMLBData:
             # Return cached value if fresh
             import time as _time
             ts = self._schedule_cache_ts.get(date, 0)
-            if (date in self._schedule_cache) and (_time.time() - ts < self._schedule_ttl):
+            if max_age is None:
+                # The poller refreshes dates it tracks; readers never wait on the network for them
+                max_age = 2 * self._poll_idle_interval if self._polling(date) else self._schedule_ttl
+            if (date in self._schedule_cache) and (_time.time() - ts < max_age):
                 return self._schedule_cache.get(date, {})
 
             # Use API call with pitcher and team data hydration (shorter timeout)
             url = f"{self.schedule_url}?sportId=1&date={date}&hydrate=probablePitcher,linescore,team,game(content(summary),tickets)"
-            response = self._session.get(url, timeout=4)
+            response = self._session.get(url, timeout=4, retries=1, conditional=True)
             response.raise_for_status()
             data = response.json() or {}
-            # Cache and return
+            # Cache and return (keeping only the most recently fetched dates)
             self._schedule_cache[date] = data
             self._schedule_cache_ts[date] = _time.time()
+            if len(self._schedule_cache_ts) > 8:
+                oldest = min(self._schedule_cache_ts, key=self._schedule_cache_ts.get)
+                self._schedule_cache.pop(oldest, None)
+                self._schedule_cache_ts.pop(oldest, None)
             return data
             
         except Exception as e:
@@ -536,20 +743,12 @@ class LiveMLBData:
                     (outs_in_half is not None and outs_in_half >= 0)
                 )
                 if is_apparently_live and (count_balls is None or count_strikes is None or current_batter is None or last_play_text is None):
-                    # Respect per-request budget for expensive feed/live fallbacks
-                    allow_fallback = False
-                    try:
-                        import time as _t
-                        self._tl.budget_deadline = getattr(self._tl, 'budget_deadline', _t.time() + self._budget_window_sec)
-                        self._tl.fallback_used = getattr(self._tl, 'fallback_used', 0)
-                        if (_t.time() < self._tl.budget_deadline) and (self._tl.fallback_used < self._fallback_limit):
-                            allow_fallback = True
-                            self._tl.fallback_used += 1
-                    except Exception:
-                        # If thread-local unavailable, allow first attempt only
-                        allow_fallback = False
+                    # Feeds were fetched concurrently by get_enhanced_games_data (or the poller);
+                    # only a direct call fetches this game's feed inline
                     game_pk = game.get('gamePk')
-                    feed = self._get_feed_live(game_pk) if allow_fallback else {}
+                    feed = self._cached_feed(game_pk)
+                    if not feed and not getattr(self._tl, 'feeds_prefetched', False):
+                        feed = self._get_feed_live(game_pk)
                     try:
                         current_play = ((feed.get('liveData') or {}).get('plays') or {}).get('currentPlay') or {}
                         # batter
@@ -772,10 +971,25 @@ class LiveMLBData:
     
     def get_enhanced_games_data(self, date: str = None) -> List[Dict]:
         """Get enhanced game data with live status"""
+        if not date:
+            date = datetime.now().strftime('%Y-%m-%d')
+        polled = self._polling(date)
+        self._track_date(date)
         schedule_data = self.get_todays_schedule(date)
+        # All live feeds in parallel under one deadline; while the poller keeps this date hot,
+        # only games it has not fetched yet are started and nothing is waited on
+        try:
+            self.prefetch_live_feeds(schedule_data, timeout=0 if polled else None)
+        except Exception as e:
+            logger.debug(f"live feed prefetch failed for {date}: {e}")
         
+        return self.format_schedule_games(schedule_data)
+
+    def format_schedule_games(self, schedule_data: Dict) -> List[Dict]:
+        """format_game_status() for every game of a schedule doc, using cached feeds only."""
         enhanced_games = []
         
+        self._tl.feeds_prefetched = True
         try:
             dates = schedule_data.get('dates', [])
             for date_obj in dates:
@@ -786,12 +1000,18 @@ class LiveMLBData:
                     
         except Exception as e:
             print(f"❌ Error processing games data: {e}")
+        finally:
+            self._tl.feeds_prefetched = False
             
         return enhanced_games
 
 # Global instance
 live_mlb_data = LiveMLBData()
 
+def get_live_mlb_data() -> LiveMLBData:
+    """Process-wide LiveMLBData, so its schedule/feed TTL caches are shared by every caller"""
+    return live_mlb_data
+
 def get_live_game_status(away_team: str, home_team: str, date: str = None) -> Dict:
     """Get live status for specific team matchup"""
     enhanced_games = live_mlb_data.get_enhanced_games_data(date)
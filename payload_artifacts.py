@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Precomputed, pre-compressed JSON payload artifacts served straight from disk.
+
+An artifact is one encoded API payload per date plus its compressed variants and a small
+meta document:
+
+  data/artifacts/<kind>/<YYYY-MM-DD>.json        identity body (compact JSON)
+  data/artifacts/<kind>/<YYYY-MM-DD>.json.gz     gzip variant
+  data/artifacts/<kind>/<YYYY-MM-DD>.json.br     brotli variant (when the brotli package is installed)
+  data/artifacts/<kind>/<YYYY-MM-DD>.meta.json   {etag, built_at, bytes, encodings, sources, ...}
+
+The meta records the (mtime_ns, size) of every source file the payload was built from;
+load() returns None as soon as any of them changes (or appears/disappears), so a stale
+artifact is never served. The ETag is a hash of the identity body.
+"""
+from __future__ import annotations
+import os, json, gzip, hashlib, threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from json_doc_cache import load_json_doc
+
+try:
+    import orjson as _orjson  # type: ignore
+except Exception:
+    _orjson = None
+
+try:
+    import brotli as _brotli  # type: ignore
+except Exception:
+    _brotli = None
+
+BASE_DIR = os.path.join('data', 'artifacts')
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact JSON bytes (orjson when available)."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(payload, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. numpy scalars: the stdlib encoder handles float/int subclasses
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+AVAILABLE_ENCODINGS = ('br', 'gzip') if _brotli is not None else ('gzip',)
+
+
+def compress_body(body: bytes, encoding: str, level: int = None) -> Optional[bytes]:
+    """body encoded as 'gzip' or 'br' (None when the encoding is unavailable)."""
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6 if level is None else level, mtime=0)
+    if encoding == 'br' and _brotli is not None:
+        try:
+            return _brotli.compress(body, quality=5 if level is None else level)
+        except Exception:
+            return None
+    return None
+
+
+def compress_variants(body: bytes, gzip_level: int = 6, br_quality: int = 5) -> Dict[str, bytes]:
+    """{'gzip': ..., 'br': ...} encodings of body (br only when brotli is installed)."""
+    out = {'gzip': compress_body(body, 'gzip', gzip_level)}
+    br = compress_body(body, 'br', br_quality)
+    if br is not None:
+        out['br'] = br
+    return out
+
+
+def choose_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> Optional[str]:
+    """Best of br/gzip that the client accepts (ignores q-values other than q=0)."""
+    accepted = set()
+    for part in (accept_encoding or '').lower().split(','):
+        token, _, params = part.strip().partition(';')
+        if token and params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            accepted.add(token)
+    for enc in ('br', 'gzip'):
+        if enc in available and enc in accepted:
+            return enc
+    return None
+
+
+def _file_sig(path: str):
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def source_signatures(paths: Iterable[str]) -> Dict[str, Any]:
+    """Signatures to pass to write(); take them before building the payload."""
+    return {p: _file_sig(p) for p in paths}
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class PayloadArtifactStore:
+    def __init__(self, kind: str, base_dir: str = BASE_DIR):
+        self.kind = kind
+        self.dir = os.path.join(base_dir, kind)
+        self._lock = threading.Lock()
+        self._stats = {'writes': 0, 'valid': 0, 'stale': 0, 'missing': 0}
+
+    def path_for(self, date_str: str, encoding: Optional[str] = None) -> str:
+        return os.path.join(self.dir, f'{date_str}.json' + ENCODING_SUFFIXES.get(encoding, ''))
+
+    def meta_path(self, date_str: str) -> str:
+        return os.path.join(self.dir, f'{date_str}.meta.json')
+
+    def write(self, date_str: str, payload: Any, sources, extra_meta: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Encode payload, write all variants then the meta (last, so readers never see a partial artifact).
+        sources: source_signatures() taken before the payload was built, or paths to sign now."""
+        source_sigs = sources if isinstance(sources, dict) else source_signatures(sources)
+        body = dumps(payload)
+        variants = compress_variants(body, gzip_level=9, br_quality=11)
+        os.makedirs(self.dir, exist_ok=True)
+        _write_atomic(self.path_for(date_str), body)
+        for enc, data in variants.items():
+            _write_atomic(self.path_for(date_str, enc), data)
+        meta = {
+            'kind': self.kind,
+            'date': date_str,
+            'etag': make_etag(body),
+            'built_at': datetime.now().isoformat(),
+            'bytes': len(body),
+            'encodings': {enc: len(data) for enc, data in variants.items()},
+            'sources': source_sigs,
+            **(extra_meta or {}),
+        }
+        _write_atomic(self.meta_path(date_str), json.dumps(meta, indent=1).encode('utf-8'))
+        with self._lock:
+            self._stats['writes'] += 1
+        return meta
+
+    def load(self, date_str: str) -> Optional[Dict[str, Any]]:
+        """Meta of a servable artifact for date, or None when missing or built from changed sources."""
+        meta = load_json_doc(self.meta_path(date_str))
+        if not isinstance(meta, dict) or not meta.get('etag'):
+            with self._lock:
+                self._stats['missing'] += 1
+            return None
+        for path, sig in (meta.get('sources') or {}).items():
+            if _file_sig(path) != sig:
+                with self._lock:
+                    self._stats['stale'] += 1
+                return None
+        with self._lock:
+            self._stats['valid'] += 1
+        return meta
+
+    def read_doc(self, date_str: str) -> Any:
+        """Parsed identity body (shared; read-only)."""
+        return load_json_doc(self.path_for(date_str))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'dir': self.dir, 'brotli': _brotli is not None}
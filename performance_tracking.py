@@ -1,137 +1,426 @@
 """
 Performance Timing Decorator and Utilities
 Adds timing metrics to key MLB betting functions for monitoring
+
+Timings are kept in an in-memory registry of log-bucketed (HDR-style) latency histograms
+keyed by kind and name:
+
+  endpoint   whole requests, by route ('/api/today-games')
+  stage      Server-Timing stages of an endpoint ('/api/today-games lines')
+  op         track_timing / time_operation blocks
+
+Recording takes no lock: every thread records into its own histograms and readers merge
+them, so a timed call costs a dict lookup and a few integer adds. The histograms of threads
+that have exited (short-lived threads, gevent greenlets) are folded into one retired set,
+so the per-thread state stays bounded by the number of live threads. Buckets have 16 linear
+sub-buckets per power of two of microseconds, so p50/p95/p99 are within ~6%.
+
+A daemon thread writes a compact snapshot to performance_metrics.json every PERF_FLUSH_SEC
+seconds (default 60, 0 disables) when something was recorded; each process (gunicorn
+worker) owns the section keyed by its pid, and the read-merge-write holds an flock on
+performance_metrics.json.lock so workers do not overwrite each other's sections.
+
+Inside a request (begin_request()/end_request(), called by the app's request hooks)
+time_operation blocks are also collected as stages for the response's Server-Timing header.
 """
 
+import os
+import re
 import time
 import logging
+import threading
 import functools
+import weakref
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, List, Optional, Tuple
 import json
-import os
+
+try:
+    import fcntl
+except ImportError:  # Windows: flushes are not serialized across processes
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+METRICS_FILE = 'performance_metrics.json'
+_SUB_BITS = 4
+_SUB = 1 << _SUB_BITS
+_MAX_SERIES = 2000  # per thread; bounds memory if names are unexpectedly unbounded
+_STALE_PROCESS_SEC = 6 * 3600
+_PRUNE_EVERY = 64  # new thread shards between sweeps for exited threads
+_TOKEN_RE = re.compile(r'[^A-Za-z0-9_.\-]+')
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except Exception:
+        return default
+
+
+def _bucket(us: int) -> int:
+    if us < 2 * _SUB:
+        return us
+    shift = us.bit_length() - _SUB_BITS - 1
+    return shift * _SUB + (us >> shift)
+
+
+def _bucket_value(idx: int) -> float:
+    """Midpoint (microseconds) of a bucket"""
+    if idx < 2 * _SUB:
+        return float(idx)
+    shift = idx // _SUB - 1
+    return float(((idx - shift * _SUB) << shift) + (1 << shift) / 2.0)
+
+
+class LatencyHistogram:
+    __slots__ = ('count', 'errors', 'sum_us', 'min_us', 'max_us', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.sum_us = 0
+        self.min_us = None
+        self.max_us = 0
+        self.buckets: Dict[int, int] = {}
+
+    def record(self, us: int, error: bool = False):
+        if us < 0:
+            us = 0
+        idx = _bucket(us)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+        self.count += 1
+        self.sum_us += us
+        if us > self.max_us:
+            self.max_us = us
+        if self.min_us is None or us < self.min_us:
+            self.min_us = us
+        if error:
+            self.errors += 1
+
+    def merge(self, other: 'LatencyHistogram'):
+        # dict.copy() is atomic, so merging a histogram another thread is writing is safe
+        for idx, n in other.buckets.copy().items():
+            self.buckets[idx] = self.buckets.get(idx, 0) + n
+        self.count += other.count
+        self.errors += other.errors
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-quantile in ms (0 < q <= 1)"""
+        total = sum(self.buckets.values())
+        if not total:
+            return None
+        rank = max(1, int(q * total + 0.5))
+        seen = 0
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if seen >= rank:
+                return min(_bucket_value(idx), float(self.max_us)) / 1000.0
+        return self.max_us / 1000.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        r = lambda v: round(v, 2) if v is not None else None
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'avg_ms': r(self.sum_us / self.count / 1000.0) if self.count else None,
+            'p50_ms': r(self.percentile(0.50)),
+            'p95_ms': r(self.percentile(0.95)),
+            'p99_ms': r(self.percentile(0.99)),
+            'min_ms': r(self.min_us / 1000.0) if self.min_us is not None else None,
+            'max_ms': r(self.max_us / 1000.0),
+            'total_ms': r(self.sum_us / 1000.0),
+        }
+
+
+class TimingRegistry:
+    def __init__(self, path: str = METRICS_FILE, flush_sec: float = None):
+        self.path = path
+        self.flush_sec = _env_float('PERF_FLUSH_SEC', 60.0) if flush_sec is None else flush_sec
+        self._lock = threading.Lock()
+        self._reset_state()
+
+    def _reset_state(self):
+        self._local = threading.local()
+        # (weakref to the owning thread, its histograms); exited threads are folded into _retired
+        self._shards: List[Tuple[Any, Dict[Tuple[str, str], LatencyHistogram]]] = []
+        self._retired: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._new_shards = 0
+        self._dirty = False
+        self._flusher: Optional[threading.Thread] = None
+        self._started_at = datetime.now().isoformat()
+        self._last_flush = None
+
+    def after_fork(self):
+        """Forget the parent's timings and flusher thread (gunicorn --preload workers)"""
+        self._lock = threading.Lock()
+        self._reset_state()
+
+    def _shard(self) -> Dict[Tuple[str, str], LatencyHistogram]:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+                self._new_shards += 1
+                if self._new_shards % _PRUNE_EVERY == 0:
+                    self._prune_locked()
+                if self._flusher is None and self.flush_sec > 0:
+                    self._flusher = threading.Thread(target=self._flush_loop, name='perf-flush', daemon=True)
+                    self._flusher.start()
+        return shard
+
+    # ---- recording ---------------------------------------------------------
+
+    def record(self, name: str, ms: float, kind: str = 'op', error: bool = False):
+        shard = self._shard()
+        key = (kind, name)
+        hist = shard.get(key)
+        if hist is None:
+            if len(shard) >= _MAX_SERIES:
+                return
+            hist = shard[key] = LatencyHistogram()
+        hist.record(int(ms * 1000), error)
+        self._dirty = True
+
+    def begin_request(self):
+        """Start collecting time_operation stages for the current request (this thread)"""
+        self._local.stages = []
+
+    def add_stage(self, name: str, ms: float):
+        stages = getattr(self._local, 'stages', None)
+        if stages is not None:
+            stages.append((name, ms))
+
+    def end_request(self) -> List[Tuple[str, float]]:
+        stages = getattr(self._local, 'stages', None) or []
+        self._local.stages = None
+        return stages
+
+    # ---- reading -----------------------------------------------------------
+
+    def _prune_locked(self):
+        """Fold the shards of exited threads into the retired histograms (caller holds _lock)"""
+        live = []
+        for ref, shard in self._shards:
+            thread = ref()
+            if thread is not None and thread.is_alive():
+                live.append((ref, shard))
+                continue
+            for key, hist in shard.items():
+                acc = self._retired.get(key)
+                if acc is None:
+                    acc = self._retired[key] = LatencyHistogram()
+                acc.merge(hist)
+        self._shards = live
+
+    def merged(self) -> Dict[Tuple[str, str], LatencyHistogram]:
+        out: Dict[Tuple[str, str], LatencyHistogram] = {}
+        with self._lock:
+            self._prune_locked()
+            shards = [shard for _, shard in self._shards]
+            for key, hist in self._retired.items():
+                acc = out[key] = LatencyHistogram()
+                acc.merge(hist)
+        for shard in shards:
+            for key, hist in shard.copy().items():
+                acc = out.get(key)
+                if acc is None:
+                    acc = out[key] = LatencyHistogram()
+                acc.merge(hist)
+        return out
+
+    def snapshot(self, kind: str = None, prefix: str = None) -> Dict[str, Dict[str, Any]]:
+        """{kind: {name: {count, errors, avg_ms, p50_ms, p95_ms, p99_ms, min_ms, max_ms, total_ms}}}"""
+        out: Dict[str, Dict[str, Any]] = {}
+        for (k, name), hist in sorted(self.merged().items()):
+            if (kind and k != kind) or (prefix and not name.startswith(prefix)):
+                continue
+            out.setdefault(k, {})[name] = hist.as_dict()
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        series = len(self.merged())
+        with self._lock:
+            threads = len(self._shards)
+        return {
+            'pid': os.getpid(),
+            'threads': threads,
+            'series': series,
+            'started_at': self._started_at,
+            'last_flush': self._last_flush,
+            'flush_sec': self.flush_sec,
+            'path': self.path,
+        }
+
+    def reset(self):
+        with self._lock:
+            shards = [shard for _, shard in self._shards]
+            self._retired = {}
+        for shard in shards:
+            for hist in shard.copy().values():
+                hist.__init__()
+
+    # ---- flushing ----------------------------------------------------------
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_sec)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.debug(f"Performance metrics flush failed: {e}")
+
+    def flush(self, force: bool = False):
+        """Write this process's snapshot into the metrics file (compact, atomic)"""
+        if not (self._dirty or force):
+            return
+        self._dirty = False
+        metrics = self.snapshot()
+        try:
+            with open(self.path + '.lock', 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._write_section(metrics)  # the lock is released when the file closes
+        except Exception as e:
+            logger.error(f"Error saving performance metrics: {e}")
+
+    def _write_section(self, metrics: Dict[str, Any]):
+        now = time.time()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+            processes = doc.get('processes') if isinstance(doc, dict) else None
+        except Exception:
+            processes = None
+        if not isinstance(processes, dict):
+            processes = {}
+        processes = {pid: p for pid, p in processes.items()
+                     if isinstance(p, dict) and now - (p.get('ts') or 0) < _STALE_PROCESS_SEC}
+        processes[str(os.getpid())] = {'ts': now, 'started_at': self._started_at, 'metrics': metrics}
+        self._last_flush = datetime.now().isoformat()
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'updated_at': self._last_flush, 'processes': processes}, f, separators=(',', ':'))
+        os.replace(tmp, self.path)
+
+
+_REGISTRY = TimingRegistry()
+try:
+    os.register_at_fork(after_in_child=_REGISTRY.after_fork)
+except AttributeError:  # platforms without fork
+    pass
+
+
+def get_timing_registry() -> TimingRegistry:
+    return _REGISTRY
+
+
+def server_timing_name(name: str) -> str:
+    """A Server-Timing metric name (token characters only)"""
+    return _TOKEN_RE.sub('_', str(name)).strip('_') or 'op'
+
+
+def parse_server_timing(header: str) -> List[Tuple[str, float]]:
+    """[(name, dur_ms)] from a Server-Timing header value (metrics without dur are skipped)"""
+    out = []
+    for part in (header or '').split(','):
+        fields = [f.strip() for f in part.split(';')]
+        if not fields or not fields[0]:
+            continue
+        for f in fields[1:]:
+            if f.startswith('dur='):
+                try:
+                    out.append((fields[0], float(f[4:])))
+                except ValueError:
+                    pass
+                break
+    return out
+
+
 class PerformanceTracker:
     """Track performance metrics for key functions"""
-    
-    def __init__(self):
-        self.metrics = {}
-        self.metrics_file = 'performance_metrics.json'
-    
+
+    def __init__(self, registry: TimingRegistry = None):
+        self.registry = registry or _REGISTRY
+        self.recent_errors = deque(maxlen=50)
+
+    @property
+    def metrics_file(self) -> str:
+        return self.registry.path
+
     def track_timing(self, function_name: str = None):
         """Decorator to track function execution time"""
         def decorator(func: Callable) -> Callable:
+            func_name = function_name or f"{func.__module__}.{func.__name__}"
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
-                func_name = function_name or f"{func.__module__}.{func.__name__}"
-                
+                start_time = time.perf_counter()
                 try:
                     result = func(*args, **kwargs)
-                    execution_time = time.time() - start_time
-                    self._record_metric(func_name, execution_time, True)
-                    
-                    # Log slow functions
-                    if execution_time > 5.0:
-                        logger.warning(f"⚠️ Slow function detected: {func_name} took {execution_time:.2f}s")
-                    elif execution_time > 2.0:
-                        logger.info(f"📊 Function timing: {func_name} took {execution_time:.2f}s")
-                    
-                    return result
-                    
                 except Exception as e:
-                    execution_time = time.time() - start_time
-                    self._record_metric(func_name, execution_time, False, str(e))
+                    self._record_metric(func_name, time.perf_counter() - start_time, False, str(e))
                     raise
-                    
+                self._record_metric(func_name, time.perf_counter() - start_time, True)
+                return result
+
             return wrapper
         return decorator
-    
+
     def _record_metric(self, function_name: str, execution_time: float, success: bool, error: str = None):
-        """Record performance metric"""
-        metric = {
-            'timestamp': datetime.now().isoformat(),
-            'function': function_name,
-            'execution_time': round(execution_time, 3),
-            'success': success,
-            'error': error
-        }
-        
-        # Add to in-memory metrics
-        if function_name not in self.metrics:
-            self.metrics[function_name] = []
-        
-        self.metrics[function_name].append(metric)
-        
-        # Keep only last 100 metrics per function
-        if len(self.metrics[function_name]) > 100:
-            self.metrics[function_name] = self.metrics[function_name][-100:]
-        
-        # Save to file periodically
-        self._save_metrics()
-    
-    def _save_metrics(self):
-        """Save metrics to file"""
-        try:
-            with open(self.metrics_file, 'w') as f:
-                json.dump(self.metrics, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving performance metrics: {e}")
-    
+        """Record performance metric (execution_time in seconds)"""
+        self.registry.record(function_name, execution_time * 1000.0, 'op', error=not success)
+        if not success:
+            self.recent_errors.append({'timestamp': datetime.now().isoformat(), 'function': function_name,
+                                       'execution_time': round(execution_time, 3), 'error': error})
+        # Log slow functions
+        if execution_time > 5.0:
+            logger.warning(f"⚠️ Slow function detected: {function_name} took {execution_time:.2f}s")
+        elif execution_time > 2.0:
+            logger.info(f"📊 Function timing: {function_name} took {execution_time:.2f}s")
+
     def get_summary(self, function_name: str = None) -> Dict[str, Any]:
         """Get performance summary for a function or all functions"""
-        if function_name:
-            metrics = self.metrics.get(function_name, [])
-        else:
-            metrics = []
-            for func_metrics in self.metrics.values():
-                metrics.extend(func_metrics)
-        
-        if not metrics:
+        acc = LatencyHistogram()
+        for (kind, name), hist in self.registry.merged().items():
+            if kind == 'op' and (function_name is None or name == function_name):
+                acc.merge(hist)
+        if not acc.count:
             return {'error': 'No metrics found'}
-        
-        # Calculate statistics
-        execution_times = [m['execution_time'] for m in metrics if m['success']]
-        success_count = sum(1 for m in metrics if m['success'])
-        total_count = len(metrics)
-        
-        if execution_times:
-            avg_time = sum(execution_times) / len(execution_times)
-            min_time = min(execution_times)
-            max_time = max(execution_times)
-        else:
-            avg_time = min_time = max_time = 0
-        
+        stats = acc.as_dict()
+        sec = lambda ms: round(ms / 1000.0, 3) if ms is not None else None
+        ok = acc.count - acc.errors
         return {
             'function': function_name or 'ALL',
-            'total_calls': total_count,
-            'successful_calls': success_count,
-            'success_rate': round((success_count / total_count) * 100, 1) if total_count > 0 else 0,
-            'average_time': round(avg_time, 3),
-            'min_time': round(min_time, 3),
-            'max_time': round(max_time, 3),
-            'recent_metrics': metrics[-10:] if metrics else []
+            'total_calls': acc.count,
+            'successful_calls': ok,
+            'success_rate': round(ok / acc.count * 100, 1),
+            'average_time': sec(stats['avg_ms']),
+            'p50_time': sec(stats['p50_ms']),
+            'p95_time': sec(stats['p95_ms']),
+            'p99_time': sec(stats['p99_ms']),
+            'min_time': sec(stats['min_ms']),
+            'max_time': sec(stats['max_ms']),
+            'recent_errors': [e for e in self.recent_errors if function_name is None or e['function'] == function_name][-10:],
         }
-    
+
     def get_slow_functions(self, threshold: float = 2.0) -> Dict[str, Any]:
-        """Get functions that are consistently slow"""
+        """Get functions that are consistently slow (average over threshold seconds, 5+ calls)"""
         slow_functions = {}
-        
-        for func_name, metrics in self.metrics.items():
-            recent_metrics = [m for m in metrics[-20:] if m['success']]  # Last 20 successful calls
-            
-            if len(recent_metrics) >= 5:  # Need at least 5 samples
-                avg_time = sum(m['execution_time'] for m in recent_metrics) / len(recent_metrics)
-                
-                if avg_time > threshold:
-                    slow_functions[func_name] = {
-                        'average_time': round(avg_time, 3),
-                        'sample_count': len(recent_metrics),
-                        'slowest_call': max(m['execution_time'] for m in recent_metrics)
-                    }
-        
+        for name, stats in self.registry.snapshot('op').get('op', {}).items():
+            if stats['count'] >= 5 and stats['avg_ms'] / 1000.0 > threshold:
+                slow_functions[name] = {
+                    'average_time': round(stats['avg_ms'] / 1000.0, 3),
+                    'p95_time': round(stats['p95_ms'] / 1000.0, 3),
+                    'sample_count': stats['count'],
+                    'slowest_call': round(stats['max_ms'] / 1000.0, 3),
+                }
         return slow_functions
 
 # Global performance tracker instance
@@ -152,26 +441,143 @@ def get_slow_functions(threshold: float = 2.0):
 
 # Context manager for manual timing
 class TimingContext:
-    """Context manager for timing code blocks"""
-    
+    """Context manager for timing code blocks (also a Server-Timing stage inside a request)"""
+
     def __init__(self, operation_name: str):
         self.operation_name = operation_name
         self.start_time = None
-    
+        self.elapsed = None
+
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        execution_time = time.time() - self.start_time
-        
-        if exc_type is None:
-            performance_tracker._record_metric(self.operation_name, execution_time, True)
-        else:
-            performance_tracker._record_metric(self.operation_name, execution_time, False, str(exc_val))
-        
-        logger.info(f"⏱️ {self.operation_name}: {execution_time:.3f}s")
+        self.elapsed = time.perf_counter() - self.start_time
+        performance_tracker._record_metric(self.operation_name, self.elapsed, exc_type is None,
+                                           str(exc_val) if exc_type is not None else None)
+        performance_tracker.registry.add_stage(self.operation_name, self.elapsed * 1000.0)
+        logger.debug(f"⏱️ {self.operation_name}: {self.elapsed:.3f}s")
 
 def time_operation(operation_name: str):
     """Create a timing context manager"""
     return TimingContext(operation_name)
+
+class StageTimer:
+    """Stage breakdown of one request.
+
+    mark(name) closes the stage that ran since the previous mark (or since creation).
+    Inside a per-item loop (e.g. per game), item_start() begins an item and item_mark(name,
+    key) closes one of its stages; item stages keep the total, max (and the key of the
+    slowest item) and count across items. header() renders both as a Server-Timing value.
+    """
+
+    def __init__(self):
+        self.t0 = self._last = self._item_last = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.items: Dict[str, Dict[str, Any]] = {}
+
+    def mark(self, name: str) -> float:
+        now = time.perf_counter()
+        ms = (now - self._last) * 1000.0
+        self._last = now
+        self.stages[name] = self.stages.get(name, 0.0) + ms
+        return ms
+
+    def skip(self):
+        """Exclude the time since the previous mark from every stage"""
+        self._last = time.perf_counter()
+
+    def item_start(self):
+        self._item_last = time.perf_counter()
+
+    def item_mark(self, name: str, key: Any = None) -> float:
+        now = time.perf_counter()
+        ms = (now - self._item_last) * 1000.0
+        self._item_last = now
+        it = self.items.get(name)
+        if it is None:
+            it = self.items[name] = {'total_ms': 0.0, 'max_ms': 0.0, 'max_key': None, 'count': 0}
+        it['total_ms'] += ms
+        it['count'] += 1
+        if ms >= it['max_ms']:
+            it['max_ms'], it['max_key'] = ms, key
+        return ms
+
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000.0
+
+    def header(self, prefix: str = '') -> str:
+        """Server-Timing value: whole-request stages, then item stages as '<prefix><name>' with
+        the total as dur and the per-item max in desc, then total"""
+        parts = [f"{server_timing_name(n)};dur={ms:.1f}" for n, ms in self.stages.items()]
+        parts += [f"{server_timing_name(prefix + n)};dur={it['total_ms']:.1f};desc=\"max {it['max_ms']:.1f}ms n={it['count']}\""
+                  for n, it in self.items.items()]
+        parts.append(f"total;dur={self.total_ms():.1f}")
+        return ', '.join(parts)
+
+    def as_dict(self) -> Dict[str, Any]:
+        r = lambda v: round(v, 2)
+        return {
+            'total_ms': r(self.total_ms()),
+            'stages': {n: r(ms) for n, ms in self.stages.items()},
+            'items': {n: {'total_ms': r(it['total_ms']), 'max_ms': r(it['max_ms']), 'max_key': it['max_key'],
+                          'count': it['count']} for n, it in self.items.items()},
+        }
+
+
+# -------------------------------------------------------------
+# Per-request sampling profiler (?profile=1 for admins, see app.py)
+# -------------------------------------------------------------
+_PROFILE_LOCK = threading.Lock()
+
+class RequestProfiler:
+    """cProfile (or pyinstrument, when installed and asked for) around one request.
+
+    Only one request per process is profiled at a time; start() returns False when another
+    profile is running (the request is then served normally).
+    """
+
+    def __init__(self, engine: str = 'cprofile', limit: int = 40):
+        self.engine = engine
+        self.limit = limit
+        self._profiler = None
+
+    def start(self) -> bool:
+        if not _PROFILE_LOCK.acquire(blocking=False):
+            return False
+        try:
+            if self.engine == 'pyinstrument':
+                try:
+                    from pyinstrument import Profiler
+                    self._profiler = Profiler()
+                except ImportError:
+                    self.engine = 'cprofile'
+            if self._profiler is None:
+                import cProfile
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            else:
+                self._profiler.start()
+            return True
+        except Exception:
+            self._profiler = None
+            _PROFILE_LOCK.release()
+            return False
+
+    def stop(self) -> str:
+        """Stop profiling and return the text report"""
+        prof, self._profiler = self._profiler, None
+        if prof is None:
+            return ''
+        try:
+            if self.engine == 'pyinstrument':
+                prof.stop()
+                return prof.output_text()
+            prof.disable()
+            import io, pstats
+            out = io.StringIO()
+            pstats.Stats(prof, stream=out).sort_stats('cumulative').print_stats(self.limit)
+            return out.getvalue()
+        finally:
+            _PROFILE_LOCK.release()
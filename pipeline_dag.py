@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Dependency-DAG runner for the daily automation pipeline.
+
+A pipeline is a list of Steps. Each step names the steps it must wait for (deps) and the
+files it reads (inputs) and writes (outputs); inputs/outputs may be glob patterns. The
+runner starts every step whose deps have finished on a thread pool (env PIPELINE_WORKERS,
+default 4), so independent branches (weather, team strengths, pitcher props, betting
+lines, ...) overlap. A step's target is a plain callable returning truthy on success: the
+automation wraps scripts either as an in-process main() call or as a subprocess.
+
+Deps only order steps; a failed dep does not stop its dependants (the pipeline has always
+been best effort and downstream steps fall back to cached files). An in-process step that
+exceeds its timeout is reported as timed out, but a thread cannot be killed: its dependants
+are only released once its thread has exited, so steps that write the same files never overlap.
+
+Skipping: every successful run is recorded in the content-addressed build manifest
+(build_manifest.py, data/build_manifest.json) with the content hashes of its inputs and
+outputs and the version of its producer (a hash of the step's code files). A step that
+declares inputs is skipped when its producer and all input contents are unchanged and its
+outputs are intact, so an intraday re-run only recomputes what a changed upstream file
+(a starter change, a line move) actually affects. Steps without declared inputs (network
+fetches) always run, but their outputs are hashed without volatile timestamps, so an
+identical re-fetch does not invalidate anything downstream. Env PIPELINE_FORCE=1 disables
+skipping; record_state=False runs without recording (e.g. when steps are no-ops on a
+no-games day).
+
+run() returns the per-step results; report() adds the wall time and the critical path
+(the dependency chain that determined the wall time). The last report is written to
+data/pipeline_report.json.
+"""
+from __future__ import annotations
+import os, json, time, threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from build_manifest import BuildManifest, get_build_manifest, producer_version
+
+REPORT_PATH = os.path.join('data', 'pipeline_report.json')
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except Exception:
+        return default
+
+
+@dataclass
+class Step:
+    name: str
+    target: Callable[[], Any]
+    deps: Sequence[str] = ()
+    inputs: Sequence[str] = ()
+    outputs: Sequence[str] = ()
+    producer: Sequence[str] = ()  # code files whose content versions the outputs
+    version: str = ''  # explicit producer version, bumped when behaviour changes without a code change
+    description: str = ''
+    in_process: bool = False
+    timeout: Optional[float] = None  # enforced by the runner for in-process steps only
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str = 'pending'  # ok | failed | timeout | skipped | error
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+    in_process: bool = False
+    deps: List[str] = field(default_factory=list)
+    input_hashes: Dict[str, Any] = field(default_factory=dict)
+    outputs_changed: Optional[int] = None  # outputs whose content differs from the previous build
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ('ok', 'skipped')
+
+    @property
+    def seconds(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+class PipelineRunner:
+    def __init__(self, steps: Sequence[Step], logger=None, max_workers: int = None,
+                 manifest: BuildManifest = None, report_path: str = REPORT_PATH, force: bool = None,
+                 record_state: bool = True):
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"duplicate pipeline step: {step.name}")
+            self.steps[step.name] = step
+        for step in steps:
+            for dep in step.deps:
+                if dep not in self.steps:
+                    raise ValueError(f"step {step.name} depends on unknown step {dep}")
+        self._order = self._topological_order()
+        self.logger = logger
+        self.max_workers = max_workers or _env_int('PIPELINE_WORKERS', 4)
+        self.manifest = manifest or get_build_manifest()
+        self.report_path = report_path
+        self.force = (os.environ.get('PIPELINE_FORCE', '').lower() in ('1', 'true', 'yes')) if force is None else force
+        self.record_state = record_state
+        self._lock = threading.Lock()
+        self.results: Dict[str, StepResult] = {}
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def _topological_order(self) -> List[str]:
+        order, state = [], {}
+
+        def visit(name, chain):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"pipeline dependency cycle: {' -> '.join(chain + [name])}")
+            state[name] = 'visiting'
+            for dep in self.steps[name].deps:
+                visit(dep, chain + [name])
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.steps:
+            visit(name, [])
+        return order
+
+    def _log(self, level: str, msg: str):
+        if self.logger is not None:
+            getattr(self.logger, level)(msg)
+
+    # ---- skip state --------------------------------------------------------
+
+    def _producer(self, step: Step) -> str:
+        return producer_version(step.producer, step.version) if (step.producer or step.version) else ''
+
+    def _unchanged(self, step: Step) -> bool:
+        if self.force or not step.inputs:
+            return False
+        return self.manifest.is_current(step.name, step.inputs, step.outputs, self._producer(step))
+
+    # ---- execution ---------------------------------------------------------
+
+    def _execute(self, step: Step) -> str:
+        res = self.results[step.name]
+        res.started = time.time()
+        try:
+            ok = step.target()
+            status = 'ok' if (ok is None or bool(ok)) else 'failed'
+        except Exception as e:
+            res.error = str(e)
+            status = 'error'
+        with self._lock:
+            if res.status == 'running':  # not already marked timed out
+                res.status = status
+                res.finished = time.time()
+        return status
+
+    def run(self) -> Dict[str, StepResult]:
+        self.started = time.time()
+        self.results = {n: StepResult(n, in_process=s.in_process, deps=list(s.deps)) for n, s in self.steps.items()}
+        pending = list(self._order)
+        running: Dict[Any, str] = {}
+        overrun = set()  # timed out but still running; dependants wait for the thread to exit
+        done = set()
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='pipeline')
+        try:
+            while pending or running:
+                for name in list(pending):
+                    step = self.steps[name]
+                    if not all(d in done for d in step.deps):
+                        continue
+                    pending.remove(name)
+                    res = self.results[name]
+                    if self._unchanged(step):
+                        res.status = 'skipped'
+                        res.started = res.finished = time.time()
+                        done.add(name)
+                        self._log('info', f"⏭️ {step.description or name}: inputs unchanged since last successful run - skipping")
+                        continue
+                    res.status = 'running'
+                    # Inputs are hashed before the step runs so a change made while it runs is picked up next time
+                    res.input_hashes = self.manifest.hash_files(step.inputs)
+                    running[pool.submit(self._execute, step)] = name
+                if not running:
+                    continue
+                finished, _ = wait(list(running), timeout=1.0, return_when=FIRST_COMPLETED)
+                now = time.time()
+                for fut, name in list(running.items()):
+                    step, res = self.steps[name], self.results[name]
+                    if fut in finished:
+                        running.pop(fut)
+                        done.add(name)
+                        if name in overrun:
+                            self._log('warning', f"⏰ {name}: exited {now - res.started:.1f}s after starting "
+                                                 f"(timed out); releasing its dependants")
+                            continue
+                        if res.status == 'ok' and self.record_state and step.outputs:
+                            res.outputs_changed = sum(self.manifest.changed_outputs(name, step.outputs).values())
+                            self.manifest.record(name, res.input_hashes, step.outputs, self._producer(step),
+                                                 seconds=round(res.seconds, 3))
+                        unchanged = ' (outputs unchanged)' if res.outputs_changed == 0 else ''
+                        self._log('info' if res.ok else 'warning',
+                                  f"⏱️ {name}: {res.status} in {res.seconds:.1f}s{unchanged}")
+                    elif (step.in_process and step.timeout and name not in overrun and res.started is not None
+                          and now - res.started > step.timeout):
+                        # A thread cannot be killed: report the timeout, but hold its dependants until it exits
+                        with self._lock:
+                            res.status = 'timeout'
+                            res.finished = now
+                        overrun.add(name)
+                        self._log('error', f"⏰ TIMEOUT: {name} (>{step.timeout}s); its dependants wait for it to exit")
+        finally:
+            pool.shutdown(wait=False)
+            self.finished = time.time()
+            if self.record_state:
+                self.manifest.save()
+            self.write_report()
+        return self.results
+
+    # ---- reporting ---------------------------------------------------------
+
+    def critical_path(self) -> List[str]:
+        """Dependency chain with the largest summed step time (ends at the last step to finish)"""
+        best: Dict[str, float] = {}
+        prev: Dict[str, Optional[str]] = {}
+        for name in self._order:
+            res = self.results.get(name)
+            dur = res.seconds if res else 0.0
+            deps = self.steps[name].deps
+            lead = max(deps, key=lambda d: best[d]) if deps else None
+            best[name] = dur + (best[lead] if lead else 0.0)
+            prev[name] = lead
+        if not best:
+            return []
+        node = max(best, key=lambda n: best[n])
+        path = []
+        while node:
+            path.append(node)
+            node = prev[node]
+        return list(reversed(path))
+
+    def report(self) -> Dict[str, Any]:
+        t0 = self.started or 0.0
+        wall = (self.finished or time.time()) - t0 if self.started else 0.0
+        path = self.critical_path()
+        steps = []
+        for name in self._order:
+            res = self.results.get(name)
+            if res is None:
+                continue
+            steps.append({
+                'name': name,
+                'status': res.status,
+                'seconds': round(res.seconds, 3),
+                'start_offset': round(res.started - t0, 3) if res.started is not None else None,
+                'in_process': res.in_process,
+                'deps': res.deps,
+                'outputs_changed': res.outputs_changed,
+                'error': res.error,
+            })
+        busy = sum(s['seconds'] for s in steps)
+        return {
+            'started_at': datetime.fromtimestamp(t0).isoformat() if self.started else None,
+            'wall_seconds': round(wall, 3),
+            'step_seconds_total': round(busy, 3),
+            'parallelism': round(busy / wall, 2) if wall > 0 else None,
+            'workers': self.max_workers,
+            'critical_path': path,
+            'critical_path_seconds': round(sum(self.results[n].seconds for n in path), 3),
+            'steps': steps,
+        }
+
+    def write_report(self) -> Dict[str, Any]:
+        rep = self.report()
+        try:
+            os.makedirs(os.path.dirname(self.report_path) or '.', exist_ok=True)
+            with open(self.report_path, 'w', encoding='utf-8') as f:
+                json.dump(rep, f, indent=1)
+        except Exception as e:
+            self._log('warning', f"⚠️ Could not write pipeline report: {e}")
+        return rep
+
+    def log_report(self):
+        rep = self.report()
+        self._log('info', f"⏱️ Pipeline: {rep['wall_seconds']:.1f}s wall, {rep['step_seconds_total']:.1f}s of step time "
+                          f"(x{rep['parallelism'] or 0} parallel, {rep['workers']} workers)")
+        for s in sorted(rep['steps'], key=lambda s: s['seconds'], reverse=True):
+            mark = '*' if s['name'] in rep['critical_path'] else ' '
+            where = 'in-process' if s['in_process'] else 'subprocess'
+            offset = s['start_offset'] if s['start_offset'] is not None else 0.0
+            self._log('info', f"  {mark} {s['name']:<28} {s['status']:<8} {s['seconds']:>8.1f}s  @+{offset:.1f}s  {where}")
+        self._log('info', f"  * critical path ({rep['critical_path_seconds']:.1f}s): {' -> '.join(rep['critical_path'])}")
+        return rep
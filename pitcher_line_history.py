@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Append-only store for intraday pitcher prop line movements.
+
+Events (line_initial / line_move) are appended as JSON Lines, one file per date:
+  data/daily_bovada/pitcher_prop_line_history_<DATE>.jsonl
+
+Appending is O(1) (no read-modify-write of the whole day). Readers keep a per-date
+in-memory index of byte offsets by pitcher and (pitcher, market) that is extended
+incrementally as the file grows, so filtered range queries only parse matching lines.
+
+Legacy day files (pitcher_prop_line_history_<DATE>.json, {"date":..,"events":[..]})
+are converted to .jsonl the first time the date is accessed.
+"""
+from __future__ import annotations
+import os, json, threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from utils.name_normalization import normalize_name
+
+BASE_DIR = os.path.join('data', 'daily_bovada')
+MAX_INDEXED_DATES = 7
+
+
+class _DayIndex:
+    __slots__ = ('indexed_bytes', 'offsets', 'ts', 'by_pitcher', 'by_key')
+
+    def __init__(self):
+        self.indexed_bytes = 0
+        self.offsets: List[int] = []
+        self.ts: List[str] = []
+        self.by_pitcher: Dict[str, List[int]] = {}          # pitcher -> positions in offsets
+        self.by_key: Dict[Tuple[str, str], List[int]] = {}  # (pitcher, market) -> positions
+
+
+class LineHistoryStore:
+    def __init__(self, base_dir: str = BASE_DIR):
+        self.base_dir = base_dir
+        self._lock = threading.RLock()
+        self._indexes: 'OrderedDict[str, _DayIndex]' = OrderedDict()
+
+    def path_for(self, date_str: str) -> str:
+        safe_date = (date_str or '').replace('-', '_')
+        return os.path.join(self.base_dir, f'pitcher_prop_line_history_{safe_date}.jsonl')
+
+    def legacy_path_for(self, date_str: str) -> str:
+        return self.path_for(date_str)[:-1]
+
+    def _migrate_legacy(self, date_str: str):
+        path = self.path_for(date_str)
+        legacy = self.legacy_path_for(date_str)
+        if os.path.exists(path) or not os.path.exists(legacy):
+            return
+        try:
+            with open(legacy, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+            events = doc.get('events') if isinstance(doc, dict) else None
+            if not isinstance(events, list):
+                return
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    for ev in events:
+                        f.write(json.dumps(ev, separators=(',', ':')) + '\n')
+                # link() refuses to overwrite: if another process migrated (and maybe appended) first,
+                # its file wins instead of being replaced by ours
+                os.link(tmp, path)
+            except FileExistsError:
+                pass
+            finally:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+        except Exception:
+            pass
+
+    def append(self, date_str: str, events: List[dict]) -> int:
+        """Append events for a date; returns the number written."""
+        if not events:
+            return 0
+        lines = ''.join(json.dumps(ev, separators=(',', ':')) + '\n' for ev in events if isinstance(ev, dict))
+        if not lines:
+            return 0
+        with self._lock:
+            self._migrate_legacy(date_str)
+            path = self.path_for(date_str)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Single write in append mode so concurrent writers (updater + web) don't interleave lines
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+        return lines.count('\n')
+
+    def _index(self, date_str: str) -> Optional[_DayIndex]:
+        """Return the day's index, extended with any lines appended since the last call."""
+        self._migrate_legacy(date_str)
+        path = self.path_for(date_str)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            self._indexes.pop(date_str, None)
+            return None
+        idx = self._indexes.get(date_str)
+        if idx is None or size < idx.indexed_bytes:
+            idx = _DayIndex()
+        self._indexes[date_str] = idx
+        self._indexes.move_to_end(date_str)
+        while len(self._indexes) > MAX_INDEXED_DATES:
+            self._indexes.popitem(last=False)
+        if size == idx.indexed_bytes:
+            return idx
+        with open(path, 'rb') as f:
+            f.seek(idx.indexed_bytes)
+            chunk = f.read(size - idx.indexed_bytes)
+        pos = idx.indexed_bytes
+        # Only index complete lines; a partially written trailing line is picked up next time
+        end = chunk.rfind(b'\n') + 1
+        for raw in chunk[:end].splitlines(keepends=True):
+            line_start = pos
+            pos += len(raw)
+            try:
+                ev = json.loads(raw)
+            except Exception:
+                continue
+            if not isinstance(ev, dict):
+                continue
+            i = len(idx.offsets)
+            idx.offsets.append(line_start)
+            idx.ts.append(str(ev.get('ts') or ''))
+            pitcher = normalize_name(ev.get('pitcher'))
+            idx.by_pitcher.setdefault(pitcher, []).append(i)
+            idx.by_key.setdefault((pitcher, str(ev.get('market') or '')), []).append(i)
+        idx.indexed_bytes += end
+        return idx
+
+    def query(self, date_str: str, pitcher: str = None, market: str = None,
+              since: str = None, limit: int = None) -> List[dict]:
+        """Events for a date in append order, optionally filtered by pitcher, market and ts >= since.
+        limit keeps the most recent N matches."""
+        with self._lock:
+            idx = self._index(date_str)
+            if idx is None:
+                return []
+            if pitcher:
+                p = normalize_name(pitcher)
+                if market:
+                    positions = idx.by_key.get((p, market), [])
+                else:
+                    positions = idx.by_pitcher.get(p, [])
+            elif market:
+                positions = sorted(i for (_, mk), pos in idx.by_key.items() if mk == market for i in pos)
+            else:
+                positions = range(len(idx.offsets))
+            if since:
+                positions = [i for i in positions if idx.ts[i] >= since]
+            if limit is not None and limit >= 0:
+                positions = list(positions)[-limit:] if limit else []
+            offsets = [idx.offsets[i] for i in positions]
+            path = self.path_for(date_str)
+        events = []
+        if not offsets:
+            return events
+        with open(path, 'rb') as f:
+            for off in offsets:
+                f.seek(off)
+                try:
+                    events.append(json.loads(f.readline()))
+                except Exception:
+                    continue
+        return events
+
+    def count(self, date_str: str) -> int:
+        with self._lock:
+            idx = self._index(date_str)
+            return len(idx.offsets) if idx else 0
+
+
+_STORE = LineHistoryStore()
+
+
+def get_line_history_store() -> LineHistoryStore:
+    return _STORE
+
+
+def append_line_history_events(date_str: str, events: List[dict]) -> int:
+    return _STORE.append(date_str, events)
@@ -9,6 +9,8 @@ import os
 import glob
 from datetime import datetime, timedelta
 
+from unified_predictions_store import get_unified_predictions_store
+
 def rebuild_unified_cache():
     """Rebuild the unified predictions cache from historical data and daily files"""
     
@@ -154,10 +156,11 @@ def rebuild_unified_cache():
         
         current_date += timedelta(days=1)
     
-    # Write the rebuilt cache
-    cache_file = "data/unified_predictions_cache.json"
-    with open(cache_file, 'w') as f:
-        json.dump(unified_cache, f, indent=2)
+    # Write the rebuilt dates as per-date shards (plus the legacy monolith for older readers)
+    store = get_unified_predictions_store("data")
+    store.put_dates(unified_cache["predictions_by_date"],
+                    meta={k: v for k, v in unified_cache.items() if k != "predictions_by_date"})
+    legacy_file = store.export_legacy()
     
     total_dates = len(unified_cache["predictions_by_date"])
     total_games = sum(date_data["total_games"] for date_data in unified_cache["predictions_by_date"].values())
@@ -166,7 +169,7 @@ def rebuild_unified_cache():
     print(f"📊 Total dates: {total_dates}")
     print(f"🎯 Total games: {total_games}")
     print(f"📅 Date range: {min(unified_cache['predictions_by_date'].keys())} to {max(unified_cache['predictions_by_date'].keys())}")
-    print(f"💾 Cache size: {os.path.getsize(cache_file)} bytes")
+    print(f"💾 Shards: {store.shard_dir} (legacy copy: {os.path.getsize(legacy_file)} bytes)")
     
     return unified_cache
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Write-behind store for daily pitcher prop snapshot documents.
+
+Snapshots relayed by the props updater (props_snapshot / recommendations_snapshot)
+used to be dumped to disk with indent=2 on every event. This store keeps the latest
+document per (doc type, date) in memory, serves readers from memory, and flushes
+dirty documents to disk at most once per interval using compact JSON + atomic replace:
+
+  props            -> data/daily_bovada/bovada_pitcher_props_<DATE>.json
+  recommendations  -> data/daily_bovada/pitcher_prop_recommendations_<DATE>.json
+
+Readers that hit a date not held in memory load it from disk once; the parsed doc is
+reused until the file's (mtime_ns, size) changes (e.g. written by another process).
+
+Documents returned by get() are shared: callers must treat them as read-only.
+Interval: env PITCHER_SNAPSHOT_FLUSH_SEC (default 5 seconds).
+"""
+from __future__ import annotations
+import os, json, time, threading, atexit
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+BASE_DIR = os.path.join('data', 'daily_bovada')
+DOC_FILE_PATTERNS = {
+    'props': 'bovada_pitcher_props_{safe_date}.json',
+    'recommendations': 'pitcher_prop_recommendations_{safe_date}.json',
+}
+MAX_CLEAN_ENTRIES = 16
+
+
+class _Entry:
+    __slots__ = ('doc', 'dirty', 'updated_at', 'flushed_at', 'file_sig')
+
+    def __init__(self, doc: Any, dirty: bool, file_sig: Optional[Tuple[int, int]]):
+        self.doc = doc
+        self.dirty = dirty
+        self.updated_at = time.time()
+        self.flushed_at = 0.0
+        self.file_sig = file_sig
+
+
+def _file_sig(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+class WriteBehindDocStore:
+    def __init__(self, base_dir: str = BASE_DIR, flush_interval: float = None):
+        self.base_dir = base_dir
+        if flush_interval is None:
+            try:
+                flush_interval = float(os.environ.get('PITCHER_SNAPSHOT_FLUSH_SEC', '5'))
+            except Exception:
+                flush_interval = 5.0
+        self.flush_interval = max(0.0, flush_interval)
+        self._lock = threading.RLock()
+        self._entries: 'OrderedDict[Tuple[str, str], _Entry]' = OrderedDict()
+        self._wake = threading.Event()
+        self._flusher = None
+        self._stats = {'puts': 0, 'memory_hits': 0, 'disk_loads': 0, 'flushes': 0,
+                       'coalesced_puts': 0, 'flush_errors': 0, 'last_flush_ms': None}
+
+    def path_for(self, doc_type: str, date_str: str) -> str:
+        safe_date = (date_str or '').replace('-', '_')
+        return os.path.join(self.base_dir, DOC_FILE_PATTERNS[doc_type].format(safe_date=safe_date))
+
+    def put(self, doc_type: str, date_str: str, doc: Any):
+        """Replace the in-memory doc; it is written to disk by the background flusher."""
+        key = (doc_type, date_str)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.dirty:
+                self._stats['coalesced_puts'] += 1
+            if entry is None:
+                entry = _Entry(doc, True, None)
+                self._entries[key] = entry
+            else:
+                entry.doc = doc
+                entry.dirty = True
+                entry.updated_at = time.time()
+            self._entries.move_to_end(key)
+            self._stats['puts'] += 1
+        self._ensure_flusher()
+        self._wake.set()
+
+    def get(self, doc_type: str, date_str: str, default: Any = None) -> Any:
+        """Latest doc from memory (pending writes included), else from disk (parsed once per file version)."""
+        key = (doc_type, date_str)
+        path = self.path_for(doc_type, date_str)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.dirty:
+                self._stats['memory_hits'] += 1
+                return entry.doc
+        sig = _file_sig(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.dirty or entry.file_sig == sig):
+                self._stats['memory_hits'] += 1
+                return entry.doc if entry.doc is not None else default
+            if sig is None:
+                return default
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+        except Exception:
+            return default
+        with self._lock:
+            entry = self._entries.get(key)
+            # A put() may have landed while we were parsing; never overwrite newer pending data
+            if entry is None or not entry.dirty:
+                self._entries[key] = _Entry(doc, False, sig)
+                self._entries.move_to_end(key)
+                self._evict_clean()
+            self._stats['disk_loads'] += 1
+        return doc
+
+    def has(self, doc_type: str, date_str: str) -> bool:
+        with self._lock:
+            entry = self._entries.get((doc_type, date_str))
+            if entry is not None and entry.dirty:
+                return True
+        return os.path.exists(self.path_for(doc_type, date_str))
+
+    def _evict_clean(self):
+        clean = [k for k, e in self._entries.items() if not e.dirty]
+        for k in clean[:max(0, len(clean) - MAX_CLEAN_ENTRIES)]:
+            self._entries.pop(k, None)
+
+    def flush(self, force: bool = False) -> int:
+        """Write dirty docs whose interval has elapsed (all dirty docs when force). Returns count written."""
+        now = time.time()
+        with self._lock:
+            due = [(k, e, e.doc) for k, e in self._entries.items()
+                   if e.dirty and (force or now - e.flushed_at >= self.flush_interval)]
+            for _, e, _ in due:
+                e.dirty = False
+        written = 0
+        for (doc_type, date_str), entry, doc in due:
+            path = self.path_for(doc_type, date_str)
+            t0 = time.time()
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(doc, f, separators=(',', ':'))
+                os.replace(tmp, path)
+                written += 1
+                with self._lock:
+                    entry.flushed_at = time.time()
+                    if entry.doc is doc:
+                        entry.file_sig = _file_sig(path)
+                    self._stats['flushes'] += 1
+                    self._stats['last_flush_ms'] = round((time.time() - t0) * 1000.0, 1)
+            except Exception:
+                with self._lock:
+                    entry.dirty = True
+                    self._stats['flush_errors'] += 1
+        return written
+
+    def _next_due_in(self) -> Optional[float]:
+        now = time.time()
+        with self._lock:
+            waits = [max(0.0, e.flushed_at + self.flush_interval - now) for e in self._entries.values() if e.dirty]
+        return min(waits) if waits else None
+
+    def _flush_loop(self):
+        while True:
+            wait = self._next_due_in()
+            if wait is None:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            if wait > 0:
+                self._wake.wait(wait)
+                self._wake.clear()
+            self.flush()
+
+    def _ensure_flusher(self):
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._lock:
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(target=self._flush_loop, name='snapshot-flusher', daemon=True)
+                self._flusher.start()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                'flush_interval_sec': self.flush_interval,
+                'entries': len(self._entries),
+                'dirty': sum(1 for e in self._entries.values() if e.dirty),
+            }
+
+
+_STORE = WriteBehindDocStore()
+atexit.register(lambda: _STORE.flush(force=True))
+
+
+def get_snapshot_store() -> WriteBehindDocStore:
+    return _STORE
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""Fan-out hubs for the Server-Sent Events streams (pitcher props, live game status).
+
+Every published event gets a monotonically increasing id and is serialized exactly once
+into an SSE frame (``id: <epoch>-N`` + ``data: {...}``). Frames are kept in a ring buffer so a
+reconnecting EventSource can resume from its ``Last-Event-ID`` without losing updates,
+and are appended by reference to each matching subscriber's bounded buffer.
+
+Subscribers may filter by date, pitcher (normalized name) and event type; events that do
+not carry the field (e.g. slate-wide snapshots have no pitcher) pass that filter.
+
+Slow consumers are evicted instead of buffering without bound: a subscriber whose buffer
+exceeds its limit, or that has left frames undelivered for longer than the stall timeout,
+is dropped and its stream closes. The browser reconnects with Last-Event-ID and catches up
+from the ring buffer.
+
+Request threads: with gunicorn's gthread worker each open stream occupies a thread. The
+hub therefore only lets a limited number of streams be held open (``max_held``); beyond
+that a connection is answered in "poll mode" -- replay any missed frames, send a retry
+hint, and close -- so EventSource degrades to cheap long-polling with Last-Event-ID
+instead of starving the app. Held streams also end after ``max_stream_sec`` and
+reconnect seamlessly. Under a gevent worker (the default in gunicorn.conf.py, which exports
+GUNICORN_WORKER_CLASS) waits are cooperative and the held-stream limit defaults high enough
+for hundreds of subscribers.
+
+Each named channel (get_sse_hub('pitcher-props'), get_sse_hub('game-status')) is an independent
+hub with its own ids, ring buffer and subscribers; the knobs below apply to all of them.
+
+Env knobs:
+  PITCHER_SSE_RING_SIZE         replay ring buffer length (default 2000)
+  PITCHER_SSE_BUFFER_MAX        per-subscriber pending frames before eviction (default 500)
+  PITCHER_SSE_STALL_SEC         pending frames older than this evict the subscriber (default 60)
+  PITCHER_SSE_MAX_HELD          concurrent held-open streams (default: 1000 on gevent, else WEB_THREADS//2)
+  PITCHER_SSE_MAX_STREAM_SEC    lifetime of a held stream before it is recycled (default 300)
+  PITCHER_SSE_HEARTBEAT_SEC     comment heartbeat interval (default 25)
+  PITCHER_SSE_RETRY_MS          reconnect hint sent to held streams (default 3000)
+  PITCHER_SSE_POLL_RETRY_MS     reconnect hint for poll-mode responses (default 15000)
+"""
+from __future__ import annotations
+import os, json, time, threading, itertools
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from utils.name_normalization import normalize_name
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except Exception:
+        return default
+
+
+def _cooperative_waits() -> bool:
+    """True when threading primitives are gevent-patched (blocking waits don't pin OS threads)."""
+    if os.environ.get('GUNICORN_WORKER_CLASS', '').strip().lower() in ('gevent', 'eventlet'):
+        # Declared worker class: with --preload the hubs exist before the worker patches threading
+        return True
+    try:
+        from gevent import monkey  # type: ignore
+        return bool(monkey.is_module_patched('threading'))
+    except Exception:
+        return False
+
+
+class _Frame:
+    __slots__ = ('id', 'date', 'pitcher', 'type', 'data')
+
+    def __init__(self, wire_id: str, event_id: int, event: dict):
+        self.id = event_id
+        self.date = event.get('date') or None
+        pitcher = event.get('pitcher')
+        self.pitcher = normalize_name(pitcher) if pitcher else None
+        self.type = event.get('type') or None
+        body = json.dumps(event, separators=(',', ':'), default=str)
+        self.data = f"id: {wire_id}\ndata: {body}\n\n".encode('utf-8')
+
+
+class Subscriber:
+    __slots__ = ('hub', 'date', 'pitchers', 'types', 'held', 'frames', 'pending_since',
+                 'wake', 'evicted', 'closed', 'connected_at', 'delivered', 'start_id')
+
+    def __init__(self, hub: 'SSEHub', date: Optional[str], pitchers: Optional[Iterable[str]],
+                 types: Optional[Iterable[str]], held: bool):
+        self.hub = hub
+        self.date = date or None
+        self.pitchers = {normalize_name(p) for p in pitchers if p} if pitchers else None
+        self.types = {t for t in types if t} if types else None
+        self.held = held
+        self.frames: deque = deque()
+        self.pending_since: Optional[float] = None
+        self.wake = threading.Event()
+        self.evicted: Optional[str] = None
+        self.closed = False
+        self.connected_at = time.time()
+        self.delivered = 0
+        self.start_id = 0
+
+    def matches(self, frame: _Frame) -> bool:
+        if self.date and frame.date and frame.date != self.date:
+            return False
+        if self.pitchers and frame.pitcher and frame.pitcher not in self.pitchers:
+            return False
+        if self.types and frame.type not in self.types:
+            return False
+        return True
+
+    def drain(self) -> list:
+        with self.hub._lock:
+            out = list(self.frames)
+            self.frames.clear()
+            self.pending_since = None
+            self.wake.clear()
+        self.delivered += len(out)
+        return out
+
+    def close(self):
+        self.hub._unsubscribe(self)
+
+
+class SSEHub:
+    def __init__(self, ring_size: int = None, buffer_max: int = None, stall_sec: float = None,
+                 max_held: int = None, max_stream_sec: float = None, heartbeat_sec: float = None):
+        self.ring_size = ring_size or _env_int('PITCHER_SSE_RING_SIZE', 2000)
+        self.buffer_max = buffer_max or _env_int('PITCHER_SSE_BUFFER_MAX', 500)
+        self.stall_sec = float(stall_sec or _env_int('PITCHER_SSE_STALL_SEC', 60))
+        # Resolved on first subscribe (and again after fork): under --preload the hub is built
+        # before the worker's gevent patching, so the default must not be decided at import time
+        self._max_held_arg = max_held
+        self._max_held: Optional[int] = None
+        self.max_stream_sec = float(max_stream_sec or _env_int('PITCHER_SSE_MAX_STREAM_SEC', 300))
+        self.heartbeat_sec = float(heartbeat_sec or _env_int('PITCHER_SSE_HEARTBEAT_SEC', 25))
+        self.retry_ms = _env_int('PITCHER_SSE_RETRY_MS', 3000)
+        self.poll_retry_ms = _env_int('PITCHER_SSE_POLL_RETRY_MS', 15000)
+        self._lock = threading.Lock()
+        self._new_epoch()
+        self._ids = itertools.count(1)
+        self._last_id = 0
+        self._ring: deque = deque(maxlen=self.ring_size)
+        self._subscribers: list = []
+        self._stats = {'published': 0, 'delivered': 0, 'replayed': 0, 'evicted_overflow': 0,
+                       'evicted_stalled': 0, 'poll_responses': 0, 'replay_gaps': 0}
+
+    @property
+    def max_held(self) -> int:
+        if self._max_held is None:
+            max_held = self._max_held_arg
+            if max_held is None:
+                default_held = 1000 if _cooperative_waits() else max(1, _env_int('WEB_THREADS', 4) // 2)
+                max_held = _env_int('PITCHER_SSE_MAX_HELD', default_held)
+            self._max_held = max(0, max_held)
+        return self._max_held
+
+    def _new_epoch(self):
+        # Ids are process-local; the epoch prefix lets a client that reconnects to another
+        # worker (or after a restart) be recognised and replayed the whole ring.
+        self.epoch = f"{os.getpid():x}{int(time.time() * 1000) & 0xffffff:x}"
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._new_epoch()
+        self._ids = itertools.count(1)
+        self._last_id = 0
+        self._ring.clear()
+        self._subscribers = []
+        self._max_held = None
+
+    def parse_event_id(self, raw: Optional[str]) -> Optional[int]:
+        """Last-Event-ID -> numeric id in this process (0 = unknown epoch, replay all; None = absent)."""
+        if not raw:
+            return None
+        epoch, _, num = str(raw).strip().rpartition('-')
+        if epoch != self.epoch:
+            return 0
+        try:
+            return int(num)
+        except ValueError:
+            return 0
+
+    # ---- publishing --------------------------------------------------------
+
+    def publish(self, event: dict) -> int:
+        """Serialize once, append to the replay ring and fan out to matching subscribers."""
+        now = time.time()
+        with self._lock:
+            event_id = next(self._ids)
+            frame = _Frame(f"{self.epoch}-{event_id}", event_id, event)
+            self._last_id = event_id
+            self._ring.append(frame)
+            self._stats['published'] += 1
+            evict = []
+            for sub in self._subscribers:
+                if not sub.matches(frame):
+                    continue
+                if sub.pending_since is not None and now - sub.pending_since > self.stall_sec:
+                    evict.append((sub, 'stalled'))
+                    continue
+                sub.frames.append(frame)
+                if len(sub.frames) > self.buffer_max:
+                    evict.append((sub, 'overflow'))
+                    continue
+                if sub.pending_since is None:
+                    sub.pending_since = now
+                sub.wake.set()
+            for sub, reason in evict:
+                self._evict_locked(sub, reason)
+        return event_id
+
+    def _evict_locked(self, sub: Subscriber, reason: str):
+        sub.evicted = reason
+        sub.frames.clear()
+        try:
+            self._subscribers.remove(sub)
+        except ValueError:
+            pass
+        self._stats['evicted_stalled' if reason == 'stalled' else 'evicted_overflow'] += 1
+        sub.wake.set()
+
+    # ---- subscribing -------------------------------------------------------
+
+    def _replay_locked(self, sub: Subscriber, last_event_id: Optional[int]):
+        if last_event_id is None or not self._ring:
+            return
+        if self._ring[0].id > last_event_id + 1:
+            self._stats['replay_gaps'] += 1
+        for frame in self._ring:
+            if frame.id > last_event_id and sub.matches(frame):
+                sub.frames.append(frame)
+        if len(sub.frames) > self.buffer_max:
+            # Too far behind: send only the newest frames rather than evicting on connect
+            for _ in range(len(sub.frames) - self.buffer_max):
+                sub.frames.popleft()
+            self._stats['replay_gaps'] += 1
+        self._stats['replayed'] += len(sub.frames)
+        if sub.frames:
+            sub.pending_since = time.time()
+            sub.wake.set()
+
+    def subscribe(self, date: str = None, pitchers: Iterable[str] = None, types: Iterable[str] = None,
+                  last_event_id: int = None) -> Subscriber:
+        """Register a subscriber (held open if capacity allows, else poll mode) with replay queued."""
+        with self._lock:
+            held = sum(1 for s in self._subscribers if s.held) < self.max_held
+            sub = Subscriber(self, date, pitchers, types, held)
+            sub.start_id = self._last_id
+            self._replay_locked(sub, last_event_id)
+            if held:
+                self._subscribers.append(sub)
+            else:
+                self._stats['poll_responses'] += 1
+        return sub
+
+    def _unsubscribe(self, sub: Subscriber):
+        with self._lock:
+            sub.closed = True
+            self._stats['delivered'] += sub.delivered
+            sub.delivered = 0
+            try:
+                self._subscribers.remove(sub)
+            except ValueError:
+                pass
+
+    def stream(self, sub: Subscriber) -> Iterator[bytes]:
+        """SSE byte stream for a subscriber; always unsubscribes when the client goes away."""
+        try:
+            # The hello frame carries the stream position at subscribe time, so even a client that
+            # has seen no events yet resumes from here (poll mode relies on this)
+            start = f"{self.epoch}-{sub.start_id}"
+            hello = {'type': 'sse_hello', 'ts': datetime.utcnow().isoformat(), 'last_event_id': start,
+                     'mode': 'stream' if sub.held else 'poll'}
+            retry = self.retry_ms if sub.held else self.poll_retry_ms
+            yield f"retry: {retry}\nid: {start}\ndata: {json.dumps(hello, separators=(',', ':'))}\n\n".encode('utf-8')
+            if not sub.held:
+                frames = sub.drain()
+                if frames:
+                    yield b''.join(f.data for f in frames)
+                return
+            deadline = sub.connected_at + self.max_stream_sec
+            while not sub.evicted:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                if sub.wake.wait(min(self.heartbeat_sec, remaining)):
+                    frames = sub.drain()
+                    if frames:
+                        yield b''.join(f.data for f in frames)
+                elif time.time() < deadline:
+                    yield b': hb\n\n'
+        finally:
+            sub.close()
+
+    # ---- diagnostics -------------------------------------------------------
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            subs = list(self._subscribers)
+            return {
+                **self._stats,
+                'delivered': self._stats['delivered'] + sum(s.delivered for s in subs),
+                'subscribers': len(subs),
+                'max_held': self.max_held,
+                'max_pending': max((len(s.frames) for s in subs), default=0),
+                'epoch': self.epoch,
+                'last_event_id': self._last_id,
+                'ring_size': len(self._ring),
+                'ring_capacity': self.ring_size,
+                'oldest_replayable_id': self._ring[0].id if self._ring else None,
+                'cooperative_waits': _cooperative_waits(),
+            }
+
+
+DEFAULT_CHANNEL = 'pitcher-props'
+_HUBS: Dict[str, SSEHub] = {DEFAULT_CHANNEL: SSEHub()}
+_HUBS_LOCK = threading.Lock()
+
+
+def _after_fork_all():
+    global _HUBS_LOCK
+    _HUBS_LOCK = threading.Lock()
+    for hub in _HUBS.values():
+        hub._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    # gunicorn --preload imports the app before forking workers; each worker gets its own hubs
+    os.register_at_fork(after_in_child=_after_fork_all)
+
+
+def get_sse_hub(channel: str = DEFAULT_CHANNEL) -> SSEHub:
+    hub = _HUBS.get(channel)
+    if hub is None:
+        with _HUBS_LOCK:
+            hub = _HUBS.setdefault(channel, SSEHub())
+    return hub
@@ -0,0 +1,100 @@
+/**
+ * SharedEventSource: one Server-Sent Events connection per URL for all tabs of this site.
+ *
+ * The tab holding the Web Lock "sse:<url>" opens the EventSource and relays every frame to the
+ * other tabs over a BroadcastChannel; they only listen. When the leading tab closes, its lock is
+ * released and the next tab takes over, resuming from the last relayed event id. Browsers
+ * without Web Locks / BroadcastChannel get a plain EventSource.
+ *
+ * Same surface as EventSource: onopen / onmessage / onerror, readyState, close(). The stream is
+ * reconnected internally, so readyState never reports CLOSED until close() is called.
+ */
+(function (global) {
+    'use strict';
+
+    const CONNECTING = 0, OPEN = 1, CLOSED = 2;
+    const RETRY_MS = 10000;
+
+    function withLastEventId(url, id) {
+        if (!id) return url;
+        return url + (url.indexOf('?') < 0 ? '?' : '&') + 'lastEventId=' + encodeURIComponent(id);
+    }
+
+    function SharedEventSource(url) {
+        if (!(global.navigator && global.navigator.locks && global.BroadcastChannel)) {
+            return new EventSource(url);
+        }
+        this.url = url;
+        this.readyState = CONNECTING;
+        this.lastEventId = '';
+        this.onopen = this.onmessage = this.onerror = null;
+        this._leader = false;
+        this._es = null;
+        this._release = null;
+        this._channel = new BroadcastChannel('sse:' + url);
+        this._channel.onmessage = (e) => this._onRelay(e.data || {});
+        this._channel.postMessage({ kind: 'hello' });
+        global.navigator.locks.request('sse:' + url, () => new Promise((release) => {
+            if (this.readyState === CLOSED) return release();
+            this._release = release;
+            this._leader = true;
+            this._connect();
+        }));
+    }
+
+    SharedEventSource.CONNECTING = CONNECTING;
+    SharedEventSource.OPEN = OPEN;
+    SharedEventSource.CLOSED = CLOSED;
+
+    SharedEventSource.prototype._setState = function (state) {
+        const prev = this.readyState;
+        this.readyState = state;
+        if (this._leader) this._channel.postMessage({ kind: 'state', state: state });
+        if (state === OPEN && prev !== OPEN && this.onopen) this.onopen({ type: 'open' });
+        if (state !== OPEN && prev === OPEN && this.onerror) this.onerror({ type: 'error' });
+    };
+
+    SharedEventSource.prototype._deliver = function (data, lastEventId) {
+        if (lastEventId) this.lastEventId = lastEventId;
+        if (this.onmessage) this.onmessage({ type: 'message', data: data, lastEventId: lastEventId || '' });
+    };
+
+    SharedEventSource.prototype._onRelay = function (msg) {
+        if (this.readyState === CLOSED) return;
+        if (this._leader) {
+            // A new tab asks for the current state
+            if (msg.kind === 'hello') this._channel.postMessage({ kind: 'state', state: this.readyState });
+            return;
+        }
+        if (msg.kind === 'state') this._setState(msg.state);
+        else if (msg.kind === 'message') this._deliver(msg.data, msg.lastEventId);
+    };
+
+    SharedEventSource.prototype._connect = function () {
+        if (this.readyState === CLOSED) return;
+        const es = this._es = new EventSource(withLastEventId(this.url, this.lastEventId));
+        es.onopen = () => this._setState(OPEN);
+        es.onmessage = (msg) => {
+            this._channel.postMessage({ kind: 'message', data: msg.data, lastEventId: msg.lastEventId });
+            this._deliver(msg.data, msg.lastEventId);
+        };
+        es.onerror = () => {
+            if (this.readyState === CLOSED) return;
+            this._setState(CONNECTING);
+            if (es.readyState === CLOSED) {
+                // The browser gave up reconnecting by itself: start over from the last event id
+                setTimeout(() => { if (this._es === es) this._connect(); }, RETRY_MS);
+            }
+        };
+    };
+
+    SharedEventSource.prototype.close = function () {
+        if (this._es) this._es.close();
+        this._es = null;
+        this.readyState = CLOSED;
+        if (this._release) this._release();
+        this._channel.close();
+    };
+
+    global.SharedEventSource = SharedEventSource;
+})(window);
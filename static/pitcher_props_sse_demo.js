@@ -51,7 +51,7 @@
     es.onmessage = ev => {
       try {
         const data = JSON.parse(ev.data);
-        if(data.type === 'heartbeat') return; // skip spam
+        if(data.type === 'sse_hello') return; // connection handshake (keep-alives are SSE comments)
         const row = el('div','ppsse-ev');
         row.textContent = `${fmt(data.ts)} ${data.type} ${data.pitcher||''} ${data.market||''} ${data.old_line||''} -> ${data.new_line||''}`;
         eventsDiv.prepend(row);
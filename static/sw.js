@@ -1,8 +1,10 @@
 /* Lightweight service worker to improve perceived cold-start on navigation.
  * Strategy: network-first with timeout for navigations; fallback to minimal inline skeleton
  * with an automatic retry that bypasses the SW once to avoid being stuck.
+ * Polled JSON APIs are revalidated with If-None-Match: unchanged data comes back as a bodiless
+ * 304 and is answered from the last body this worker saw.
  */
-const CACHE_NAME = 'mlb-shell-v3';
+const CACHE_NAME = 'mlb-shell-v4';
 // Cache navigations under their own request URL, not a single shell.
 // This avoids serving the wrong page when the network is slow.
 // Increase timeout to better handle cold starts on hosting platforms.
@@ -43,10 +45,63 @@ self.addEventListener('activate', (event) => {
 
 function timeout(ms) { return new Promise((_, reject) => setTimeout(() => reject(new Error('timeout')), ms)); }
 
+// ---- Conditional revalidation for polled JSON endpoints ----
+const REVALIDATE_PREFIXES = ['/api/today-games', '/api/live-status', '/api/pitcher-props/unified', '/api/props/progress'];
+// Cache-busting params added by the pages; ignored when matching a stored body
+const BUST_PARAMS = ['t', '_t', '_', 'ts'];
+const MAX_API_ENTRIES = 24;
+const apiEntries = new Map(); // normalized URL -> { etag, body, headers }
+
+function apiKey(url) {
+  const u = new URL(url.toString());
+  BUST_PARAMS.forEach((p) => u.searchParams.delete(p));
+  u.searchParams.sort();
+  return u.pathname + '?' + u.searchParams.toString();
+}
+
+function rememberApi(key, etag, body, headers) {
+  apiEntries.delete(key);
+  apiEntries.set(key, { etag, body, headers });
+  while (apiEntries.size > MAX_API_ENTRIES) {
+    apiEntries.delete(apiEntries.keys().next().value);
+  }
+}
+
+async function revalidateApi(req, url) {
+  const key = apiKey(url);
+  const entry = apiEntries.get(key);
+  const headers = new Headers(req.headers);
+  if (entry && !headers.has('If-None-Match')) headers.set('If-None-Match', entry.etag);
+  const netResp = await fetch(req.url, { method: 'GET', headers, credentials: req.credentials, cache: 'no-store' });
+  if (netResp.status === 304 && entry) {
+    const h = new Headers(entry.headers);
+    h.set('X-SW-Revalidated', '1');
+    return new Response(entry.body, { status: 200, headers: h });
+  }
+  const etag = netResp.headers.get('ETag');
+  if (netResp.ok && etag) {
+    try {
+      const body = await netResp.clone().arrayBuffer();
+      const h = {};
+      netResp.headers.forEach((v, k) => { if (k !== 'content-encoding' && k !== 'content-length') h[k] = v; });
+      rememberApi(key, etag, body, h);
+    } catch (e) {}
+  }
+  return netResp;
+}
+
 self.addEventListener('fetch', (event) => {
   const req = event.request;
   const url = new URL(req.url);
 
+  if (req.method === 'GET' && url.origin === self.location.origin &&
+      REVALIDATE_PREFIXES.some((p) => url.pathname.startsWith(p)) &&
+      (req.headers.get('Accept') || '').indexOf('text/event-stream') === -1 &&
+      url.pathname.indexOf('/stream') === -1) {
+    event.respondWith(revalidateApi(req, url).catch(() => fetch(req)));
+    return;
+  }
+
   // Only intercept top-level navigations
   const isNavigation = req.mode === 'navigate' || (req.destination === 'document');
   if (!isNavigation) return; // let API/static proceed normally
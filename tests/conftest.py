@@ -0,0 +1,6 @@
+import os, sys
+
+# Tests import the root-level modules directly (python -m pytest from the repo root)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,101 @@
+import json
+import os
+
+import pytest
+
+from build_manifest import BuildManifest, content_hash
+
+
+def _write_json(path, doc):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(doc, f)
+    # Step the mtime so the (mtime_ns, size) memo never hides a rewrite within one clock tick
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def files(tmp_path):
+    src = tmp_path / 'input.json'
+    out = tmp_path / 'output.json'
+    _write_json(src, {'rows': [1, 2, 3], 'retrieved_at': '2025-09-21T10:00:00'})
+    _write_json(out, {'result': 6})
+    return str(src), str(out)
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return BuildManifest(str(tmp_path / 'build_manifest.json'))
+
+
+def test_volatile_fields_do_not_change_the_hash(tmp_path):
+    a, b, c = tmp_path / 'a.json', tmp_path / 'b.json', tmp_path / 'c.json'
+    _write_json(a, {'rows': [1, 2], 'retrieved_at': '2025-09-21T10:00:00', 'meta': {'generated_at': 'x'}})
+    _write_json(b, {'meta': {'generated_at': 'y'}, 'rows': [1, 2], 'retrieved_at': '2025-09-22T08:00:00'})
+    _write_json(c, {'rows': [1, 3], 'retrieved_at': '2025-09-21T10:00:00', 'meta': {'generated_at': 'x'}})
+    assert content_hash(str(a)) == content_hash(str(b))
+    assert content_hash(str(a)) != content_hash(str(c))
+    assert content_hash(str(tmp_path / 'missing.json')) is None
+
+
+def test_not_current_until_recorded(manifest, files):
+    src, out = files
+    assert not manifest.is_current('step', [src], [out], 'v1')
+    manifest.record('step', manifest.hash_files([src]), [out], 'v1')
+    assert manifest.is_current('step', [src], [out], 'v1')
+
+
+def test_refetch_with_new_timestamp_stays_current(manifest, files):
+    src, out = files
+    manifest.record('step', manifest.hash_files([src]), [out], 'v1')
+    _write_json(src, {'rows': [1, 2, 3], 'retrieved_at': '2025-09-21T11:30:00'})
+    assert manifest.is_current('step', [src], [out], 'v1')
+
+
+def test_input_change_makes_stale(manifest, files):
+    src, out = files
+    manifest.record('step', manifest.hash_files([src]), [out], 'v1')
+    _write_json(src, {'rows': [1, 2, 3, 4], 'retrieved_at': '2025-09-21T10:00:00'})
+    assert not manifest.is_current('step', [src], [out], 'v1')
+
+
+def test_producer_change_makes_stale(manifest, files):
+    src, out = files
+    manifest.record('step', manifest.hash_files([src]), [out], 'v1')
+    assert not manifest.is_current('step', [src], [out], 'v2')
+
+
+def test_missing_or_edited_output_makes_stale(manifest, files):
+    src, out = files
+    manifest.record('step', manifest.hash_files([src]), [out], 'v1')
+    _write_json(out, {'result': 7})
+    assert not manifest.is_current('step', [src], [out], 'v1')
+    manifest.record('step', manifest.hash_files([src]), [out], 'v1')
+    os.remove(out)
+    assert not manifest.is_current('step', [src], [out], 'v1')
+
+
+def test_record_uses_input_hashes_taken_before_the_build(manifest, files):
+    src, out = files
+    before = manifest.hash_files([src])
+    # The input changes while the step runs: the next check must rebuild
+    _write_json(src, {'rows': [9], 'retrieved_at': '2025-09-21T10:00:00'})
+    entry = manifest.record('step', before, [out], 'v1', duration_s=1.5)
+    assert entry['inputs'] == before and entry['duration_s'] == 1.5
+    assert entry['outputs'] == manifest.hash_files([out])
+    assert not manifest.is_current('step', [src], [out], 'v1')
+
+
+def test_save_merges_entries_from_other_processes(tmp_path, files):
+    src, out = files
+    path = str(tmp_path / 'build_manifest.json')
+    first, second = BuildManifest(path), BuildManifest(path)
+    first._load()
+    second._load()
+    first.record('a', first.hash_files([src]), [out], 'v1')
+    second.record('b', second.hash_files([src]), [out], 'v1')
+    first.save()
+    second.save()
+    reloaded = BuildManifest(path)
+    assert reloaded.entry('a') is not None and reloaded.entry('b') is not None
+    assert reloaded.is_current('a', [src], [out], 'v1')
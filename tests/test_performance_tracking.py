@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+
+import pytest
+
+from performance_tracking import (LatencyHistogram, StageTimer, TimingRegistry, parse_server_timing,
+                                  server_timing_name)
+
+
+def _hist(values_ms):
+    hist = LatencyHistogram()
+    for ms in values_ms:
+        hist.record(int(ms * 1000))
+    return hist
+
+
+def test_percentiles_within_bucket_resolution():
+    hist = _hist(range(1, 1001))
+    for q, expected in ((0.50, 500.0), (0.95, 950.0), (0.99, 990.0)):
+        assert hist.percentile(q) == pytest.approx(expected, rel=0.04)
+    assert hist.percentile(1.0) == pytest.approx(1000.0, rel=0.04)
+
+
+def test_percentile_never_exceeds_max_and_small_values_are_exact():
+    hist = LatencyHistogram()
+    for us in (3, 7, 7, 12):
+        hist.record(us)
+    assert hist.percentile(0.5) == pytest.approx(0.007)
+    assert hist.percentile(1.0) == pytest.approx(0.012)
+    single = _hist([123.4])
+    assert single.percentile(0.99) <= 123.4
+
+
+def test_empty_histogram_and_summary_fields():
+    assert LatencyHistogram().percentile(0.5) is None
+    hist = LatencyHistogram()
+    hist.record(2000)
+    hist.record(4000, error=True)
+    d = hist.as_dict()
+    assert d['count'] == 2 and d['errors'] == 1
+    assert d['avg_ms'] == 3.0 and d['min_ms'] == 2.0 and d['max_ms'] == 4.0 and d['total_ms'] == 6.0
+
+
+def test_merge_matches_recording_everything_in_one():
+    a, b = _hist([1, 5, 9]), _hist([200, 400])
+    a.merge(b)
+    whole = _hist([1, 5, 9, 200, 400])
+    assert a.as_dict() == whole.as_dict()
+
+
+def test_registry_merges_threads_and_keeps_exited_threads(tmp_path):
+    reg = TimingRegistry(path=str(tmp_path / 'metrics.json'), flush_sec=0)
+
+    def worker():
+        for _ in range(10):
+            reg.record('today_games', 5.0, kind='request')
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    reg.record('today_games', 50.0, kind='request', error=True)
+    snap = reg.snapshot(kind='request')['request']['today_games']
+    assert snap['count'] == 81 and snap['errors'] == 1
+    # Exited threads were folded into the retired totals: only this thread's shard is left
+    assert reg.stats()['threads'] == 1
+
+
+def test_registry_flush_writes_this_process_section(tmp_path):
+    path = tmp_path / 'metrics.json'
+    reg = TimingRegistry(path=str(path), flush_sec=0)
+    reg.record('stage_a', 12.0, kind='stage')
+    reg.flush()
+    doc = json.loads(path.read_text())
+    (section,) = doc['processes'].values()
+    assert section['metrics']['stage']['stage_a']['count'] == 1
+
+
+def test_stage_timer_marks_skip_and_items():
+    st = StageTimer()
+    time.sleep(0.02)
+    st.mark('load')
+    time.sleep(0.02)
+    st.skip()
+    st.mark('format')
+    for key, pause in (('g1', 0.005), ('g2', 0.02)):
+        st.item_start()
+        time.sleep(pause)
+        st.item_mark('game', key)
+    d = st.as_dict()
+    assert d['stages']['load'] >= 15.0
+    assert d['stages']['format'] < 15.0  # the skipped sleep is not charged to any stage
+    game = d['items']['game']
+    assert game['count'] == 2 and game['max_key'] == 'g2'
+    assert game['total_ms'] >= game['max_ms'] >= 15.0
+    assert d['total_ms'] >= d['stages']['load'] + game['total_ms']
+
+
+def test_stage_timer_header_round_trips_through_the_parser():
+    st = StageTimer()
+    st.mark('cache lookup')
+    st.item_start()
+    st.item_mark('enrich')
+    parsed = dict(parse_server_timing(st.header(prefix='game_')))
+    assert set(parsed) == {'cache_lookup', 'game_enrich', 'total'}
+    assert parsed['total'] >= parsed['cache_lookup']
+
+
+def test_server_timing_helpers():
+    assert server_timing_name('api/today games') == 'api_today_games'
+    assert server_timing_name('///') == 'op'
+    assert parse_server_timing('db;dur=12.5, cache;desc="hit", total;dur=20') == [('db', 12.5), ('total', 20.0)]
@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+
+import pytest
+
+from build_manifest import BuildManifest
+from pipeline_dag import PipelineRunner, Step
+
+
+@pytest.fixture
+def make_runner(tmp_path):
+    def make(steps, **kwargs):
+        kwargs.setdefault('manifest', BuildManifest(str(tmp_path / 'build_manifest.json')))
+        kwargs.setdefault('report_path', str(tmp_path / 'pipeline_report.json'))
+        kwargs.setdefault('force', False)
+        return PipelineRunner(steps, **kwargs)
+    return make
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.events = []
+
+    def step(self, name, seconds=0.0, result=True):
+        def target():
+            with self._lock:
+                self.events.append(('start', name))
+            time.sleep(seconds)
+            with self._lock:
+                self.events.append(('end', name))
+            return result
+        return target
+
+    def index(self, kind, name):
+        return self.events.index((kind, name))
+
+
+def test_dependants_start_after_their_deps_finish(make_runner):
+    rec = Recorder()
+    runner = make_runner([
+        Step('fetch', rec.step('fetch', 0.05)),
+        Step('features', rec.step('features'), deps=['fetch']),
+        Step('lines', rec.step('lines', 0.05)),
+        Step('predict', rec.step('predict'), deps=['features', 'lines']),
+    ])
+    results = runner.run()
+    assert all(r.status == 'ok' for r in results.values())
+    assert rec.index('end', 'fetch') < rec.index('start', 'features')
+    assert rec.index('end', 'features') < rec.index('start', 'predict')
+    assert rec.index('end', 'lines') < rec.index('start', 'predict')
+
+
+def test_failed_dep_does_not_block_dependants(make_runner):
+    def boom():
+        raise RuntimeError('no data')
+    rec = Recorder()
+    runner = make_runner([
+        Step('a', rec.step('a', result=False)),
+        Step('b', boom),
+        Step('c', rec.step('c'), deps=['a', 'b']),
+    ])
+    results = runner.run()
+    assert results['a'].status == 'failed'
+    assert results['b'].status == 'error' and results['b'].error == 'no data'
+    assert results['c'].status == 'ok'
+
+
+def test_unknown_dep_and_cycle_are_rejected(make_runner):
+    with pytest.raises(ValueError):
+        make_runner([Step('a', lambda: True, deps=['missing'])])
+    with pytest.raises(ValueError):
+        make_runner([Step('a', lambda: True, deps=['b']), Step('b', lambda: True, deps=['a'])])
+    with pytest.raises(ValueError):
+        make_runner([Step('a', lambda: True), Step('a', lambda: True)])
+
+
+def test_unchanged_inputs_skip_the_step(make_runner, tmp_path):
+    src, out = tmp_path / 'in.json', tmp_path / 'out.json'
+    src.write_text(json.dumps({'v': 1}))
+    calls = []
+
+    def build():
+        calls.append(1)
+        out.write_text(json.dumps({'v': json.loads(src.read_text())['v'] * 2}))
+        return True
+
+    steps = [Step('build', build, inputs=[str(src)], outputs=[str(out)], version='1')]
+    manifest = BuildManifest(str(tmp_path / 'build_manifest.json'))
+    assert make_runner(steps, manifest=manifest).run()['build'].status == 'ok'
+    assert make_runner(steps, manifest=manifest).run()['build'].status == 'skipped'
+    assert make_runner(steps, manifest=manifest, force=True).run()['build'].status == 'ok'
+    assert len(calls) == 2
+
+    src.write_text(json.dumps({'v': 10}))
+    assert make_runner(steps, manifest=manifest).run()['build'].status == 'ok'
+    assert len(calls) == 3
+
+
+def test_steps_without_inputs_always_run(make_runner, tmp_path):
+    out = tmp_path / 'fetched.json'
+
+    def fetch():
+        out.write_text(json.dumps({'v': 1}))
+        return True
+
+    manifest = BuildManifest(str(tmp_path / 'build_manifest.json'))
+    steps = [Step('fetch', fetch, outputs=[str(out)])]
+    make_runner(steps, manifest=manifest).run()
+    results = make_runner(steps, manifest=manifest).run()
+    assert results['fetch'].status == 'ok' and results['fetch'].outputs_changed == 0
+
+
+def test_critical_path_follows_the_slowest_chain(make_runner, tmp_path):
+    rec = Recorder()
+    runner = make_runner([
+        Step('slow', rec.step('slow', 0.3)),
+        Step('fast', rec.step('fast', 0.01)),
+        Step('join', rec.step('join', 0.01), deps=['slow', 'fast']),
+        Step('side', rec.step('side', 0.01), deps=['fast']),
+    ])
+    runner.run()
+    assert runner.critical_path() == ['slow', 'join']
+    report = json.loads((tmp_path / 'pipeline_report.json').read_text())
+    assert report['critical_path'] == ['slow', 'join']
+    assert report['critical_path_seconds'] >= 0.3
+    assert {s['name'] for s in report['steps']} == {'slow', 'fast', 'join', 'side'}
+
+
+def test_timed_out_step_holds_dependants_until_it_exits(make_runner):
+    rec = Recorder()
+    runner = make_runner([
+        Step('slow', rec.step('slow', 1.5), in_process=True, timeout=0.2),
+        Step('after', rec.step('after'), deps=['slow']),
+    ])
+    results = runner.run()
+    assert results['slow'].status == 'timeout'
+    assert results['after'].status == 'ok'
+    assert rec.index('end', 'slow') < rec.index('start', 'after')
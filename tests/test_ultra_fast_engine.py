@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from engines.ultra_fast_engine import UltraFastSimEngine
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return UltraFastSimEngine(analytic=False)
+
+
+def _game(away, home, away_pitcher=None, home_pitcher=None):
+    return {'away_team': away, 'home_team': home, 'game_date': '2025-09-21',
+            'away_pitcher': away_pitcher, 'home_pitcher': home_pitcher}
+
+
+def _arrays_summary(engine, game, sims):
+    arrays, _ = engine.simulate_game_arrays(game['away_team'], game['home_team'], sims, game['game_date'],
+                                            game['away_pitcher'], game['home_pitcher'])
+    return engine.summarize_scores(arrays.away_scores, arrays.home_scores)[0]
+
+
+def test_slate_game_matches_simulate_game_arrays(engine):
+    games = [_game('New York Yankees', 'Boston Red Sox'),
+             _game('Los Angeles Dodgers', 'San Diego Padres'),
+             _game('Houston Astros', 'Seattle Mariners')]
+    slate = engine.simulate_slate(games, sim_count=3000)
+    for game, summary in zip(games, slate):
+        expected = _arrays_summary(engine, game, 3000)
+        for key in ('mean_away_runs', 'mean_home_runs', 'mean_total_runs', 'home_win_prob', 'total_runs_std'):
+            assert summary[key] == expected[key], key
+
+
+def test_slate_result_independent_of_other_games(engine):
+    nyy_bos = _game('New York Yankees', 'Boston Red Sox')
+    alone = engine.simulate_slate([nyy_bos], sim_count=2000)[0]
+    paired = engine.simulate_slate([_game('Chicago Cubs', 'St. Louis Cardinals'), nyy_bos], sim_count=2000)[1]
+    assert alone['mean_total_runs'] == paired['mean_total_runs']
+    assert alone['home_win_prob'] == paired['home_win_prob']
+
+
+def test_simulate_game_arrays_seeded_per_call(engine):
+    a1, _ = engine.simulate_game_arrays('New York Yankees', 'Boston Red Sox', 1000, '2025-09-21')
+    a2, _ = engine.simulate_game_arrays('New York Yankees', 'Boston Red Sox', 1000, '2025-09-21')
+    assert np.array_equal(a1.away_scores, a2.away_scores)
+    assert np.array_equal(a1.home_scores, a2.home_scores)
+    # Different starters (doubleheader games) draw from a different stream
+    b, _ = engine.simulate_game_arrays('New York Yankees', 'Boston Red Sox', 1000, '2025-09-21', 'A', 'B')
+    assert not np.array_equal(a1.away_scores, b.away_scores)
@@ -0,0 +1,73 @@
+import json
+import os
+
+from unified_predictions_store import UnifiedPredictionsStore
+
+
+def _legacy_doc():
+    return {
+        'predictions_by_date': {
+            '2025-09-20': {'games': {'Yankees_vs_Red Sox': {'away_team': 'Yankees', 'home_team': 'Red Sox'}},
+                           'timestamp': '2025-09-20T09:00:00'},
+            '2025-09-21': {'games': {'Dodgers_vs_Padres': {'away_team': 'Dodgers', 'home_team': 'Padres'},
+                                     'Astros_vs_Mariners': {'away_team': 'Astros', 'home_team': 'Mariners'}}},
+        },
+        'last_updated': '2025-09-21T10:00:00',
+    }
+
+
+def _write_legacy(store, doc):
+    with open(store.legacy_path, 'w', encoding='utf-8') as f:
+        json.dump(doc, f)
+
+
+def test_legacy_monolith_is_imported_into_shards(tmp_path):
+    store = UnifiedPredictionsStore(str(tmp_path))
+    _write_legacy(store, _legacy_doc())
+    assert store.dates() == ['2025-09-20', '2025-09-21']
+    assert os.path.exists(store.shard_path('2025-09-21'))
+    assert set(store.get_games('2025-09-21')) == {'Dodgers_vs_Padres', 'Astros_vs_Mariners'}
+    assert store.get_date('2025-09-22') is None
+    manifest = json.loads(open(store.manifest_path, encoding='utf-8').read())
+    assert manifest['shards']['2025-09-21']['games'] == 2
+    assert manifest['meta']['last_updated'] == '2025-09-21T10:00:00'
+
+
+def test_import_export_round_trip(tmp_path):
+    legacy = _legacy_doc()
+    store = UnifiedPredictionsStore(str(tmp_path))
+    _write_legacy(store, legacy)
+    assert store.load_all() == legacy
+
+    store.put_date('2025-09-22', {'games': {'Mets_vs_Braves': {'away_team': 'Mets', 'home_team': 'Braves'}}})
+    path = store.export_legacy()
+    with open(path, 'r', encoding='utf-8') as f:
+        exported = json.load(f)
+    assert exported['predictions_by_date']['2025-09-20'] == legacy['predictions_by_date']['2025-09-20']
+    assert set(exported['predictions_by_date']) == {'2025-09-20', '2025-09-21', '2025-09-22'}
+
+    # A fresh process reading the exported monolith sees the same document and re-imports nothing
+    fresh = UnifiedPredictionsStore(str(tmp_path))
+    assert fresh.load_all() == exported
+    assert fresh.stats()['legacy_imports'] == 0
+
+
+def test_rewritten_monolith_is_reimported(tmp_path):
+    store = UnifiedPredictionsStore(str(tmp_path))
+    _write_legacy(store, _legacy_doc())
+    store.dates()
+    doc = _legacy_doc()
+    doc['predictions_by_date']['2025-09-20']['games']['Cubs_vs_Cardinals'] = {'away_team': 'Cubs'}
+    _write_legacy(store, doc)
+    st = os.stat(store.legacy_path)
+    os.utime(store.legacy_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert 'Cubs_vs_Cardinals' in store.get_games('2025-09-20')
+
+
+def test_put_date_keeps_entries_written_by_another_store(tmp_path):
+    first = UnifiedPredictionsStore(str(tmp_path))
+    second = UnifiedPredictionsStore(str(tmp_path))
+    first.put_date('2025-09-20', {'games': {'a': {}}})
+    second.put_date('2025-09-21', {'games': {'b': {}}})
+    first.put_date('2025-09-22', {'games': {'c': {}}})
+    assert UnifiedPredictionsStore(str(tmp_path)).dates() == ['2025-09-20', '2025-09-21', '2025-09-22']
@@ -103,8 +103,26 @@ def norm_name(name: str) -> str:
     return normalize_name((name or "").split("(")[0].strip())
 
 
+_HTTP_CLIENT = None
+
+
+def _http():
+    """Shared pooled client from the repo root (keep-alive + retries), else the requests module"""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        try:
+            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+            if repo_root not in sys.path:
+                sys.path.insert(0, repo_root)
+            from http_client import get_http_client  # type: ignore
+            _HTTP_CLIENT = get_http_client()
+        except Exception:
+            _HTTP_CLIENT = requests
+    return _HTTP_CLIENT
+
+
 def _http_get(url: str, params: Dict[str, Any], timeout: int = 30) -> Any:
-    r = requests.get(url, params=params, timeout=timeout)
+    r = _http().get(url, params=params, timeout=timeout)
     # Raise for non-2xx; let caller handle
     r.raise_for_status()
     return r.json(), {k.lower(): v for k, v in r.headers.items()}
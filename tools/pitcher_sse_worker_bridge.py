@@ -4,13 +4,15 @@
 Usage: import and call send_events([...]) from the worker when needed.
 The web app must expose /internal/pitcher-props/broadcast with token auth.
 """
-import os, json, urllib.request, time
+import os, sys, json, urllib.request, time
 from urllib.error import HTTPError, URLError
 
 WEB_BASE = os.environ.get('WEB_BASE_URL')  # e.g., https://mlb-betting-system.onrender.com
 DEBUG = os.environ.get('PITCHER_SSE_BRIDGE_DEBUG','0') == '1'
 TIMEOUT = float(os.environ.get('PITCHER_SSE_BRIDGE_TIMEOUT_SEC', '20'))
 RETRIES = int(os.environ.get('PITCHER_SSE_BRIDGE_RETRIES', '2'))
+# Events per POST; keep below the app's PITCHER_INGEST_QUEUE_MAX (default 5000)
+BATCH_MAX = max(1, int(os.environ.get('PITCHER_SSE_BRIDGE_BATCH_MAX', '1000')))
 
 def _get_token():
     tok = os.environ.get('PITCHER_SSE_INGEST_TOKEN')
@@ -27,13 +29,23 @@ def _get_token():
             pass
     return '', 'none'
 
+def _log_drop(count, reason):
+    print(f"[Bridge] Dropped {count} events: {reason}", file=sys.stderr)
+
 def send_events(events):
+    """POST events in batches of at most BATCH_MAX; True when every batch was accepted."""
     token, src = _get_token()
     if not WEB_BASE or not token:
         if DEBUG:
             print(f"[Bridge] Missing WEB_BASE_URL or ingest token (WEB_BASE_URL={bool(WEB_BASE)} TOKEN_SRC={src})")
         return False
     url = WEB_BASE.rstrip('/') + '/internal/pitcher-props/broadcast'
+    ok = True
+    for i in range(0, len(events), BATCH_MAX):
+        ok = _send_batch(url, token, src, events[i:i + BATCH_MAX]) and ok
+    return ok
+
+def _send_batch(url, token, src, events):
     data = json.dumps({'type':'batch','events': events}).encode('utf-8')
     if DEBUG:
         print(f"[Bridge] POST {url} bytes={len(data)} events={len(events)} types={[e.get('type') for e in events][:5]} timeout={TIMEOUT}s retries={RETRIES} token_src={src}")
@@ -55,8 +67,9 @@ def send_events(events):
                 except Exception:
                     body = ''
                 print(f"[Bridge] HTTPError {e.code}: {body}")
-            # No retry on 401/403/400
-            if getattr(e, 'code', None) in (400, 401, 403):
+            # No retry on 401/403/400, nor on 413 (batch larger than the app's ingest queue)
+            if getattr(e, 'code', None) in (400, 401, 403, 413):
+                _log_drop(len(events), f"HTTP {e.code}")
                 return False
         except URLError as e:
             last_err = e
@@ -69,6 +82,7 @@ def send_events(events):
         # backoff before next attempt
         if attempt < RETRIES:
             time.sleep(1.5 * (attempt + 1))
+    _log_drop(len(events), f"{RETRIES + 1} attempts failed ({last_err})")
     return False
 
 if __name__ == '__main__':
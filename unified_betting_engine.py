@@ -19,6 +19,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from unified_predictions_store import get_unified_predictions_store
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,7 +33,7 @@ class UnifiedBettingEngine:
         self.root_dir = os.path.dirname(os.path.abspath(__file__))
         # File paths (precompute date tag to avoid complex expressions in f-strings)
         date_tag = self.current_date.replace('-', '_')
-        self.predictions_cache_path = os.path.join(self.root_dir, 'data', 'unified_predictions_cache.json')
+        self.predictions_cache_path = os.path.join(self.root_dir, 'data', 'unified_predictions')
         self.betting_lines_path = os.path.join(self.root_dir, 'data', f'real_betting_lines_{date_tag}.json')
         self.output_path = os.path.join(self.root_dir, 'data', f'betting_recommendations_{date_tag}.json')
 
@@ -125,58 +127,29 @@ class UnifiedBettingEngine:
         return game_predictions
     
     def load_predictions(self) -> Dict:
-        """Load predictions from unified cache"""
+        """Load predictions from the unified predictions store (today's shard only)"""
         try:
-            with open(self.predictions_cache_path, 'r') as f:
-                data = json.load(f)
-            
-            # Check both structures: direct date key or nested under 'predictions_by_date'
-            predictions_data = None
-            if self.current_date in data:
-                predictions_data = data[self.current_date]
-            elif 'predictions_by_date' in data and self.current_date in data['predictions_by_date']:
-                predictions_data = data['predictions_by_date'][self.current_date]
-            
-            if predictions_data:
-                # Handle nested structure with 'games' key
-                if 'games' in predictions_data:
-                    games = predictions_data['games']
-                else:
-                    games = predictions_data
-                
-                logger.info(f"📊 Loaded {len(games)} game predictions for {self.current_date}")
-                return games
-            else:
+            store = get_unified_predictions_store(os.path.join(self.root_dir, 'data'))
+            predictions_data = store.get_date(self.current_date)
+            used_date = self.current_date
+            if not predictions_data:
                 # Try latest available date if current date not found
-                available_dates = []
-                if 'predictions_by_date' in data:
-                    available_dates = list(data['predictions_by_date'].keys())
-                else:
-                    available_dates = [k for k in data.keys() if k != 'metadata']
-                
-                if available_dates:
-                    latest_date = max(available_dates)
-                    logger.warning(f"⚠️ No predictions for {self.current_date}, using latest: {latest_date}")
-                    
-                    if 'predictions_by_date' in data:
-                        predictions_data = data['predictions_by_date'][latest_date]
-                    else:
-                        predictions_data = data[latest_date]
-                    
-                    if 'games' in predictions_data:
-                        games = predictions_data['games']
-                    else:
-                        games = predictions_data
-                    
-                    logger.info(f"📊 Loaded {len(games)} game predictions for {latest_date}")
-                    return games
-                else:
+                available_dates = store.dates()
+                if not available_dates:
                     logger.warning(f"⚠️ No predictions found in cache")
                     return {}
-                
-        except FileNotFoundError:
-            logger.error(f"❌ Predictions cache not found: {self.predictions_cache_path}")
-            return {}
+                used_date = available_dates[-1]
+                logger.warning(f"⚠️ No predictions for {self.current_date}, using latest: {used_date}")
+                predictions_data = store.get_date(used_date) or {}
+
+            # Handle nested structure with 'games' key
+            if 'games' in predictions_data:
+                games = predictions_data['games']
+            else:
+                games = predictions_data
+
+            logger.info(f"📊 Loaded {len(games)} game predictions for {used_date}")
+            return games
         except Exception as e:
             logger.error(f"❌ Error loading predictions: {e}")
             return {}
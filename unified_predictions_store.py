@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Date-sharded store for unified game predictions.
+
+Replaces the monolithic data/unified_predictions_cache.json ({"predictions_by_date": {...}})
+with one compact file per date plus a small manifest:
+
+  data/unified_predictions/<YYYY-MM-DD>.json   day doc ({"games": {...}, "timestamp": ..., ...})
+  data/unified_predictions/manifest.json       {"shards": {date: {games, mtime_ns, size}}, "meta": {...}}
+
+Readers load only the dates they ask for; parsed shards are reused until the shard's
+(mtime_ns, size) changes. load_all() assembles the legacy-shaped document for callers that
+still need every date, re-parsing only changed shards.
+
+The legacy monolith is still honoured for compatibility: the first time it is seen (or
+whenever a non-migrated script rewrites it) its dates are imported into shards, and batch
+writers can regenerate it with export_legacy() for scripts that read it directly.
+
+Day docs returned by readers are shared: callers must treat them as read-only.
+
+Manifest updates (read, merge, write) hold an flock on manifest.json.lock, so the web
+workers and the daily scripts never drop each other's shard entries.
+"""
+from __future__ import annotations
+import os, json, threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: manifest updates are only serialized within a process
+    fcntl = None
+
+SHARD_DIRNAME = 'unified_predictions'
+MANIFEST_NAME = 'manifest.json'
+LEGACY_NAME = 'unified_predictions_cache.json'
+
+
+def _file_sig(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _dump_atomic(path: str, doc: Any, indent: int = None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(doc, f, indent=indent, separators=None if indent else (',', ':'))
+    os.replace(tmp, path)
+
+
+def _game_count(day_doc: Any) -> int:
+    games = day_doc.get('games') if isinstance(day_doc, dict) else None
+    return len(games) if isinstance(games, dict) else 0
+
+
+class UnifiedPredictionsStore:
+    def __init__(self, data_dir: str = 'data'):
+        self.data_dir = data_dir
+        self.shard_dir = os.path.join(data_dir, SHARD_DIRNAME)
+        self.manifest_path = os.path.join(self.shard_dir, MANIFEST_NAME)
+        self.legacy_path = os.path.join(data_dir, LEGACY_NAME)
+        self._lock = threading.RLock()
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_sig = None
+        self._shards: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._assembled = None  # (sigs key, doc)
+        self._flock_depth = 0
+        self._stats = {'shard_hits': 0, 'shard_loads': 0, 'shard_writes': 0,
+                       'legacy_imports': 0, 'legacy_exports': 0}
+
+    def shard_path(self, date_str: str) -> str:
+        return os.path.join(self.shard_dir, f'{date_str}.json')
+
+    # ---- manifest ----------------------------------------------------------
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        sig = _file_sig(self.manifest_path)
+        if self._manifest is not None and sig == self._manifest_sig:
+            return self._manifest
+        manifest = {}
+        if sig is not None:
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f) or {}
+            except Exception:
+                manifest = {}
+        manifest.setdefault('shards', {})
+        manifest.setdefault('meta', {})
+        self._manifest, self._manifest_sig = manifest, sig
+        return manifest
+
+    @contextmanager
+    def _manifest_update(self):
+        """Latest manifest on disk, held under the cross-process manifest lock until the block exits.
+        Caller holds self._lock; nested use reuses the outer flock."""
+        if self._flock_depth:
+            self._flock_depth += 1
+            try:
+                yield self._read_manifest()
+            finally:
+                self._flock_depth -= 1
+            return
+        os.makedirs(self.shard_dir, exist_ok=True)
+        with open(self.manifest_path + '.lock', 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            self._flock_depth = 1
+            try:
+                self._manifest_sig = None  # always merge into the latest manifest on disk
+                yield self._read_manifest()
+            finally:
+                self._flock_depth = 0  # the lock is released when the file closes
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        manifest['updated_at'] = datetime.now().isoformat()
+        _dump_atomic(self.manifest_path, manifest, indent=1)
+        self._manifest, self._manifest_sig = manifest, _file_sig(self.manifest_path)
+
+    def _sync_legacy(self):
+        """Import the monolith into shards when it is new or was rewritten by a legacy writer."""
+        legacy_sig = _file_sig(self.legacy_path)
+        if legacy_sig is None:
+            return
+        if list(legacy_sig) == self._read_manifest().get('legacy_sig'):
+            return
+        with self._manifest_update() as manifest:
+            if list(legacy_sig) == manifest.get('legacy_sig'):
+                return  # another process imported it while we waited
+            try:
+                with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                    legacy = json.load(f) or {}
+            except Exception:
+                return
+            by_date = legacy.get('predictions_by_date') if isinstance(legacy, dict) else None
+            if isinstance(by_date, dict):
+                for date_str, day_doc in by_date.items():
+                    # A shard written after the monolith is newer than the monolith's copy of that date
+                    shard_sig = _file_sig(self.shard_path(date_str))
+                    if shard_sig is not None and shard_sig[0] > legacy_sig[0]:
+                        continue
+                    if self._write_shard(manifest, date_str, day_doc, only_if_changed=True):
+                        self._stats['legacy_imports'] += 1
+                manifest['meta'].update({k: v for k, v in legacy.items() if k != 'predictions_by_date'})
+            manifest['legacy_sig'] = list(legacy_sig)
+            self._write_manifest(manifest)
+
+    # ---- shards ------------------------------------------------------------
+
+    def _write_shard(self, manifest: Dict[str, Any], date_str: str, day_doc: Any,
+                     only_if_changed: bool = False) -> bool:
+        path = self.shard_path(date_str)
+        payload = json.dumps(day_doc, separators=(',', ':'))
+        if only_if_changed:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    if f.read() == payload:
+                        return False
+            except OSError:
+                pass
+        os.makedirs(self.shard_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp, path)
+        sig = _file_sig(path)
+        manifest['shards'][date_str] = {'games': _game_count(day_doc), 'mtime_ns': sig[0], 'size': sig[1]}
+        self._shards[date_str] = (sig, day_doc)
+        self._stats['shard_writes'] += 1
+        return True
+
+    def _load_shard(self, date_str: str) -> Any:
+        path = self.shard_path(date_str)
+        sig = _file_sig(path)
+        if sig is None:
+            self._shards.pop(date_str, None)
+            return None
+        cached = self._shards.get(date_str)
+        if cached is not None and cached[0] == sig:
+            self._stats['shard_hits'] += 1
+            return cached[1]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+        except Exception:
+            return None
+        self._shards[date_str] = (sig, doc)
+        self._stats['shard_loads'] += 1
+        return doc
+
+    # ---- readers -----------------------------------------------------------
+
+    def dates(self) -> List[str]:
+        with self._lock:
+            self._sync_legacy()
+            return sorted(self._read_manifest()['shards'])
+
+    def get_date(self, date_str: str, default: Any = None) -> Any:
+        """Day doc for one date ({"games": {...}, ...}), or default when the date has no shard."""
+        with self._lock:
+            self._sync_legacy()
+            doc = self._load_shard(date_str)
+        return default if doc is None else doc
+
+    def get_games(self, date_str: str) -> Dict[str, Any]:
+        doc = self.get_date(date_str) or {}
+        games = doc.get('games') if isinstance(doc, dict) else None
+        return games if isinstance(games, dict) else {}
+
+    def get_dates(self, dates: Iterable[str]) -> Dict[str, Any]:
+        with self._lock:
+            self._sync_legacy()
+            out = {}
+            for d in dates:
+                doc = self._load_shard(d)
+                if doc is not None:
+                    out[d] = doc
+            return out
+
+    def load_all(self) -> Dict[str, Any]:
+        """Legacy-shaped {"predictions_by_date": {...}, **meta} built from shards.
+        Returns the same object while no shard has changed."""
+        with self._lock:
+            self._sync_legacy()
+            manifest = self._read_manifest()
+            by_date = {}
+            sigs = []
+            for d in sorted(manifest['shards']):
+                doc = self._load_shard(d)
+                if doc is not None:
+                    by_date[d] = doc
+                    sigs.append((d, self._shards[d][0]))
+            key = tuple(sigs)
+            if self._assembled is not None and self._assembled[0] == key:
+                return self._assembled[1]
+            doc = {**manifest.get('meta', {}), 'predictions_by_date': by_date}
+            self._assembled = (key, doc)
+            return doc
+
+    def exists(self) -> bool:
+        return bool(self.dates())
+
+    # ---- writers -----------------------------------------------------------
+
+    def put_date(self, date_str: str, day_doc: Dict[str, Any], meta: Dict[str, Any] = None):
+        """Replace one date's shard and update the manifest (other dates are untouched)."""
+        with self._lock, self._manifest_update():
+            self._sync_legacy()
+            manifest = self._read_manifest()
+            self._write_shard(manifest, date_str, day_doc)
+            if meta:
+                manifest['meta'].update(meta)
+            self._write_manifest(manifest)
+
+    def put_dates(self, by_date: Dict[str, Any], meta: Dict[str, Any] = None):
+        with self._lock, self._manifest_update():
+            self._sync_legacy()
+            manifest = self._read_manifest()
+            for date_str, day_doc in by_date.items():
+                self._write_shard(manifest, date_str, day_doc, only_if_changed=True)
+            if meta:
+                manifest['meta'].update(meta)
+            self._write_manifest(manifest)
+
+    def export_legacy(self) -> str:
+        """Regenerate the monolith for scripts that still read it; returns its path."""
+        with self._lock, self._manifest_update():
+            doc = self.load_all()
+            _dump_atomic(self.legacy_path, doc)
+            manifest = self._read_manifest()
+            manifest['legacy_sig'] = list(_file_sig(self.legacy_path))
+            self._write_manifest(manifest)
+            self._stats['legacy_exports'] += 1
+            return self.legacy_path
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            manifest = self._manifest or {}
+            return {
+                **self._stats,
+                'shards': len(manifest.get('shards', {})),
+                'loaded_shards': len(self._shards),
+            }
+
+
+_STORES: Dict[str, UnifiedPredictionsStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_unified_predictions_store(data_dir: str = 'data') -> UnifiedPredictionsStore:
+    """Process-wide shared store for a data directory"""
+    key = os.path.abspath(data_dir)
+    store = _STORES.get(key)
+    if store is None:
+        with _STORES_LOCK:
+            store = _STORES.setdefault(key, UnifiedPredictionsStore(key))
+    return store
@@ -13,8 +13,18 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
 
+try:
+    from http_client import get_http_client as _get_http_client
+except Exception:  # used outside the repo root: plain requests
+    _get_http_client = None
+
 logger = logging.getLogger(__name__)
 
+
+def _http():
+    """Shared pooled client when available (keep-alive + retries), else the requests module"""
+    return _get_http_client() if _get_http_client is not None else requests
+
 class MLBDataFetcher:
     def __init__(self, data_dir: str = None):
         self.data_dir = data_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
@@ -31,7 +41,7 @@ class MLBDataFetcher:
             }
             
             # Keep this reasonably low to avoid long stalls on hosted platforms
-            response = requests.get(url, params=params, timeout=6)
+            response = _http().get(url, params=params, timeout=6)
             response.raise_for_status()
             
             data = response.json()
@@ -114,7 +124,7 @@ class MLBDataFetcher:
                 'season': season
             }
             
-            response = requests.get(url, params=params, timeout=6)
+            response = _http().get(url, params=params, timeout=6)
             response.raise_for_status()
             
             data = response.json()
@@ -152,7 +162,7 @@ class MLBDataFetcher:
                 'season': season
             }
             
-            response = requests.get(url, params=params, timeout=6)
+            response = _http().get(url, params=params, timeout=6)
             response.raise_for_status()
             
             data = response.json()
@@ -200,7 +210,7 @@ class OddsAPIFetcher:
             if date_str:
                 params['date'] = date_str
             
-            response = requests.get(url, params=params, timeout=6)
+            response = _http().get(url, params=params, timeout=6)
             response.raise_for_status()
             
             data = response.json()
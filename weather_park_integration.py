@@ -10,6 +10,8 @@ from datetime import datetime, date
 from typing import Dict, List, Tuple, Optional
 import logging
 
+from http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 class WeatherParkFactorEngine:
@@ -406,7 +408,7 @@ class WeatherParkFactorEngine:
                 'units': 'imperial'
             }
             
-            response = requests.get(self.weather_base_url, params=params, timeout=10)
+            response = get_http_client().get(self.weather_base_url, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 
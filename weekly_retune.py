@@ -3,10 +3,16 @@
 Uses last 7 completed days (excluding today if games still in progress) to run the
 comprehensive optimization in a constrained window. Produces a timestamped
 config and a comparison summary vs current active comprehensive_optimized_config.json.
+
+The run is recorded in the build manifest (build_manifest.py); when the window's
+recommendations, final scores and park factors and the retuner code are unchanged since the
+last run it is a no-op (pass --force to retune anyway).
 """
 from datetime import datetime, timedelta
 import json
 import os
+import sys
+from build_manifest import get_build_manifest, producer_version
 from comprehensive_model_retuner import AdvancedModelRetuner
 from typing import Dict, Any, List
 
@@ -424,11 +430,31 @@ def update_optimization_history(last_days: List[datetime.date], new_cfg: Dict[st
     except Exception:
         pass
 
-def main():
+def retune_inputs(last_days: List[datetime.date]) -> List[str]:
+    """Files the retune window is computed from"""
+    paths = []
+    for d in last_days:
+        date_us = d.strftime('%Y_%m_%d')
+        paths += [os.path.join(DATA_DIR, f'betting_recommendations_{date_us}.json'),
+                  os.path.join(DATA_DIR, f'final_scores_{date_us}.json'),
+                  os.path.join(DATA_DIR, f'park_weather_factors_{date_us}.json')]
+    return paths
+
+
+def main(force: bool = False):
     print("🏁 Weekly Retune Starting")
     last_days = get_last_completed_days(7)
     print("Using days:", ", ".join(d.strftime('%Y-%m-%d') for d in last_days))
 
+    manifest = get_build_manifest()
+    inputs = retune_inputs(last_days)
+    outputs = [os.path.join(DATA_DIR, 'optimization_history.json')]
+    producer = producer_version(['weekly_retune.py', 'comprehensive_model_retuner.py'])
+    if not force and manifest.is_current('weekly_retune', inputs, outputs, producer):
+        print("⏭️ Retune window inputs unchanged since the last retune - nothing to do (use --force to rerun)")
+        return
+    input_hashes = manifest.hash_files(inputs)
+
     existing_cfg_path = os.path.join(DATA_DIR, 'comprehensive_optimized_config.json')
     old_cfg = load_existing_config(existing_cfg_path)
     old_metrics = extract_key_metrics(old_cfg)
@@ -468,5 +494,8 @@ def main():
     print("Previous vs New Metrics:")
     print(json.dumps(comparison, indent=2))
 
+    manifest.record('weekly_retune', input_hashes, outputs, producer, comparison=os.path.basename(out_file))
+    manifest.save()
+
 if __name__ == '__main__':
-    main()
+    main(force='--force' in sys.argv[1:])